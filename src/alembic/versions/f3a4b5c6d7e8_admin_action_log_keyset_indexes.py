@@ -0,0 +1,56 @@
+"""Индексы keyset-пагинации логов действий администраторов.
+
+Revision ID: f3a4b5c6d7e8
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "f3a4b5c6d7e8"
+down_revision: Union[str, None] = "e7f8a9b0c1d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(
+        "idx_admin_action_log_created",
+        table_name="admin_action_logs",
+        if_exists=True,
+    )
+    op.drop_index(
+        "idx_admin_action_log_admin_created",
+        table_name="admin_action_logs",
+        if_exists=True,
+    )
+    op.create_index(
+        "idx_admin_action_log_created_id",
+        "admin_action_logs",
+        ["created_at", "id"],
+    )
+    op.create_index(
+        "idx_admin_action_log_admin_created_id",
+        "admin_action_logs",
+        ["admin_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "idx_admin_action_log_admin_created_id", table_name="admin_action_logs"
+    )
+    op.drop_index("idx_admin_action_log_created_id", table_name="admin_action_logs")
+    op.create_index(
+        "idx_admin_action_log_admin_created",
+        "admin_action_logs",
+        ["admin_id", "created_at"],
+    )
+    op.create_index(
+        "idx_admin_action_log_created",
+        "admin_action_logs",
+        ["created_at"],
+    )
@@ -1,11 +1,17 @@
 import asyncio
 import logging
 
-from container import ContainerSetup, container
+from config import settings
+from container import ContainerProfile, ContainerSetup, container
+from metrics import sample_buffers, sample_task_queues, start_metrics_server
 from repositories import UserRepository
 from scheduler import broker
-from services import BotMessageService
+from scheduler.taskiq import delay_queue, task_queue
+from services import AnalyticsBufferService, BotMessageService
+from tasks.automoderation_tasks import sweep_auto_moderation_buffers_task
 from tasks.analytics_tasks import (
+    process_buffered_admin_logs_task,
+    process_buffered_membership_events_task,
     process_buffered_messages_task,
     process_buffered_reactions_task,
     process_buffered_replies_task,
@@ -22,14 +28,23 @@ ANALYTICS_CHECK_INTERVAL = 10
 
 async def main():
     """Главная функция для запуска analytics scheduler"""
-    ContainerSetup.setup()
+    ContainerSetup.setup(ContainerProfile.SCHEDULER)
     await broker.startup()
     logger.info(
         "Analytics Scheduler запущен (интервал: %d сек)", ANALYTICS_CHECK_INTERVAL
     )
+    # Глубину буферов и очередей замеряет один процесс — этот цикл
+    metrics_runner = None
+    if settings.METRICS_ENABLED:
+        metrics_runner = await start_metrics_server(settings.METRICS_PORT)
+    buffer_service = container.resolve(AnalyticsBufferService)
 
     try:
         while True:
+            if settings.METRICS_ENABLED:
+                await sample_buffers(buffer_service)
+                await sample_task_queues(broker, (task_queue.name, delay_queue.name))
+
             try:
                 # Запускаем задачи обработки буферов
                 await (
@@ -47,6 +62,22 @@ async def main():
                     .with_task_id("analytics:replies")
                     .kiq()
                 )
+                await (
+                    process_buffered_membership_events_task.kicker()
+                    .with_task_id("analytics:membership_events")
+                    .kiq()
+                )
+                await (
+                    process_buffered_admin_logs_task.kicker()
+                    .with_task_id("analytics:admin_logs")
+                    .kiq()
+                )
+                # Сброс буферов автомодерации, которые ждут дольше допустимого
+                await (
+                    sweep_auto_moderation_buffers_task.kicker()
+                    .with_task_id("automod:sweep")
+                    .kiq()
+                )
             except Exception as e:
                 logger.error(
                     "Ошибка при запуске задач обработки буферов: %s", e, exc_info=True
@@ -62,6 +93,8 @@ async def main():
     except asyncio.CancelledError:
         pass
     finally:
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
         await broker.shutdown()
         logger.info("Analytics Scheduler остановлен")
 
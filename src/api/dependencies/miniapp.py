@@ -7,6 +7,13 @@ Telegram подписывает initData HMAC-SHA256:
 
 data_check_string — все поля initData (кроме hash), отсортированные по ключу,
 соединённые символом '\n'.
+
+Проверенные initData кешируются в памяти процесса до auth_date +
+MAX_AGE_SECONDS: повторные запросы Mini App не пересчитывают HMAC.
+Найденный по ним пользователь (вместе с ролью) кешируется не дольше
+MINIAPP_CALLER_CACHE_TTL_SECONDS: роль меняют и пользователей удаляют в
+процессе бота, поэтому понижение роли или удаление доходит до API не позже
+чем через этот срок.
 """
 
 import hashlib
@@ -14,13 +21,20 @@ import hmac
 import json
 import logging
 import time
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, NamedTuple, cast
 from urllib.parse import parse_qsl, unquote
 
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import APIKeyHeader
+from punq import Container
 
+from api.dependencies.container import get_container
 from config import settings
+from constants.enums import UserRole
+from dto.user import UserDTO
+from repositories import UserRepository
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +42,39 @@ INIT_DATA_HEADER = APIKeyHeader(name="X-Telegram-Init-Data", auto_error=False)
 
 MAX_AGE_SECONDS = 3600
 
+# Сколько проверенных initData и пользователей держать в памяти процесса
+AUTH_CACHE_SIZE = 4096
+
+
+class _Expiring(NamedTuple):
+    value: object
+    expires_at: float
+
+
+def _expiring_cache() -> TLRUCache:
+    return TLRUCache(
+        maxsize=AUTH_CACHE_SIZE,
+        ttu=lambda _key, item, _now: item.expires_at,
+        timer=time.time,
+    )
+
+
+# Ключ — сырая строка initData целиком: подпись покрывает все поля,
+# поэтому совпадение строки означает совпадение проверенных данных
+_verified_init_data = _expiring_cache()
+# Ключ — tg_id пользователя
+_callers = _expiring_cache()
 
+
+@lru_cache(maxsize=1)
 def _compute_secret_key(bot_token: str) -> bytes:
     return hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
 
 
+def _expires_at(params: dict) -> float:
+    return int(params.get("auth_date", 0)) + MAX_AGE_SECONDS
+
+
 def _verify_init_data(raw: str) -> dict:
     """
     Проверяет подпись initData и возвращает распарсенные поля.
@@ -86,12 +128,72 @@ def verify_telegram_init_data(
             detail="X-Telegram-Init-Data header required",
         )
 
-    return _verify_init_data(unquote(raw_init_data))
+    raw = unquote(raw_init_data)
+    cached = _verified_init_data.get(raw)
+    if cached is not None:
+        return dict(cast(dict, cached.value))
+
+    params = _verify_init_data(raw)
+    expires_at = _expires_at(params)
+    if expires_at > time.time():
+        _verified_init_data[raw] = _Expiring(dict(params), expires_at)
+    return params
 
 
 TelegramInitData = Annotated[dict, Depends(verify_telegram_init_data)]
 
 
+async def get_miniapp_caller(
+    init_data: TelegramInitData,
+    dc: Container = Depends(get_container),
+) -> UserDTO:
+    """
+    FastAPI dependency. Зарегистрированный пользователь, открывший Mini App.
+    Кешируется на MINIAPP_CALLER_CACHE_TTL_SECONDS (не дольше срока initData);
+    403, если пользователя нет в системе.
+    """
+    tg_id = tg_id_from_init_data(init_data)
+    cached = _callers.get(tg_id)
+    if cached is not None:
+        return cast(UserDTO, cached.value)
+
+    user_repo = cast(UserRepository, dc.resolve(UserRepository))
+    user = await user_repo.get_user_by_tg_id(tg_id=tg_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User not registered in the system",
+        )
+
+    caller = UserDTO.from_model(user)
+    expires_at = min(
+        _expires_at(init_data),
+        time.time() + settings.MINIAPP_CALLER_CACHE_TTL_SECONDS,
+    )
+    if expires_at > time.time():
+        _callers[tg_id] = _Expiring(caller, expires_at)
+    return caller
+
+
+MiniAppCaller = Annotated[UserDTO, Depends(get_miniapp_caller)]
+
+# Те же роли, что пропускает AdminOnlyFilter в боте
+ADMIN_ROLES = frozenset({UserRole.ADMIN, UserRole.ROOT, UserRole.DEV, UserRole.OWNER})
+
+
+def get_miniapp_admin(caller: MiniAppCaller) -> UserDTO:
+    """FastAPI dependency. Вызывающий с ролью админа; иначе 403."""
+    if caller.role not in ADMIN_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin role required",
+        )
+    return caller
+
+
+MiniAppAdmin = Annotated[UserDTO, Depends(get_miniapp_admin)]
+
+
 def tg_id_from_init_data(init_data: dict) -> str:
     """Извлекает tg_id пользователя из распарсенных полей initData."""
     user_raw = init_data.get("user", "{}")
@@ -0,0 +1,50 @@
+"""
+HTTP-обёртка над ResponseCache для эндпоинтов Mini App.
+
+Отдаёт закешированный JSON с заголовками ETag и Cache-Control, а на
+If-None-Match с совпадающим ETag — 304 без тела.
+"""
+
+from typing import Any, Awaitable, Callable, Optional, Sequence, cast
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from punq import Container
+
+from services.caching import ResponseCache
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def cached_json_response(
+    request: Request,
+    dc: Container,
+    namespace: str,
+    params: Sequence[object],
+    build: Callable[[], Awaitable[Any]],
+    ttl_seconds: Optional[int] = None,
+    watermark_user_ids: Optional[Sequence[int]] = None,
+) -> Response:
+    """
+    Возвращает ответ из кеша (или строит его) с поддержкой ETag.
+    Ответы персональные, поэтому Cache-Control — private.
+    """
+    response_cache = cast(ResponseCache, dc.resolve(ResponseCache))
+    cached = await response_cache.get_or_build(
+        namespace, params, build, ttl_seconds, watermark_user_ids=watermark_user_ids
+    )
+
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": (
+            f"private, max-age={ttl_seconds or response_cache.ttl_seconds}"
+        ),
+    }
+    if _etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return JSONResponse(content=cached.body, headers=headers)
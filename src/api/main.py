@@ -3,8 +3,12 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from api.metrics import router as metrics_router
 from api.v1 import router as v1_router
-from container import ContainerSetup
+from config import settings
+from container import ContainerProfile, ContainerSetup
+from database.session import engine
+from metrics import instrument_engine
 from utils.logger_config import setup_logger
 
 setup_logger(log_level=logging.INFO)
@@ -13,7 +17,7 @@ logger = logging.getLogger(__name__)
 
 
 def create_app() -> FastAPI:
-    ContainerSetup.setup()
+    ContainerSetup.setup(ContainerProfile.API)
     logger.info("ContainerSetup setup")
     app = FastAPI(title="tg-bot-analyst", version="1.0.0")
 
@@ -28,6 +32,13 @@ def create_app() -> FastAPI:
     # Публичные/клиентские v1 эндпоинты
     app.include_router(router=v1_router, prefix="/api")
 
+    # API доступно из интернета через туннель: без токена /metrics не монтируется
+    if settings.METRICS_ENABLED and settings.METRICS_TOKEN:
+        instrument_engine(engine)
+        app.include_router(router=metrics_router)
+    elif settings.METRICS_ENABLED:
+        logger.warning("METRICS_TOKEN не задан: /metrics в API отключён")
+
     return app
 
 
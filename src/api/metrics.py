@@ -0,0 +1,33 @@
+import hmac
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from config import settings
+from metrics import render_metrics
+
+router = APIRouter()
+
+_BEARER = HTTPBearer(auto_error=False)
+
+
+def verify_metrics_token(
+    creds: Annotated[HTTPAuthorizationCredentials | None, Depends(_BEARER)],
+) -> None:
+    """API публикуется через туннель: нужен Bearer-токен METRICS_TOKEN."""
+    if (
+        not settings.METRICS_TOKEN
+        or creds is None
+        or not hmac.compare_digest(creds.credentials, settings.METRICS_TOKEN)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token"
+        )
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(_: Annotated[None, Depends(verify_metrics_token)]) -> Response:
+    """Метрики процесса API в формате Prometheus."""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from .amnesty import router as amnesty_router
 from .analytics import router as analytics_router
 from .chats import router as chats_router
+from .export import router as export_router
 from .moderation import router as moderation_router
 from .stats import router as stats_router
 from .users import router as users_router
@@ -15,3 +16,4 @@ router.include_router(users_router)
 router.include_router(moderation_router)
 router.include_router(analytics_router)
 router.include_router(amnesty_router)
+router.include_router(export_router)
@@ -5,12 +5,16 @@ GET  /api/v1/miniapp/analytics/users          — отчёт по всем от
 GET  /api/v1/miniapp/analytics/users/{user_id} — отчёт по одному пользователю
 POST /api/v1/miniapp/analytics/tracking        — добавить пользователя в отслеживание
 DELETE /api/v1/miniapp/analytics/tracking/{user_tgid} — удалить из отслеживания
+
+Отчёты кешируются по (tg_id, маршрут, период, отслеживаемые пользователи,
+версия данных) и отдаются с ETag: повторный просмотр того же периода
+не пересобирает отчёт.
 """
 
 import logging
-from typing import Optional, cast
+from typing import Any, Optional, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from punq import Container
 from pydantic import BaseModel
 
@@ -20,9 +24,11 @@ from api.dependencies.miniapp import (
     tg_id_from_init_data,
     username_from_init_data,
 )
+from api.dependencies.response_cache import cached_json_response
 from constants.period import TimePeriod
 from dto.report import AllUsersReportDTO, SingleUserReportDTO
 from dto.user_tracking import RemoveUserTrackingDTO, UserTrackingDTO
+from services.user import TrackingIndexService
 from usecases.report import GetAllUsersReportUseCase, GetSingleUserReportUseCase
 from usecases.user_tracking import (
     AddUserToTrackingUseCase,
@@ -90,8 +96,20 @@ def _serialize_replies_stats(s) -> dict:
     }
 
 
+async def _tracked_user_ids(dc: Container, tg_id: str) -> list[int]:
+    tracking_index = cast(TrackingIndexService, dc.resolve(TrackingIndexService))
+    return sorted(await tracking_index.get_tracked_user_ids(tg_id))
+
+
+def _cache_params(tg_id: str, period: str, tracked_ids: list[int]) -> list[object]:
+    """Параметры ключа кеша: отчёт зависит от периода и списка отслеживаемых."""
+    start_date, _ = TimePeriod.to_datetime(period)
+    return [tg_id, period, start_date.date(), tracked_ids]
+
+
 @router.get("/analytics/users")
 async def get_all_users_report(
+    request: Request,
     init_data: TelegramInitData,
     period: str = Query(default="За сегодня"),
     dc: Container = Depends(get_container),
@@ -105,6 +123,20 @@ async def get_all_users_report(
             detail=f"Invalid period. Valid: {VALID_PERIODS}",
         )
 
+    tracked_ids = await _tracked_user_ids(dc, tg_id)
+    return await cached_json_response(
+        request,
+        dc,
+        namespace="analytics:users",
+        params=_cache_params(tg_id, period, tracked_ids),
+        build=lambda: _build_all_users_report(dc, tg_id, period),
+        watermark_user_ids=tracked_ids,
+    )
+
+
+async def _build_all_users_report(
+    dc: Container, tg_id: str, period: str
+) -> dict[str, Any]:
     start_date, end_date = TimePeriod.to_datetime(period)
 
     uc = cast(GetAllUsersReportUseCase, dc.resolve(GetAllUsersReportUseCase))
@@ -152,6 +184,7 @@ async def get_all_users_report(
 
 @router.get("/analytics/users/{user_id}")
 async def get_single_user_report(
+    request: Request,
     user_id: int,
     init_data: TelegramInitData,
     period: str = Query(default="За сегодня"),
@@ -166,6 +199,20 @@ async def get_single_user_report(
             detail=f"Invalid period. Valid: {VALID_PERIODS}",
         )
 
+    tracked_ids = await _tracked_user_ids(dc, tg_id)
+    return await cached_json_response(
+        request,
+        dc,
+        namespace="analytics:user",
+        params=[user_id, *_cache_params(tg_id, period, tracked_ids)],
+        build=lambda: _build_single_user_report(dc, tg_id, user_id, period),
+        watermark_user_ids=[user_id],
+    )
+
+
+async def _build_single_user_report(
+    dc: Container, tg_id: str, user_id: int, period: str
+) -> dict[str, Any]:
     start_date, end_date = TimePeriod.to_datetime(period)
 
     uc = cast(GetSingleUserReportUseCase, dc.resolve(GetSingleUserReportUseCase))
@@ -0,0 +1,108 @@
+"""
+Потоковая выгрузка отчётов для Mini App.
+GET /api/miniapp/export — CSV по чату или пользователю за период
+(по сообщениям или по дням).
+
+Строки читаются из БД пачками и сразу отдаются клиенту через
+StreamingResponse: память не зависит от размера выгрузки.
+"""
+
+import logging
+from datetime import date, datetime, time
+from typing import Optional, cast
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from punq import Container
+
+from api.dependencies.container import get_container
+from api.dependencies.miniapp import MiniAppAdmin
+from constants.enums import ExportGranularity, ExportScope
+from constants.period import TimePeriod
+from dto.report import ReportExportDTO
+from services.time_service import TimeZoneService
+from services.user import TrackingIndexService
+from usecases.report import ExportReportUseCase
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+VALID_PERIODS = [p.value for p in TimePeriod if p != TimePeriod.CUSTOM]
+
+
+def _resolve_period(
+    period: str, start_date: Optional[date], end_date: Optional[date]
+) -> tuple[datetime, datetime]:
+    """Явные даты (локальные дни целиком) имеют приоритет над period."""
+    if start_date is not None and end_date is not None:
+        if start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date must not be after end_date",
+            )
+        tz = TimeZoneService.DEFAULT_TIMEZONE
+        return (
+            tz.localize(datetime.combine(start_date, time.min)),
+            tz.localize(datetime.combine(end_date, time.max)),
+        )
+
+    if period not in VALID_PERIODS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid period. Valid: {VALID_PERIODS}",
+        )
+    return TimePeriod.to_datetime(period)
+
+
+@router.get("/export")
+async def export_report(
+    caller: MiniAppAdmin,
+    scope: ExportScope = Query(),
+    target_id: int = Query(),
+    granularity: ExportGranularity = Query(default=ExportGranularity.DAILY),
+    period: str = Query(default=TimePeriod.ONE_MONTH.value),
+    start_date: Optional[date] = Query(default=None),
+    end_date: Optional[date] = Query(default=None),
+    dc: Container = Depends(get_container),
+) -> StreamingResponse:
+    """Выгрузка в CSV по отслеживаемому чату или пользователю вызывающего админа."""
+    start, end = _resolve_period(period, start_date, end_date)
+
+    tracking_index = cast(TrackingIndexService, dc.resolve(TrackingIndexService))
+    admin_tg_id = caller.tg_id or ""
+    if scope == ExportScope.CHAT:
+        allowed_ids = await tracking_index.get_tracked_chat_ids(caller.id)
+    else:
+        allowed_ids = await tracking_index.get_tracked_user_ids(admin_tg_id)
+    if target_id not in allowed_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"{scope.value} {target_id} is not tracked by the caller",
+        )
+
+    dto = ReportExportDTO(
+        scope=scope,
+        target_id=target_id,
+        start_date=start,
+        end_date=end,
+        granularity=granularity,
+    )
+    uc = cast(ExportReportUseCase, dc.resolve(ExportReportUseCase))
+    filename = (
+        f"report_{scope.value}_{target_id}_{granularity.value}_"
+        f"{start:%Y%m%d}_{end:%Y%m%d}.csv"
+    )
+    logger.info(
+        "Выгрузка %s: admin=%s, %s=%d, %s — %s",
+        granularity.value,
+        admin_tg_id,
+        scope.value,
+        target_id,
+        start,
+        end,
+    )
+    return StreamingResponse(
+        uc.execute(dto),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,6 +1,6 @@
 """
 Эндпоинты модерации для Mini App.
-GET  /api/miniapp/moderation/log     — история действий (пагинация)
+GET  /api/miniapp/moderation/log     — история действий (keyset-пагинация по курсору)
 POST /api/miniapp/moderation/warn    — выдать предупреждение
 POST /api/miniapp/moderation/ban     — заблокировать пользователя
 """
@@ -14,6 +14,7 @@ from pydantic import BaseModel
 
 from api.dependencies.container import get_container
 from api.dependencies.miniapp import (
+    MiniAppCaller,
     TelegramInitData,
     tg_id_from_init_data,
     username_from_init_data,
@@ -21,8 +22,8 @@ from api.dependencies.miniapp import (
 from constants.punishment import PunishmentActions as Actions
 from dto.moderation import ModerationActionDTO
 from exceptions.base import BotBaseException
-from repositories import AdminActionLogRepository, UserRepository
 from repositories.chat_repository import ChatRepository
+from services.admin_action_log_service import AdminActionLogService
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -30,23 +31,31 @@ logger = logging.getLogger(__name__)
 
 @router.get("/moderation/log")
 async def get_moderation_log(
-    init_data: TelegramInitData,
-    page: int = Query(default=1, ge=1),
+    _: MiniAppCaller,
+    cursor: Optional[str] = Query(default=None, max_length=64),
+    backward: bool = Query(default=False),
     limit: int = Query(default=20, ge=1, le=100),
     dc: Container = Depends(get_container),
 ):
-    tg_id = tg_id_from_init_data(init_data)
-    user_repo = cast(UserRepository, dc.resolve(UserRepository))
-    log_repo = cast(AdminActionLogRepository, dc.resolve(AdminActionLogRepository))
-
-    caller = await user_repo.get_user_by_tg_id(tg_id=tg_id)
-    if not caller:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    """
+    Страница истории действий от новых к старым. cursor — next_cursor
+    (или prev_cursor вместе с backward=true) из предыдущего ответа.
+    total приблизительный: кешируется на короткое время.
+    """
+    log_service = cast(AdminActionLogService, dc.resolve(AdminActionLogService))
 
-    logs, total = await log_repo.get_logs_paginated(page=page, limit=limit)
+    try:
+        page = await log_service.get_logs_page(
+            limit=limit, cursor=cursor, backward=backward
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+    total = await log_service.count_logs()
 
     items = []
-    for log in logs:
+    for log in page.logs:
         items.append(
             {
                 "id": log.id,
@@ -58,7 +67,13 @@ async def get_moderation_log(
             }
         )
 
-    return {"items": items, "total": total, "page": page, "limit": limit}
+    return {
+        "items": items,
+        "total": total,
+        "limit": limit,
+        "next_cursor": page.next_cursor,
+        "prev_cursor": page.prev_cursor,
+    }
 
 
 class ModerationActionRequest(BaseModel):
@@ -72,19 +87,15 @@ class ModerationActionRequest(BaseModel):
 @router.post("/moderation/action")
 async def perform_moderation_action(
     body: ModerationActionRequest,
+    _: MiniAppCaller,
     init_data: TelegramInitData,
     dc: Container = Depends(get_container),
 ):
     tg_id = tg_id_from_init_data(init_data)
     username = username_from_init_data(init_data)
 
-    user_repo = cast(UserRepository, dc.resolve(UserRepository))
     chat_repo = cast(ChatRepository, dc.resolve(ChatRepository))
 
-    caller = await user_repo.get_user_by_tg_id(tg_id=tg_id)
-    if not caller:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
-
     chat = await chat_repo.get_chat_by_tg_id(chat_tg_id=body.chat_tgid)
     if not chat:
         raise HTTPException(
@@ -3,20 +3,30 @@
 GET /api/miniapp/stats             — сводные метрики за сегодня и за всё время.
 GET /api/miniapp/stats/activity    — активность по дням (messages + warns + bans).
 GET /api/miniapp/stats/moderators  — разбивка наказаний по модераторам за период.
+GET /api/miniapp/stats/chats/{chat_id}/today — лидерборд и активные за сегодня.
+
+Общие ответы одинаковы для всех пользователей Mini App, поэтому кешируются в
+Redis на MINIAPP_STATS_CACHE_TTL_SECONDS по параметрам запроса (без версии
+данных): опрос дашборда не нагружает Postgres.
+Сегодняшний лидерборд чата читается из живых счётчиков Redis и не кешируется.
 """
 
 import logging
-from datetime import datetime, timedelta
-from typing import cast
+from datetime import timedelta
+from typing import Any, cast
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from punq import Container
 
 from api.dependencies.container import get_container
-from api.dependencies.miniapp import TelegramInitData
+from api.dependencies.miniapp import MiniAppAdmin, TelegramInitData
+from api.dependencies.response_cache import cached_json_response
+from config import settings
 from constants.period import TimePeriod
 from repositories import MessageRepository, PunishmentRepository, UserRepository
+from services import TrackingIndexService
 from services.time_service import TimeZoneService
+from usecases.report import GetChatDayActivityUseCase
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -26,9 +36,21 @@ VALID_PERIODS = [p.value for p in TimePeriod if p != TimePeriod.CUSTOM]
 
 @router.get("/stats")
 async def get_stats(
+    request: Request,
     _: TelegramInitData,
     dc: Container = Depends(get_container),
 ):
+    return await cached_json_response(
+        request,
+        dc,
+        namespace="stats:summary",
+        params=[],
+        build=lambda: _build_stats(dc),
+        ttl_seconds=settings.MINIAPP_STATS_CACHE_TTL_SECONDS,
+    )
+
+
+async def _build_stats(dc: Container) -> dict[str, Any]:
     punishment_repo = cast(PunishmentRepository, dc.resolve(PunishmentRepository))
     user_repo = cast(UserRepository, dc.resolve(UserRepository))
 
@@ -37,33 +59,22 @@ async def get_stats(
     today_end = now.replace(hour=23, minute=59, second=59, microsecond=999999)
 
     moderators = await user_repo.get_all_moderators()
-    total_users = len(moderators)
-
-    today_actions = 0
-    total_actions = 0
-    for mod in moderators:
-        counts_today = await punishment_repo.get_punishment_counts_by_moderator(
-            moderator_id=mod.id,
-            start_date=today_start,
-            end_date=today_end,
-        )
-        counts_all = await punishment_repo.get_punishment_counts_by_moderator(
-            moderator_id=mod.id,
-            start_date=datetime(2000, 1, 1),
-            end_date=today_end,
-        )
-        today_actions += counts_today.get("warns", 0) + counts_today.get("bans", 0)
-        total_actions += counts_all.get("warns", 0) + counts_all.get("bans", 0)
+    counts_by_id = await punishment_repo.get_action_counts_by_moderators(
+        moderator_ids=[mod.id for mod in moderators],
+        today_start=today_start,
+        end_date=today_end,
+    )
 
     return {
-        "active_users": total_users,
-        "moderation_actions": total_actions,
-        "today_actions": today_actions,
+        "active_users": len(moderators),
+        "moderation_actions": sum(c["total"] for c in counts_by_id.values()),
+        "today_actions": sum(c["today"] for c in counts_by_id.values()),
     }
 
 
 @router.get("/stats/activity")
 async def get_activity(
+    request: Request,
     _: TelegramInitData,
     days_count: int = Query(default=7, ge=7, le=30, alias="days"),
     dc: Container = Depends(get_container),
@@ -72,6 +83,17 @@ async def get_activity(
     Активность по дням: количество сообщений, варнов и банов за каждый день.
     Параметр days: глубина в днях (от 7 до 30, по умолчанию 7).
     """
+    return await cached_json_response(
+        request,
+        dc,
+        namespace="stats:activity",
+        params=[days_count],
+        build=lambda: _build_activity(dc, days_count),
+        ttl_seconds=settings.MINIAPP_STATS_CACHE_TTL_SECONDS,
+    )
+
+
+async def _build_activity(dc: Container, days_count: int) -> dict[str, Any]:
     msg_repo = cast(MessageRepository, dc.resolve(MessageRepository))
     punishment_repo = cast(PunishmentRepository, dc.resolve(PunishmentRepository))
 
@@ -88,30 +110,28 @@ async def get_activity(
     except Exception:
         daily_punishments = {}
 
+    try:
+        daily_messages = await msg_repo.count_messages_by_day(
+            start=period_start,
+            end=period_end,
+            tz_name=settings.TIMEZONE,
+        )
+    except Exception:
+        daily_messages = {}
+
     day_names = ["Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс"]
     result = []
 
     for i in range(days_count - 1, -1, -1):
         day = now - timedelta(days=i)
-        day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-        day_end = day.replace(hour=23, minute=59, second=59, microsecond=999999)
         date_str = day.strftime("%Y-%m-%d")
-
-        try:
-            messages = await msg_repo.count_messages_by_date_range(
-                start=day_start,
-                end=day_end,
-            )
-        except Exception:
-            messages = 0
-
         punishments = daily_punishments.get(date_str, {"warns": 0, "bans": 0})
 
         result.append(
             {
                 "day": day_names[day.weekday()],
                 "date": date_str,
-                "messages": messages,
+                "messages": daily_messages.get(date_str, 0),
                 "warns": punishments["warns"],
                 "bans": punishments["bans"],
             }
@@ -122,6 +142,7 @@ async def get_activity(
 
 @router.get("/stats/moderators")
 async def get_moderators_stats(
+    request: Request,
     _: TelegramInitData,
     period: str = Query(default="За сегодня"),
     dc: Container = Depends(get_container),
@@ -131,13 +152,22 @@ async def get_moderators_stats(
     Используется для pie chart / bar chart «кто сколько сделал».
     """
     if period not in VALID_PERIODS:
-        from fastapi import HTTPException, status
-
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid period. Valid: {VALID_PERIODS}",
         )
 
+    return await cached_json_response(
+        request,
+        dc,
+        namespace="stats:moderators",
+        params=[period],
+        build=lambda: _build_moderators_stats(dc, period),
+        ttl_seconds=settings.MINIAPP_STATS_CACHE_TTL_SECONDS,
+    )
+
+
+async def _build_moderators_stats(dc: Container, period: str) -> dict[str, Any]:
     start_date, end_date = TimePeriod.to_datetime(period)
 
     punishment_repo = cast(PunishmentRepository, dc.resolve(PunishmentRepository))
@@ -172,3 +202,34 @@ async def get_moderators_stats(
     result.sort(key=lambda x: x["total"], reverse=True)
 
     return {"moderators": result, "period": period}
+
+
+@router.get("/stats/chats/{chat_id}/today")
+async def get_chat_today(
+    chat_id: int,
+    caller: MiniAppAdmin,
+    limit: int = Query(default=10, ge=1, le=50),
+    dc: Container = Depends(get_container),
+):
+    """
+    Топ по сообщениям и число активных пользователей чата за сегодня.
+    Доступно только админу и только для чатов, к которым у него есть доступ.
+    """
+    tracking_index = cast(TrackingIndexService, dc.resolve(TrackingIndexService))
+    tracked_chat_ids = await tracking_index.get_tracked_chat_ids(caller.id)
+    if chat_id not in tracked_chat_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"chat {chat_id} is not tracked by the caller",
+        )
+
+    usecase = cast(GetChatDayActivityUseCase, dc.resolve(GetChatDayActivityUseCase))
+    activity = await usecase.execute(chat_id=chat_id, limit=limit)
+
+    return {
+        "chat_id": activity.chat_id,
+        "date": activity.day.isoformat(),
+        "top_users": [u.model_dump() for u in activity.top_users],
+        "active_users": activity.active_users_count,
+        "live": activity.live,
+    }
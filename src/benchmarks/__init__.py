@@ -0,0 +1,15 @@
+"""
+Бенчмарки горячих путей и генератор синтетических данных.
+
+- datagen — детерминированный генератор мультичатовых данных за несколько
+  месяцев (сообщения, ответы, реакции, наказания, шаблоны) и загрузка их
+  в локальные Postgres/Redis: python -m benchmarks.datagen
+- cases — сценарии замеров (отчёты, перерывы, буфер аналитики, массовая
+  вставка, поиск шаблонов).
+- runner — прогон сценариев и, по --compare, сравнение с baseline,
+  записанным на этой же машине: python -m benchmarks
+- load — нагрузочный прогон апдейтов через настоящий Dispatcher с сессией
+  Bot без сети и воркером аналитики: python -m benchmarks.load
+
+Запуск из src/.
+"""
@@ -0,0 +1,8 @@
+import asyncio
+import logging
+import sys
+
+from .runner import main
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+sys.exit(asyncio.run(main()))
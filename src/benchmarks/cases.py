@@ -0,0 +1,337 @@
+"""
+Сценарии бенчмарков горячих путей.
+
+Каждый сценарий — async-функция подготовки, которая по набору данных строит
+Workload: вызываемый объект (замеряется) и необязательную очистку. Сценарии
+с requires выполняются, только если раннер подключил нужный бэкенд
+("postgres" — загруженный набор в dev-базе, "redis" — отдельная база Redis).
+"""
+
+import inspect
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from redis.asyncio import Redis
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import asyncpg, insert
+
+from database.session import DatabaseContextManager
+from dto.buffer import BufferedMessageDTO
+from models import ChatMessage, ChatSession, MessageReaction, MessageTemplate
+from models.base import Base
+from repositories import MessageRepository
+from services.analytics_buffer_service import AnalyticsBufferService
+from services.break_analysis_service import BreakAnalysisService
+from services.templates.search_index import TemplateSearchIndex
+from services.time_service import TimeZoneService
+from usecases.report.base import BaseReportUseCase
+
+from .datagen import Row, SyntheticDataset, buffered_messages
+
+M = TypeVar("M", bound=Base)
+
+# Размер пачки, как у воркера аналитики
+BULK_SIZE = 1000
+BUFFER_MESSAGES = 2000
+TEMPLATE_QUERIES = [
+    "пр",
+    "воз",
+    "дост",
+    "оплата заказа",
+    "кур",
+    "ата",
+    "vip",
+    "жалоба клиента кратко",
+    "обмен товара 1",
+    "несуществующий",
+]
+
+
+class SkipCase(Exception):
+    """Сценарий нельзя выполнить в текущем окружении."""
+
+
+@dataclass
+class Workload:
+    run: Callable[[], Any]
+    teardown: Optional[Callable[[], Awaitable[None]]] = None
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.run)
+
+
+@dataclass
+class BenchContext:
+    dataset: SyntheticDataset
+    db: Optional[DatabaseContextManager] = None
+    redis: Optional[Redis] = None
+
+    def available(self) -> FrozenSet[str]:
+        backends = set()
+        if self.db is not None:
+            backends.add("postgres")
+        if self.redis is not None:
+            backends.add("redis")
+        return frozenset(backends)
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    setup: Callable[[BenchContext], Awaitable[Workload]]
+    requires: FrozenSet[str] = field(default_factory=frozenset)
+
+
+CASES: List[BenchmarkCase] = []
+
+
+def benchmark(
+    name: str, requires: Sequence[str] = ()
+) -> Callable[
+    [Callable[[BenchContext], Awaitable[Workload]]],
+    Callable[[BenchContext], Awaitable[Workload]],
+]:
+    """Регистрирует сценарий в CASES."""
+
+    def decorator(
+        setup: Callable[[BenchContext], Awaitable[Workload]],
+    ) -> Callable[[BenchContext], Awaitable[Workload]]:
+        CASES.append(BenchmarkCase(name, setup, frozenset(requires)))
+        return setup
+
+    return decorator
+
+
+class _ReportUseCase(BaseReportUseCase):
+    """Отчёт без репозиториев: нужны только методы расчёта базового класса."""
+
+    def __init__(self) -> None:
+        super().__init__(None, None, None, None, None, None)  # type: ignore[arg-type]
+
+    async def execute(self, dto: Any) -> None:
+        return None
+
+
+def _models(model: Type[M], rows: List[Row]) -> List[M]:
+    return [model(**row) for row in rows]
+
+
+def _busiest_user(dataset: SyntheticDataset) -> Tuple[List[Row], List[Row]]:
+    """Сообщения и реакции самого активного пользователя (отчёт за период)."""
+    counts: Dict[int, int] = defaultdict(int)
+    for row in dataset.messages:
+        counts[row["user_id"]] += 1
+    user_id = max(counts, key=lambda u: (counts[u], -u))
+    return (
+        [row for row in dataset.messages if row["user_id"] == user_id],
+        [row for row in dataset.reactions if row["user_id"] == user_id],
+    )
+
+
+def _by_local_day(items: List[Any]) -> Dict[date, List[Any]]:
+    days: Dict[date, List[Any]] = defaultdict(list)
+    for item in items:
+        days[item.created_at.date()].append(item)
+    return days
+
+
+@benchmark("report.process_items")
+async def process_items(ctx: BenchContext) -> Workload:
+    messages, _ = _busiest_user(ctx.dataset)
+    items = _models(ChatMessage, messages)
+    usecase = _ReportUseCase()
+    return Workload(lambda: usecase._process_items(items))
+
+
+@benchmark("report.calculate_day_stats")
+async def calculate_day_stats(ctx: BenchContext) -> Workload:
+    messages, reactions = _busiest_user(ctx.dataset)
+    messages_by_day = _by_local_day(_models(ChatMessage, messages))
+    reactions_by_day = _by_local_day(_models(MessageReaction, reactions))
+    tz = TimeZoneService.DEFAULT_TIMEZONE
+    days = [
+        (
+            messages_by_day[day],
+            reactions_by_day.get(day, []),
+            tz.localize(datetime.combine(day, time.min)),
+            tz.localize(datetime.combine(day, time.max)),
+        )
+        for day in sorted(messages_by_day)
+    ]
+    usecase = _ReportUseCase()
+
+    def run() -> None:
+        for day_messages, day_reactions, start, end in days:
+            usecase._calculate_day_stats(day_messages, day_reactions, start, end)
+
+    return Workload(run)
+
+
+@benchmark("breaks.calculate_breaks")
+async def calculate_breaks(ctx: BenchContext) -> Workload:
+    messages, reactions = _busiest_user(ctx.dataset)
+    message_models = _models(ChatMessage, messages)
+    reaction_models = _models(MessageReaction, reactions)
+    return Workload(
+        lambda: BreakAnalysisService.calculate_breaks(message_models, reaction_models)
+    )
+
+
+@benchmark("buffer.serialize")
+async def buffer_serialize(ctx: BenchContext) -> Workload:
+    """Сериализация пачки буфера без сети (доля CPU в push/drain)."""
+    dtos = buffered_messages(ctx.dataset.messages[:BUFFER_MESSAGES])
+
+    def run() -> None:
+        for dto in dtos:
+            payload = dto.model_dump_json().encode("utf-8")
+            BufferedMessageDTO.model_validate_json(payload.decode("utf-8"))
+
+    return Workload(run)
+
+
+@benchmark("buffer.push_drain", requires=["redis"])
+async def buffer_push_drain(ctx: BenchContext) -> Workload:
+    """Запись сообщений в буфер (с живыми счётчиками) и вычитка пачками."""
+    redis = ctx.redis
+    assert redis is not None
+    if await redis.llen(AnalyticsBufferService.REDIS_KEY_MESSAGES):
+        raise SkipCase("буфер сообщений в этой базе Redis не пуст")
+
+    dtos = buffered_messages(ctx.dataset.messages[:BUFFER_MESSAGES])
+    chat_ids = {dto.chat_id for dto in dtos}
+    buffer_service = AnalyticsBufferService(redis_client=redis)
+
+    async def run() -> None:
+        for dto in dtos:
+            await buffer_service.add_message(dto)
+        while batch := await buffer_service.pop_messages(BULK_SIZE):
+            await buffer_service.trim_messages(len(batch))
+
+    async def teardown() -> None:
+        keys = []
+        for chat_id in chat_ids:
+            keys += [key async for key in redis.scan_iter(match=f"live:*:{chat_id}:*")]
+        if keys:
+            await redis.delete(*keys)
+
+    return Workload(run, teardown)
+
+
+@benchmark("repo.bulk_upsert_compile")
+async def bulk_upsert_compile(ctx: BenchContext) -> Workload:
+    """Построение INSERT ... ON CONFLICT DO NOTHING на пачку (без БД)."""
+    mappings = [
+        {key: row[key] for key in row if key != "id"}
+        for row in ctx.dataset.messages[:BULK_SIZE]
+    ]
+    dialect = asyncpg.dialect()
+
+    def run() -> None:
+        stmt = (
+            insert(ChatMessage.__table__).values(mappings).on_conflict_do_nothing()  # type: ignore[arg-type]
+        )
+        stmt.compile(dialect=dialect)
+
+    return Workload(run)
+
+
+@benchmark("repo.bulk_upsert", requires=["postgres"])
+async def bulk_upsert(ctx: BenchContext) -> Workload:
+    """MessageRepository.bulk_create_messages на загруженном наборе."""
+    db = ctx.db
+    assert db is not None
+    chat_id = ctx.dataset.chats[0]["id"]
+    async with db.session() as session:
+        exists = await session.scalar(
+            select(ChatSession.id).where(ChatSession.id == chat_id)
+        )
+    if exists is None:
+        raise SkipCase(
+            "набор не загружен: python -m benchmarks.datagen --target postgres"
+        )
+
+    repository = MessageRepository(db)
+    template = buffered_messages(ctx.dataset.messages[:BULK_SIZE])
+    rounds = iter(range(1_000_000))
+
+    async def run() -> None:
+        n = next(rounds)
+        await repository.bulk_create_messages(
+            [
+                dto.model_copy(
+                    update={"chat_id": chat_id, "message_id": f"bench-{n}-{i}"}
+                )
+                for i, dto in enumerate(template)
+            ]
+        )
+
+    async def teardown() -> None:
+        async with db.session() as session:
+            await session.execute(
+                delete(ChatMessage).where(ChatMessage.message_id.like("bench-%"))
+            )
+            await session.commit()
+
+    return Workload(run, teardown)
+
+
+class _TemplateRows:
+    """Источник шаблонов для индекса поиска вместо MessageTemplateRepository."""
+
+    def __init__(self, templates: List[MessageTemplate]) -> None:
+        self._templates = templates
+
+    async def get_templates_for_search_index(self, limit: int) -> List[MessageTemplate]:
+        return self._templates[:limit]
+
+
+def _search_index(ctx: BenchContext) -> TemplateSearchIndex:
+    templates = _models(MessageTemplate, ctx.dataset.templates)
+    return TemplateSearchIndex(
+        _TemplateRows(templates),  # type: ignore[arg-type]
+        max_entries=max(len(templates), 1),
+    )
+
+
+@benchmark("templates.search_index_build")
+async def templates_index_build(ctx: BenchContext) -> Workload:
+    index = _search_index(ctx)
+
+    async def run() -> None:
+        index.invalidate()
+        await index.search("")
+
+    return Workload(run)
+
+
+@benchmark("templates.search")
+async def templates_search(ctx: BenchContext) -> Workload:
+    index = _search_index(ctx)
+    await index.search("")
+
+    async def run() -> None:
+        for query in TEMPLATE_QUERIES:
+            await index.search(query)
+
+    return Workload(run)
+
+
+def select_cases(pattern: Optional[str] = None) -> List[BenchmarkCase]:
+    """Сценарии, в имени которых есть pattern."""
+    return [case for case in CASES if not pattern or pattern in case.name]
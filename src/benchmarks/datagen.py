@@ -0,0 +1,640 @@
+"""
+Детерминированный генератор синтетических данных для бенчмарков.
+
+Генерирует мультичатовые данные за несколько месяцев: пользователей, чаты,
+сообщения (с ответами), реакции, наказания и шаблоны. Один и тот же seed и
+масштаб всегда дают одинаковые строки, включая id, поэтому повторная загрузка
+ничего не дублирует (ON CONFLICT DO NOTHING).
+
+Активность похожа на реальную: смены с 10:00 до 22:00 с перерывами, разная
+интенсивность у разных пользователей, меньше сообщений в выходные, ответы
+на свежие сообщения коллег, реакции через несколько минут.
+
+Запуск из src/:
+    python -m benchmarks.datagen --scale medium                  # только объёмы
+    python -m benchmarks.datagen --scale medium --target postgres
+    python -m benchmarks.datagen --scale small --target redis --redis-db 15
+
+Загрузка в Postgres разрешена только при IS_DEVELOPMENT=True.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple, cast
+
+from sqlalchemy import Table, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from constants.enums import ReactionAction, UserRole
+from constants.punishment import PunishmentType
+from constants.work_time import END_TIME, START_TIME
+from database.session import DatabaseContextManager
+from dto.buffer import BufferedMessageDTO, BufferedMessageReplyDTO, BufferedReactionDTO
+from models import (
+    AdminChatAccess,
+    ChatMessage,
+    ChatSession,
+    MessageReaction,
+    MessageReply,
+    MessageTemplate,
+    Punishment,
+    User,
+)
+from models.associations import admin_user_tracking
+from models.base import Base
+from models.message import MessageType
+from services.analytics_buffer_service import AnalyticsBufferService
+from services.time_service import TimeZoneService
+
+logger = logging.getLogger(__name__)
+
+Row = Dict[str, Any]
+
+
+def _table(model: type[Base]) -> Table:
+    """Таблица модели (в стабах SQLAlchemy __table__ описан как FromClause)."""
+    return cast(Table, model.__table__)
+
+
+_PHRASES = [
+    "Добрый день, заказ передан на сборку",
+    "Клиент просит перезвонить после обеда",
+    "Проверьте, пожалуйста, статус оплаты",
+    "Возврат оформлен, деньги придут в течение трёх дней",
+    "Уточните адрес доставки у покупателя",
+    "Принято, беру в работу",
+    "Сейчас посмотрю",
+    "Спасибо!",
+    "Ок",
+    "Товара нет на складе, предложил замену",
+    "Кто может подменить на час?",
+    "Ушёл на перерыв",
+    "Вернулся",
+    "Жалоба передана старшему смены",
+    "Промокод не применяется, клиент прислал скриншот",
+]
+_EMOJIS = ["👍", "❤", "🔥", "👌", "😁", "🙏", "👀", "✍"]
+_TEMPLATE_TOPICS = [
+    "приветствие",
+    "правила чата",
+    "оплата заказа",
+    "возврат средств",
+    "доставка курьером",
+    "самовывоз",
+    "смена адреса",
+    "промокод",
+    "гарантия",
+    "обмен товара",
+    "статус заказа",
+    "жалоба клиента",
+]
+_TEMPLATE_VARIANTS = ["кратко", "подробно", "вежливо", "для новичков", "vip", "ночью"]
+
+# Время ответа коллеге ищется среди последних сообщений дня
+_REPLY_WINDOW = 20
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Масштаб и форма набора данных."""
+
+    chats: int = 3
+    users_per_chat: int = 10
+    days: int = 30
+    # Среднее число сообщений пользователя за рабочий день
+    messages_per_user_day: int = 40
+    reply_ratio: float = 0.3
+    reaction_ratio: float = 0.5
+    # Доля сообщений, после которых автор получает наказание
+    punishment_ratio: float = 0.002
+    templates: int = 500
+    seed: int = 42
+    # Последний день набора: фиксирован, чтобы данные не зависели от даты запуска
+    end_date: date = date(2026, 1, 31)
+    # Смещение id, чтобы не пересекаться с данными dev-базы
+    id_offset: int = 1_000_000
+
+
+SCALES: Dict[str, DatasetSpec] = {
+    "tiny": DatasetSpec(
+        chats=1, users_per_chat=3, days=2, messages_per_user_day=10, templates=50
+    ),
+    "small": DatasetSpec(),
+    "medium": DatasetSpec(
+        chats=10, users_per_chat=30, days=90, messages_per_user_day=60, templates=2000
+    ),
+    "large": DatasetSpec(
+        chats=40, users_per_chat=50, days=180, messages_per_user_day=60, templates=5000
+    ),
+}
+
+
+@dataclass
+class DayBatch:
+    """Строки одного чата за один день (в порядке вставки)."""
+
+    chat_id: int
+    day: date
+    messages: List[Row] = field(default_factory=list)
+    replies: List[Row] = field(default_factory=list)
+    reactions: List[Row] = field(default_factory=list)
+    punishments: List[Row] = field(default_factory=list)
+
+    def tables(self) -> List[Tuple[Table, List[Row]]]:
+        return [
+            (_table(ChatMessage), self.messages),
+            (_table(MessageReply), self.replies),
+            (_table(MessageReaction), self.reactions),
+            (_table(Punishment), self.punishments),
+        ]
+
+
+@dataclass
+class SyntheticDataset:
+    """Набор данных целиком (для бенчмарков в памяти)."""
+
+    spec: DatasetSpec
+    users: List[Row]
+    chats: List[Row]
+    templates: List[Row]
+    messages: List[Row] = field(default_factory=list)
+    replies: List[Row] = field(default_factory=list)
+    reactions: List[Row] = field(default_factory=list)
+    punishments: List[Row] = field(default_factory=list)
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "users": len(self.users),
+            "chats": len(self.chats),
+            "templates": len(self.templates),
+            "messages": len(self.messages),
+            "replies": len(self.replies),
+            "reactions": len(self.reactions),
+            "punishments": len(self.punishments),
+        }
+
+
+class SyntheticDataGenerator:
+    """
+    Генератор строк для таблиц users, chat_sessions, chat_messages,
+    message_replies, message_reactions, punishments и message_templates.
+
+    Строки — словари колонок: их можно вставить как есть или превратить
+    в модели (ChatMessage(**row)). Случайность каждого чата-дня зависит
+    только от seed, номера чата и даты.
+    """
+
+    def __init__(self, spec: DatasetSpec) -> None:
+        self.spec = spec
+        self._tz = TimeZoneService.DEFAULT_TIMEZONE
+
+    @property
+    def admin_id(self) -> int:
+        return self.spec.id_offset + 1
+
+    def chat_id(self, chat_index: int) -> int:
+        return self.spec.id_offset + 1 + chat_index
+
+    def members(self, chat_index: int) -> List[int]:
+        """id пользователей чата."""
+        first = self.spec.id_offset + 2 + chat_index * self.spec.users_per_chat
+        return list(range(first, first + self.spec.users_per_chat))
+
+    def days(self) -> List[date]:
+        start = self.spec.end_date - timedelta(days=self.spec.days - 1)
+        return [start + timedelta(days=i) for i in range(self.spec.days)]
+
+    def users(self) -> List[Row]:
+        rows = [self._user(self.admin_id, UserRole.ADMIN)]
+        for chat_index in range(self.spec.chats):
+            rows.extend(
+                self._user(u, UserRole.MODERATOR) for u in self.members(chat_index)
+            )
+        return rows
+
+    def chats(self) -> List[Row]:
+        return [
+            {
+                "id": self.chat_id(i),
+                "chat_id": f"-100{7_000_000_000 + self.chat_id(i)}",
+                "title": f"Смена #{i + 1}",
+                "created_at": self._at(self.days()[0], time.min),
+            }
+            for i in range(self.spec.chats)
+        ]
+
+    def admin_tracking(self) -> List[Row]:
+        """Админ отслеживает всех пользователей (как в отчётах)."""
+        return [
+            {"admin_id": self.admin_id, "tracked_user_id": user["id"]}
+            for user in self.users()[1:]
+        ]
+
+    def chat_access(self) -> List[Row]:
+        return [
+            {
+                "id": self.chat_id(i),
+                "admin_id": self.admin_id,
+                "chat_id": self.chat_id(i),
+                "is_source": True,
+                "is_target": True,
+            }
+            for i in range(self.spec.chats)
+        ]
+
+    def templates(self) -> List[Row]:
+        rng = random.Random(f"{self.spec.seed}:templates")
+        rows = []
+        for i in range(self.spec.templates):
+            topic = rng.choice(_TEMPLATE_TOPICS)
+            variant = rng.choice(_TEMPLATE_VARIANTS)
+            rows.append(
+                {
+                    "id": self.spec.id_offset + 1 + i,
+                    "title": f"{topic.capitalize()} {variant} {i + 1}",
+                    "content": f"Шаблон «{topic}»: {rng.choice(_PHRASES)}",
+                    "author_id": self.admin_id,
+                    "chat_id": (
+                        self.chat_id(rng.randrange(self.spec.chats))
+                        if self.spec.chats and rng.random() < 0.3
+                        else None
+                    ),
+                    "usage_count": int(rng.paretovariate(1.2)) - 1,
+                }
+            )
+        return rows
+
+    def iter_days(self) -> Iterator[DayBatch]:
+        """Строки по чатам и дням; id сквозные в порядке обхода."""
+        counters: Counter[str] = Counter()
+        for chat_index in range(self.spec.chats):
+            tg_message_id = 0
+            steps: Dict[int, int] = defaultdict(int)
+            for day in self.days():
+                batch, tg_message_id = self._day(
+                    chat_index, day, tg_message_id, steps, counters
+                )
+                yield batch
+
+    def build(self) -> SyntheticDataset:
+        dataset = SyntheticDataset(
+            spec=self.spec,
+            users=self.users(),
+            chats=self.chats(),
+            templates=self.templates(),
+        )
+        for batch in self.iter_days():
+            dataset.messages.extend(batch.messages)
+            dataset.replies.extend(batch.replies)
+            dataset.reactions.extend(batch.reactions)
+            dataset.punishments.extend(batch.punishments)
+        return dataset
+
+    def _user(self, user_id: int, role: UserRole) -> Row:
+        return {
+            "id": user_id,
+            "tg_id": str(8_000_000_000 + user_id),
+            "username": f"user_{user_id - self.spec.id_offset}",
+            "role": role,
+            "is_active": True,
+            "language": "ru",
+            "created_at": self._at(self.days()[0], time.min),
+        }
+
+    def _at(self, day: date, moment: time) -> datetime:
+        return cast(datetime, self._tz.localize(datetime.combine(day, moment)))
+
+    def _next_id(self, counters: Counter[str], table: str) -> int:
+        counters[table] += 1
+        return self.spec.id_offset + counters[table]
+
+    def _shift_times(self, rng: random.Random, day: date, count: int) -> List[datetime]:
+        """Моменты сообщений за смену: пуассоновский поток с перерывами."""
+        if count <= 0:
+            return []
+        day_start = self._at(day, time.min)
+        start = START_TIME.hour * 3600 + rng.uniform(-20, 40) * 60
+        end = END_TIME.hour * 3600 - rng.uniform(0, 4) * 3600
+        mean_gap = (end - start) / count
+        moments: List[datetime] = []
+        moment = start
+        while len(moments) < count:
+            gap = rng.expovariate(1 / mean_gap)
+            if rng.random() < 0.03:
+                gap += rng.uniform(15, 60) * 60
+            moment += gap
+            if moment >= end:
+                break
+            moments.append(day_start + timedelta(seconds=moment))
+        return moments
+
+    def _day(
+        self,
+        chat_index: int,
+        day: date,
+        tg_message_id: int,
+        steps: Dict[int, int],
+        counters: Counter[str],
+    ) -> Tuple[DayBatch, int]:
+        spec = self.spec
+        rng = random.Random(f"{spec.seed}:{chat_index}:{day.isoformat()}")
+        chat_id = self.chat_id(chat_index)
+        chat_url = f"https://t.me/c/{7_000_000_000 + chat_id}"
+        members = self.members(chat_index)
+        weekend = day.weekday() >= 5
+
+        events: List[Tuple[datetime, int]] = []
+        for user_id in members:
+            weight = random.Random(f"{spec.seed}:user:{user_id}").lognormvariate(0, 0.6)
+            if rng.random() < (0.75 if weekend else 0.05):
+                continue
+            mean = spec.messages_per_user_day * weight / (3 if weekend else 1)
+            count = max(0, round(rng.gauss(mean, mean * 0.3)))
+            events.extend((m, user_id) for m in self._shift_times(rng, day, count))
+        events.sort()
+
+        batch = DayBatch(chat_id=chat_id, day=day)
+        for created_at, user_id in events:
+            tg_message_id += 1
+            message_db_id = self._next_id(counters, "messages")
+            message_type = MessageType.MESSAGE.value
+
+            recent = [
+                m for m in batch.messages[-_REPLY_WINDOW:] if m["user_id"] != user_id
+            ]
+            if recent and rng.random() < spec.reply_ratio:
+                original = rng.choice(recent)
+                message_type = MessageType.REPLY.value
+                batch.replies.append(
+                    {
+                        "id": self._next_id(counters, "replies"),
+                        "chat_id": chat_id,
+                        "original_message_url": f"{chat_url}/{original['message_id']}",
+                        "reply_message_id": message_db_id,
+                        "reply_user_id": user_id,
+                        "response_time_seconds": int(
+                            (created_at - original["created_at"]).total_seconds()
+                        ),
+                        "created_at": created_at,
+                    }
+                )
+
+            batch.messages.append(
+                {
+                    "id": message_db_id,
+                    "chat_id": chat_id,
+                    "user_id": user_id,
+                    "message_id": str(tg_message_id),
+                    "message_type": message_type,
+                    "content_type": "text",
+                    "text": rng.choice(_PHRASES),
+                    "created_at": created_at,
+                }
+            )
+
+            if len(members) > 1 and rng.random() < spec.reaction_ratio:
+                reactor = rng.choice([m for m in members if m != user_id])
+                batch.reactions.append(
+                    {
+                        "id": self._next_id(counters, "reactions"),
+                        "chat_id": chat_id,
+                        "user_id": reactor,
+                        "message_id": str(tg_message_id),
+                        "action": (
+                            ReactionAction.ADDED
+                            if rng.random() < 0.9
+                            else ReactionAction.CHANGED
+                        ),
+                        "emoji": rng.choice(_EMOJIS),
+                        "message_url": f"{chat_url}/{tg_message_id}",
+                        "created_at": created_at
+                        + timedelta(seconds=rng.expovariate(1 / 120)),
+                    }
+                )
+
+            if rng.random() < spec.punishment_ratio:
+                steps[user_id] = min(steps[user_id] + 1, 3)
+                punishment_type = [
+                    PunishmentType.WARNING,
+                    PunishmentType.MUTE,
+                    PunishmentType.BAN,
+                ][steps[user_id] - 1]
+                batch.punishments.append(
+                    {
+                        "id": self._next_id(counters, "punishments"),
+                        "user_id": user_id,
+                        "step": steps[user_id],
+                        "punishment_type": punishment_type,
+                        "duration_seconds": (
+                            3600 if punishment_type == PunishmentType.MUTE else None
+                        ),
+                        "punished_by_id": self.admin_id,
+                        "chat_id": chat_id,
+                        "created_at": created_at + timedelta(seconds=60),
+                    }
+                )
+        return batch, tg_message_id
+
+
+def buffered_messages(messages: List[Row]) -> List[BufferedMessageDTO]:
+    return [
+        BufferedMessageDTO(
+            chat_id=row["chat_id"],
+            user_id=row["user_id"],
+            message_id=row["message_id"],
+            message_type=row["message_type"],
+            content_type=row["content_type"],
+            text=row["text"],
+            created_at=row["created_at"],
+        )
+        for row in messages
+    ]
+
+
+async def _insert(session: AsyncSession, table: Table, rows: List[Row]) -> None:
+    if rows:
+        await session.execute(insert(table).on_conflict_do_nothing(), rows)
+
+
+async def load_postgres(
+    generator: SyntheticDataGenerator,
+    db: DatabaseContextManager,
+    chunk_size: int = 20_000,
+) -> Counter[str]:
+    """Загружает набор в Postgres пачками; повторная загрузка не дублирует строки."""
+    loaded: Counter[str] = Counter()
+    async with db.session() as session:
+        for table, rows in (
+            (_table(User), generator.users()),
+            (_table(ChatSession), generator.chats()),
+            (admin_user_tracking, generator.admin_tracking()),
+            (_table(AdminChatAccess), generator.chat_access()),
+            (_table(MessageTemplate), generator.templates()),
+        ):
+            await _insert(session, table, rows)
+            loaded[table.name] += len(rows)
+        await session.commit()
+
+        pending: Dict[Table, List[Row]] = defaultdict(list)
+
+        async def flush() -> None:
+            # Порядок важен: ответы ссылаются на сообщения
+            for table, rows in pending.items():
+                await _insert(session, table, rows)
+                loaded[table.name] += len(rows)
+            await session.commit()
+            pending.clear()
+            logger.info("Загружено сообщений: %d", loaded["chat_messages"])
+
+        for batch in generator.iter_days():
+            for table, rows in batch.tables():
+                pending[table].extend(rows)
+            if len(pending[_table(ChatMessage)]) >= chunk_size:
+                await flush()
+        await flush()
+
+        # id заданы явно, поэтому последовательности нужно сдвинуть вручную
+        for model in (
+            User,
+            ChatSession,
+            AdminChatAccess,
+            MessageTemplate,
+            ChatMessage,
+            MessageReply,
+            MessageReaction,
+            Punishment,
+        ):
+            table_name = model.__tablename__
+            await session.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), "
+                    f"(SELECT MAX(id) FROM {table_name}))"
+                )
+            )
+        await session.commit()
+    return loaded
+
+
+async def load_redis(
+    generator: SyntheticDataGenerator,
+    buffer_service: AnalyticsBufferService,
+    days: int = 1,
+) -> Counter[str]:
+    """
+    Кладёт последние days дней набора в буфер аналитики, как это делает бот:
+    воркер аналитики затем перенесёт их в Postgres.
+    """
+    first_day = generator.spec.end_date - timedelta(days=days - 1)
+    usernames = {user["id"]: user["username"] for user in generator.users()}
+    loaded: Counter[str] = Counter()
+    for batch in generator.iter_days():
+        if batch.day < first_day:
+            continue
+        tg_ids = {row["id"]: row["message_id"] for row in batch.messages}
+        for dto in buffered_messages(batch.messages):
+            await buffer_service.add_message(dto, username=usernames[dto.user_id])
+        for row in batch.reactions:
+            await buffer_service.add_reaction(
+                BufferedReactionDTO(
+                    chat_id=row["chat_id"],
+                    user_id=row["user_id"],
+                    message_id=row["message_id"],
+                    action=row["action"].value,
+                    emoji=row["emoji"],
+                    message_url=row["message_url"],
+                    created_at=row["created_at"],
+                )
+            )
+        for row in batch.replies:
+            await buffer_service.add_reply(
+                BufferedMessageReplyDTO(
+                    chat_id=row["chat_id"],
+                    original_message_url=row["original_message_url"],
+                    reply_message_id_str=tg_ids[row["reply_message_id"]],
+                    reply_user_id=row["reply_user_id"],
+                    response_time_seconds=row["response_time_seconds"],
+                    created_at=row["created_at"],
+                )
+            )
+        loaded["messages"] += len(batch.messages)
+        loaded["reactions"] += len(batch.reactions)
+        loaded["replies"] += len(batch.replies)
+    return loaded
+
+
+def _summary(generator: SyntheticDataGenerator) -> Counter[str]:
+    counts: Counter[str] = Counter(
+        users=len(generator.users()),
+        chats=generator.spec.chats,
+        templates=generator.spec.templates,
+    )
+    for batch in generator.iter_days():
+        for table, rows in batch.tables():
+            counts[table.name] += len(rows)
+    return counts
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Генератор синтетических данных для бенчмарков"
+    )
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--target", choices=["summary", "postgres", "redis"], default="summary"
+    )
+    parser.add_argument("--redis-db", type=int, default=None)
+    parser.add_argument(
+        "--buffer-days", type=int, default=1, help="сколько последних дней в буфер"
+    )
+    args = parser.parse_args(argv)
+
+    spec = SCALES[args.scale]
+    if args.seed is not None:
+        spec = DatasetSpec(**{**spec.__dict__, "seed": args.seed})
+    generator = SyntheticDataGenerator(spec)
+
+    if args.target == "summary":
+        counts = _summary(generator)
+    elif args.target == "postgres":
+        from config import settings
+        from database.session import async_session
+
+        if not settings.IS_DEVELOPMENT:
+            logger.error("Загрузка в Postgres разрешена только при IS_DEVELOPMENT=True")
+            return 1
+        counts = await load_postgres(generator, DatabaseContextManager(async_session))
+    else:
+        from redis.asyncio import Redis
+
+        from config import settings
+
+        redis_client = Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB if args.redis_db is None else args.redis_db,
+        )
+        buffer_service = AnalyticsBufferService(redis_client=redis_client)
+        try:
+            counts = await load_redis(generator, buffer_service, args.buffer_days)
+        finally:
+            await buffer_service.close()
+
+    for name, count in sorted(counts.items()):
+        logger.info("%-20s %10d", name, count)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,538 @@
+"""
+Нагрузочный прогон всего конвейера бота без сети.
+
+Собирает настоящий Dispatcher (configure_dispatcher из bot.py: middleware,
+фильтры, роутеры, шардирование) поверх профиля BOT, подменяет сессию Bot на
+RecordingSession (вызовы API запоминаются, ответы синтезируются) и вместо
+отправки задач в RabbitMQ считает их. Поток апдейтов — синтетический
+(сообщения, ответы и реакции из benchmarks.datagen) или записанный (JSONL
+с апдейтами Telegram) — подаётся в dp.feed_update с заданной частотой, как
+это делает polling. Параллельно воркер аналитики переносит буферы Redis
+в Postgres, как analytics_scheduler.
+
+Итог: апдейтов в секунду, p50/p99 обработки (от входа в dp.update до конца
+обработчика) и полного пути (с ожиданием в очереди шарда), запросы к БД на
+апдейт, вызовы Bot API и задачи по типам, отставание буфера аналитики.
+
+Нужны локальные Redis и Postgres (IS_DEVELOPMENT=True). Запуск из src/:
+    python -m benchmarks.load --scale small --limit 5000 --rate 200
+    python -m benchmarks.load --updates updates.jsonl --rate 0
+    python -m benchmarks.load --limit 1000 --dump updates.jsonl
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    get_args,
+    get_origin,
+)
+
+from aiogram import Bot, Dispatcher
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import GetChatMember, TelegramMethod
+from aiogram.types import (
+    Chat,
+    ChatMemberAdministrator,
+    ChatMemberMember,
+    Message,
+    TelegramObject,
+    Update,
+    User,
+)
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .datagen import SCALES, Row, SyntheticDataGenerator, SyntheticDataset
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]]
+
+_SCALARS: Dict[Any, Any] = {bool: True, int: 0, str: ""}
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))], 3)
+
+
+class RecordingSession(BaseSession):
+    """
+    Сессия Bot без сети: считает вызовы API по методам и возвращает
+    правдоподобный результат (отправленное сообщение, True, участника чата).
+
+    latency_ms имитирует время ответа Telegram.
+    """
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        super().__init__()
+        self.calls: Counter[str] = Counter()
+        self._latency = latency_ms / 1000
+        self._message_ids = itertools.count(1_000_000)
+
+    async def make_request(
+        self, bot: Bot, method: TelegramMethod[Any], timeout: Optional[int] = None
+    ) -> Any:
+        self.calls[type(method).__name__] += 1
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return self._result(bot, method)
+
+    async def stream_content(
+        self,
+        url: str,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: int = 30,
+        chunk_size: int = 65536,
+        raise_for_status: bool = True,
+    ) -> AsyncGenerator[bytes, None]:
+        yield b""
+
+    async def close(self) -> None:
+        return None
+
+    def _result(self, bot: Bot, method: TelegramMethod[Any]) -> Any:
+        if isinstance(method, GetChatMember):
+            return self._chat_member(bot, method.user_id)
+
+        returning = method.__returning__
+        if get_origin(returning) is list:
+            return []
+        # Для объединений (Message | bool) — первый подходящий вариант
+        for candidate in get_args(returning) or (returning,):
+            if candidate in _SCALARS:
+                return _SCALARS[candidate]
+            if isinstance(candidate, type) and issubclass(candidate, Message):
+                return self._message(bot, method)
+            if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+                return candidate.model_construct()
+        return None
+
+    def _message(self, bot: Bot, method: TelegramMethod[Any]) -> Message:
+        chat_id = getattr(method, "chat_id", None)
+        return Message.model_construct(
+            message_id=next(self._message_ids),
+            date=datetime.now(timezone.utc),
+            chat=Chat.model_construct(
+                id=chat_id if isinstance(chat_id, int) else 0, type="supergroup"
+            ),
+            from_user=self._bot_user(bot),
+            text=getattr(method, "text", None),
+        ).as_(bot)
+
+    @staticmethod
+    def _bot_user(bot: Bot) -> User:
+        return User(id=bot.id, is_bot=True, first_name="bench", username="bench_bot")
+
+    def _chat_member(self, bot: Bot, user_id: int) -> Any:
+        if user_id != bot.id:
+            return ChatMemberMember(
+                user=User(id=user_id, is_bot=False, first_name="member")
+            )
+        return ChatMemberAdministrator(
+            user=self._bot_user(bot),
+            can_be_edited=False,
+            is_anonymous=False,
+            can_manage_chat=True,
+            can_delete_messages=True,
+            can_manage_video_chats=True,
+            can_restrict_members=True,
+            can_promote_members=False,
+            can_change_info=True,
+            can_invite_users=True,
+            can_post_stories=False,
+            can_edit_stories=False,
+            can_delete_stories=False,
+        )
+
+
+def synthetic_updates(dataset: SyntheticDataset, limit: int) -> List[Dict[str, Any]]:
+    """
+    Апдейты Telegram из набора: сообщения (ответы — с reply_to_message)
+    и реакции всех чатов вперемешку в порядке времени.
+    """
+    users = {row["id"]: row for row in dataset.users}
+    chats = {row["id"]: row for row in dataset.chats}
+    by_tg_id = {(row["chat_id"], row["message_id"]): row for row in dataset.messages}
+    reply_of = {
+        row["reply_message_id"]: row["original_message_url"].rsplit("/", 1)[1]
+        for row in dataset.replies
+    }
+
+    def user(user_id: int) -> Dict[str, Any]:
+        row = users[user_id]
+        return {
+            "id": int(row["tg_id"]),
+            "is_bot": False,
+            "first_name": row["username"],
+            "username": row["username"],
+            "language_code": "ru",
+        }
+
+    def chat(chat_id: int) -> Dict[str, Any]:
+        row = chats[chat_id]
+        return {"id": int(row["chat_id"]), "type": "supergroup", "title": row["title"]}
+
+    def message(row: Row, date: int) -> Dict[str, Any]:
+        return {
+            "message_id": int(row["message_id"]),
+            "date": date,
+            "chat": chat(row["chat_id"]),
+            "from": user(row["user_id"]),
+            "text": row["text"],
+        }
+
+    events = sorted(
+        [(row["created_at"], 0, row) for row in dataset.messages]
+        + [(row["created_at"], 1, row) for row in dataset.reactions],
+        key=lambda event: (event[0], event[1]),
+    )[:limit]
+
+    updates = []
+    now = int(time.time())
+    for _, kind, row in events:
+        if kind == 0:
+            payload = message(row, now)
+            original_id = reply_of.get(row["id"])
+            if original_id is not None:
+                original = by_tg_id[(row["chat_id"], original_id)]
+                payload["reply_to_message"] = message(original, now)
+            updates.append({"message": payload})
+        else:
+            updates.append(
+                {
+                    "message_reaction": {
+                        "chat": chat(row["chat_id"]),
+                        "message_id": int(row["message_id"]),
+                        "user": user(row["user_id"]),
+                        "date": now,
+                        "old_reaction": [],
+                        "new_reaction": [{"type": "emoji", "emoji": row["emoji"]}],
+                    }
+                }
+            )
+    return updates
+
+
+def read_updates(path: Path, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Записанный поток: по одному апдейту Telegram (JSON) на строку."""
+    updates = []
+    with path.open(encoding="utf-8") as stream:
+        for line in stream:
+            if line.strip():
+                updates.append(json.loads(line))
+            if limit and len(updates) >= limit:
+                break
+    return updates
+
+
+@dataclass
+class LoadStats:
+    updates: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    handler_ms: List[float] = field(default_factory=list)
+    end_to_end_ms: List[float] = field(default_factory=list)
+    handler_queries: int = 0
+    worker_queries: int = 0
+    worker_errors: int = 0
+    max_buffer_depth: int = 0
+    max_buffer_lag_seconds: float = 0.0
+    drain_seconds: Optional[float] = None
+    api_calls: Dict[str, int] = field(default_factory=dict)
+    enqueued_tasks: Dict[str, int] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, Any]:
+        handled = max(self.updates, 1)
+        data = asdict(self)
+        del data["handler_ms"], data["end_to_end_ms"]
+        data.update(
+            updates_per_second=round(self.updates / self.seconds, 1)
+            if self.seconds
+            else None,
+            handler_p50_ms=percentile(self.handler_ms, 0.5),
+            handler_p99_ms=percentile(self.handler_ms, 0.99),
+            end_to_end_p50_ms=percentile(self.end_to_end_ms, 0.5),
+            end_to_end_p99_ms=percentile(self.end_to_end_ms, 0.99),
+            db_queries_per_update=round(self.handler_queries / handled, 2),
+            api_calls_per_update=round(sum(self.api_calls.values()) / handled, 2),
+        )
+        return data
+
+
+class QueryCounter:
+    """
+    Считает SQL-запросы движка. Запросы из задач воркера (worker_tasks)
+    учитываются отдельно от запросов обработки апдейтов.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine.sync_engine
+        self.worker_tasks: Set["asyncio.Task[Any]"] = set()
+        self.handler = 0
+        self.worker = 0
+
+    def _on_execute(self, *args: Any) -> None:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task in self.worker_tasks:
+            self.worker += 1
+        else:
+            self.handler += 1
+
+    def __enter__(self) -> "QueryCounter":
+        from sqlalchemy import event
+
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        from sqlalchemy import event
+
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+
+async def replay(
+    dp: Dispatcher,
+    bot: Bot,
+    updates: List[Dict[str, Any]],
+    rate: float,
+    stats: LoadStats,
+    as_tasks: bool = True,
+) -> None:
+    """
+    Подаёт апдейты в dp.feed_update с частотой rate в секунду (0 — без пауз).
+
+    as_tasks повторяет polling без шардирования (каждый апдейт — задача);
+    иначе feed_update ждёт места в очереди шарда. Время обработки каждого
+    апдейта замеряет outer middleware dp.update, поставленный последним.
+    """
+    sent_at: Dict[int, float] = {}
+
+    async def timing(
+        handler: Handler, event: TelegramObject, data: Dict[str, Any]
+    ) -> Any:
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            finished = time.perf_counter()
+            stats.handler_ms.append((finished - started) * 1000)
+            update_id = getattr(event, "update_id", None)
+            if update_id in sent_at:
+                stats.end_to_end_ms.append((finished - sent_at.pop(update_id)) * 1000)
+
+    dp.update.outer_middleware(timing)
+    base_id = int(time.time() * 1000)
+    mounted = [
+        Update.model_validate(
+            {**update, "update_id": base_id + i}, context={"bot": bot}
+        )
+        for i, update in enumerate(updates)
+    ]
+
+    tasks: List["asyncio.Task[Any]"] = []
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for i, update in enumerate(mounted):
+        if rate > 0:
+            delay = started + i / rate - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        sent_at[update.update_id] = time.perf_counter()
+        if as_tasks:
+            tasks.append(asyncio.create_task(dp.feed_update(bot, update)))
+        else:
+            await dp.feed_update(bot, update)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    stats.updates += len(mounted)
+
+
+async def _buffer_lag(redis: Any, key: str) -> tuple[int, float]:
+    """Глубина буфера и возраст самого старого элемента в секундах."""
+    depth = await redis.llen(key)
+    if not depth:
+        return 0, 0.0
+    head = await redis.lindex(key, 0)
+    created_at = datetime.fromisoformat(json.loads(head)["created_at"])
+    return depth, max(0.0, (datetime.now(timezone.utc) - created_at).total_seconds())
+
+
+async def analytics_worker(
+    redis: Any,
+    interval: float,
+    stats: LoadStats,
+    stop: asyncio.Event,
+) -> None:
+    """Переносит буферы в Postgres раз в interval секунд, как analytics_scheduler."""
+    from services.analytics_buffer_service import AnalyticsBufferService
+    from tasks.analytics_tasks import (
+        process_buffered_messages_task,
+        process_buffered_reactions_task,
+        process_buffered_replies_task,
+    )
+
+    while not stop.is_set():
+        depth, lag = await _buffer_lag(redis, AnalyticsBufferService.REDIS_KEY_MESSAGES)
+        stats.max_buffer_depth = max(stats.max_buffer_depth, depth)
+        stats.max_buffer_lag_seconds = round(max(stats.max_buffer_lag_seconds, lag), 3)
+        for task in (
+            process_buffered_messages_task,
+            process_buffered_reactions_task,
+            process_buffered_replies_task,
+        ):
+            try:
+                await task()
+            except Exception:
+                stats.worker_errors += 1
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _wait_drained(redis: Any, timeout: float) -> Optional[float]:
+    from services.analytics_buffer_service import AnalyticsBufferService
+
+    keys = (
+        AnalyticsBufferService.REDIS_KEY_MESSAGES,
+        AnalyticsBufferService.REDIS_KEY_REACTIONS,
+        AnalyticsBufferService.REDIS_KEY_REPLIES,
+    )
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if not any([await redis.llen(key) for key in keys]):
+            return round(time.perf_counter() - started, 3)
+        await asyncio.sleep(0.1)
+    return None
+
+
+async def run(args: argparse.Namespace) -> LoadStats:
+    from redis.asyncio import Redis
+
+    from bot import configure_dispatcher
+    from config import settings
+    from container import ContainerProfile, ContainerSetup, container
+    from database.session import engine
+    from scheduler import broker
+
+    ContainerSetup.setup(ContainerProfile.BOT)
+
+    # Все держатели Bot получают сессию без сети
+    session = RecordingSession(latency_ms=args.api_latency_ms)
+    bot: Bot = container.resolve(Bot)
+    bot.session = session
+
+    # Задачи TaskIQ не уходят в RabbitMQ, а считаются
+    enqueued: Counter[str] = Counter()
+
+    async def kick(message: Any) -> None:
+        enqueued[message.task_name] += 1
+
+    broker.kick = kick  # type: ignore[method-assign]
+
+    if args.updates:
+        updates = read_updates(Path(args.updates), args.limit)
+    else:
+        dataset = SyntheticDataGenerator(SCALES[args.scale]).build()
+        updates = synthetic_updates(dataset, args.limit)
+    if args.dump:
+        with Path(args.dump).open("w", encoding="utf-8") as stream:
+            for update in updates:
+                stream.write(json.dumps(update, ensure_ascii=False) + "\n")
+        logger.info("Поток записан в %s", args.dump)
+
+    bot, dp = await configure_dispatcher()
+    redis = container.resolve(Redis)
+    stats = LoadStats()
+    stop = asyncio.Event()
+
+    with QueryCounter(engine) as queries:
+        worker = asyncio.create_task(
+            analytics_worker(redis, args.worker_interval, stats, stop)
+        )
+        queries.worker_tasks.add(worker)
+        await dp.emit_startup(bot=bot, dispatcher=dp)
+        started = time.perf_counter()
+        try:
+            await replay(
+                dp,
+                bot,
+                updates,
+                args.rate,
+                stats,
+                as_tasks=settings.UPDATE_SHARDS == 0,
+            )
+        finally:
+            await dp.emit_shutdown(bot=bot, dispatcher=dp)
+        stats.seconds = round(time.perf_counter() - started, 3)
+        stats.drain_seconds = await _wait_drained(redis, args.drain_timeout)
+        stop.set()
+        await worker
+
+    stats.handler_queries = queries.handler
+    stats.worker_queries = queries.worker
+    stats.api_calls = dict(session.calls.most_common())
+    stats.enqueued_tasks = dict(enqueued.most_common())
+    await engine.dispose()
+    return stats
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон конвейера бота")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--limit", type=int, default=2000, help="апдейтов в прогоне")
+    parser.add_argument("--updates", help="JSONL с записанными апдейтами")
+    parser.add_argument("--dump", help="сохранить поток апдейтов в JSONL")
+    parser.add_argument("--rate", type=float, default=100.0, help="апдейтов в секунду")
+    parser.add_argument("--api-latency-ms", type=float, default=0.0)
+    parser.add_argument("--worker-interval", type=float, default=1.0)
+    parser.add_argument("--drain-timeout", type=float, default=60.0)
+    parser.add_argument("--json", help="сохранить итог в JSON")
+    args = parser.parse_args(argv)
+
+    from config import settings
+
+    if not settings.IS_DEVELOPMENT:
+        logger.error("Нагрузочный прогон разрешён только при IS_DEVELOPMENT=True")
+        return 1
+
+    # Журнал aiogram на каждый апдейт искажает замер
+    logging.getLogger("aiogram.event").setLevel(logging.WARNING)
+    summary = (await run(args)).summary()
+    for key, value in summary.items():
+        logger.info("%-24s %s", key, value)
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sys.exit(asyncio.run(main()))
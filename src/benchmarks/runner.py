@@ -0,0 +1,271 @@
+"""
+Прогон бенчмарков и сравнение с локальным baseline.
+
+    python -m benchmarks                          # сценарии без бэкендов
+    python -m benchmarks -k report --rounds 10
+    python -m benchmarks --redis-db 15 --postgres # + Redis/Postgres
+    python -m benchmarks --save-baseline          # записать baseline (до правки)
+    python -m benchmarks --compare                # сравнить с ним (после)
+
+Для каждого сценария — прогрев и rounds замеров; сравнивается медиана.
+Абсолютное время зависит от машины, поэтому baseline не хранится в
+репозитории: он пишется в baseline.local.json рядом с модулем (в .gitignore)
+на той же машине, где потом сравнивают. Без --compare раннер только печатает
+замеры. С --compare медленнее baseline больше чем на threshold — регрессия,
+код выхода 1; baseline с другой машины или версии Python — код выхода 2.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .cases import BenchContext, BenchmarkCase, SkipCase, select_cases
+from .datagen import SCALES, SyntheticDataGenerator
+
+logger = logging.getLogger(__name__)
+
+BASELINE_PATH = Path(__file__).with_name("baseline.local.json")
+DEFAULT_THRESHOLD = 0.3
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    median_ms: float
+    min_ms: float
+    rounds: int
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ms / self.baseline_ms
+
+
+async def measure(case: BenchmarkCase, ctx: BenchContext, rounds: int) -> CaseResult:
+    """Прогрев и rounds замеров одного сценария."""
+    workload = await case.setup(ctx)
+    timings: List[float] = []
+    try:
+        for attempt in range(rounds + 1):
+            started = time.perf_counter()
+            if workload.is_async:
+                await workload.run()
+            else:
+                workload.run()
+            if attempt:
+                timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        if workload.teardown is not None:
+            await workload.teardown()
+    return CaseResult(
+        median_ms=round(statistics.median(timings), 3),
+        min_ms=round(min(timings), 3),
+        rounds=rounds,
+    )
+
+
+async def run_cases(
+    ctx: BenchContext,
+    cases: List[BenchmarkCase],
+    rounds: int,
+) -> Dict[str, CaseResult]:
+    """Выполняет доступные сценарии; недоступные пропускает с пояснением."""
+    results: Dict[str, CaseResult] = {}
+    available = ctx.available()
+    for case in cases:
+        missing = case.requires - available
+        if missing:
+            logger.info(
+                "%-30s пропущен: нужен %s", case.name, ", ".join(sorted(missing))
+            )
+            continue
+        try:
+            results[case.name] = await measure(case, ctx, rounds)
+        except SkipCase as e:
+            logger.info("%-30s пропущен: %s", case.name, e)
+    return results
+
+
+def compare(
+    results: Dict[str, CaseResult],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Regression]:
+    """Сценарии, медиана которых хуже baseline больше чем на threshold."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result.median_ms > base["median_ms"] * (1 + threshold):
+            regressions.append(Regression(name, base["median_ms"], result.median_ms))
+    return regressions
+
+
+def _environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def load_baseline(scale: str, path: Path = BASELINE_PATH) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data.get(scale, {}).get("results", {})
+
+
+def baseline_environment(scale: str, path: Path = BASELINE_PATH) -> Dict[str, str]:
+    """Окружение, в котором записан baseline масштаба ({} — baseline нет)."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data.get(scale, {}).get("environment", {})
+
+
+def save_baseline(
+    scale: str, results: Dict[str, CaseResult], path: Path = BASELINE_PATH
+) -> None:
+    """Обновляет результаты масштаба, сохраняя остальные масштабы и сценарии."""
+    data = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    entry = data.setdefault(scale, {})
+    entry["environment"] = _environment()
+    entry.setdefault("results", {}).update(
+        {name: asdict(result) for name, result in results.items()}
+    )
+    path.write_text(
+        json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+
+
+def _report(
+    results: Dict[str, CaseResult], baseline: Dict[str, Dict[str, Any]]
+) -> None:
+    for name, result in results.items():
+        base = baseline.get(name)
+        delta = (
+            f"{(result.median_ms / base['median_ms'] - 1) * 100:+6.1f}%"
+            if base
+            else "   нет baseline"
+        )
+        logger.info(
+            "%-30s медиана %9.3f мс  мин %9.3f мс  %s",
+            name,
+            result.median_ms,
+            result.min_ms,
+            delta,
+        )
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки горячих путей")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("-k", dest="pattern", help="подстрока имени сценария")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINE_PATH, help="файл локального baseline"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--save-baseline", action="store_true")
+    mode.add_argument(
+        "--compare", action="store_true", help="сравнить с baseline этой машины"
+    )
+    parser.add_argument(
+        "--postgres", action="store_true", help="dev-база с загруженным набором"
+    )
+    parser.add_argument(
+        "--redis-db", type=int, default=None, help="отдельная база Redis для замеров"
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    dataset = SyntheticDataGenerator(SCALES[args.scale]).build()
+    logger.info(
+        "Набор %s за %.1f с: %s",
+        args.scale,
+        time.perf_counter() - started,
+        dataset.counts(),
+    )
+
+    ctx = BenchContext(dataset=dataset)
+    if args.postgres:
+        from config import settings
+        from database.session import DatabaseContextManager, async_session
+
+        if not settings.IS_DEVELOPMENT:
+            logger.error("Замеры на Postgres разрешены только при IS_DEVELOPMENT=True")
+            return 1
+        ctx.db = DatabaseContextManager(async_session)
+    if args.redis_db is not None:
+        from redis.asyncio import Redis
+
+        from config import settings
+
+        ctx.redis = Redis(
+            host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=args.redis_db
+        )
+
+    try:
+        results = await run_cases(ctx, select_cases(args.pattern), args.rounds)
+    finally:
+        if ctx.redis is not None:
+            await ctx.redis.aclose()
+
+    baseline = load_baseline(args.scale, args.baseline)
+    _report(results, baseline)
+    if args.save_baseline:
+        save_baseline(args.scale, results, args.baseline)
+        logger.info("Baseline записан: %s (%s)", args.baseline, args.scale)
+        return 0
+    if not args.compare:
+        return 0
+
+    if not baseline:
+        logger.error(
+            "Нет baseline для %s в %s: сначала --save-baseline",
+            args.scale,
+            args.baseline,
+        )
+        return 2
+    recorded = baseline_environment(args.scale, args.baseline)
+    if recorded != _environment():
+        logger.error(
+            "Baseline записан в другом окружении (%s, сейчас %s): "
+            "перезапишите его через --save-baseline",
+            recorded,
+            _environment(),
+        )
+        return 2
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        logger.warning(
+            "Регрессия %s: %.3f мс → %.3f мс (x%.2f)",
+            regression.name,
+            regression.baseline_ms,
+            regression.current_ms,
+            regression.ratio,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sys.exit(asyncio.run(main()))
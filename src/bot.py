@@ -1,8 +1,14 @@
 from aiogram import Bot, Dispatcher
 
+from config import settings
 from di import container
 from handlers import registry_routers
-from middlewares import LanguageMiddleware
+from middlewares import (
+    HandlerMetricsMiddleware,
+    LanguageMiddleware,
+    ShardedUpdateMiddleware,
+    TelegramApiMetricsMiddleware,
+)
 from services.user import UserService
 from utils.exception_handler import registry_exceptions
 
@@ -11,6 +17,28 @@ async def configure_dispatcher() -> tuple[Bot, Dispatcher]:
     bot: Bot = container.resolve(Bot)
     dp: Dispatcher = container.resolve(Dispatcher)
 
+    if settings.UPDATE_SHARDS > 0:
+        # Параллельно по чатам, по порядку внутри чата, без дублей update_id
+        sharding: ShardedUpdateMiddleware = container.resolve(ShardedUpdateMiddleware)
+        dp.update.outer_middleware(sharding)
+        dp.startup.register(sharding.start)
+        dp.shutdown.register(sharding.stop)
+
+    if settings.METRICS_ENABLED:
+        # Первым из inner middleware: замер включает остальные middleware
+        handler_metrics = HandlerMetricsMiddleware()
+        for observer in (
+            dp.message,
+            dp.edited_message,
+            dp.callback_query,
+            dp.inline_query,
+            dp.chat_member,
+            dp.my_chat_member,
+            dp.message_reaction,
+        ):
+            observer.middleware(handler_metrics)
+        bot.session.middleware(TelegramApiMetricsMiddleware())
+
     user_service: UserService = container.resolve(UserService)
     language_middleware = LanguageMiddleware(user_service, container)
     dp.message.middleware(language_middleware)
@@ -40,12 +40,95 @@ class Settings(BaseSettings):
     # Настройки кэширования
     SUMMARY_CACHE_TTL_MINUTES: int = 60
     SUMMARY_INVALIDATION_THRESHOLD: int = 50
+    # Инкрементальная сводка: окно частичных сводок и бюджет токенов на один запрос к LLM
+    SUMMARY_WINDOW_MINUTES: int = Field(default=60, ge=5)
+    SUMMARY_CHUNK_MAX_TOKENS: int = Field(default=6000, ge=500)
+    SUMMARY_PARTIAL_CACHE_TTL_HOURS: int = Field(default=26, ge=1)
 
     # Настройки нейросети
     OPEN_ROUTER_TOKEN: str
     OPEN_ROUTER_MODEL: str = "mistralai/devstral-2512:free"
-    # Автомодерация: размер пачки текстовых сообщений перед вызовом LLM
+    # Пул HTTP-соединений к OpenRouter: таймауты, размер пула и лимит одновременных запросов
+    OPEN_ROUTER_TIMEOUT_SECONDS: float = Field(default=60.0, gt=0)
+    OPEN_ROUTER_CONNECT_TIMEOUT_SECONDS: float = Field(default=10.0, gt=0)
+    OPEN_ROUTER_MAX_CONNECTIONS: int = Field(default=10, ge=1)
+    OPEN_ROUTER_MAX_CONCURRENCY: int = Field(default=5, ge=1)
+    OPEN_ROUTER_HTTP2: bool = True
+    # Ожидание свободного слота и дедлайн вызова модели целиком (сек);
+    # после BREAKER_FAILURES отказов подряд вызовы не выполняются BREAKER_RESET_SECONDS
+    OPEN_ROUTER_QUEUE_TIMEOUT_SECONDS: float = Field(default=30.0, gt=0)
+    OPEN_ROUTER_CALL_DEADLINE_SECONDS: float = Field(default=90.0, gt=0)
+    OPEN_ROUTER_BREAKER_FAILURES: int = Field(default=5, ge=1)
+    OPEN_ROUTER_BREAKER_RESET_SECONDS: float = Field(default=60.0, gt=0)
+    # Автомодерация: минимальный размер пачки текстовых сообщений перед вызовом LLM.
+    # Фактический порог адаптируется к темпу чата (до MAX_BATCH_SIZE и бюджета токенов),
+    # а пачка тихого чата уходит в LLM не позже MAX_AGE_SECONDS (sweeper).
     AUTO_MODERATION_BATCH_SIZE: int = Field(default=30, ge=1)
+    AUTO_MODERATION_MAX_BATCH_SIZE: int = Field(default=100, ge=1)
+    AUTO_MODERATION_MAX_AGE_SECONDS: int = Field(default=60, ge=1)
+    AUTO_MODERATION_MAX_BATCH_TOKENS: int = Field(default=6000, ge=100)
+    # Предфильтр перед LLM: короткие тексты без ссылок не проверяются (0 — проверять все);
+    # вердикты LLM кешируются по хешу нормализованного текста (0 — без кеша);
+    # автор с таким числом чистых по вердикту LLM сообщений считается знакомым,
+    # и его сообщения без ссылок не отправляются в LLM (0 — отключено)
+    AUTO_MODERATION_SAFE_TEXT_MAX_LENGTH: int = Field(default=12, ge=0)
+    AUTO_MODERATION_VERDICT_TTL_SECONDS: int = Field(default=86400, ge=0)
+    AUTO_MODERATION_KNOWN_USER_MESSAGES: int = Field(default=20, ge=0)
+
+    # Антирейд: порог вступлений за окно, после которого чат переходит в режим рейда
+    RAID_JOIN_THRESHOLD: int = Field(default=20, ge=2)
+    RAID_DETECTION_WINDOW_SECONDS: int = Field(default=60, ge=1)
+    # Сколько режим рейда держится после последнего превышения порога
+    RAID_MODE_COOLDOWN_SECONDS: int = Field(default=300, ge=1)
+    # Интервал сводной обработки очереди вступлений в режиме рейда
+    RAID_BATCH_INTERVAL_SECONDS: int = Field(default=10, ge=1)
+    # Пауза между ограничениями участников в режиме рейда
+    RAID_RESTRICT_PACE_SECONDS: float = Field(default=0.05, ge=0)
+
+    # Планировщик отчетов: максимальный сон между сверками очереди с БД
+    # (страховка на случай потерянного уведомления об изменении расписания)
+    REPORT_SCHEDULER_RESYNC_SECONDS: int = Field(default=300, ge=5)
+    # Сколько наступивших расписаний собирать в одну пакетную задачу отчетов
+    REPORT_BATCH_SIZE: int = Field(default=50, ge=1)
+    # Пауза между отправками отчетов в архивные чаты внутри пакета
+    REPORT_SEND_PACE_SECONDS: float = Field(default=0.5, ge=0)
+    # Размер пачки строк при потоковой выгрузке отчётов (серверный курсор)
+    REPORT_EXPORT_BATCH_SIZE: int = Field(default=1000, ge=1)
+    # Время жизни кешированного индекса отслеживания (админ → пользователи/чаты)
+    TRACKING_INDEX_TTL_SECONDS: int = Field(default=300, ge=1)
+    # Время жизни кеша ответов статистики Mini App
+    MINIAPP_STATS_CACHE_TTL_SECONDS: int = Field(default=30, ge=1)
+    # Время жизни кеша ответов аналитики Mini App (ключ включает версию данных)
+    MINIAPP_RESPONSE_CACHE_TTL_SECONDS: int = Field(default=60, ge=1)
+    # Сколько API держит в памяти пользователя Mini App с его ролью
+    # (за этот срок до API доходят смена роли и удаление пользователя)
+    MINIAPP_CALLER_CACHE_TTL_SECONDS: int = Field(default=60, ge=1)
+    # Время жизни кеша общего количества логов админов (для пагинации)
+    ADMIN_LOGS_COUNT_CACHE_TTL_SECONDS: int = Field(default=60, ge=1)
+    # Время жизни in-memory индекса поиска шаблонов (учёт usage_count)
+    TEMPLATE_SEARCH_INDEX_TTL_SECONDS: int = Field(default=300, ge=1)
+    # Больше шаблонов — поиск идёт через триграммный индекс БД
+    TEMPLATE_SEARCH_INDEX_MAX_ENTRIES: int = Field(default=5000, ge=0)
+    # Время кеширования результатов inline-поиска шаблонов на стороне Telegram
+    TEMPLATE_INLINE_CACHE_SECONDS: int = Field(default=30, ge=0)
+
+    # Обработка апдейтов: число шардов по chat_id (0 — без шардирования),
+    # ёмкость очереди шарда и окно дедупликации update_id в Redis
+    UPDATE_SHARDS: int = Field(default=8, ge=0)
+    UPDATE_SHARD_QUEUE_SIZE: int = Field(default=100, ge=1)
+    UPDATE_DEDUP_WINDOW_SECONDS: int = Field(default=600, ge=1)
+
+    # Логирование: формат вывода (text/json), размер очереди записей и
+    # сэмплирование записей ниже WARNING ("логгер=доля,...")
+    LOG_FORMAT: str = Field(default="text", pattern="^(text|json)$")
+    LOG_QUEUE_SIZE: int = Field(default=10_000, ge=1)
+    LOG_SAMPLING: str = ""
+
+    # Метрики Prometheus: порт сервера экспозиции в процессах бота, воркера и
+    # планировщика аналитики; токен /metrics в FastAPI (пусто — эндпоинт не монтируется)
+    METRICS_ENABLED: bool = True
+    METRICS_PORT: int = Field(default=9100, ge=1, le=65535)
+    METRICS_TOKEN: str = ""
 
     # Базы данных
     DEV_DATABASE_URL: str
@@ -39,6 +39,8 @@ WELCOME_MESSAGE_NOTIFICATION_TTL = (
     3600  # Время жизни уведомления о приветствии в чате (60 минут)
 )
 KICK_UNVERIFIED_MEMBER_TTL = WELCOME_MESSAGE_NOTIFICATION_TTL
+RAID_GREETING_MAX_MENTIONS = 30  # Максимум упоминаний в сводном приветствии
+RAID_DIGEST_MAX_MEMBERS = 60  # Максимум строк участников в сводке для архива
 
 
 class InlineButtons:
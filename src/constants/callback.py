@@ -237,6 +237,8 @@ class AntibotCallbackData:
 
     # Prefixes
     CONFIRM_HUMANITY_PREFIX = "confirm_humanity__"
+    # Сводное приветствие в режиме рейда (одна кнопка на всех вступивших)
+    CONFIRM_HUMANITY_RAID = "confirm_humanity_raid"
 
 
 class AutoModerationCallbackData:
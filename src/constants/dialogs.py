@@ -248,6 +248,8 @@ class AntibotDialogs:
         "\n\n"
         "Чтобы иметь возможность писать в чате, нажмите кнопку ниже и подтвердите, что вы не бот."
     )
+    RAID_GREETING = "👋 Привет, {usernames}!\n\n"
+    RAID_MORE_MEMBERS = " и ещё {count}"
     VERIFIED_SUCCESS = "✅ Проверка пройдена! Теперь вы можете отправлять сообщения."
     VERIFIED_ERROR_USER = "❌ Эта кнопка предназначена для другого пользователя."
     VERIFIED_HAS_PUNISHMENTS = "У вас {warns_count} предупреждений. Следующее наказание: {next_punishment_description}."
@@ -946,6 +948,25 @@ class ArchiveNotificationDialogs:
         "Чат: {chat_title}"
     )
 
+    NEW_MEMBERS_DIGEST = (
+        "👥 <b>Массовое вступление</b>\n"
+        "Участников: {count}\n"
+        "Когда: {date} {time}\n"
+        "Чат: {chat_title}\n\n"
+        "{members}"
+    )
+
+    MEMBERS_KICKED_DIGEST = (
+        "❌ <b>Кик непроверенных участников</b>\n"
+        "Участников: {count}\n"
+        "Когда: {date} {time}\n"
+        "Чат: {chat_title}\n\n"
+        "{members}"
+    )
+
+    DIGEST_MEMBER_LINE = "• {username} (<code>{tg_id}</code>)"
+    DIGEST_MORE_MEMBERS = "… и ещё {count}"
+
 
 class ModerationReportDialogs:
     """Шаблоны для отчетов о наказаниях в архивный чат"""
@@ -79,3 +79,17 @@ class MembershipEventType(str, Enum):
     JOIN = "join"
     LEFT = "left"
     REMOVED = "removed"
+
+
+class ExportScope(str, Enum):
+    """Область выгрузки отчёта."""
+
+    CHAT = "chat"
+    USER = "user"
+
+
+class ExportGranularity(str, Enum):
+    """Детализация выгрузки: по сообщениям или по дням."""
+
+    MESSAGES = "messages"
+    DAILY = "daily"
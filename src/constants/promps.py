@@ -35,6 +35,23 @@ USER_CONTENT_FULL = (
     "Лог сообщений для анализа:\n{text}"
 )
 
+SUMMARY_CHUNK_SYSTEM = (
+    "Ты — помощник аналитика. Сожми фрагмент лога чата в плотный конспект для последующего объединения с другими фрагментами.\n\n"
+    "ПРАВИЛА:\n"
+    "- Только простой текст, без HTML-разметки.\n"
+    "- Сохраняй @username участников и кто что сказал по ключевым темам.\n"
+    "- Фиксируй темы, события, настроение, конфликты и риски, если они есть.\n"
+    "- Не добавляй заголовков, вступлений и выводов — только факты, до 10 пунктов."
+)
+
+USER_CONTENT_CHUNK = "Фрагмент лога для конспекта:\n{text}"
+
+# Подставляется перед текстом, когда финальная сводка строится из конспектов окон
+SUMMARY_PARTIALS_PREAMBLE = (
+    "Ниже не сырой лог, а хронологические конспекты отрезков обсуждения "
+    "(в квадратных скобках — начало отрезка). Анализируй их как единый диалог.\n\n"
+)
+
 AUTOMOD_SYSTEM = """Ты — эксперт по модерации чатов. Твоя задача: выявление спама, ботов, фишинга и вредоносных аккаунтов в логах сообщений.
 
 КРИТЕРИИ СПАМА (банить за это):
@@ -1,175 +1,63 @@
-from aiogram import Bot, Dispatcher
-from aiogram.client.default import DefaultBotProperties
-from aiogram.enums import ParseMode
-from aiogram.fsm.storage.base import BaseStorage
-from aiogram.fsm.storage.redis import RedisStorage
+from enum import Enum
+
 from punq import Container, Scope
-from redis.asyncio import Redis
 
 from config import settings
-from database.session import DatabaseContextManager, async_session
 from di import container
-from repositories import (
-    AdminActionLogRepository,
-    ChatMembershipEventRepository,
-    ChatRepository,
-    ChatTrackingRepository,
-    MessageReactionRepository,
-    MessageReplyRepository,
-    MessageRepository,
-    MessageTemplateRepository,
-    PunishmentLadderRepository,
-    PunishmentRepository,
-    ReportScheduleRepository,
-    TemplateCategoryRepository,
-    TemplateMediaRepository,
-    UserChatStatusRepository,
-    UserRepository,
-    UserTrackingRepository,
-)
-from services import (
-    AdminActionLogService,
-    AnalyticsBufferService,
-    ArchiveBindService,
-    BotMessageService,
-    BotPermissionService,
-    CategoryService,
-    ChatService,
-    PunishmentService,
-    ReportScheduleService,
-    TaskiqSchedulerService,
-    TemplateContentService,
-    TemplateService,
-    UserService,
-)
-from services.automoderation_buffer_service import AutoModerationBufferService
-from services.caching import ICache, RedisCache
-from services.chat.summarize import IAIService
-from services.chat.summarize.open_router_service import OpenRouterService
-from services.client import ApiClient
-from usecases.admin_actions import (
-    BroadcastMessageToTrackedChatsUseCase,
-    DeleteMessageUseCase,
-    ReplyToMessageUseCase,
-    SendMessageToChatUseCase,
-)
-from usecases.admin_logs import (
-    GetAdminLogsPageUseCase,
-    GetAdminsWithLogsUseCase,
-)
-from usecases.amnesty import (
-    CancelLastWarnUseCase,
-    GetChatsWithAnyRestrictionUseCase,
-    GetChatsWithBannedUserUseCase,
-    GetChatsWithMutedUserUseCase,
-    GetChatsWithPunishedUserUseCase,
-    UnbanUserUseCase,
-    UnmuteUserUseCase,
-)
-from usecases.antibot import GetAntibotSettingsUseCase
-from usecases.archive import (
-    BindArchiveChatUseCase,
-    GenerateArchiveBindHashUseCase,
-    GetArchiveSettingsUseCase,
-    NotifyArchiveChatMemberKickedUseCase,
-    NotifyArchiveChatMemberLeftUseCase,
-    NotifyArchiveChatNewMemberUseCase,
-    SetArchiveSendingTimeUseCase,
-    ToggleArchiveScheduleUseCase,
-)
-from usecases.automoderation import (
-    GetAutoModerationSettingsUseCase,
-    NotifyAutoModerationHitUseCase,
-    ProcessAutoModerationBatchUseCase,
-    RunAutoModerationOnMessageUseCase,
-)
-from usecases.categories import (
-    CreateCategoryUseCase,
-    DeleteCategoryUseCase,
-    GetCategoriesPaginatedUseCase,
-    GetCategoriesUseCase,
-    GetCategoryByIdUseCase,
-    UpdateCategoryNameUseCase,
-)
-from usecases.chat import (
-    GetAllChatsUseCase,
-    GetChatsForUserActionUseCase,
-    GetChatWithArchiveUseCase,
-    GetTrackedChatsUseCase,
-    ToggleAntibotUseCase,
-    ToggleAutoDeleteWelcomeTextUseCase,
-    ToggleAutoModerationUseCase,
-    ToggleWelcomeTextUseCase,
-    UpdateChatWelcomeTextUseCase,
-    UpdateChatWorkHoursUseCase,
-)
-from usecases.chat_tracking import (
-    AddChatToTrackUseCase,
-    GetUserTrackedChatsUseCase,
-    RemoveChatFromTrackingUseCase,
-)
-from usecases.membership import RecordChatMembershipEventUseCase
-from usecases.message import (
-    SaveMessageUseCase,
-    SaveReplyMessageUseCase,
-)
-from usecases.moderation import (
-    ExecuteModerationInChatsUseCase,
-    GiveUserBanUseCase,
-    GiveUserWarnUseCase,
-    RestrictNewMemberUseCase,
-    VerifyMemberUseCase,
-)
-from usecases.permissions import GetBotPermissionsInChatUseCase
-from usecases.punishment import (
-    GetPunishmentLadderUseCase,
-    SetDefaultPunishmentLadderUseCase,
-    UpdatePunishmentLadderUseCase,
-)
-from usecases.reactions import GetUserReactionsUseCase, SaveMessageReactionUseCase
-from usecases.release_notes import BroadcastTextToAdminsUseCase
-from usecases.report import (
-    GetAllUsersBreaksDetailReportUseCase,
-    GetAllUsersReportUseCase,
-    GetBreaksDetailReportUseCase,
-    GetChatBreaksDetailReportUseCase,
-    GetChatReportUseCase,
-    GetSingleUserReportUseCase,
-    SendDailyChatReportsUseCase,
-)
-from usecases.report.daily_rating import GetDailyTopUsersUseCase
-from usecases.settings import ResetAllTrackingUseCase
-from usecases.summarize.summarize_chat_messages import GetChatSummaryUseCase
-from usecases.templates import (
-    CreateTemplateFromContentUseCase,
-    DeleteTemplateUseCase,
-    GetTemplateAndIncreaseUsageUseCase,
-    GetTemplateByIdUseCase,
-    GetTemplatesByCategoryUseCase,
-    GetTemplatesByQueryUseCase,
-    GetTemplatesByScopeUseCase,
-    GetTemplatesPaginatedUseCase,
-    UpdateTemplateContentUseCase,
-    UpdateTemplateTitleUseCase,
-)
-from usecases.time import ConvertToLocalTimeUseCase, GetAppNowUseCase
-from usecases.user import (
-    CreateNewUserUserCase,
-    DeleteUserUseCase,
-    GetAllUsersUseCase,
-    GetOrCreateUserIfNotExistUserCase,
-    GetUserByIdUseCase,
-    GetUserByTgIdUseCase,
-    GetUserByUsernameUseCase,
-    UpdateUserRoleUseCase,
+
+# Импорты зависимостей — внутри шагов регистрации: процесс загружает только то,
+# что нужно его профилю (воркер аналитики не тянет aiogram, шаблоны и т.п.).
+
+
+class ContainerProfile(str, Enum):
+    """Профиль процесса: определяет, какие группы зависимостей регистрируются."""
+
+    BOT = "bot"
+    API = "api"
+    SCHEDULER = "scheduler"
+    ANALYTICS_WORKER = "analytics_worker"
+    AUTOMOD_WORKER = "automod_worker"
+    # Общий воркер TaskIQ: отчеты, модерация, режим рейда
+    WORKER = "worker"
+
+
+# Шаги регистрации в порядке выполнения (зависимости шагов идут раньше)
+_STEPS = (
+    "_register_redis",
+    "_register_database",
+    "_register_repositories",
+    "_register_buffers",
+    "_register_bot_components",
+    "_register_dispatcher",
+    "_register_services",
+    "_register_automoderation_usecases",
+    "_register_usecases",
+    "_register_async_error_handler",
 )
-from usecases.user_tracking import (
-    AddUserToTrackingUseCase,
-    GetListTrackedUsersUseCase,
-    HasTrackedUsersUseCase,
-    RemoveUserFromTrackingUseCase,
+
+_CORE_STEPS = frozenset(
+    {
+        "_register_redis",
+        "_register_database",
+        "_register_repositories",
+        "_register_buffers",
+    }
 )
-from utils.exception_handler import AsyncErrorHandler
+_SERVICE_STEPS = _CORE_STEPS | {"_register_bot_components", "_register_services"}
+_USECASE_STEPS = _SERVICE_STEPS | {
+    "_register_automoderation_usecases",
+    "_register_usecases",
+}
+
+_PROFILE_STEPS: dict[ContainerProfile, frozenset[str]] = {
+    ContainerProfile.BOT: frozenset(_STEPS),
+    ContainerProfile.API: _USECASE_STEPS,
+    ContainerProfile.SCHEDULER: _SERVICE_STEPS,
+    ContainerProfile.ANALYTICS_WORKER: _CORE_STEPS,
+    ContainerProfile.AUTOMOD_WORKER: _SERVICE_STEPS
+    | {"_register_automoderation_usecases"},
+    ContainerProfile.WORKER: _USECASE_STEPS,
+}
 
 
 def _redis_url() -> str:
@@ -177,20 +65,68 @@ def _redis_url() -> str:
     return f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
 
 
+def _is_stateless_component(service: object) -> bool:
+    """
+    Репозитории и use cases не хранят состояния между вызовами (только ссылки
+    на зависимости из __init__), поэтому их безопасно держать синглтонами.
+    """
+    module = getattr(service, "__module__", "")
+    return module.startswith(("repositories.", "usecases."))
+
+
 class ContainerSetup:
+    # Выполненные шаги регистрации глобального контейнера
+    _registered_steps: set[str] = set()
+    # Профили, заявленные импортированными модулями задач
+    _required_profiles: set[ContainerProfile] = set()
+
+    @staticmethod
+    def setup(*profiles: ContainerProfile) -> None:
+        """
+        Регистрирует зависимости указанных профилей (по умолчанию — BOT, всё).
+
+        Повторный вызов регистрирует только недостающие группы, поэтому его
+        безопасно делать из нескольких модулей одного процесса.
+        """
+        pending = [
+            step
+            for step in ContainerSetup.steps(*profiles)
+            if step not in ContainerSetup._registered_steps
+        ]
+        if not pending:
+            return
+        for step in pending:
+            getattr(ContainerSetup, step)(container)
+            ContainerSetup._registered_steps.add(step)
+        container.compile(promote_to_singleton=_is_stateless_component)
+
+    @staticmethod
+    def steps(*profiles: ContainerProfile) -> list[str]:
+        """Шаги регистрации для объединения профилей в порядке выполнения."""
+        selected: set[str] = set()
+        for profile in profiles or (ContainerProfile.BOT,):
+            selected |= _PROFILE_STEPS[profile]
+        return [step for step in _STEPS if step in selected]
+
+    @staticmethod
+    def require(profile: ContainerProfile) -> None:
+        """
+        Заявляет профиль, нужный модулю задач. Регистрация выполняется при старте
+        воркера (setup_required), а не при импорте: планировщики импортируют
+        модули задач только ради .kiq().
+        """
+        ContainerSetup._required_profiles.add(profile)
+
     @staticmethod
-    def setup() -> None:
-        ContainerSetup._register_redis(container)
-        ContainerSetup._register_bot_components(container)
-        ContainerSetup._register_database(container)
-        ContainerSetup._register_repositories(container)
-        ContainerSetup._register_services(container)
-        ContainerSetup._register_usecases(container)
-        ContainerSetup._register_async_error_handler(container)
+    def setup_required() -> None:
+        """Регистрирует объединение профилей, заявленных через require()."""
+        ContainerSetup.setup(*ContainerSetup._required_profiles)
 
     @staticmethod
     def _register_redis(container: Container) -> None:
         """Единый клиент Redis для FSM, кеша и буфера аналитики."""
+        from redis.asyncio import Redis
+
         container.register(
             Redis,
             instance=Redis.from_url(_redis_url()),
@@ -198,6 +134,10 @@ class ContainerSetup:
 
     @staticmethod
     def _register_bot_components(container: Container) -> None:
+        from aiogram import Bot
+        from aiogram.client.default import DefaultBotProperties
+        from aiogram.enums import ParseMode
+
         container.register(
             Bot,
             instance=Bot(
@@ -206,13 +146,35 @@ class ContainerSetup:
             ),
         )
 
+    @staticmethod
+    def _register_dispatcher(container: Container) -> None:
+        """FSM-хранилище и диспетчер нужны только процессу бота."""
+        from aiogram import Dispatcher
+        from aiogram.fsm.storage.base import BaseStorage
+        from aiogram.fsm.storage.redis import RedisStorage
+        from redis.asyncio import Redis
+
+        from middlewares.sharded_dispatch import ShardedUpdateMiddleware
+        from services.caching import UpdateDeduplicator
+
         redis_client = container.resolve(Redis)
         storage = RedisStorage(redis=redis_client)
         container.register(BaseStorage, instance=storage)
         container.register(Dispatcher, instance=Dispatcher(storage=storage))
+        container.register(
+            ShardedUpdateMiddleware,
+            factory=lambda: ShardedUpdateMiddleware(
+                shards=settings.UPDATE_SHARDS,
+                queue_size=settings.UPDATE_SHARD_QUEUE_SIZE,
+                deduplicator=container.resolve(UpdateDeduplicator),
+            ),
+            scope=Scope.singleton,
+        )
 
     @staticmethod
     def _register_database(container: Container) -> None:
+        from database.session import DatabaseContextManager, async_session
+
         container.register(
             DatabaseContextManager,
             instance=DatabaseContextManager(async_session),
@@ -220,11 +182,32 @@ class ContainerSetup:
 
     @staticmethod
     def _register_async_error_handler(container: Container) -> None:
+        from utils.exception_handler import AsyncErrorHandler
+
         container.register(AsyncErrorHandler)
 
     @staticmethod
     def _register_repositories(container: Container) -> None:
         """Регистрация репозиториев."""
+        from repositories import (
+            AdminActionLogRepository,
+            ChatMembershipEventRepository,
+            ChatRepository,
+            ChatTrackingRepository,
+            MessageReactionRepository,
+            MessageReplyRepository,
+            MessageRepository,
+            MessageTemplateRepository,
+            PunishmentLadderRepository,
+            PunishmentRepository,
+            ReportScheduleRepository,
+            TemplateCategoryRepository,
+            TemplateMediaRepository,
+            UserChatStatusRepository,
+            UserRepository,
+            UserTrackingRepository,
+        )
+
         repositories = [
             UserRepository,
             ChatRepository,
@@ -248,36 +231,160 @@ class ContainerSetup:
             container.register(repo)
 
     @staticmethod
-    def _register_services(container: Container) -> None:
-        """Регистрация сервисов."""
+    def _register_buffers(container: Container) -> None:
+        """Кеш и Redis-буферы: зависят только от Redis, без aiogram."""
+        from redis.asyncio import Redis
+
+        from services.analytics_buffer_service import AnalyticsBufferService
+        from services.automoderation_buffer_service import (
+            AutoModerationBufferService,
+        )
+        from services.automoderation_prefilter_service import (
+            AutoModerationPrefilterService,
+        )
+        from services.caching import (
+            DataWatermark,
+            ICache,
+            RedisCache,
+            UpdateDeduplicator,
+        )
+        from services.raid_mode_service import RaidModeService
+
         container.register(
             ICache,
             RedisCache,
             scope=Scope.singleton,
         )
+        container.register(DataWatermark, scope=Scope.singleton)
+        container.register(
+            UpdateDeduplicator,
+            factory=lambda: UpdateDeduplicator(
+                redis_client=container.resolve(Redis),
+                window_seconds=settings.UPDATE_DEDUP_WINDOW_SECONDS,
+            ),
+            scope=Scope.singleton,
+        )
+        container.register(AnalyticsBufferService, scope=Scope.singleton)
+        container.register(
+            AutoModerationBufferService,
+            factory=lambda: AutoModerationBufferService(
+                redis_client=container.resolve(Redis),
+                max_batch_size=settings.AUTO_MODERATION_MAX_BATCH_SIZE,
+                max_age_seconds=settings.AUTO_MODERATION_MAX_AGE_SECONDS,
+                max_batch_tokens=settings.AUTO_MODERATION_MAX_BATCH_TOKENS,
+            ),
+            scope=Scope.singleton,
+        )
+        container.register(
+            AutoModerationPrefilterService,
+            factory=lambda: AutoModerationPrefilterService(
+                redis_client=container.resolve(Redis),
+                verdict_ttl_seconds=settings.AUTO_MODERATION_VERDICT_TTL_SECONDS,
+                known_user_messages=settings.AUTO_MODERATION_KNOWN_USER_MESSAGES,
+            ),
+            scope=Scope.singleton,
+        )
+        container.register(
+            RaidModeService,
+            factory=lambda: RaidModeService(
+                redis_client=container.resolve(Redis),
+                join_threshold=settings.RAID_JOIN_THRESHOLD,
+                window_seconds=settings.RAID_DETECTION_WINDOW_SECONDS,
+                cooldown_seconds=settings.RAID_MODE_COOLDOWN_SECONDS,
+                batch_interval_seconds=settings.RAID_BATCH_INTERVAL_SECONDS,
+            ),
+            scope=Scope.singleton,
+        )
+
+    @staticmethod
+    def _register_services(container: Container) -> None:
+        """Регистрация сервисов."""
+        from services import (
+            AdminActionLogService,
+            ArchiveBindService,
+            BotMessageService,
+            BotPermissionService,
+            CategoryService,
+            ChatService,
+            PunishmentService,
+            ReportScheduleService,
+            TaskiqSchedulerService,
+            TemplateContentService,
+            TemplateService,
+            TrackingIndexService,
+            UserService,
+        )
+        from services.caching import ResponseCache
+        from services.chat.summarize import IAIService
+        from services.chat.summarize.limiter import CircuitBreaker, ProviderLimiter
+        from services.chat.summarize.open_router_service import OpenRouterService
+        from services.client import ApiClient
+        from services.scheduler import ScheduleChangeNotifier
+        from services.templates import TemplateSearchIndex
+
         container.register(
             IAIService,
             factory=lambda: OpenRouterService(
                 api_key=settings.OPEN_ROUTER_TOKEN,
                 model_name=settings.OPEN_ROUTER_MODEL,
+                timeout_seconds=settings.OPEN_ROUTER_TIMEOUT_SECONDS,
+                connect_timeout_seconds=settings.OPEN_ROUTER_CONNECT_TIMEOUT_SECONDS,
+                max_connections=settings.OPEN_ROUTER_MAX_CONNECTIONS,
+                http2=settings.OPEN_ROUTER_HTTP2,
+                limiter=ProviderLimiter(
+                    max_concurrency=settings.OPEN_ROUTER_MAX_CONCURRENCY,
+                    queue_timeout_seconds=settings.OPEN_ROUTER_QUEUE_TIMEOUT_SECONDS,
+                    call_deadline_seconds=settings.OPEN_ROUTER_CALL_DEADLINE_SECONDS,
+                    breaker=CircuitBreaker(
+                        failure_threshold=settings.OPEN_ROUTER_BREAKER_FAILURES,
+                        reset_timeout_seconds=settings.OPEN_ROUTER_BREAKER_RESET_SECONDS,
+                    ),
+                ),
             ),
             scope=Scope.singleton,
         )
+        container.register(ScheduleChangeNotifier, scope=Scope.singleton)
         container.register(UserService, scope=Scope.singleton)
+        container.register(
+            TrackingIndexService,
+            factory=TrackingIndexService,
+            scope=Scope.singleton,
+            ttl_seconds=settings.TRACKING_INDEX_TTL_SECONDS,
+        )
         container.register(ChatService, scope=Scope.singleton)
         container.register(ArchiveBindService, scope=Scope.singleton)
+        container.register(
+            TemplateSearchIndex,
+            factory=TemplateSearchIndex,
+            scope=Scope.singleton,
+            ttl_seconds=settings.TEMPLATE_SEARCH_INDEX_TTL_SECONDS,
+            max_entries=settings.TEMPLATE_SEARCH_INDEX_MAX_ENTRIES,
+        )
         container.register(TemplateService, scope=Scope.singleton)
         container.register(TemplateContentService, scope=Scope.singleton)
         container.register(CategoryService, scope=Scope.singleton)
         container.register(BotPermissionService, scope=Scope.singleton)
         container.register(BotMessageService, scope=Scope.singleton)
         container.register(PunishmentService, scope=Scope.singleton)
-        container.register(AdminActionLogService, scope=Scope.singleton)
+        container.register(
+            AdminActionLogService,
+            factory=AdminActionLogService,
+            scope=Scope.singleton,
+            count_ttl_seconds=settings.ADMIN_LOGS_COUNT_CACHE_TTL_SECONDS,
+        )
+        container.register(
+            ResponseCache,
+            factory=ResponseCache,
+            scope=Scope.singleton,
+            ttl_seconds=settings.MINIAPP_RESPONSE_CACHE_TTL_SECONDS,
+        )
         container.register(ReportScheduleService, scope=Scope.singleton)
-        container.register(TaskiqSchedulerService, scope=Scope.singleton)
-
-        container.register(AnalyticsBufferService, scope=Scope.singleton)
-        container.register(AutoModerationBufferService, scope=Scope.singleton)
+        container.register(
+            TaskiqSchedulerService,
+            factory=TaskiqSchedulerService,
+            scope=Scope.singleton,
+            batch_size=settings.REPORT_BATCH_SIZE,
+        )
         container.register(
             ApiClient,
             factory=lambda: ApiClient(base_url=settings.API_BASE_URL),
@@ -286,10 +393,11 @@ class ContainerSetup:
 
     @staticmethod
     def _register_usecases(container: Container) -> None:
-        """Регистрация всех use cases."""
+        """Регистрация всех use cases (кроме автомодерации — отдельный шаг)."""
         ContainerSetup._register_user_usecases(container)
         ContainerSetup._register_chat_usecases(container)
         ContainerSetup._register_antibot_usecases(container)
+        ContainerSetup._register_antiraid_usecases(container)
         ContainerSetup._register_message_usecases(container)
         ContainerSetup._register_archive_usecases(container)
         ContainerSetup._register_report_usecases(container)
@@ -308,6 +416,12 @@ class ContainerSetup:
     @staticmethod
     def _register_punishment_usecases(container: Container) -> None:
         """Регистрация use cases для управления наказаниями."""
+        from usecases.punishment import (
+            GetPunishmentLadderUseCase,
+            SetDefaultPunishmentLadderUseCase,
+            UpdatePunishmentLadderUseCase,
+        )
+
         punishment_usecases = [
             GetPunishmentLadderUseCase,
             SetDefaultPunishmentLadderUseCase,
@@ -320,18 +434,41 @@ class ContainerSetup:
     @staticmethod
     def _register_admin_logs_usecases(container: Container) -> None:
         """Регистрация use cases для просмотра логов администраторов."""
+        from usecases.admin_logs import (
+            GetAdminLogsPageUseCase,
+            GetAdminsWithLogsUseCase,
+        )
+
         container.register(GetAdminsWithLogsUseCase)
         container.register(GetAdminLogsPageUseCase)
 
     @staticmethod
     def _register_release_notes_usecases(container: Container) -> None:
         """Регистрация use cases для релизных заметок (рассылка текста)."""
+        from usecases.release_notes import BroadcastTextToAdminsUseCase
+
         container.register(BroadcastTextToAdminsUseCase)
 
     @staticmethod
     def _register_antibot_usecases(container: Container) -> None:
         """Регистрация use cases для антибота."""
+        from usecases.antibot import GetAntibotSettingsUseCase
+
         container.register(GetAntibotSettingsUseCase)
+
+    @staticmethod
+    def _register_automoderation_usecases(container: Container) -> None:
+        """Регистрация use cases автомодерации (бот и воркер автомодерации)."""
+        from services.automoderation_buffer_service import (
+            AutoModerationBufferService,
+        )
+        from usecases.automoderation import (
+            GetAutoModerationSettingsUseCase,
+            NotifyAutoModerationHitUseCase,
+            ProcessAutoModerationBatchUseCase,
+            RunAutoModerationOnMessageUseCase,
+        )
+
         container.register(GetAutoModerationSettingsUseCase)
         container.register(NotifyAutoModerationHitUseCase)
         container.register(ProcessAutoModerationBatchUseCase)
@@ -340,27 +477,61 @@ class ContainerSetup:
             factory=lambda: RunAutoModerationOnMessageUseCase(
                 buffer_service=container.resolve(AutoModerationBufferService),
                 batch_size=settings.AUTO_MODERATION_BATCH_SIZE,
+                safe_text_max_length=settings.AUTO_MODERATION_SAFE_TEXT_MAX_LENGTH,
             ),
         )
 
+    @staticmethod
+    def _register_antiraid_usecases(container: Container) -> None:
+        """Регистрация use cases для режима рейда (массовые вступления)."""
+        from usecases.antiraid import (
+            EnqueueRaidJoinUseCase,
+            ProcessRaidJoinBatchUseCase,
+        )
+
+        container.register(EnqueueRaidJoinUseCase)
+        container.register(
+            ProcessRaidJoinBatchUseCase,
+            factory=ProcessRaidJoinBatchUseCase,
+            restrict_pace_seconds=settings.RAID_RESTRICT_PACE_SECONDS,
+        )
+
     @staticmethod
     def _register_archive_usecases(container: Container) -> None:
         """Регистрация use cases для архива."""
+        from usecases.archive import (
+            BindArchiveChatUseCase,
+            GenerateArchiveBindHashUseCase,
+            GetArchiveSettingsUseCase,
+            NotifyArchiveChatMemberKickedUseCase,
+            NotifyArchiveChatMemberLeftUseCase,
+            NotifyArchiveChatMembersDigestUseCase,
+            NotifyArchiveChatNewMemberUseCase,
+        )
+
         container.register(BindArchiveChatUseCase)
         container.register(GenerateArchiveBindHashUseCase)
         container.register(GetArchiveSettingsUseCase)
         container.register(NotifyArchiveChatMemberKickedUseCase)
         container.register(NotifyArchiveChatMemberLeftUseCase)
+        container.register(NotifyArchiveChatMembersDigestUseCase)
         container.register(NotifyArchiveChatNewMemberUseCase)
 
     @staticmethod
     def _register_summarize_usecases(container: Container) -> None:
         """Регистрация use cases для суммаризации."""
+        from usecases.summarize.summarize_chat_messages import GetChatSummaryUseCase
+
         container.register(GetChatSummaryUseCase)
 
     @staticmethod
     def _register_reaction_usecases(container: Container) -> None:
         """Регистрация use cases для реакций."""
+        from usecases.reactions import (
+            GetUserReactionsUseCase,
+            SaveMessageReactionUseCase,
+        )
+
         reaction_usecases = [
             SaveMessageReactionUseCase,
             GetUserReactionsUseCase,
@@ -372,6 +543,18 @@ class ContainerSetup:
     @staticmethod
     def _register_user_usecases(container: Container) -> None:
         """Регистрация use cases для пользователей."""
+        from usecases.settings import ResetAllTrackingUseCase
+        from usecases.user import (
+            CreateNewUserUserCase,
+            DeleteUserUseCase,
+            GetAllUsersUseCase,
+            GetOrCreateUserIfNotExistUserCase,
+            GetUserByIdUseCase,
+            GetUserByTgIdUseCase,
+            GetUserByUsernameUseCase,
+            UpdateUserRoleUseCase,
+        )
+
         user_usecases = [
             GetOrCreateUserIfNotExistUserCase,
             CreateNewUserUserCase,
@@ -390,6 +573,19 @@ class ContainerSetup:
     @staticmethod
     def _register_chat_usecases(container: Container) -> None:
         """Регистрация use cases для чатов."""
+        from usecases.chat import (
+            GetAllChatsUseCase,
+            GetChatsForUserActionUseCase,
+            GetChatWithArchiveUseCase,
+            GetTrackedChatsUseCase,
+            ToggleAntibotUseCase,
+            ToggleAutoDeleteWelcomeTextUseCase,
+            ToggleAutoModerationUseCase,
+            ToggleWelcomeTextUseCase,
+            UpdateChatWelcomeTextUseCase,
+            UpdateChatWorkHoursUseCase,
+        )
+
         chat_usecases = [
             GetAllChatsUseCase,
             GetChatWithArchiveUseCase,
@@ -409,6 +605,12 @@ class ContainerSetup:
     @staticmethod
     def _register_message_usecases(container: Container) -> None:
         """Регистрация use cases для сообщений."""
+        from usecases.membership import RecordChatMembershipEventUseCase
+        from usecases.message import (
+            SaveMessageUseCase,
+            SaveReplyMessageUseCase,
+        )
+
         message_usecases = [
             SaveMessageUseCase,
             SaveReplyMessageUseCase,
@@ -422,6 +624,29 @@ class ContainerSetup:
     @staticmethod
     def _register_moderation_usecases(container: Container) -> None:
         """Регистрация use cases для модерации."""
+        from usecases.admin_actions import (
+            BroadcastMessageToTrackedChatsUseCase,
+            DeleteMessageUseCase,
+            ReplyToMessageUseCase,
+            SendMessageToChatUseCase,
+        )
+        from usecases.amnesty import (
+            CancelLastWarnUseCase,
+            GetChatsWithAnyRestrictionUseCase,
+            GetChatsWithBannedUserUseCase,
+            GetChatsWithMutedUserUseCase,
+            GetChatsWithPunishedUserUseCase,
+            UnbanUserUseCase,
+            UnmuteUserUseCase,
+        )
+        from usecases.moderation import (
+            ExecuteModerationInChatsUseCase,
+            GiveUserBanUseCase,
+            GiveUserWarnUseCase,
+            RestrictNewMemberUseCase,
+            VerifyMemberUseCase,
+        )
+
         container.register(GiveUserWarnUseCase)
         container.register(GiveUserBanUseCase)
         container.register(ExecuteModerationInChatsUseCase)
@@ -442,7 +667,21 @@ class ContainerSetup:
     @staticmethod
     def _register_report_usecases(container: Container) -> None:
         """Регистрация use cases для отчетов."""
+        from usecases.report import (
+            ExportReportUseCase,
+            GetAllUsersBreaksDetailReportUseCase,
+            GetAllUsersReportUseCase,
+            GetBreaksDetailReportUseCase,
+            GetChatBreaksDetailReportUseCase,
+            GetChatDayActivityUseCase,
+            GetChatReportUseCase,
+            GetSingleUserReportUseCase,
+            SendDailyChatReportsUseCase,
+        )
+        from usecases.report.daily_rating import GetDailyTopUsersUseCase
+
         report_usecases = [
+            GetChatDayActivityUseCase,
             GetSingleUserReportUseCase,
             GetBreaksDetailReportUseCase,
             GetAllUsersReportUseCase,
@@ -450,15 +689,37 @@ class ContainerSetup:
             GetChatReportUseCase,
             GetChatBreaksDetailReportUseCase,
             GetDailyTopUsersUseCase,
-            SendDailyChatReportsUseCase,
         ]
 
         for usecase in report_usecases:
             container.register(usecase)
 
+        container.register(
+            SendDailyChatReportsUseCase,
+            factory=SendDailyChatReportsUseCase,
+            send_pace_seconds=settings.REPORT_SEND_PACE_SECONDS,
+        )
+        container.register(
+            ExportReportUseCase,
+            factory=ExportReportUseCase,
+            batch_size=settings.REPORT_EXPORT_BATCH_SIZE,
+        )
+
     @staticmethod
     def _register_tracking_usecases(container: Container) -> None:
         """Регистрация use cases для отслеживания пользователей."""
+        from usecases.chat_tracking import (
+            AddChatToTrackUseCase,
+            GetUserTrackedChatsUseCase,
+            RemoveChatFromTrackingUseCase,
+        )
+        from usecases.user_tracking import (
+            AddUserToTrackingUseCase,
+            GetListTrackedUsersUseCase,
+            HasTrackedUsersUseCase,
+            RemoveUserFromTrackingUseCase,
+        )
+
         tracking_usecases = [
             AddUserToTrackingUseCase,
             GetListTrackedUsersUseCase,
@@ -475,6 +736,27 @@ class ContainerSetup:
     @staticmethod
     def _register_template_usecases(container: Container) -> None:
         """Регистрация use cases для шаблонов."""
+        from usecases.categories import (
+            CreateCategoryUseCase,
+            DeleteCategoryUseCase,
+            GetCategoriesPaginatedUseCase,
+            GetCategoriesUseCase,
+            GetCategoryByIdUseCase,
+            UpdateCategoryNameUseCase,
+        )
+        from usecases.templates import (
+            CreateTemplateFromContentUseCase,
+            DeleteTemplateUseCase,
+            GetTemplateAndIncreaseUsageUseCase,
+            GetTemplateByIdUseCase,
+            GetTemplatesByCategoryUseCase,
+            GetTemplatesByQueryUseCase,
+            GetTemplatesByScopeUseCase,
+            GetTemplatesPaginatedUseCase,
+            UpdateTemplateContentUseCase,
+            UpdateTemplateTitleUseCase,
+        )
+
         template_usecases = [
             CreateCategoryUseCase,
             CreateTemplateFromContentUseCase,
@@ -500,16 +782,25 @@ class ContainerSetup:
     @staticmethod
     def _register_permissions_usecases(container: Container) -> None:
         """Регистрация use cases для проверки прав бота."""
+        from usecases.permissions import GetBotPermissionsInChatUseCase
+
         container.register(GetBotPermissionsInChatUseCase)
 
     @staticmethod
     def _register_archive_toggle_usecases(container: Container) -> None:
         """Регистрация use cases для переключения/настройки архива."""
+        from usecases.archive import (
+            SetArchiveSendingTimeUseCase,
+            ToggleArchiveScheduleUseCase,
+        )
+
         container.register(ToggleArchiveScheduleUseCase)
         container.register(SetArchiveSendingTimeUseCase)
 
     @staticmethod
     def _register_time_usecases(container: Container) -> None:
         """Регистрация use cases для времени (текущее время, конвертация в локальную зону)."""
+        from usecases.time import ConvertToLocalTimeUseCase, GetAppNowUseCase
+
         container.register(GetAppNowUseCase)
         container.register(ConvertToLocalTimeUseCase)
@@ -1,3 +1,129 @@
-from punq import Container
+import inspect
+import logging
+from typing import Any, Callable, Optional
 
-container: Container = Container()
+from punq import Container, Scope, empty
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class CompiledContainer(Container):
+    """
+    punq-контейнер с предкомпилированными фабриками для горячих путей.
+
+    punq на каждый resolve заново строит контекст разрешения и разбирает сигнатуру
+    конструктора (inspect.getfullargspec). После compile() синглтоны отдаются
+    напрямую из кеша, а для transient-регистраций используется фабрика, собранная
+    один раз: список (имя аргумента, ключ зависимости) и статические kwargs.
+    resolve с kwargs и всё, что не удалось скомпилировать, идёт штатным путём punq.
+    """
+
+    def __init__(self) -> None:
+        # Заполняются до super().__init__: там уже вызывается register()
+        self._service_keys: dict[Any, None] = {}
+        self._compiled: dict[Any, Callable[[], Any]] = {}
+        super().__init__()
+
+    def register(
+        self, service, factory=empty, instance=empty, scope=Scope.transient, **kwargs
+    ):
+        self._service_keys[service] = None
+        self._compiled.pop(service, None)
+        return super().register(
+            service, factory=factory, instance=instance, scope=scope, **kwargs
+        )
+
+    def is_registered(self, service_key: Any) -> bool:
+        """Есть ли регистрация ключа (профиль процесса мог её не включать)."""
+        return service_key in self._service_keys
+
+    def resolve(self, service_key, **kwargs):
+        if not kwargs:
+            instance = self._singletons.get(service_key, _MISSING)
+            if instance is not _MISSING:
+                return instance
+            factory = self._compiled.get(service_key)
+            if factory is not None:
+                return factory()
+        return super().resolve(service_key, **kwargs)
+
+    def compile(
+        self, promote_to_singleton: Optional[Callable[[Any], bool]] = None
+    ) -> None:
+        """
+        Компилирует фабрики и прогревает переведённые в singleton регистрации.
+
+        Args:
+            promote_to_singleton: предикат по ключу сервиса; transient-регистрации,
+                для которых он истинен, переводятся в singleton (только для
+                объектов без состояния между вызовами).
+        """
+        self._compiled.clear()
+        promoted: list[Any] = []
+        for key in self._service_keys:
+            impls = self.registrations[key]
+            if not impls:
+                continue
+            registration = impls[-1]
+            if (
+                registration.scope == Scope.transient
+                and promote_to_singleton is not None
+                and promote_to_singleton(key)
+            ):
+                registration = registration._replace(scope=Scope.singleton)
+                impls[-1] = registration
+                promoted.append(key)
+            if registration.scope == Scope.transient:
+                factory = self._compile_factory(registration)
+                if factory is not None:
+                    self._compiled[key] = factory
+
+        # Прогреваем только переведённые регистрации: остальные синглтоны (клиенты
+        # Redis/HTTP) могут требовать запущенный event loop и создаются лениво.
+        for key in promoted:
+            if key in self._singletons:
+                continue
+            try:
+                self.resolve(key)
+            except Exception as e:
+                # Ошибка всплывёт при первом реальном resolve — не валим старт процесса
+                logger.warning("DI: не удалось прогреть %s: %s", key, e)
+
+        logger.debug(
+            "DI: скомпилировано фабрик=%d, синглтонов=%d",
+            len(self._compiled),
+            len(self._singletons),
+        )
+
+    def _compile_factory(self, registration: Any) -> Optional[Callable[[], Any]]:
+        builder = registration.builder
+        try:
+            spec = inspect.getfullargspec(builder)
+        except TypeError:
+            return None
+
+        accepted = set(spec.args) | set(spec.kwonlyargs)
+        deps: list[tuple[str, Any]] = []
+        for name, dep_key in registration.needs.items():
+            if name == "return" or name in registration.args or name not in accepted:
+                continue
+            if dep_key not in self._service_keys:
+                # Незарегистрированная зависимость: punq подставит default или
+                # выбросит понятную ошибку — оставляем ему.
+                return None
+            deps.append((name, dep_key))
+
+        static_args = dict(registration.args)
+        resolve = self.resolve
+
+        def factory() -> Any:
+            kwargs = {name: resolve(dep_key) for name, dep_key in deps}
+            kwargs.update(static_args)
+            return builder(**kwargs)
+
+        return factory
+
+
+container: CompiledContainer = CompiledContainer()
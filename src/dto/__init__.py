@@ -4,6 +4,7 @@ from .admin_log import (
     GetAdminLogsPageDTO,
 )
 from .amnesty import AmnestyUserDTO, CancelWarnResultDTO
+from .antiraid import ArchiveMembersDigestDTO, RaidJoinBatchJobDTO, RaidJoinItemDTO
 from .archive_notification import ArchiveMemberNotificationDTO
 from .automoderation import (
     AutoModerationBatchJobDTO,
@@ -52,6 +53,7 @@ from .report import (
     ChatReportDTO,
     SingleUserReportDTO,
 )
+from .report_schedule import ReportScheduleChangeDTO
 from .template_dto import TemplateDTO, TemplateSearchResultDTO, UpdateTemplateTitleDTO
 from .user import UserDTO
 from .user_tracking import RemoveUserTrackingDTO, UserTrackingDTO
@@ -63,6 +65,7 @@ __all__ = [
     "GetAdminLogsPageDTO",
     # Archive
     "ArchiveMemberNotificationDTO",
+    "ArchiveMembersDigestDTO",
     # Category
     "CategoryDTO",
     "CreateCategoryDTO",
@@ -99,6 +102,8 @@ __all__ = [
     "ChatReportDTO",
     "ChatReportDTO",
     "SingleUserReportDTO",
+    # Report schedule
+    "ReportScheduleChangeDTO",
     # Template
     "TemplateDTO",
     "TemplateSearchResultDTO",
@@ -113,6 +118,9 @@ __all__ = [
     "AutoModerationBufferItemDTO",
     "AutoModerationRunDTO",
     "SpamDetectionLLMResultDTO",
+    # Antiraid
+    "RaidJoinBatchJobDTO",
+    "RaidJoinItemDTO",
     # User Tracking
     "UserTrackingDTO",
     "RemoveUserTrackingDTO",
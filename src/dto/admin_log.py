@@ -4,6 +4,8 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
 
+from models import AdminActionLog
+
 
 class AdminWithLogsDTO(BaseModel):
     """Администратор с логами для списка выбора."""
@@ -16,20 +18,38 @@ class AdminWithLogsDTO(BaseModel):
 
 
 class GetAdminLogsPageDTO(BaseModel):
-    """Входные данные для получения страницы логов. admin_id=None — логи всех админов."""
+    """
+    Входные данные для получения страницы логов. admin_id=None — логи всех админов.
+    cursor — токен соседней страницы (None — первая страница), backward — идти назад.
+    page используется только для отображения номера страницы.
+    """
 
     admin_id: Optional[int] = None
     page: int = 1
     limit: int = 10
+    cursor: Optional[str] = None
+    backward: bool = False
 
     model_config = ConfigDict(frozen=True)
 
 
+class AdminLogsPageDTO(BaseModel):
+    """Keyset-страница логов: записи от новых к старым и курсоры соседних страниц."""
+
+    logs: list[AdminActionLog]
+    prev_cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
 class AdminLogPageResultDTO(BaseModel):
     """Результат страницы логов: заголовок и готовые строки записей."""
 
     header_text: str
     entry_lines: list[str]
     total_count: int
+    prev_cursor: Optional[str] = None
+    next_cursor: Optional[str] = None
 
     model_config = ConfigDict(frozen=True)
@@ -0,0 +1,41 @@
+"""DTO режима рейда (массовые вступления в чат)."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RaidJoinItemDTO(BaseModel):
+    """Один вступивший участник в очереди режима рейда."""
+
+    user_tgid: int
+    username: str | None = None
+    first_name: str | None = None
+    joined_at: datetime
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def display_name(self) -> str:
+        return self.username or self.first_name or str(self.user_tgid)
+
+
+class RaidJoinBatchJobDTO(BaseModel):
+    """Пачка вступлений одного чата для сводной обработки в воркере."""
+
+    chat_tgid: str
+    chat_title: str
+    items: list[RaidJoinItemDTO]
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ArchiveMembersDigestDTO(BaseModel):
+    """Сводное уведомление в архивный чат о группе участников."""
+
+    chat_tgid: str
+    chat_title: str
+    members: list[RaidJoinItemDTO]
+    kicked: bool = False
+
+    model_config = ConfigDict(frozen=True)
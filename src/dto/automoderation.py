@@ -10,6 +10,8 @@ class AutoModerationBufferItemDTO(BaseModel):
     user_tg_id: int
     message_id: int
     message_text: str = Field(max_length=4096)
+    # Unix-время попадания в буфер (для метрик времени до обнаружения)
+    enqueued_at: float | None = None
 
     model_config = ConfigDict(frozen=True)
 
@@ -43,3 +43,25 @@ class BufferedMessageReplyDTO(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class BufferedMembershipEventDTO(BaseModel):
+    """Минималистичный DTO события состава чата для массовой вставки"""
+
+    chat_id: int
+    user_tgid: int
+    event_type: str  # MembershipEventType enum value
+    created_at: datetime
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class BufferedAdminActionLogDTO(BaseModel):
+    """Минималистичный DTO записи лога действий администратора для буферизации в Redis"""
+
+    admin_id: int
+    action_type: str  # AdminActionType enum value
+    details: Optional[str] = None
+    created_at: datetime
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
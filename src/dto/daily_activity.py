@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -47,3 +47,16 @@ class ChatDailyStatsDTO(BaseModel):
     total_users_count: int = 0
 
     model_config = ConfigDict(frozen=True)
+
+
+class ChatDayActivityDTO(BaseModel):
+    """Лидерборд по сообщениям и число активных пользователей чата за день."""
+
+    chat_id: int
+    day: date
+    top_users: List[UserDailyActivityDTO]
+    active_users_count: int
+    # True — из живых счётчиков Redis, False — посчитано по БД
+    live: bool
+
+    model_config = ConfigDict(frozen=True)
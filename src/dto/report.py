@@ -3,6 +3,8 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict
 
+from constants.enums import ExportGranularity, ExportScope
+
 
 class SingleUserReportDTO(BaseModel):
     user_id: int
@@ -181,7 +183,9 @@ class AllUsersUserStatsResult(BaseModel):
     user_id: int
     username: str
     day_stats: Optional[SingleUserDayStats] = None  # переиспользуем существующий
-    multi_day_stats: Optional[SingleUserMultiDayStats] = None  # переиспользуем существующий
+    multi_day_stats: Optional[SingleUserMultiDayStats] = (
+        None  # переиспользуем существующий
+    )
     replies_stats: RepliesStats
     breaks: List[str]  # уже отформатированные из BreakAnalysisService
 
@@ -212,3 +216,15 @@ class ReportResultDTO(BaseModel):
     error_message: Optional[str] = None
 
     model_config = ConfigDict(frozen=True)
+
+
+class ReportExportDTO(BaseModel):
+    """Параметры потоковой выгрузки отчёта в CSV."""
+
+    scope: ExportScope
+    target_id: int  # Database id чата или пользователя
+    start_date: datetime
+    end_date: datetime
+    granularity: ExportGranularity = ExportGranularity.DAILY
+
+    model_config = ConfigDict(frozen=True)
@@ -0,0 +1,18 @@
+"""DTO расписания ежедневных отчетов."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ReportScheduleChangeDTO(BaseModel):
+    """
+    Уведомление об изменении расписания для планировщика отчетов.
+
+    next_run_at=None — расписание отключено и должно уйти из очереди.
+    """
+
+    schedule_id: int
+    next_run_at: datetime | None = None
+
+    model_config = ConfigDict(frozen=True)
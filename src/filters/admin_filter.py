@@ -1,4 +1,5 @@
 import logging
+from typing import TYPE_CHECKING, Optional
 
 from aiogram.types import CallbackQuery, InlineQuery, Message
 from punq import Container
@@ -6,6 +7,9 @@ from punq import Container
 from constants.enums import UserRole
 from filters.base_filter import BaseUserFilter
 
+if TYPE_CHECKING:
+    from services.update_context import UpdateContext
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +18,7 @@ class AdminOnlyFilter(BaseUserFilter):
         self,
         event: Message | CallbackQuery,
         container: Container,
+        update_context: Optional["UpdateContext"] = None,
     ) -> bool:
         if isinstance(event, Message):
             tg_id = str(event.from_user.id)
@@ -25,7 +30,10 @@ class AdminOnlyFilter(BaseUserFilter):
             return False
 
         user = await self.get_user(
-            tg_id=tg_id, current_username=current_username, container=container
+            tg_id=tg_id,
+            current_username=current_username,
+            container=container,
+            update_context=update_context,
         )
 
         if user and user.role in (
@@ -41,12 +49,20 @@ class AdminOnlyFilter(BaseUserFilter):
 
 
 class StaffOnlyFilter(BaseUserFilter):
-    async def __call__(self, message: Message, container: Container) -> bool:
+    async def __call__(
+        self,
+        message: Message,
+        container: Container,
+        update_context: Optional["UpdateContext"] = None,
+    ) -> bool:
         tg_id = str(message.from_user.id)
         current_username = message.from_user.username
 
         user = await self.get_user(
-            tg_id=tg_id, current_username=current_username, container=container
+            tg_id=tg_id,
+            current_username=current_username,
+            container=container,
+            update_context=update_context,
         )
         return user is not None and user.role in (
             UserRole.ADMIN,
@@ -65,7 +81,9 @@ class StaffOnlyInlineFilter(BaseUserFilter):
         current_username = inline_query.from_user.username
 
         user = await self.get_user(
-            tg_id=tg_id, current_username=current_username, container=container
+            tg_id=tg_id,
+            current_username=current_username,
+            container=container,
         )
         return user is not None and user.role in (
             UserRole.ADMIN,
@@ -1,10 +1,13 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from aiogram.filters import Filter
 from punq import Container
 
 from models.user import User
 
+if TYPE_CHECKING:
+    from services.update_context import UpdateContext
+
 
 class BaseUserFilter(Filter):
     """Базовый фильтр для работы с пользователями"""
@@ -14,8 +17,15 @@ class BaseUserFilter(Filter):
         tg_id: str,
         current_username: str,
         container: Container,
+        update_context: Optional["UpdateContext"] = None,
     ) -> Optional[User]:
-        """Получает пользователя из кеша или БД через UserService"""
+        """
+        Получает пользователя из контекста апдейта (если он есть и относится
+        к тому же пользователю) или из кеша/БД через UserService
+        """
+        if update_context is not None and update_context.user_tg_id == tg_id:
+            return await update_context.find_user()
+
         from services.user.user_service import UserService
 
         user_service: UserService = container.resolve(UserService)
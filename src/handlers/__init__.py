@@ -3,8 +3,10 @@ from aiogram.enums import ChatType
 from punq import Container
 
 from filters import AdminOnlyFilter, ChatTypeFilter, GroupTypeFilter
-from middlewares import AdminAntispamMiddleware
+from middlewares import AdminAntispamMiddleware, UpdateContextMiddleware
 from services.caching import ICache
+from services.chat import ChatService
+from services.user import UserService
 
 from .group import router as group_router
 from .private import router as private_router
@@ -20,6 +22,14 @@ def _make_inject_container_middleware(container: Container):
     return middleware
 
 
+def _make_update_context_middleware(container: Container) -> UpdateContextMiddleware:
+    """Middleware общего контекста апдейта (пользователь и чат загружаются один раз)."""
+    return UpdateContextMiddleware(
+        user_service=container.resolve(UserService),
+        chat_service=container.resolve(ChatService),
+    )
+
+
 def registry_admin_routers(dispatcher: Dispatcher, container: Container) -> None:
     # Создаем роутер для админов
     only_admin_router = Router(name="admin_router")
@@ -44,6 +54,12 @@ def registry_admin_routers(dispatcher: Dispatcher, container: Container) -> None
     only_admin_router.callback_query.outer_middleware(inject_container)
     only_admin_router.inline_query.outer_middleware(inject_container)
 
+    # Общий контекст апдейта: фильтр админа и LanguageMiddleware читают
+    # пользователя один раз
+    update_context = _make_update_context_middleware(container)
+    only_admin_router.message.outer_middleware(update_context)
+    only_admin_router.callback_query.outer_middleware(update_context)
+
     # Регистрируем приватный роутер
     only_admin_router.include_router(private_router)
 
@@ -64,6 +80,9 @@ def registry_group_routers(dispatcher: Dispatcher, container: Container) -> None
     public_router.chat_member.outer_middleware(inject_container)
     public_router.inline_query.outer_middleware(inject_container)
 
+    # Общий контекст апдейта для фильтров, обработчиков и use case'ов
+    public_router.message.outer_middleware(_make_update_context_middleware(container))
+
     public_router.include_router(group_router)
 
     dispatcher.include_router(public_router)
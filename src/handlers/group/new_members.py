@@ -13,17 +13,22 @@ from constants import (
 from constants.callback import CallbackData
 from constants.enums import MembershipEventType
 from dto import ArchiveMemberNotificationDTO
+from dto.antiraid import RaidJoinItemDTO
 from dto.membership_event import RecordChatMembershipEventDTO
 from exceptions.base import BotBaseException
 from keyboards.inline.antibot import confirm_humanity_verification_ikb
 from keyboards.inline.chats import hide_notification_ikb
+from services.raid_mode_service import RaidModeService
+from services.time_service import TimeZoneService
 from tasks.moderation_tasks import (
     delete_message_from_chat,
     kick_unverified_member_task,
 )
+from usecases.antiraid import EnqueueRaidJoinUseCase
 from usecases.archive import NotifyArchiveChatNewMemberUseCase
 from usecases.membership import RecordChatMembershipEventUseCase
 from usecases.moderation import RestrictNewMemberUseCase, VerifyMemberUseCase
+from utils.antibot_utils import format_welcome_text
 
 router = Router(name=__name__)
 logger = logging.getLogger(__name__)
@@ -44,6 +49,28 @@ async def process_chat_member_joined(
         user = event.new_chat_member.user
 
         if not user.is_bot:
+            # Режим рейда: участник уходит в сводную очередь (одно приветствие на пачку)
+            enqueue_raid_uc: EnqueueRaidJoinUseCase = container.resolve(
+                EnqueueRaidJoinUseCase
+            )
+            queued = await enqueue_raid_uc.execute(
+                chat_tgid=str(event.chat.id),
+                chat_title=chat_title,
+                item=RaidJoinItemDTO(
+                    user_tgid=user.id,
+                    username=user.username,
+                    first_name=user.first_name,
+                    joined_at=TimeZoneService.now(),
+                ),
+            )
+            if queued:
+                logger.debug(
+                    "Участник %s поставлен в очередь режима рейда чата '%s'",
+                    user.id,
+                    chat_title,
+                )
+                return
+
             record_uc: RecordChatMembershipEventUseCase = container.resolve(
                 RecordChatMembershipEventUseCase
             )
@@ -135,6 +162,45 @@ async def process_humanity_verification(
     await callback.answer(result.message, show_alert=True)
 
 
+@router.callback_query(
+    F.data == CallbackData.Antibot.CONFIRM_HUMANITY_RAID,
+    F.message.chat.type.in_([ChatType.GROUP, ChatType.SUPERGROUP]),
+)
+async def process_raid_humanity_verification(
+    callback: types.CallbackQuery,
+    container: Container,
+) -> None:
+    """Обработчик кнопки сводной верификации (режим рейда): одна кнопка на всю пачку."""
+    chat_tgid = str(callback.message.chat.id)
+    message_id = callback.message.message_id
+
+    raid_service: RaidModeService = container.resolve(RaidModeService)
+    is_pending = await raid_service.is_pending_verification(
+        chat_tgid=chat_tgid,
+        message_id=message_id,
+        user_tgid=callback.from_user.id,
+    )
+    if not is_pending:
+        await callback.answer(Dialog.Antibot.VERIFIED_ERROR_USER, show_alert=True)
+        return
+
+    verify_usecase: VerifyMemberUseCase = container.resolve(VerifyMemberUseCase)
+    result = await verify_usecase.execute(
+        user_tgid=str(callback.from_user.id),
+        chat_tgid=chat_tgid,
+    )
+
+    # Сообщение не удаляем: по нему проверяются остальные участники пачки
+    if result.unmuted:
+        await raid_service.mark_verified(
+            chat_tgid=chat_tgid,
+            message_id=message_id,
+            user_tgid=callback.from_user.id,
+        )
+
+    await callback.answer(result.message, show_alert=True)
+
+
 async def _notify_archive(
     container: Container,
     chat_id: int,
@@ -155,20 +221,6 @@ async def _notify_archive(
     await notify_archive_usecase.execute(dto)
 
 
-def _get_formatted_welcome_text(
-    welcome_text: str | None,
-    username: str,
-) -> str:
-    """Форматирование текста приветствия."""
-    if not welcome_text:
-        return Dialog.Antibot.GREETING.format(username=username)
-
-    try:
-        return welcome_text.format(username=username)
-    except (KeyError, ValueError):
-        return welcome_text
-
-
 async def _handle_new_member(
     chat: types.Chat,
     user: types.User,
@@ -180,8 +232,8 @@ async def _handle_new_member(
     username = user.username or user.first_name or f"user_{user.id}"
 
     if user.is_bot:
-        bot_info = await bot.get_me()
-        if user.id == bot_info.id:
+        # bot.id берётся из токена — без запроса get_me на каждое вступление
+        if user.id == bot.id:
             logger.info(
                 "Наш бот добавлен в группу '%s' (ID: %s)",
                 chat_title,
@@ -222,7 +274,7 @@ async def _handle_new_member(
     if restriction_data.is_antibot_enabled:
         greeting_text = ""
         if restriction_data.show_welcome_text:
-            greeting_text = _get_formatted_welcome_text(
+            greeting_text = format_welcome_text(
                 welcome_text=restriction_data.welcome_text,
                 username=username_val,
             )
@@ -250,7 +302,7 @@ async def _handle_new_member(
 
     # Сценарий 2: Антибот выключен + Приветствие включено
     elif not restriction_data.is_antibot_enabled and restriction_data.show_welcome_text:
-        greeting_text = _get_formatted_welcome_text(
+        greeting_text = format_welcome_text(
             welcome_text=restriction_data.welcome_text,
             username=username_val,
         )
@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from aiogram import Router
 from aiogram.types import Message
@@ -10,6 +11,7 @@ from dto.message_reply import CreateMessageReplyDTO
 from dto.time_dto import ConvertToLocalTimeDTO
 from models.message import MessageType
 from services.chat import ChatService
+from services.update_context import UpdateContext
 from usecases.automoderation import RunAutoModerationOnMessageUseCase
 from usecases.message import (
     SaveMessageUseCase,
@@ -21,16 +23,24 @@ router = Router(name=__name__)
 logger = logging.getLogger(__name__)
 
 
-async def _run_automoderation_if_needed(message: Message, container: Container) -> None:
+async def _run_automoderation_if_needed(
+    message: Message,
+    container: Container,
+    update_context: Optional[UpdateContext] = None,
+) -> None:
     """Запускает цепочку автомодерации для текстового сообщения (не глотает исключения наружу)."""
     if not message.text:
         return
     try:
-        chat_service: ChatService = container.resolve(ChatService)
-        chat = await chat_service.get_chat(
-            chat_tgid=str(message.chat.id),
-            title=message.chat.title,
-        )
+        if update_context is not None:
+            # Чат уже загружен при сохранении сообщения
+            chat = await update_context.get_chat()
+        else:
+            chat_service: ChatService = container.resolve(ChatService)
+            chat = await chat_service.get_chat(
+                chat_tgid=str(message.chat.id),
+                title=message.chat.title,
+            )
         if not chat or not chat.is_auto_moderation_enabled:
             return
         run_uc: RunAutoModerationOnMessageUseCase = container.resolve(
@@ -63,9 +73,16 @@ def _get_message_type(message: Message) -> MessageType:
 
 
 @router.message()
-async def group_message_handler(message: Message, container: Container) -> None:
+async def group_message_handler(
+    message: Message,
+    container: Container,
+    update_context: Optional[UpdateContext] = None,
+) -> None:
     """
     Сохраняет все сообщения и ответы от всех пользователей для построения метрик.
+
+    update_context (из UpdateContextMiddleware) загружает пользователя и чат
+    один раз на апдейт — для сохранения и для автомодерации.
     """
     if message.from_user.is_bot:
         return
@@ -77,14 +94,15 @@ async def group_message_handler(message: Message, container: Container) -> None:
     msg_type = _get_message_type(message)
 
     if msg_type == MessageType.REPLY:
-        await process_reply_message(message, container)
+        await process_reply_message(message, container, update_context)
     else:
-        await process_message(message, container)
+        await process_message(message, container, update_context)
 
 
 async def process_reply_message(
     message: Message,
     container: Container,
+    update_context: Optional[UpdateContext] = None,
 ) -> None:
     """
     Сохраняет reply-сообщения и связь с оригинальным сообщением.
@@ -110,7 +128,9 @@ async def process_reply_message(
     try:
         # Сохраняем reply как обычное сообщение
         message_usecase: SaveMessageUseCase = container.resolve(SaveMessageUseCase)
-        await message_usecase.execute(message_dto=msg_dto)
+        await message_usecase.execute(
+            message_dto=msg_dto, update_context=update_context
+        )
 
         # Создаем ссылку на оригинальное сообщение
         original_message_url = _get_original_message_url(message)
@@ -136,7 +156,7 @@ async def process_reply_message(
             SaveReplyMessageUseCase
         )
         await reply_usecase.execute(reply_message_dto=reply_dto)
-        await _run_automoderation_if_needed(message, container)
+        await _run_automoderation_if_needed(message, container, update_context)
     except Exception as e:
         logger.error("Ошибка сохранения reply сообщения: %s", str(e))
 
@@ -144,6 +164,7 @@ async def process_reply_message(
 async def process_message(
     message: Message,
     container: Container,
+    update_context: Optional[UpdateContext] = None,
 ) -> None:
     """
     Сохраняет обычные сообщения от всех пользователей.
@@ -164,8 +185,8 @@ async def process_message(
 
     try:
         usecase: SaveMessageUseCase = container.resolve(SaveMessageUseCase)
-        await usecase.execute(message_dto=msg_dto)
-        await _run_automoderation_if_needed(message, container)
+        await usecase.execute(message_dto=msg_dto, update_context=update_context)
+        await _run_automoderation_if_needed(message, container, update_context)
         # client_service: ApiClient = container.resolve(ApiClient)
         # await client_service.message.create_message(msg_dto)
 
@@ -16,6 +16,7 @@ from aiogram.types import (
 )
 from punq import Container
 
+from config import settings
 from dto import TemplateDTO
 from filters import StaffOnlyInlineFilter
 from models import MessageTemplate
@@ -53,7 +54,12 @@ async def handle_inline_query(query: InlineQuery, container: Container) -> None:
                 )
             )
 
-        await query.answer(results, cache_time=1)
+        # is_personal: кеш Telegram не должен отдавать шаблоны не-сотрудникам
+        await query.answer(
+            results,
+            cache_time=settings.TEMPLATE_INLINE_CACHE_SECONDS,
+            is_personal=True,
+        )
     except Exception as e:
         logger.error(f"Ошибка при обработке inline запроса: {e}")
         # Отправляем пустой результат в случае ошибки
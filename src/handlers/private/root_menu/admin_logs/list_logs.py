@@ -112,6 +112,7 @@ async def admin_logs_select_handler(
                 total_count=result.total_count,
                 page_size=DEFAULT_PAGE_SIZE,
                 admin_id=admin_id,
+                next_cursor=result.next_cursor,
             ),
         )
 
@@ -18,14 +18,17 @@ router = Router(name=__name__)
 logger = logging.getLogger(__name__)
 
 
-def _parse_pagination_callback(callback_data: str) -> tuple[int, Optional[int]]:
-    """Парсит callback_data: prev/next_admin_logs_page__{page} или __{page}__{admin_id}."""
+def _parse_pagination_callback(
+    callback_data: str,
+) -> tuple[int, Optional[int], Optional[str]]:
+    """Парсит callback_data: prev/next_admin_logs_page__{page}__{admin_id}__{cursor}."""
     parts = callback_data.split("__")
     current_page = int(parts[1])
     admin_id: Optional[int] = (
         int(parts[2]) if len(parts) > 2 and parts[2] != "None" else None
     )
-    return current_page, admin_id
+    cursor = parts[3] if len(parts) > 3 else None
+    return current_page, admin_id, cursor
 
 
 @router.callback_query(F.data.startswith("prev_admin_logs_page__"))
@@ -42,13 +45,15 @@ async def prev_admin_logs_page_handler(
         return
 
     try:
-        current_page, admin_id = _parse_pagination_callback(callback.data)
+        current_page, admin_id, cursor = _parse_pagination_callback(callback.data)
         prev_page = max(1, current_page - 1)
 
         dto = GetAdminLogsPageDTO(
             admin_id=admin_id,
             page=prev_page,
             limit=DEFAULT_PAGE_SIZE,
+            cursor=cursor,
+            backward=True,
         )
         usecase: GetAdminLogsPageUseCase = container.resolve(GetAdminLogsPageUseCase)
         result = await usecase.execute(dto)
@@ -68,14 +73,14 @@ async def prev_admin_logs_page_handler(
                 total_count=result.total_count,
                 page_size=DEFAULT_PAGE_SIZE,
                 admin_id=admin_id,
+                prev_cursor=result.prev_cursor,
+                next_cursor=result.next_cursor,
             ),
         )
     except BotBaseException as e:
         await callback.answer(e.get_user_message(), show_alert=True)
     except Exception as e:
-        logger.exception(
-            "Ошибка при переходе на предыдущую страницу логов: %s", e
-        )
+        logger.exception("Ошибка при переходе на предыдущую страницу логов: %s", e)
         raise BusinessLogicException(
             message=Dialog.AdminLogs.ERROR_LOAD_PAGE,
             details={"original": str(e)},
@@ -96,13 +101,14 @@ async def next_admin_logs_page_handler(
         return
 
     try:
-        current_page, admin_id = _parse_pagination_callback(callback.data)
+        current_page, admin_id, cursor = _parse_pagination_callback(callback.data)
         next_page = current_page + 1
 
         dto = GetAdminLogsPageDTO(
             admin_id=admin_id,
             page=next_page,
             limit=DEFAULT_PAGE_SIZE,
+            cursor=cursor,
         )
         usecase: GetAdminLogsPageUseCase = container.resolve(GetAdminLogsPageUseCase)
         result = await usecase.execute(dto)
@@ -123,14 +129,14 @@ async def next_admin_logs_page_handler(
                 total_count=result.total_count,
                 page_size=DEFAULT_PAGE_SIZE,
                 admin_id=admin_id,
+                prev_cursor=result.prev_cursor,
+                next_cursor=result.next_cursor,
             ),
         )
     except BotBaseException as e:
         await callback.answer(e.get_user_message(), show_alert=True)
     except Exception as e:
-        logger.exception(
-            "Ошибка при переходе на следующую страницу логов: %s", e
-        )
+        logger.exception("Ошибка при переходе на следующую страницу логов: %s", e)
         raise BusinessLogicException(
             message=Dialog.AdminLogs.ERROR_LOAD_PAGE,
             details={"original": str(e)},
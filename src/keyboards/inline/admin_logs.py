@@ -15,22 +15,29 @@ def admin_logs_ikb(
     total_count: int = 0,
     page_size: int = DEFAULT_PAGE_SIZE,
     admin_id: int | None = None,
+    prev_cursor: str | None = None,
+    next_cursor: str | None = None,
 ) -> InlineKeyboardMarkup:
-    """Клавиатура для списка логов действий администраторов."""
+    """
+    Клавиатура для списка логов действий администраторов.
+    Кнопки навигации несут курсор соседней страницы:
+    {prev|next}_admin_logs_page__{page}__{admin_id}__{cursor}.
+    """
     builder = InlineKeyboardBuilder()
 
-    # Пагинация (только если больше одной страницы)
-    if total_count > page_size:
-        max_pages = (total_count + page_size - 1) // page_size
+    # Пагинация (только если есть соседние страницы)
+    if prev_cursor or next_cursor:
         pagination_buttons = []
 
         # Кнопка "Назад"
-        if page > 1:
-            callback_data = f"prev_admin_logs_page__{page}"
-            if admin_id:
-                callback_data += f"__{admin_id}"
+        if prev_cursor:
             pagination_buttons.append(
-                InlineKeyboardButton(text="◀️", callback_data=callback_data)
+                InlineKeyboardButton(
+                    text="◀️",
+                    callback_data=(
+                        f"prev_admin_logs_page__{page}__{admin_id}__{prev_cursor}"
+                    ),
+                )
             )
 
         # Информация о странице
@@ -47,16 +54,17 @@ def admin_logs_ikb(
         )
 
         # Кнопка "Вперед"
-        if page < max_pages:
-            callback_data = f"next_admin_logs_page__{page}"
-            if admin_id:
-                callback_data += f"__{admin_id}"
+        if next_cursor:
             pagination_buttons.append(
-                InlineKeyboardButton(text="▶️", callback_data=callback_data)
+                InlineKeyboardButton(
+                    text="▶️",
+                    callback_data=(
+                        f"next_admin_logs_page__{page}__{admin_id}__{next_cursor}"
+                    ),
+                )
             )
 
-        if pagination_buttons:
-            builder.row(*pagination_buttons)
+        builder.row(*pagination_buttons)
 
     # Кнопка "Вернуться в меню логов"
     builder.row(
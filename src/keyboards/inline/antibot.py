@@ -17,3 +17,17 @@ def confirm_humanity_verification_ikb(user_id: int) -> InlineKeyboardMarkup:
         ),
     )
     return builder.as_markup()
+
+
+def confirm_humanity_raid_ikb() -> InlineKeyboardMarkup:
+    """Клавиатура сводной верификации в режиме рейда (одна кнопка на всех)"""
+    builder = InlineKeyboardBuilder()
+
+    builder.row(
+        InlineKeyboardButton(
+            text=InlineButtons.Antibot.CONFIRM_HUMANITY,
+            callback_data=CallbackData.Antibot.CONFIRM_HUMANITY_RAID,
+            style="danger",
+        ),
+    )
+    return builder.as_markup()
@@ -3,18 +3,29 @@ import asyncio
 import logging
 import os
 import sys
+from typing import Optional
 
 import uvicorn
 from aiogram import Bot, Dispatcher
 from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
 from aiohttp import web
+from prometheus_client import REGISTRY
 
 from bot import configure_dispatcher
 from commands.start_commands import set_bot_commands
 from config import settings
-from container import ContainerSetup
+from container import ContainerProfile, ContainerSetup, container
 from database.session import engine
+from metrics import (
+    AIProviderCollector,
+    ShardingCollector,
+    instrument_engine,
+    start_metrics_server,
+)
+from middlewares import ShardedUpdateMiddleware
 from scheduler import broker
+from services.chat.summarize import IAIService
+from services.chat.summarize.open_router_service import OpenRouterService
 from utils.logger_config import setup_logger
 
 setup_logger(log_level=logging.INFO)
@@ -33,11 +44,25 @@ ALLOWED_UPDATES = [
 async def init_bot() -> tuple[Bot, Dispatcher]:
     """Инициализирует контейнер зависимостей и возвращает экземпляры бота и диспетчера."""
     logger.info("Инициализация контейнера...")
-    ContainerSetup.setup()
+    ContainerSetup.setup(ContainerProfile.BOT)
     logger.info("Настройка и запуск бота...")
     return await configure_dispatcher()
 
 
+async def start_metrics() -> Optional[web.AppRunner]:
+    """Подключает сборщики компонентов процесса бота и поднимает /metrics."""
+    if not settings.METRICS_ENABLED:
+        return None
+    instrument_engine(engine)
+    if settings.UPDATE_SHARDS > 0:
+        sharding = container.resolve(ShardedUpdateMiddleware)
+        REGISTRY.register(ShardingCollector(sharding.stats))
+    ai_service = container.resolve(IAIService)
+    if isinstance(ai_service, OpenRouterService):
+        REGISTRY.register(AIProviderCollector(ai_service.stats))
+    return await start_metrics_server(settings.METRICS_PORT)
+
+
 async def setup_webhook_and_commands(bot: Bot, webhook_url: str) -> None:
     """Настраивает вебхук и команды перед стартом веб-сервера."""
     await broker.startup()
@@ -93,7 +118,12 @@ def build_web_app(bot: Bot, dp: Dispatcher, webhook_url: str) -> web.Application
     app.router.add_get("/health", health)
     app.router.add_get("/webhook-info", webhook_info)
 
-    webhook_requests_handler = SimpleRequestHandler(dispatcher=dp, bot=bot)
+    # При шардировании ответ вебхуку ждёт места в очереди шарда (backpressure)
+    webhook_requests_handler = SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        handle_in_background=settings.UPDATE_SHARDS == 0,
+    )
     webhook_requests_handler.register(app, path="/webhook")
     setup_application(app, dp, bot=bot)
 
@@ -154,7 +184,13 @@ async def run_polling(bot: Bot, dp: Dispatcher):
     await set_bot_commands(bot)
 
     logger.info("Запуск polling...")
-    await dp.start_polling(bot, allowed_updates=ALLOWED_UPDATES)
+    # При шардировании апдейты раскладываются по очередям сразу, а polling
+    # ждёт места в очереди шарда вместо накопления задач (backpressure)
+    await dp.start_polling(
+        bot,
+        allowed_updates=ALLOWED_UPDATES,
+        handle_as_tasks=settings.UPDATE_SHARDS == 0,
+    )
 
 
 async def shutdown(bot: Bot, dp: Dispatcher) -> None:
@@ -171,6 +207,12 @@ async def shutdown(bot: Bot, dp: Dispatcher) -> None:
     except Exception as e:
         logger.warning("Ошибка при остановке брокера: %s", e)
 
+    try:
+        logger.info("Закрытие пула соединений OpenRouter...")
+        await container.resolve(IAIService).close()
+    except Exception as e:
+        logger.warning("Ошибка при закрытии клиента OpenRouter: %s", e)
+
     if dp and getattr(dp, "storage", None):
         logger.info("Закрытие хранилища FSM...")
         await dp.storage.close()
@@ -193,6 +235,7 @@ async def main():
     webhook_url = args.webhook_url or settings.USE_WEBHOOK
 
     bot, dp = await init_bot()
+    metrics_runner = await start_metrics()
 
     try:
         if webhook_url:
@@ -204,6 +247,8 @@ async def main():
         sys.exit(1)
     finally:
         await shutdown(bot, dp)
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
 
 
 if __name__ == "__main__":
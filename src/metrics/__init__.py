@@ -0,0 +1,34 @@
+"""
+Метрики Prometheus.
+
+- registry — гистограммы и счётчики процесса;
+- database — время SQL-запросов и состояние пула соединений;
+- collectors — шарды апдейтов и провайдер модели (поверх stats());
+- live — эти сборщики в воркере с несколькими процессами;
+- sampler — длина и отставание буферов аналитики, очереди TaskIQ;
+- tasks — время и ошибки задач в воркере;
+- server — GET /metrics в процессах без FastAPI.
+
+Middleware обработчиков и запросов к Bot API — в middlewares.metrics.
+"""
+
+from .collectors import AIProviderCollector, ShardingCollector
+from .database import instrument_engine
+from .live import start_live_export, stop_live_export
+from .sampler import sample_buffers, sample_task_queues
+from .server import metrics_registry, render_metrics, start_metrics_server
+from .tasks import TaskMetricsMiddleware
+
+__all__ = [
+    "AIProviderCollector",
+    "ShardingCollector",
+    "TaskMetricsMiddleware",
+    "instrument_engine",
+    "metrics_registry",
+    "render_metrics",
+    "sample_buffers",
+    "sample_task_queues",
+    "start_live_export",
+    "start_metrics_server",
+    "stop_live_export",
+]
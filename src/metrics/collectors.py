@@ -0,0 +1,79 @@
+"""
+Сборщики поверх stats() компонентов процесса.
+
+Значения читаются в момент сбора: сервер метрик работает в том же цикле
+событий (metrics.server), поэтому stats() не требует блокировок.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Union
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+Metric = Union[CounterMetricFamily, GaugeMetricFamily]
+StatsSource = Callable[[], Dict[str, Any]]
+
+
+class ShardingCollector(Collector):
+    """Очереди шардов апдейтов и счётчики ShardedUpdateMiddleware.stats()."""
+
+    def __init__(self, stats: StatsSource) -> None:
+        self._stats = stats
+
+    def collect(self) -> Iterable[Metric]:
+        stats = self._stats()
+        depth = GaugeMetricFamily(
+            "bot_update_shard_queue_depth",
+            "Апдейтов в очереди шарда",
+            labels=["shard"],
+        )
+        for shard, value in enumerate(stats["queue_depths"]):
+            depth.add_metric([str(shard)], value)
+        yield depth
+        for name, documentation in (
+            ("processed", "Апдейтов обработано шардами"),
+            ("duplicates", "Повторных апдейтов отброшено по update_id"),
+            ("failed", "Апдейтов, обработка которых завершилась ошибкой"),
+        ):
+            yield CounterMetricFamily(
+                f"bot_updates_{name}", documentation, value=stats[name]
+            )
+
+
+class AIProviderCollector(Collector):
+    """Вызовы провайдера модели по маршрутам и состояние цепи ProviderLimiter."""
+
+    def __init__(self, stats: StatsSource) -> None:
+        self._stats = stats
+
+    def collect(self) -> Iterable[Metric]:
+        stats = self._stats()
+        in_flight = GaugeMetricFamily(
+            "ai_provider_in_flight", "Вызовов в работе", labels=["route"]
+        )
+        counters = {
+            name: CounterMetricFamily(
+                f"ai_provider_{name}", documentation, labels=["route"]
+            )
+            for name, documentation in (
+                ("calls", "Вызовов провайдера"),
+                ("failures", "Отказов провайдера"),
+                ("rejected", "Вызовов, не получивших слот или отклонённых цепью"),
+            )
+        }
+        for route, route_stats in stats["routes"].items():
+            in_flight.add_metric([route], route_stats["in_flight"])
+            for name, counter in counters.items():
+                counter.add_metric([route], route_stats[name])
+        yield in_flight
+        yield from counters.values()
+        yield GaugeMetricFamily(
+            "ai_provider_circuit_open",
+            "1 — цепь разомкнута или ждёт пробного вызова",
+            value=int(stats["circuit_state"] != "closed"),
+        )
+        yield CounterMetricFamily(
+            "ai_provider_circuit_opened",
+            "Размыканий цепи",
+            value=stats["circuit_opened"],
+        )
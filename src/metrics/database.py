@@ -0,0 +1,102 @@
+"""Время SQL-запросов (события движка) и состояние пула соединений."""
+
+import time
+import weakref
+from typing import Any, Iterable, Optional
+
+from prometheus_client import REGISTRY, CollectorRegistry
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.engine.interfaces import ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .registry import DB_QUERY_DURATION, DB_QUERY_ERRORS
+
+_STATEMENTS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+_instrumented: "weakref.WeakKeyDictionary[Engine, PoolCollector]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def statement_type(statement: str) -> str:
+    """Первое ключевое слово запроса как метка (прочие — OTHER)."""
+    words = statement.lstrip()[:7].split(None, 1)
+    keyword = words[0].upper() if words else ""
+    return keyword if keyword in _STATEMENTS else "OTHER"
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    if context is not None:
+        context._metrics_started = time.perf_counter()  # type: ignore[attr-defined]
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    started = getattr(context, "_metrics_started", None)
+    if started is not None:
+        DB_QUERY_DURATION.labels(statement_type(statement)).observe(
+            time.perf_counter() - started
+        )
+
+
+def _handle_error(exception_context: Any) -> None:
+    statement = exception_context.statement
+    if statement:
+        DB_QUERY_ERRORS.labels(statement_type(statement)).inc()
+
+
+class PoolCollector(Collector):
+    """Размер пула и занятые соединения — читаются в момент сбора метрик."""
+
+    def __init__(self, engine: Engine) -> None:
+        self._engine = engine
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        pool = self._engine.pool
+        for name, documentation, method in (
+            ("db_pool_size", "Постоянных соединений в пуле", "size"),
+            ("db_pool_checked_out", "Соединений, выданных сессиям", "checkedout"),
+            ("db_pool_checked_in", "Свободных соединений в пуле", "checkedin"),
+            ("db_pool_overflow", "Соединений сверх pool_size", "overflow"),
+        ):
+            reader = getattr(pool, method, None)
+            if reader is not None:
+                yield GaugeMetricFamily(name, documentation, value=reader())
+
+
+def instrument_engine(
+    engine: AsyncEngine, registry: Optional[CollectorRegistry] = REGISTRY
+) -> PoolCollector:
+    """
+    Подписывает движок на замер запросов и регистрирует сборщик пула
+    (registry=None — не регистрирует: воркер экспортирует его сам,
+    см. metrics.live).
+
+    Повторный вызов для того же движка возвращает прежний сборщик.
+    """
+    sync_engine = engine.sync_engine
+    collector = _instrumented.get(sync_engine)
+    if collector is not None:
+        return collector
+    collector = _instrumented[sync_engine] = PoolCollector(sync_engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+    if registry is not None:
+        registry.register(collector)
+    return collector
@@ -0,0 +1,93 @@
+"""
+Живые значения процесса (пул соединений, провайдер модели) в воркере.
+
+Без PROMETHEUS_MULTIPROC_DIR сборщики поверх stats() просто регистрируются
+в REGISTRY. С ним сервер метрик отдаёт только файлы процессов
+(MultiProcessCollector), а сборщик видит лишь свой процесс. Поэтому каждый
+процесс воркера периодически переносит значения своих сборщиков в gauge с
+multiprocess_mode="livesum": в выводе — сумма по живым процессам, а файлы
+завершившегося процесса удаляет mark_process_dead.
+"""
+
+import asyncio
+import logging
+import os
+from typing import Callable, Dict, Optional, Sequence, Tuple, cast
+
+from prometheus_client import REGISTRY, Gauge
+from prometheus_client.multiprocess import mark_process_dead
+from prometheus_client.registry import Collector
+
+logger = logging.getLogger(__name__)
+
+EXPORT_INTERVAL_SECONDS = 15.0
+
+_gauges: Dict[Tuple[str, Tuple[str, ...]], Gauge] = {}
+
+
+def is_multiprocess() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def _gauge(name: str, documentation: str, labelnames: Tuple[str, ...]) -> Gauge:
+    key = (name, labelnames)
+    gauge = _gauges.get(key)
+    if gauge is None:
+        # registry=None: в режиме нескольких процессов значения живут в файлах
+        gauge = _gauges[key] = Gauge(
+            name,
+            documentation,
+            labelnames,
+            registry=None,
+            multiprocess_mode="livesum",
+        )
+    return gauge
+
+
+def export_collectors(collectors: Sequence[Collector]) -> None:
+    """Переносит текущие значения сборщиков в livesum-gauge процесса."""
+    for collector in collectors:
+        for family in collector.collect():
+            for sample in family.samples:
+                labelnames = tuple(sample.labels)
+                gauge = _gauge(sample.name, family.documentation, labelnames)
+                target = gauge.labels(**sample.labels) if labelnames else gauge
+                target.set(sample.value)
+
+
+async def _export_loop(collectors: Sequence[Collector], interval: float) -> None:
+    while True:
+        try:
+            export_collectors(collectors)
+        except Exception as e:
+            logger.warning("Не удалось снять живые метрики процесса: %s", e)
+        await asyncio.sleep(interval)
+
+
+def start_live_export(
+    collectors: Sequence[Collector],
+    interval: float = EXPORT_INTERVAL_SECONDS,
+) -> Optional[asyncio.Task[None]]:
+    """
+    Подключает сборщики процесса к экспозиции. None — процесс один,
+    сборщики зарегистрированы в REGISTRY; иначе задача периодического
+    переноса (остановить через stop_live_export).
+    """
+    if not is_multiprocess():
+        for collector in collectors:
+            REGISTRY.register(collector)
+        return None
+    return asyncio.create_task(_export_loop(collectors, interval))
+
+
+async def stop_live_export(task: Optional[asyncio.Task[None]]) -> None:
+    """Останавливает перенос и удаляет livesum-файлы завершающегося процесса."""
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    if is_multiprocess():
+        # В prometheus_client функция без аннотаций
+        cast(Callable[[int], None], mark_process_dead)(os.getpid())
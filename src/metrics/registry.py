@@ -0,0 +1,79 @@
+"""
+Метрики процесса в реестре prometheus_client по умолчанию.
+
+Метки — только из ограниченных множеств (тип события, имя обработчика,
+метод API, тип SQL-запроса, имя задачи), иначе растёт число рядов.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Обработчики и вызовы API: от миллисекунд до таймаутов
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+# SQL-запросы в основном короче 100 мс
+QUERY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+# Задачи TaskIQ: пакетные отчёты и сводки идут минутами
+TASK_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300)
+
+HANDLER_DURATION = Histogram(
+    "bot_handler_duration_seconds",
+    "Время обработчика aiogram (с inner middleware)",
+    ["event_type", "handler"],
+    buckets=LATENCY_BUCKETS,
+)
+HANDLER_ERRORS = Counter(
+    "bot_handler_errors",
+    "Исключения, вышедшие из обработчика aiogram",
+    ["event_type", "handler"],
+)
+
+TELEGRAM_API_DURATION = Histogram(
+    "telegram_api_request_duration_seconds",
+    "Время запроса к Bot API",
+    ["method"],
+    buckets=LATENCY_BUCKETS,
+)
+TELEGRAM_API_ERRORS = Counter(
+    "telegram_api_errors",
+    "Ошибки Bot API по методу и типу исключения",
+    ["method", "error"],
+)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Время выполнения SQL-запроса (курсор)",
+    ["statement"],
+    buckets=QUERY_BUCKETS,
+)
+DB_QUERY_ERRORS = Counter(
+    "db_query_errors",
+    "SQL-запросы, завершившиеся ошибкой",
+    ["statement"],
+)
+
+BUFFER_LENGTH = Gauge(
+    "analytics_buffer_length",
+    "Элементов в буфере аналитики Redis",
+    ["buffer"],
+)
+BUFFER_LAG = Gauge(
+    "analytics_buffer_lag_seconds",
+    "Возраст самого старого элемента буфера (отставание переноса в БД)",
+    ["buffer"],
+)
+TASK_QUEUE_DEPTH = Gauge(
+    "taskiq_queue_messages",
+    "Сообщений в очереди RabbitMQ, ожидающих воркера",
+    ["queue"],
+)
+
+TASK_DURATION = Histogram(
+    "taskiq_task_duration_seconds",
+    "Время выполнения задачи TaskIQ",
+    ["task"],
+    buckets=TASK_BUCKETS,
+)
+TASK_ERRORS = Counter(
+    "taskiq_task_errors",
+    "Задачи TaskIQ, завершившиеся исключением",
+    ["task"],
+)
@@ -0,0 +1,48 @@
+"""
+Замеры внешних очередей для метрик: буферы аналитики в Redis и очереди
+RabbitMQ. Вызываются из цикла планировщика аналитики — одного на систему.
+"""
+
+import asyncio
+import logging
+from typing import Iterable
+
+from aio_pika.exceptions import AMQPError
+from taskiq_aio_pika import AioPikaBroker
+
+from services.analytics_buffer_service import AnalyticsBufferService
+from services.time_service import TimeZoneService
+
+from .registry import BUFFER_LAG, BUFFER_LENGTH, TASK_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+
+async def sample_buffers(buffer_service: AnalyticsBufferService) -> None:
+    """Длина буферов и возраст самого старого элемента (0 — буфер пуст)."""
+    stats = await buffer_service.get_buffer_stats()
+    if stats is None:
+        return
+    now = TimeZoneService.now()
+    for name, (length, oldest) in stats.items():
+        BUFFER_LENGTH.labels(name).set(length)
+        lag = (now - oldest).total_seconds() if oldest is not None else 0.0
+        BUFFER_LAG.labels(name).set(max(0.0, lag))
+
+
+async def sample_task_queues(broker: AioPikaBroker, queues: Iterable[str]) -> None:
+    """
+    Глубина очередей TaskIQ через пассивное объявление. Отдельный канал:
+    ошибка объявления закрывает канал, а канал публикации задач нужен живым.
+    """
+    if broker.write_conn is None:
+        return
+    try:
+        async with broker.write_conn.channel() as channel:
+            for name in queues:
+                queue = await channel.declare_queue(name, passive=True)
+                TASK_QUEUE_DEPTH.labels(name).set(
+                    queue.declaration_result.message_count or 0
+                )
+    except (AMQPError, OSError, asyncio.TimeoutError) as e:
+        logger.warning("Не удалось получить глубину очередей TaskIQ: %s", e)
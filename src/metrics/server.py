@@ -0,0 +1,65 @@
+"""
+Экспозиция метрик в процессах бота, воркера и планировщика аналитики.
+
+Сервер aiohttp работает в цикле событий процесса (а не в отдельном потоке,
+как start_http_server): сбор читает stats() компонентов без гонок с
+обработчиками. При PROMETHEUS_MULTIPROC_DIR (воркер TaskIQ с несколькими
+процессами) отдаётся сумма по всем процессам; порт занимает первый из них,
+а живые значения остальных процессов приходят через metrics.live.
+"""
+
+import logging
+import os
+from typing import Callable, Optional, cast
+
+from aiohttp import web
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector
+
+logger = logging.getLogger(__name__)
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Реестр для экспозиции: свой процесс или все процессы воркера."""
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    registry = CollectorRegistry()
+    # В prometheus_client конструктор без аннотаций
+    cast(Callable[[CollectorRegistry], object], MultiProcessCollector)(registry)
+    return registry
+
+
+def render_metrics() -> bytes:
+    return generate_latest(metrics_registry())
+
+
+async def _handle_metrics(request: web.Request) -> web.Response:
+    return web.Response(
+        body=render_metrics(), headers={"Content-Type": CONTENT_TYPE_LATEST}
+    )
+
+
+async def start_metrics_server(
+    port: int, host: str = "0.0.0.0"
+) -> Optional[web.AppRunner]:
+    """
+    Поднимает GET /metrics на port. None — порт занят (метрики уже отдаёт
+    другой процесс воркера).
+    """
+    app = web.Application()
+    app.router.add_get("/metrics", _handle_metrics)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host=host, port=port).start()
+    except OSError as e:
+        await runner.cleanup()
+        logger.info("Сервер метрик не запущен (порт %d): %s", port, e)
+        return None
+    logger.info("Метрики Prometheus доступны на порту %d", port)
+    return runner
@@ -0,0 +1,32 @@
+"""Время и ошибки задач TaskIQ в процессе воркера."""
+
+import time
+from typing import Any, Dict
+
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from .registry import TASK_DURATION, TASK_ERRORS
+
+
+class TaskMetricsMiddleware(TaskiqMiddleware):
+    """
+    Замеряет задачи между pre_execute и post_execute. Хуки вызываются только
+    при выполнении в воркере, поэтому отправка задач из бота не замеряется.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._started: Dict[str, float] = {}
+
+    def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        self._started[message.task_id] = time.perf_counter()
+        return message
+
+    def post_execute(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+        started = self._started.pop(message.task_id, None)
+        if started is not None:
+            TASK_DURATION.labels(message.task_name).observe(
+                time.perf_counter() - started
+            )
+        if result.is_err:
+            TASK_ERRORS.labels(message.task_name).inc()
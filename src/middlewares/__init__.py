@@ -1,5 +1,16 @@
 from .admin_antispam import AdminAntispamMiddleware
 from .album_middleware import AlbumMiddleware
 from .language_middleware import LanguageMiddleware
+from .metrics import HandlerMetricsMiddleware, TelegramApiMetricsMiddleware
+from .sharded_dispatch import ShardedUpdateMiddleware
+from .update_context_middleware import UpdateContextMiddleware
 
-__all__ = ["AdminAntispamMiddleware", "AlbumMiddleware", "LanguageMiddleware"]
+__all__ = [
+    "AdminAntispamMiddleware",
+    "AlbumMiddleware",
+    "HandlerMetricsMiddleware",
+    "LanguageMiddleware",
+    "ShardedUpdateMiddleware",
+    "TelegramApiMetricsMiddleware",
+    "UpdateContextMiddleware",
+]
@@ -7,7 +7,9 @@ from aiogram import BaseMiddleware
 from aiogram.types import CallbackQuery, Message, TelegramObject
 from punq import Container
 
+from constants.enums import ChatType
 from constants.i18n import DEFAULT_LANGUAGE
+from services.update_context import UpdateContext
 from services.user import UserService
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,10 @@ class LanguageMiddleware(BaseMiddleware):
     1. Поля language в модели User (если пользователь существует в БД)
     2. language_code из Telegram (если пользователь новый)
     3. DEFAULT_LANGUAGE, если язык не определен
+
+    Обычные (не командные) сообщения групп пропускаются без определения
+    языка: бот на них не отвечает, а пользователя и так загрузит сохранение
+    сообщения. Если в data есть UpdateContext, пользователь берётся из него.
     """
 
     def __init__(self, user_service: UserService, container: Container):
@@ -54,20 +60,34 @@ class LanguageMiddleware(BaseMiddleware):
         if not user:
             return await handler(event, data)
 
+        if isinstance(event, Message) and self._is_group_chatter(event):
+            return await handler(event, data)
+
         # Определяем язык пользователя
-        language = await self._get_user_language(user)
+        language = await self._get_user_language(user, data.get("update_context"))
 
         # Сохраняем язык в контексте для использования в обработчиках
         data["user_language"] = language
 
         return await handler(event, data)
 
-    async def _get_user_language(self, telegram_user) -> str:
+    @staticmethod
+    def _is_group_chatter(message: Message) -> bool:
+        """Сообщение группы, не являющееся командой боту."""
+        if message.chat.type not in (ChatType.GROUP, ChatType.SUPERGROUP):
+            return False
+        text = message.text or message.caption or ""
+        return not text.startswith("/")
+
+    async def _get_user_language(
+        self, telegram_user, update_context: UpdateContext | None = None
+    ) -> str:
         """
         Получает язык пользователя из базы данных или определяет его из Telegram.
 
         Args:
             telegram_user: Объект пользователя из Telegram
+            update_context: Контекст апдейта (если есть, пользователь берётся из него)
 
         Returns:
             Код языка пользователя
@@ -76,7 +96,10 @@ class LanguageMiddleware(BaseMiddleware):
 
         try:
             # Получаем пользователя из БД
-            db_user = await self.user_service.get_user(tg_id=tg_id)
+            if update_context is not None and update_context.user_tg_id == tg_id:
+                db_user = await update_context.find_user()
+            else:
+                db_user = await self.user_service.get_user(tg_id=tg_id)
 
             if db_user and db_user.language:
                 # Используем язык из БД
@@ -0,0 +1,75 @@
+"""Middleware метрик: время обработчиков aiogram и запросов к Bot API"""
+
+import time
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import TelegramObject
+
+from metrics.registry import (
+    HANDLER_DURATION,
+    HANDLER_ERRORS,
+    TELEGRAM_API_DURATION,
+    TELEGRAM_API_ERRORS,
+)
+
+
+def handler_name(handler: HandlerObject | None) -> str:
+    """Модуль и имя функции обработчика (ограниченное множество меток)."""
+    if handler is None:
+        return "unknown"
+    callback = handler.callback
+    name = getattr(callback, "__qualname__", type(callback).__name__)
+    return f"{getattr(callback, '__module__', '')}.{name}".lstrip(".")
+
+
+class HandlerMetricsMiddleware(BaseMiddleware):
+    """
+    Inner middleware: время и исключения обработчика по типу события.
+
+    Регистрируется на наблюдателях диспетчера первым из inner middleware,
+    поэтому замер включает LanguageMiddleware и вложенные роутеры.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        labels = (type(event).__name__, handler_name(data.get("handler")))
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        except Exception:
+            HANDLER_ERRORS.labels(*labels).inc()
+            raise
+        finally:
+            HANDLER_DURATION.labels(*labels).observe(time.perf_counter() - started)
+
+
+class TelegramApiMetricsMiddleware(BaseRequestMiddleware):
+    """Время запросов сессии Bot и ошибки по методу и типу исключения."""
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        name = type(method).__name__
+        started = time.perf_counter()
+        try:
+            return await make_request(bot, method)
+        except Exception as e:
+            TELEGRAM_API_ERRORS.labels(name, type(e).__name__).inc()
+            raise
+        finally:
+            TELEGRAM_API_DURATION.labels(name).observe(time.perf_counter() - started)
@@ -0,0 +1,138 @@
+"""Параллельная обработка апдейтов с сохранением порядка внутри чата"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject, Update
+
+from services.caching import UpdateDeduplicator
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]]
+QueueItem = Tuple[Handler, Update, dict[str, Any]]
+
+
+def shard_key(update: Update) -> int:
+    """
+    Ключ упорядочивания апдейта: id чата, иначе id пользователя
+    (inline-запросы), иначе update_id.
+    """
+    event = update.event
+    chat = getattr(event, "chat", None)
+    if chat is None:
+        message = getattr(event, "message", None)
+        chat = getattr(message, "chat", None)
+    if chat is not None:
+        return chat.id
+    user = getattr(event, "from_user", None) or getattr(event, "user", None)
+    if user is not None:
+        return user.id
+    return update.update_id
+
+
+class ShardedUpdateMiddleware(BaseMiddleware):
+    """
+    Outer middleware dp.update: раскладывает апдейты по N очередям-шардам
+    по chat_id и обрабатывает шарды параллельно.
+
+    - Апдейты одного чата попадают в один шард и обрабатываются строго
+      по очереди; медленный обработчик в одном чате не задерживает чаты
+      других шардов.
+    - Очереди ограничены: при заполнении шарда приём апдейтов ждёт места
+      (polling не забирает новые апдейты, вебхук отвечает позже).
+    - Повторы с тем же update_id в окне дедупликации отбрасываются.
+
+    Воркеры запускаются и останавливаются хуками dp.startup/dp.shutdown.
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        queue_size: int,
+        deduplicator: Optional[UpdateDeduplicator] = None,
+    ) -> None:
+        self._queues: List[asyncio.Queue[QueueItem]] = [
+            asyncio.Queue(maxsize=queue_size) for _ in range(shards)
+        ]
+        self._deduplicator = deduplicator
+        self._workers: List[asyncio.Task[None]] = []
+        self.processed = 0
+        self.duplicates = 0
+        self.failed = 0
+
+    async def __call__(
+        self,
+        handler: Handler,
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        if not isinstance(event, Update) or not self._workers:
+            return await handler(event, data)
+
+        if self._deduplicator and not await self._deduplicator.first_seen(
+            event.update_id
+        ):
+            self.duplicates += 1
+            logger.info("Апдейт %s уже принят, повтор пропущен", event.update_id)
+            return None
+
+        shard = shard_key(event) % len(self._queues)
+        await self._queues[shard].put((handler, event, data))
+        return None
+
+    def queue_depths(self) -> List[int]:
+        """Текущая глубина очереди каждого шарда."""
+        return [q.qsize() for q in self._queues]
+
+    def stats(self) -> Dict[str, Any]:
+        """Метрики для мониторинга."""
+        return {
+            "shards": len(self._queues),
+            "queue_depths": self.queue_depths(),
+            "processed": self.processed,
+            "duplicates": self.duplicates,
+            "failed": self.failed,
+        }
+
+    async def start(self) -> None:
+        """Запускает воркеры шардов (хук dp.startup)."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(q), name=f"update-shard-{i}")
+            for i, q in enumerate(self._queues)
+        ]
+        logger.info("Запущено %d шардов обработки апдейтов", len(self._workers))
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Дорабатывает очереди (не дольше timeout) и останавливает воркеры."""
+        if not self._workers:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(q.join() for q in self._queues)), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Остановка шардов: не обработано апдейтов %d",
+                sum(self.queue_depths()),
+            )
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self, queue: asyncio.Queue[QueueItem]) -> None:
+        while True:
+            handler, update, data = await queue.get()
+            try:
+                await handler(update, data)
+                self.processed += 1
+            except Exception:
+                self.failed += 1
+                logger.exception("Ошибка обработки апдейта %s", update.update_id)
+            finally:
+                queue.task_done()
@@ -0,0 +1,50 @@
+"""Middleware, создающее общий контекст апдейта (пользователь и чат)"""
+
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware
+from aiogram.types import CallbackQuery, Message, TelegramObject
+
+from services.chat.chat_service import ChatService
+from services.update_context import UpdateContext
+from services.user.user_service import UserService
+
+
+class UpdateContextMiddleware(BaseMiddleware):
+    """
+    Кладёт в data["update_context"] UpdateContext текущего апдейта.
+
+    Регистрируется как outer middleware, поэтому контекст доступен фильтрам,
+    inner middleware (LanguageMiddleware) и обработчикам. Сам по себе
+    контекст ничего не загружает — пользователь и чат читаются при первом
+    обращении и переиспользуются до конца апдейта.
+    """
+
+    def __init__(self, user_service: UserService, chat_service: ChatService):
+        self.user_service = user_service
+        self.chat_service = chat_service
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        if isinstance(event, Message):
+            chat = event.chat
+        elif isinstance(event, CallbackQuery):
+            chat = event.message.chat if event.message else None
+        else:
+            return await handler(event, data)
+
+        user = event.from_user
+        if user is not None and "update_context" not in data:
+            data["update_context"] = UpdateContext(
+                user_service=self.user_service,
+                chat_service=self.chat_service,
+                user_tg_id=str(user.id),
+                username=user.username,
+                chat_tg_id=str(chat.id) if chat else None,
+                chat_title=chat.title if chat else None,
+            )
+        return await handler(event, data)
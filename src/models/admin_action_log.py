@@ -36,6 +36,7 @@ class AdminActionLog(BaseModel):
     __table_args__ = (
         Index("idx_admin_action_log_admin", "admin_id"),
         Index("idx_admin_action_log_type", "action_type"),
-        Index("idx_admin_action_log_created", "created_at"),
-        Index("idx_admin_action_log_admin_created", "admin_id", "created_at"),
+        # Ключ keyset-пагинации: (created_at, id) и (admin_id, created_at, id)
+        Index("idx_admin_action_log_created_id", "created_at", "id"),
+        Index("idx_admin_action_log_admin_created_id", "admin_id", "created_at", "id"),
     )
@@ -1,7 +1,6 @@
 import enum
 from typing import TYPE_CHECKING, Optional
 
-from aiogram.enums import ContentType
 from sqlalchemy import ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -54,7 +53,7 @@ class ChatMessage(BaseModel):
     content_type: Mapped[str] = mapped_column(
         String(length=32),
         nullable=False,
-        default=ContentType.TEXT.value,
+        default="text",
     )
 
     # Relationships
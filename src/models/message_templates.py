@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -66,6 +66,16 @@ class MessageTemplate(BaseModel):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # Триграммный индекс для ILIKE '%запрос%' в inline-поиске (pg_trgm)
+        Index(
+            "idx_message_templates_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+
 
 class TemplateCategory(BaseModel):
     __tablename__ = "template_categories"
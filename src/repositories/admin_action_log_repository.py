@@ -1,13 +1,14 @@
 import logging
+from datetime import datetime
 from typing import List, Optional, Tuple
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, func, select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.sql.elements import ColumnElement
 
 from constants.enums import AdminActionType
+from dto.buffer import BufferedAdminActionLogDTO
 from exceptions import DatabaseException
 from models import AdminActionLog, User
 from repositories.base import BaseRepository
@@ -16,32 +17,9 @@ logger = logging.getLogger(__name__)
 
 
 class AdminActionLogRepository(BaseRepository):
-    async def _get_logs_page_with_total(
-        self,
-        session: AsyncSession,
-        page: int,
-        limit: int,
-        where_clause: Optional[ColumnElement[bool]] = None,
-    ) -> Tuple[List[AdminActionLog], int]:
-        """Возвращает страницу логов и общее количество. Для внутреннего использования."""
-        count_stmt = select(func.count(AdminActionLog.id))
-        if where_clause is not None:
-            count_stmt = count_stmt.where(where_clause)
-        total_count = await session.scalar(count_stmt) or 0
-
-        offset = (page - 1) * limit
-        stmt = (
-            select(AdminActionLog)
-            .options(selectinload(AdminActionLog.admin))
-            .order_by(desc(AdminActionLog.created_at))
-            .offset(offset)
-            .limit(limit)
-        )
-        if where_clause is not None:
-            stmt = stmt.where(where_clause)
-        result = await session.execute(stmt)
-        logs = list(result.scalars().all())
-        return logs, total_count
+    @staticmethod
+    def _admin_filter(admin_id: Optional[int]) -> Optional[ColumnElement[bool]]:
+        return AdminActionLog.admin_id == admin_id if admin_id is not None else None
 
     async def create_log(
         self,
@@ -74,39 +52,92 @@ class AdminActionLogRepository(BaseRepository):
                     details={"context": "create_log", "original": str(e)}
                 ) from e
 
-    async def get_logs_paginated(
-        self, page: int = 1, limit: int = 10
-    ) -> Tuple[List[AdminActionLog], int]:
-        """Получает логи с пагинацией."""
+    async def bulk_create_logs(self, dtos: List[BufferedAdminActionLogDTO]) -> int:
+        """
+        Массово добавляет записи логов из буфера одним INSERT.
+
+        Returns:
+            int: Количество вставленных записей
+        """
+        if not dtos:
+            return 0
+
+        mappings = [
+            {
+                "admin_id": dto.admin_id,
+                "action_type": dto.action_type,
+                "details": dto.details,
+                "created_at": dto.created_at,
+            }
+            for dto in dtos
+        ]
+
+        return await self._bulk_upsert_on_conflict_nothing(
+            AdminActionLog, mappings, "логов действий"
+        )
+
+    async def get_logs_page(
+        self,
+        limit: int = 10,
+        admin_id: Optional[int] = None,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        backward: bool = False,
+    ) -> List[AdminActionLog]:
+        """
+        Keyset-пагинация логов по (created_at, id), от новых к старым.
+
+        Без курсора — первая страница. С курсором — записи старше курсора,
+        либо при backward=True — ближайшие записи новее курсора (предыдущая
+        страница). Стоимость глубокой страницы равна стоимости первой:
+        OFFSET не используется, выборка идёт по индексу.
+        """
         async with self._db.session() as session:
             try:
-                return await self._get_logs_page_with_total(session, page, limit)
+                key = tuple_(AdminActionLog.created_at, AdminActionLog.id)
+                if backward:
+                    order = (AdminActionLog.created_at, AdminActionLog.id)
+                else:
+                    order = (desc(AdminActionLog.created_at), desc(AdminActionLog.id))
+
+                stmt = (
+                    select(AdminActionLog)
+                    .options(selectinload(AdminActionLog.admin))
+                    .order_by(*order)
+                    .limit(limit)
+                )
+                where_clause = self._admin_filter(admin_id)
+                if where_clause is not None:
+                    stmt = stmt.where(where_clause)
+                if cursor is not None:
+                    position = tuple_(*cursor)
+                    stmt = stmt.where(key > position if backward else key < position)
+
+                result = await session.execute(stmt)
+                logs = list(result.scalars().all())
+                if backward:
+                    logs.reverse()
+                return logs
             except SQLAlchemyError as e:
                 logger.error("Ошибка при получении логов: %s", e, exc_info=True)
                 await session.rollback()
                 raise DatabaseException(
-                    details={"context": "get_logs_paginated", "original": str(e)}
+                    details={"context": "get_logs_page", "original": str(e)}
                 ) from e
 
-    async def get_logs_by_admin(
-        self, admin_id: int, page: int = 1, limit: int = 10
-    ) -> Tuple[List[AdminActionLog], int]:
-        """Получает логи конкретного администратора с пагинацией."""
+    async def count_logs(self, admin_id: Optional[int] = None) -> int:
+        """Возвращает количество логов (всех или конкретного администратора)."""
         async with self._db.session() as session:
             try:
-                return await self._get_logs_page_with_total(
-                    session, page, limit, AdminActionLog.admin_id == admin_id
-                )
+                stmt = select(func.count(AdminActionLog.id))
+                where_clause = self._admin_filter(admin_id)
+                if where_clause is not None:
+                    stmt = stmt.where(where_clause)
+                return await session.scalar(stmt) or 0
             except SQLAlchemyError as e:
-                logger.error(
-                    "Ошибка при получении логов админа %d: %s",
-                    admin_id,
-                    e,
-                    exc_info=True,
-                )
+                logger.error("Ошибка при подсчёте логов: %s", e, exc_info=True)
                 await session.rollback()
                 raise DatabaseException(
-                    details={"context": "get_logs_by_admin", "original": str(e)}
+                    details={"context": "count_logs", "original": str(e)}
                 ) from e
 
     async def get_admins_with_logs(self) -> List[Tuple[int, str, str]]:
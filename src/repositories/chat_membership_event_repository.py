@@ -1,11 +1,13 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime
+from typing import List
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from constants.enums import MembershipEventType
+from dto.buffer import BufferedMembershipEventDTO
 from exceptions import DatabaseException
 from models import ChatMembershipEvent
 from repositories.base import BaseRepository
@@ -58,6 +60,30 @@ class ChatMembershipEventRepository(BaseRepository):
                     details={"context": "chat_membership_event_add", "original": str(e)}
                 ) from e
 
+    async def bulk_add_events(self, dtos: List[BufferedMembershipEventDTO]) -> int:
+        """
+        Массово добавляет события состава чата одним INSERT.
+
+        Returns:
+            int: Количество вставленных записей
+        """
+        if not dtos:
+            return 0
+
+        mappings = [
+            {
+                "chat_id": dto.chat_id,
+                "user_tgid": dto.user_tgid,
+                "event_type": dto.event_type,
+                "created_at": dto.created_at,
+            }
+            for dto in dtos
+        ]
+
+        return await self._bulk_upsert_on_conflict_nothing(
+            ChatMembershipEvent, mappings, "событий состава чата"
+        )
+
     async def count_by_chat_and_period(
         self,
         *,
@@ -138,6 +138,34 @@ class ChatRepository(BaseRepository):
                     details={"context": "get_all", "original": str(e)}
                 ) from e
 
+    async def get_chats_by_ids(self, chat_ids: List[int]) -> List[ChatSession]:
+        """Получает чаты по списку идентификаторов одним запросом."""
+        if not chat_ids:
+            return []
+
+        async with self._db.session() as session:
+            try:
+                result = await session.execute(
+                    _chat_select_with_relations().where(ChatSession.id.in_(chat_ids))
+                )
+                chats = list(result.scalars().all())
+                session.expunge_all()
+
+                logger.info(
+                    "Получено %d чатов из %d запрошенных", len(chats), len(chat_ids)
+                )
+                return chats
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Произошла ошибка при получении чатов по id: %s",
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={"context": "get_chats_by_ids", "original": str(e)}
+                ) from e
+
     async def create_chat(self, chat_id: str, title: str) -> ChatSession:
         """Создает новый чат."""
         async with self._db.session() as session:
@@ -111,6 +111,61 @@ class MessageReplyRepository(BaseRepository):
                     }
                 ) from e
 
+    async def get_replies_by_chat_ids_and_period(
+        self,
+        chat_ids: list[int],
+        start_date: datetime,
+        end_date: datetime,
+        tracked_user_ids: Optional[list[int]] = None,
+    ) -> list[MessageReply]:
+        """
+        Получает ответы сразу для нескольких чатов за период одним запросом
+        (пакетная генерация ежедневных отчетов).
+        """
+        if not chat_ids:
+            return []
+
+        async with self._db.session() as session:
+            query = (
+                select(MessageReply)
+                .options(joinedload(MessageReply.chat_session))
+                .where(
+                    MessageReply.chat_id.in_(chat_ids),
+                    MessageReply.created_at.between(start_date, end_date),
+                )
+            )
+
+            # Фильтруем только по отслеживаемым пользователям
+            if tracked_user_ids:
+                query = query.where(MessageReply.reply_user_id.in_(tracked_user_ids))
+            try:
+                result = await session.execute(query)
+                items = list(result.scalars().all())
+                logger.info(
+                    "Получено %d ответов для %d чатов за период %s - %s",
+                    len(items),
+                    len(chat_ids),
+                    start_date,
+                    end_date,
+                )
+                return items
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при получении ответов по чатам %s: период=%s-%s, %s",
+                    chat_ids,
+                    start_date,
+                    end_date,
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={
+                        "context": "get_replies_by_chat_ids_and_period",
+                        "original": str(e),
+                    }
+                ) from e
+
     async def get_replies_by_period_date_and_chats(
         self,
         user_id: int,
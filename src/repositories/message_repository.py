@@ -1,15 +1,15 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, List, Optional, Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
 
 from dto.buffer import BufferedMessageDTO
 from dto.daily_activity import UserDailyActivityDTO
 from exceptions import DatabaseException
-from models import ChatMessage, User
+from models import ChatMessage, ChatSession, User
 from repositories.base import BaseRepository
 from utils.date_utils import validate_and_normalize_period
 
@@ -17,54 +17,6 @@ logger = logging.getLogger(__name__)
 
 
 class MessageRepository(BaseRepository):
-    async def get_messages_for_summary(
-        self,
-        chat_id: int,
-        limit: int,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-    ) -> list[tuple[str | None, str | None]]:
-        """
-        Выбирает только текст и имя пользователя.
-        Игнорирует системные сообщения и медиа.
-        """
-        async with self._db.session() as session:
-            try:
-                query = (
-                    select(
-                        ChatMessage.text,
-                        User.username,
-                    )
-                    .join(User, ChatMessage.user_id == User.id)
-                    .where(
-                        ChatMessage.chat_id == chat_id,
-                        ChatMessage.content_type == "text",
-                        ChatMessage.text.is_not(None),
-                    )
-                )
-
-                if start_date and end_date:
-                    query = query.where(
-                        ChatMessage.created_at.between(start_date, end_date)
-                    )
-
-                query = query.order_by(ChatMessage.created_at.desc()).limit(limit)
-
-                result = await session.execute(query)
-                rows = result.all()
-                return [tuple(r) for r in reversed(rows)]
-            except SQLAlchemyError as e:
-                logger.error(
-                    "Ошибка при получении сообщений для саммари: chat_id=%s, %s",
-                    chat_id,
-                    e,
-                    exc_info=True,
-                )
-                await session.rollback()
-                raise DatabaseException(
-                    details={"context": "get_messages_for_summary", "original": str(e)}
-                ) from e
-
     async def get_messages_by_period_date_for_users(
         self,
         user_ids: list[int],
@@ -165,6 +117,61 @@ class MessageRepository(BaseRepository):
                     }
                 ) from e
 
+    async def get_messages_by_chat_ids_and_period(
+        self,
+        chat_ids: list[int],
+        start_date: datetime,
+        end_date: datetime,
+        tracked_user_ids: Optional[list[int]] = None,
+    ) -> list[ChatMessage]:
+        """
+        Получает сообщения сразу для нескольких чатов за период одним запросом
+        (пакетная генерация ежедневных отчетов).
+        """
+        if not chat_ids:
+            return []
+
+        async with self._db.session() as session:
+            query = (
+                select(ChatMessage)
+                .options(joinedload(ChatMessage.user))
+                .where(
+                    ChatMessage.chat_id.in_(chat_ids),
+                    ChatMessage.created_at.between(start_date, end_date),
+                )
+            )
+
+            # Фильтруем только по отслеживаемым пользователям
+            if tracked_user_ids:
+                query = query.where(ChatMessage.user_id.in_(tracked_user_ids))
+            try:
+                result = await session.execute(query)
+                items = list(result.scalars().all())
+                logger.info(
+                    "Получено %d сообщений для %d чатов за период %s - %s",
+                    len(items),
+                    len(chat_ids),
+                    start_date,
+                    end_date,
+                )
+                return items
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при получении сообщений по чатам %s: период=%s-%s, %s",
+                    chat_ids,
+                    start_date,
+                    end_date,
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={
+                        "context": "get_messages_by_chat_ids_and_period",
+                        "original": str(e),
+                    }
+                ) from e
+
     async def get_daily_top_users(
         self,
         chat_id: int,
@@ -298,6 +305,60 @@ class MessageRepository(BaseRepository):
             ChatMessage, mappings, "сообщений"
         )
 
+    async def get_messages_for_summary_windows(
+        self,
+        chat_id: int,
+        limit: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> list[tuple[int, datetime, str | None, str | None]]:
+        """
+        Текстовые сообщения чата для сводки: (id, created_at, text, username) —
+        для разбиения на окна инкрементальной сводки. Системные сообщения и медиа
+        не выбираются. Последние limit сообщений в хронологическом порядке.
+        """
+        async with self._db.session() as session:
+            try:
+                query = (
+                    select(
+                        ChatMessage.id,
+                        ChatMessage.created_at,
+                        ChatMessage.text,
+                        User.username,
+                    )
+                    .join(User, ChatMessage.user_id == User.id)
+                    .where(
+                        ChatMessage.chat_id == chat_id,
+                        ChatMessage.content_type == "text",
+                        ChatMessage.text.is_not(None),
+                    )
+                )
+
+                if start_date and end_date:
+                    query = query.where(
+                        ChatMessage.created_at.between(start_date, end_date)
+                    )
+
+                query = query.order_by(ChatMessage.created_at.desc()).limit(limit)
+
+                result = await session.execute(query)
+                rows = result.all()
+                return [tuple(r) for r in reversed(rows)]
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при получении окон сообщений для саммари: chat_id=%s, %s",
+                    chat_id,
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={
+                        "context": "get_messages_for_summary_windows",
+                        "original": str(e),
+                    }
+                ) from e
+
     async def get_max_message_id(self, chat_id: int) -> int | None:
         """Возвращает максимальный ID сообщения в чате."""
         async with self._db.session() as session:
@@ -371,3 +432,138 @@ class MessageRepository(BaseRepository):
                         "original": str(e),
                     }
                 ) from e
+
+    async def count_messages_by_day(
+        self, start: datetime, end: datetime, tz_name: str
+    ) -> dict[str, int]:
+        """
+        Считает текстовые сообщения во всех чатах по дням за период одним запросом.
+        Дни считаются в часовом поясе tz_name. Результат: {"YYYY-MM-DD": N}.
+        """
+        async with self._db.session() as session:
+            try:
+                day = func.date_trunc(
+                    "day", func.timezone(tz_name, ChatMessage.created_at)
+                ).label("day")
+                query = (
+                    select(day, func.count(ChatMessage.id))
+                    .where(
+                        ChatMessage.created_at >= start,
+                        ChatMessage.created_at <= end,
+                        ChatMessage.content_type == "text",
+                        ChatMessage.text.is_not(None),
+                    )
+                    .group_by(day)
+                )
+                result = await session.execute(query)
+                return {row[0].strftime("%Y-%m-%d"): row[1] for row in result.all()}
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при подсчёте сообщений по дням за период %s — %s: %s",
+                    start,
+                    end,
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={
+                        "context": "count_messages_by_day",
+                        "original": str(e),
+                    }
+                ) from e
+
+    async def _stream_batches(
+        self, query: Select[Any], batch_size: int, context: str
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Отдаёт результат запроса пачками через серверный курсор."""
+        async with self._db.session() as session:
+            try:
+                result = await session.stream(
+                    query.execution_options(yield_per=batch_size)
+                )
+                async for batch in result.partitions():
+                    yield batch
+            except SQLAlchemyError as e:
+                logger.error("Ошибка при выгрузке (%s): %s", context, e, exc_info=True)
+                await session.rollback()
+                raise DatabaseException(
+                    details={"context": context, "original": str(e)}
+                ) from e
+
+    def iter_messages_for_export(
+        self,
+        start: datetime,
+        end: datetime,
+        chat_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Сообщения за период для выгрузки, пачками по batch_size строк в порядке
+        created_at. Строка: (created_at, chat_tg_id, chat_title, user_tg_id,
+        username, message_id, content_type, text). Память не зависит от объёма.
+        """
+        query = (
+            select(
+                ChatMessage.created_at,
+                ChatSession.chat_id,
+                ChatSession.title,
+                User.tg_id,
+                User.username,
+                ChatMessage.message_id,
+                ChatMessage.content_type,
+                ChatMessage.text,
+            )
+            .join(ChatSession, ChatSession.id == ChatMessage.chat_id)
+            .join(User, User.id == ChatMessage.user_id)
+            .where(ChatMessage.created_at >= start, ChatMessage.created_at <= end)
+            .order_by(ChatMessage.created_at, ChatMessage.id)
+        )
+        if chat_id is not None:
+            query = query.where(ChatMessage.chat_id == chat_id)
+        if user_id is not None:
+            query = query.where(ChatMessage.user_id == user_id)
+        return self._stream_batches(query, batch_size, "iter_messages_for_export")
+
+    def iter_daily_counts_for_export(
+        self,
+        start: datetime,
+        end: datetime,
+        tz_name: str,
+        chat_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Количество сообщений по дням (в часовом поясе tz_name), чатам и
+        пользователям для выгрузки, пачками по batch_size строк. Строка:
+        (day, chat_tg_id, chat_title, user_tg_id, username, messages).
+        """
+        day = func.date_trunc("day", func.timezone(tz_name, ChatMessage.created_at))
+        query = (
+            select(
+                day.label("day"),
+                ChatSession.chat_id,
+                ChatSession.title,
+                User.tg_id,
+                User.username,
+                func.count(ChatMessage.id),
+            )
+            .join(ChatSession, ChatSession.id == ChatMessage.chat_id)
+            .join(User, User.id == ChatMessage.user_id)
+            .where(ChatMessage.created_at >= start, ChatMessage.created_at <= end)
+            .group_by(
+                day,
+                ChatSession.chat_id,
+                ChatSession.title,
+                User.tg_id,
+                User.username,
+            )
+            .order_by(day, ChatSession.chat_id, User.tg_id)
+        )
+        if chat_id is not None:
+            query = query.where(ChatMessage.chat_id == chat_id)
+        if user_id is not None:
+            query = query.where(ChatMessage.user_id == user_id)
+        return self._stream_batches(query, batch_size, "iter_daily_counts_for_export")
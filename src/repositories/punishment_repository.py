@@ -219,6 +219,59 @@ class PunishmentRepository(BaseRepository):
                     }
                 ) from e
 
+    async def get_action_counts_by_moderators(
+        self,
+        moderator_ids: list[int],
+        today_start: datetime,
+        end_date: datetime,
+    ) -> dict[int, dict[str, int]]:
+        """
+        Возвращает число варнов и банов каждого модератора за сегодня и за всё время
+        одним запросом (GROUP BY punished_by_id с фильтрованными COUNT).
+        Результат: {moderator_id: {"today": N, "total": N}}.
+        """
+        if not moderator_ids:
+            return {}
+
+        async with self._db.session() as session:
+            try:
+                query = (
+                    select(
+                        Punishment.punished_by_id,
+                        func.count(Punishment.id)
+                        .filter(Punishment.created_at >= today_start)
+                        .label("today"),
+                        func.count(Punishment.id).label("total"),
+                    )
+                    .where(
+                        Punishment.punished_by_id.in_(moderator_ids),
+                        Punishment.punishment_type.in_(
+                            [PunishmentType.WARNING, PunishmentType.BAN]
+                        ),
+                        Punishment.created_at <= end_date,
+                    )
+                    .group_by(Punishment.punished_by_id)
+                )
+                result = await session.execute(query)
+
+                stats = {mod_id: {"today": 0, "total": 0} for mod_id in moderator_ids}
+                for mod_id, today, total in result.all():
+                    stats[mod_id] = {"today": today, "total": total}
+                return stats
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при получении сводной статистики наказаний модераторов: %s",
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={
+                        "context": "get_action_counts_by_moderators",
+                        "original": str(e),
+                    }
+                ) from e
+
     async def get_daily_punishment_counts(
         self, start: datetime, end: datetime
     ) -> dict[str, dict[str, int]]:
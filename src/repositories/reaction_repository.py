@@ -97,6 +97,61 @@ class MessageReactionRepository(BaseRepository):
                     }
                 ) from e
 
+    async def get_reactions_by_chat_ids_and_period(
+        self,
+        chat_ids: list[int],
+        start_date: datetime,
+        end_date: datetime,
+        tracked_user_ids: Optional[list[int]] = None,
+    ) -> list[MessageReaction]:
+        """
+        Получает реакции сразу для нескольких чатов за период одним запросом
+        (пакетная генерация ежедневных отчетов).
+        """
+        if not chat_ids:
+            return []
+
+        async with self._db.session() as session:
+            query = (
+                select(MessageReaction)
+                .options(joinedload(MessageReaction.user))
+                .where(
+                    MessageReaction.chat_id.in_(chat_ids),
+                    MessageReaction.created_at.between(start_date, end_date),
+                )
+            )
+
+            # Фильтруем только по отслеживаемым пользователям
+            if tracked_user_ids:
+                query = query.where(MessageReaction.user_id.in_(tracked_user_ids))
+            try:
+                result = await session.execute(query)
+                items = list(result.scalars().all())
+                logger.info(
+                    "Получено %d реакций для %d чатов за период %s - %s",
+                    len(items),
+                    len(chat_ids),
+                    start_date,
+                    end_date,
+                )
+                return items
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при получении реакций по чатам %s: период=%s-%s, %s",
+                    chat_ids,
+                    start_date,
+                    end_date,
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={
+                        "context": "get_reactions_by_chat_ids_and_period",
+                        "original": str(e),
+                    }
+                ) from e
+
     async def get_reactions_by_user_and_period_for_users(
         self,
         user_ids: list[int],
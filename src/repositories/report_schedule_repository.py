@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, time, timedelta, timezone
-from typing import List, Optional, cast
+from typing import List, Optional, Tuple, cast
 
 import pytz  # type: ignore[import-untyped]
 from sqlalchemy import select
@@ -57,14 +57,11 @@ class ReportScheduleRepository(BaseRepository):
                     # но мы возьмем нужные данные, пока сессия открыта)
                     results_to_return.append(schedule)
 
-                # 3. Фиксируем изменения (Lock отпускается здесь)
+                # 3. Фиксируем изменения (Lock отпускается здесь).
+                # Сессия с expire_on_commit=False: id, chat_id и новые
+                # last_run_at/next_run_at остаются в объектах без refresh.
                 await session.commit()
 
-                # Обновляем объекты данными из БД (на случай generated values),
-                # хотя для отправки ID и chat_id этого обычно не требуется.
-                for s in results_to_return:
-                    await session.refresh(s)
-
                 return results_to_return
 
             except SQLAlchemyError as e:
@@ -77,6 +74,28 @@ class ReportScheduleRepository(BaseRepository):
                     }
                 ) from e
 
+    async def get_enabled_run_times(self) -> List[Tuple[int, datetime]]:
+        """Пары (id, next_run_at) включённых расписаний для очереди планировщика."""
+        async with self._db.session() as session:
+            try:
+                result = await session.execute(
+                    select(ReportSchedule.id, ReportSchedule.next_run_at).where(
+                        ReportSchedule.enabled.is_(True),
+                        ReportSchedule.next_run_at.isnot(None),
+                    )
+                )
+                return [(row.id, row.next_run_at) for row in result]
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при загрузке времени запуска расписаний: %s",
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={"context": "get_enabled_run_times", "original": str(e)}
+                ) from e
+
     def _calculate_next_run(
         self, schedule: ReportSchedule, now_utc: datetime
     ) -> datetime:
@@ -46,37 +46,46 @@ class MessageTemplateRepository(BaseRepository):
                     details={"context": "create_template", "original": str(e)}
                 ) from e
 
-    async def get_templates_by_query(self, query: str) -> List[MessageTemplate]:
-        """Ищет шаблоны по подстроке в названии (уникальные по title)."""
+    @staticmethod
+    def _unique_title_ids(*criteria: Any) -> Any:
+        """Подзапрос: по одному (минимальному) id на каждое уникальное название."""
+        return (
+            select(MessageTemplate.id)
+            .where(*criteria)
+            .distinct(MessageTemplate.title)
+            .order_by(MessageTemplate.title, MessageTemplate.id)
+        )
+
+    async def get_templates_by_query(
+        self, query: str, limit: int = 50
+    ) -> List[MessageTemplate]:
+        """
+        Ищет шаблоны по подстроке в названии (уникальные по title).
+
+        ILIKE обслуживается GIN-индексом pg_trgm по title. Порядок: сначала
+        названия, начинающиеся с запроса, затем по триграммному сходству,
+        затем по популярности.
+        """
         async with self._db.session() as session:
             try:
-                # Подзапрос для получения минимальных ID уникальных заголовков
                 search_pattern = f"%{query}%"
-                subquery = (
-                    select(
-                        MessageTemplate.title,
-                        func.min(MessageTemplate.id).label("min_id"),
-                    )
-                    .where(MessageTemplate.title.ilike(search_pattern))
-                    .group_by(MessageTemplate.title)
-                    .subquery()
-                )
-
-                # Основной запрос — выбираем только записи с минимальными ID
                 stmt = (
                     select(MessageTemplate)
-                    .join(
-                        subquery,
-                        and_(
-                            MessageTemplate.title == subquery.c.title,
-                            MessageTemplate.id == subquery.c.min_id,
-                        ),
+                    .where(
+                        MessageTemplate.id.in_(
+                            self._unique_title_ids(
+                                MessageTemplate.title.ilike(search_pattern)
+                            )
+                        )
                     )
-                    .options(
-                        selectinload(MessageTemplate.media_items),
-                        selectinload(MessageTemplate.category),
+                    .options(selectinload(MessageTemplate.media_items))
+                    .order_by(
+                        MessageTemplate.title.ilike(f"{query}%").desc(),
+                        func.similarity(MessageTemplate.title, query).desc(),
+                        MessageTemplate.usage_count.desc(),
+                        MessageTemplate.id,
                     )
-                    .order_by(MessageTemplate.usage_count.desc())
+                    .limit(limit)
                 )
 
                 result = await session.execute(stmt)
@@ -89,6 +98,36 @@ class MessageTemplateRepository(BaseRepository):
                     details={"context": "get_templates_by_query", "original": str(e)}
                 ) from e
 
+    async def get_templates_for_search_index(self, limit: int) -> List[MessageTemplate]:
+        """
+        Шаблоны с уникальными названиями для in-memory индекса поиска
+        (не больше limit, с медиа для признака has_media).
+        """
+        async with self._db.session() as session:
+            try:
+                stmt = (
+                    select(MessageTemplate)
+                    .where(MessageTemplate.id.in_(self._unique_title_ids()))
+                    .options(selectinload(MessageTemplate.media_items))
+                    .order_by(MessageTemplate.id)
+                    .limit(limit)
+                )
+                result = await session.execute(stmt)
+                return list(result.scalars().all())
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при загрузке шаблонов для индекса поиска: %s",
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={
+                        "context": "get_templates_for_search_index",
+                        "original": str(e),
+                    }
+                ) from e
+
     async def get_templates_count(
         self,
         category_id: Optional[int] = None,
@@ -1,6 +1,7 @@
 import logging
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
 from sqlalchemy import and_, delete, func, select
 from sqlalchemy.exc import SQLAlchemyError
@@ -211,6 +212,75 @@ class UserRepository(BaseRepository):
                     }
                 ) from e
 
+    async def get_admin_ids_by_chats(self, chat_ids: List[int]) -> Dict[int, Set[int]]:
+        """Возвращает ID админов для каждого из чатов одним запросом."""
+        if not chat_ids:
+            return {}
+
+        async with self._db.session() as session:
+            try:
+                rows = await session.execute(
+                    select(AdminChatAccess.chat_id, AdminChatAccess.admin_id).where(
+                        AdminChatAccess.chat_id.in_(chat_ids)
+                    )
+                )
+                admins_by_chat: Dict[int, Set[int]] = defaultdict(set)
+                for chat_id, admin_id in rows:
+                    admins_by_chat[chat_id].add(admin_id)
+
+                logger.info("Получены админы для %d чатов", len(chat_ids))
+                return dict(admins_by_chat)
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при получении админов для чатов %s: %s",
+                    chat_ids,
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={"context": "get_admin_ids_by_chats", "original": str(e)}
+                ) from e
+
+    async def get_tracked_user_ids_by_admins(
+        self, admin_ids: List[int]
+    ) -> Dict[int, Set[int]]:
+        """Возвращает ID отслеживаемых пользователей для каждого из админов одним запросом."""
+        if not admin_ids:
+            return {}
+
+        async with self._db.session() as session:
+            try:
+                rows = await session.execute(
+                    select(
+                        admin_user_tracking.c.admin_id,
+                        admin_user_tracking.c.tracked_user_id,
+                    ).where(admin_user_tracking.c.admin_id.in_(admin_ids))
+                )
+                tracked_by_admin: Dict[int, Set[int]] = defaultdict(set)
+                for admin_id, tracked_user_id in rows:
+                    tracked_by_admin[admin_id].add(tracked_user_id)
+
+                logger.info(
+                    "Получены отслеживаемые пользователи для %d админов",
+                    len(admin_ids),
+                )
+                return dict(tracked_by_admin)
+            except SQLAlchemyError as e:
+                logger.error(
+                    "Ошибка при получении отслеживаемых пользователей для админов %s: %s",
+                    admin_ids,
+                    e,
+                    exc_info=True,
+                )
+                await session.rollback()
+                raise DatabaseException(
+                    details={
+                        "context": "get_tracked_user_ids_by_admins",
+                        "original": str(e),
+                    }
+                ) from e
+
     async def get_admins_for_chat(self, chat_tg_id: str) -> Optional[List[User]]:
         async with self._db.session() as session:
             try:
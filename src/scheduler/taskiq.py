@@ -1,19 +1,92 @@
 import logging
 
+from taskiq import TaskiqEvents, TaskiqState
 from taskiq_aio_pika import AioPikaBroker, Queue
 from taskiq_redis import RedisAsyncResultBackend
 
 from config import settings
+from metrics.tasks import TaskMetricsMiddleware
 from utils.logger_config import setup_logger
 
 # Инициализируем логгер для воркера
 setup_logger(log_level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 result_backend = RedisAsyncResultBackend(
     redis_url=f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}",
 )
 
+# Очереди RabbitMQ (task_queue совпадает с очередью TaskIQ по умолчанию);
+# имена нужны и для метрики глубины очередей
+task_queue = Queue(name="taskiq")
+delay_queue = Queue(name="taskiq.delay_queue")
+
 broker = AioPikaBroker(
     url=f"amqp://{settings.RABBITMQ_USER}:{settings.RABBITMQ_PASS}@{settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}/",
-    delay_queue=Queue(name="taskiq.delay_queue"),
+    task_queues=[task_queue],
+    delay_queue=delay_queue,
 ).with_result_backend(result_backend)
+
+if settings.METRICS_ENABLED:
+    broker.add_middlewares(TaskMetricsMiddleware())
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def setup_worker_container(state: TaskiqState) -> None:
+    """
+    Регистрирует зависимости профилей, заявленных загруженными модулями задач:
+    воркер только с tasks.analytics_tasks получает лёгкий профиль без aiogram.
+    Поднимает сервер метрик процесса (при нескольких процессах воркера порт
+    занимает первый, он же отдаёт сумму при PROMETHEUS_MULTIPROC_DIR) и
+    подключает пул соединений и провайдер модели процесса (metrics.live).
+    """
+    from container import ContainerSetup, container
+
+    ContainerSetup.setup_required()
+
+    if settings.METRICS_ENABLED:
+        from database.session import engine
+        from metrics import (
+            AIProviderCollector,
+            instrument_engine,
+            start_live_export,
+            start_metrics_server,
+        )
+        from services.chat.summarize import IAIService
+        from services.chat.summarize.open_router_service import OpenRouterService
+
+        collectors = [instrument_engine(engine, registry=None)]
+        if container.is_registered(IAIService):
+            ai_service = container.resolve(IAIService)
+            if isinstance(ai_service, OpenRouterService):
+                collectors.append(AIProviderCollector(ai_service.stats))
+        state.metrics_export = start_live_export(collectors)
+        state.metrics_runner = await start_metrics_server(settings.METRICS_PORT)
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def stop_metrics_server(state: TaskiqState) -> None:
+    """Останавливает сервер и экспорт метрик процесса воркера."""
+    if not settings.METRICS_ENABLED:
+        return
+    from metrics import stop_live_export
+
+    await stop_live_export(getattr(state, "metrics_export", None))
+    runner = getattr(state, "metrics_runner", None)
+    if runner is not None:
+        await runner.cleanup()
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def close_ai_client(state: TaskiqState) -> None:
+    """Закрывает пул соединений OpenRouter при остановке воркера."""
+    # Импорт внутри: контейнер импортирует модули, которые сами импортируют broker
+    from container import container
+    from services.chat.summarize import IAIService
+
+    if not container.is_registered(IAIService):
+        return
+    try:
+        await container.resolve(IAIService).close()
+    except Exception as e:
+        logger.warning("Ошибка при закрытии клиента OpenRouter: %s", e)
@@ -0,0 +1,114 @@
+"""
+Время импорта + регистрации контейнера и пиковый RSS для каждой роли процесса.
+
+Каждая роль запускается в отдельном интерпретаторе: импортирует то же, что её
+точка входа, и регистрирует свой профиль контейнера.
+Запуск из src/: python -m script.bench_bootstrap
+"""
+
+import json
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+# Роль -> код, повторяющий импорты и регистрацию её точки входа
+ROLES: dict[str, str] = {
+    "bot": (
+        "import main\n"
+        "from container import ContainerProfile, ContainerSetup\n"
+        "ContainerSetup.setup(ContainerProfile.BOT)\n"
+    ),
+    "api": "import api.main\n",
+    "scheduler": (
+        "import analytics_scheduler_entrypoint\n"
+        "import taskiq_scheduler_entrypoint\n"
+        "from container import ContainerProfile, ContainerSetup\n"
+        "ContainerSetup.setup(ContainerProfile.SCHEDULER)\n"
+    ),
+    "analytics_worker": (
+        "import scheduler.taskiq\n"
+        "import tasks.analytics_tasks\n"
+        "from container import ContainerSetup\n"
+        "ContainerSetup.setup_required()\n"
+    ),
+    "automod_worker": (
+        "import scheduler.taskiq\n"
+        "import tasks.automoderation_tasks\n"
+        "from container import ContainerSetup\n"
+        "ContainerSetup.setup_required()\n"
+    ),
+    "worker": (
+        "import scheduler.taskiq\n"
+        "import tasks.analytics_tasks, tasks.antiraid_tasks\n"
+        "import tasks.automoderation_tasks, tasks.moderation_tasks\n"
+        "import tasks.report_tasks\n"
+        "from container import ContainerSetup\n"
+        "ContainerSetup.setup_required()\n"
+    ),
+}
+
+# Пиковый RSS берём из VmHWM: ru_maxrss в Linux наследуется через fork/exec
+# от родителя (например, процесса pytest)
+_PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - started
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+try:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                rss_kb = int(line.split()[1])
+except OSError:
+    pass
+print(json.dumps({{
+    "seconds": elapsed,
+    "rss_mb": rss_kb / 1024,
+    "modules": sorted(sys.modules),
+}}))
+"""
+
+
+def measure(role: str) -> dict:
+    """
+    Запускает роль в новом интерпретаторе.
+
+    Returns:
+        {"seconds": ..., "rss_mb": ..., "modules": [...]}
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(body=ROLES[role])],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Последняя строка stdout — JSON пробы, выше может быть вывод логгеров
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run() -> None:
+    for role in ROLES:
+        stats = measure(role)
+        modules = stats["modules"]
+        logger.info(
+            "%-17s %6.2f с  RSS=%6.1f МБ  модулей=%5d  aiogram=%s",
+            role,
+            stats["seconds"],
+            stats["rss_mb"],
+            len(modules),
+            "да" if "aiogram" in modules else "нет",
+        )
+
+
+if __name__ == "__main__":
+    run()
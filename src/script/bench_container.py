@@ -0,0 +1,78 @@
+"""
+Бенчмарк DI-контейнера: resolves/sec и накладные расходы на одно сообщение группы.
+
+Сравнивает обычный punq.Container с теми же регистрациями и CompiledContainer
+после compile(). Запуск из src/: python -m script.bench_container
+"""
+
+import argparse
+import logging
+import time
+from typing import Any, Callable
+
+from punq import Container
+
+from container import ContainerProfile, ContainerSetup, _is_stateless_component
+from di import CompiledContainer
+from services import ChatService
+from usecases.automoderation import RunAutoModerationOnMessageUseCase
+from usecases.message import SaveMessageUseCase
+from usecases.time import ConvertToLocalTimeUseCase
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# Resolve'ы group_message_handler на обычное сообщение (включая автомодерацию)
+MESSAGE_PATH = (
+    ChatService,
+    ConvertToLocalTimeUseCase,
+    SaveMessageUseCase,
+    RunAutoModerationOnMessageUseCase,
+)
+
+
+def _populate(container: Container) -> None:
+    for step in ContainerSetup.steps(ContainerProfile.BOT):
+        getattr(ContainerSetup, step)(container)
+
+
+def _measure(fn: Callable[[], Any], iterations: int) -> float:
+    """Секунды на один вызов fn."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+
+def run(iterations: int) -> None:
+    plain = Container()
+    _populate(plain)
+
+    compiled = CompiledContainer()
+    _populate(compiled)
+    started = time.perf_counter()
+    compiled.compile(promote_to_singleton=_is_stateless_component)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    for name, container in (("punq", plain), ("compiled", compiled)):
+        per_resolve = _measure(
+            lambda: container.resolve(SaveMessageUseCase), iterations
+        )
+        per_message = _measure(
+            lambda: [container.resolve(key) for key in MESSAGE_PATH], iterations
+        )
+        logger.info(
+            "%-8s resolves/sec=%10.0f  на сообщение=%8.2f мкс",
+            name,
+            1 / per_resolve,
+            per_message * 1_000_000,
+        )
+    logger.info("compile() занял %.1f мс", compile_ms)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--iterations", type=int, default=2000)
+    run(parser.parse_args().iterations)
@@ -0,0 +1,202 @@
+"""
+Обращения к Redis и БД на одно сохраняемое сообщение группы.
+
+Прогоняет обычное (не командное) сообщение группы через цепочку бота в двух
+вариантах и считает обращения к кешу, репозиториям и буферу аналитики:
+- без контекста: как раньше — LanguageMiddleware читает пользователя,
+  затем обработчик заново загружает пользователя и чат;
+- с контекстом: UpdateContextMiddleware → LanguageMiddleware (пропуск
+  для сообщений группы) → обработчик с общим UpdateContext.
+
+Кеш и репозитории — счётчики в памяти, поэтому замер не требует Redis/БД и
+показывает ровно число сетевых обращений в установившемся режиме (пользователь
+и чат уже в кеше). Запуск из src/: python -m script.bench_ingest
+"""
+
+import argparse
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Optional, cast
+
+from aiogram.types import Chat, Message, TelegramObject
+from aiogram.types import User as TelegramUser
+from punq import Container
+
+from handlers.group.new_message import group_message_handler
+from middlewares import LanguageMiddleware, UpdateContextMiddleware
+from models import ChatSession, ChatSettings, User
+from repositories import ChatRepository, UserRepository
+from services.analytics_buffer_service import AnalyticsBufferService
+from services.caching import ICache
+from services.chat import ChatService
+from services.user import UserService
+from usecases.message import SaveMessageUseCase
+from usecases.time import ConvertToLocalTimeUseCase
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+USER_TG_ID = 1001
+CHAT_TG_ID = -1001234567890
+
+
+class CountingCache(ICache):
+    """Кеш в памяти, считающий обращения (каждое — поход в Redis)."""
+
+    def __init__(self, calls: Counter[str]) -> None:
+        self._data: dict[str, Any] = {}
+        self._calls = calls
+
+    async def get(self, key: str) -> Optional[Any]:
+        self._calls["redis"] += 1
+        return self._data.get(key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self._calls["redis"] += 1
+        self._data[key] = value
+
+    async def delete(self, key: str) -> bool:
+        self._calls["redis"] += 1
+        return self._data.pop(key, None) is not None
+
+    async def clear(self) -> None:
+        self._data.clear()
+
+
+class CountingRepository:
+    """Репозиторий-заглушка: любой метод — одно обращение к БД."""
+
+    def __init__(self, calls: Counter[str], result: Any) -> None:
+        self._calls = calls
+        self._result = result
+
+    def __getattr__(self, name: str) -> Any:
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            self._calls["db"] += 1
+            return self._result
+
+        return method
+
+
+class CountingBuffer:
+    """Буфер аналитики: запись сообщения — одно обращение к Redis."""
+
+    def __init__(self, calls: Counter[str]) -> None:
+        self._calls = calls
+
+    async def add_message(self, dto: Any, username: Optional[str] = None) -> None:
+        self._calls["redis"] += 1
+
+
+def _build(calls: Counter[str]) -> tuple[Container, UserService, ChatService]:
+    cache = CountingCache(calls)
+    user = User(id=1, tg_id=str(USER_TG_ID), username="member", language="ru")
+    chat = ChatSession(id=10, chat_id=str(CHAT_TG_ID), title="Bench group")
+    chat.settings = ChatSettings(
+        id=10,
+        chat_id=10,
+        is_antibot_enabled=False,
+        is_auto_moderation_enabled=False,
+        auto_delete_welcome_text=False,
+        show_welcome_text=False,
+    )
+
+    # Заглушки подменяют репозитории и буфер по duck typing
+    user_service = UserService(
+        cast(UserRepository, CountingRepository(calls, user)), cache
+    )
+    chat_service = ChatService(
+        cast(ChatRepository, CountingRepository(calls, chat)), cache
+    )
+
+    container = Container()
+    container.register(UserService, instance=user_service)
+    container.register(ChatService, instance=chat_service)
+    container.register(ConvertToLocalTimeUseCase)
+    container.register(
+        SaveMessageUseCase,
+        instance=SaveMessageUseCase(
+            buffer_service=cast(AnalyticsBufferService, CountingBuffer(calls)),
+            user_service=user_service,
+            chat_service=chat_service,
+        ),
+    )
+    return container, user_service, chat_service
+
+
+def _message(message_id: int) -> Message:
+    return Message.model_construct(
+        message_id=message_id,
+        date=datetime.now(timezone.utc),
+        chat=Chat.model_construct(
+            id=CHAT_TG_ID, type="supergroup", title="Bench group"
+        ),
+        from_user=TelegramUser.model_construct(
+            id=USER_TG_ID,
+            is_bot=False,
+            first_name="Member",
+            username="member",
+            language_code="ru",
+        ),
+        text="обычное сообщение",
+    )
+
+
+async def _without_context(
+    message: Message, container: Container, user_service: UserService, _: Any
+) -> None:
+    language = LanguageMiddleware(user_service, container)
+    await language._get_user_language(message.from_user)
+    await group_message_handler(message, container)
+
+
+async def _with_context(
+    message: Message,
+    container: Container,
+    user_service: UserService,
+    chat_service: ChatService,
+) -> None:
+    update_context = UpdateContextMiddleware(user_service, chat_service)
+    language = LanguageMiddleware(user_service, container)
+
+    async def handler(event: TelegramObject, data: dict[str, Any]) -> None:
+        await group_message_handler(
+            cast(Message, event), container, update_context=data.get("update_context")
+        )
+
+    async def inner(event: TelegramObject, data: dict[str, Any]) -> None:
+        await language(handler, event, data)
+
+    await update_context(inner, message, {})
+
+
+async def run(messages: int) -> None:
+    for name, scenario in (
+        ("без контекста", _without_context),
+        ("с контекстом", _with_context),
+    ):
+        calls: Counter[str] = Counter()
+        container, user_service, chat_service = _build(calls)
+        # Прогрев: пользователь и чат попадают в кеш
+        await scenario(_message(0), container, user_service, chat_service)
+        calls.clear()
+
+        for message_id in range(1, messages + 1):
+            await scenario(_message(message_id), container, user_service, chat_service)
+
+        logger.info(
+            "%-14s Redis=%5.2f  БД=%5.2f  обращений на сообщение",
+            name,
+            calls["redis"] / messages,
+            calls["db"] / messages,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--messages", type=int, default=1000)
+    asyncio.run(run(parser.parse_args().messages))
@@ -0,0 +1,119 @@
+"""
+Задержка event loop при интенсивном логировании: синхронный
+RotatingFileHandler против очереди (BoundedQueueHandler + QueueListener).
+
+Пока продюсер пишет в лог пачками (как обработчики при потоке сообщений
+групп), пробная задача засыпает на 1 мс и меряет, насколько позже она
+просыпается. С --fsync каждая запись сбрасывается на диск, что моделирует
+медленный диск. Запуск из src/: python -m script.bench_logging
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import queue
+import statistics
+import tempfile
+import time
+from logging.handlers import QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import List
+
+from utils.logger_config import BoundedQueueHandler
+
+logger = logging.getLogger(__name__)
+bench_logger = logging.getLogger("bench.ingest")
+
+PROBE_INTERVAL = 0.001
+
+
+class FsyncRotatingFileHandler(RotatingFileHandler):
+    """Файловый обработчик, сбрасывающий каждую запись на диск."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if self.stream:
+            os.fsync(self.stream.fileno())
+
+
+def _file_handler(path: Path, fsync: bool) -> logging.Handler:
+    handler_cls = FsyncRotatingFileHandler if fsync else RotatingFileHandler
+    handler = handler_cls(path, maxBytes=1024 * 1024, backupCount=2, encoding="utf-8")
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+    )
+    return handler
+
+
+async def _probe(lags: List[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - started - PROBE_INTERVAL)
+
+
+async def _produce(messages: int, batch: int) -> None:
+    for i in range(messages):
+        bench_logger.info("Сообщение %d сохранено в буфер (chat_id=%d)", i, -100 - i)
+        if i % batch == 0:
+            await asyncio.sleep(0)
+
+
+async def _measure(messages: int, batch: int) -> List[float]:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await _produce(messages, batch)
+    stop.set()
+    await probe
+    return lags
+
+
+def _report(name: str, lags: List[float], elapsed: float) -> None:
+    ordered = sorted(lags)
+    p99 = ordered[int(len(ordered) * 0.99) - 1] if ordered else 0.0
+    logger.warning(
+        "%-6s p50=%7.2f мс  p99=%7.2f мс  max=%7.2f мс  продюсер=%6.2f с",
+        name,
+        statistics.median(ordered) * 1000 if ordered else 0.0,
+        p99 * 1000,
+        (ordered[-1] if ordered else 0.0) * 1000,
+        elapsed,
+    )
+
+
+def run(messages: int, batch: int, fsync: bool) -> None:
+    bench_logger.propagate = False
+    bench_logger.setLevel(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Синхронная запись из event loop
+        handler = _file_handler(Path(tmp) / "sync.log", fsync)
+        bench_logger.handlers = [handler]
+        started = time.perf_counter()
+        lags = asyncio.run(_measure(messages, batch))
+        _report("sync", lags, time.perf_counter() - started)
+        handler.close()
+
+        # Запись через очередь и фоновый поток
+        handler = _file_handler(Path(tmp) / "queue.log", fsync)
+        queue_handler = BoundedQueueHandler(queue.Queue(maxsize=messages + 1))
+        listener = QueueListener(queue_handler.queue, handler)
+        listener.start()
+        bench_logger.handlers = [queue_handler]
+        started = time.perf_counter()
+        lags = asyncio.run(_measure(messages, batch))
+        _report("queue", lags, time.perf_counter() - started)
+        listener.stop()
+        handler.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--messages", type=int, default=20000)
+    parser.add_argument("-b", "--batch", type=int, default=20)
+    parser.add_argument("--fsync", action="store_true")
+    args = parser.parse_args()
+    run(args.messages, args.batch, args.fsync)
@@ -1,17 +1,50 @@
-from .admin_action_log_service import AdminActionLogService
-from .analytics_buffer_service import AnalyticsBufferService
-from .break_analysis_service import BreakAnalysisService
-from .categories.category_service import CategoryService
-from .chat import ArchiveBindService, ChatService
-from .chat.summarize import IAIService
-from .messaging import BotMessageService
-from .permissions import BotPermissionService
-from .punishment_service import PunishmentService
-from .report_schedule_service import ReportScheduleService
-from .scheduler.taskiq_scheduler import TaskiqSchedulerService
-from .templates.content_service import TemplateContentService
-from .templates.template_service import TemplateService
-from .user import UserService
+"""
+Сервисы приложения.
+
+Реэкспорт ленивый: модуль сервиса импортируется при первом обращении к имени,
+поэтому `from services import AnalyticsBufferService` не тянет aiogram и
+остальные сервисы в процессы, которым они не нужны (воркер аналитики и т.п.).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .admin_action_log_service import AdminActionLogService
+    from .analytics_buffer_service import AnalyticsBufferService
+    from .break_analysis_service import BreakAnalysisService
+    from .categories.category_service import CategoryService
+    from .chat import ArchiveBindService, ChatService
+    from .chat.summarize import IAIService
+    from .messaging import BotMessageService
+    from .permissions import BotPermissionService
+    from .punishment_service import PunishmentService
+    from .report_schedule_service import ReportScheduleService
+    from .scheduler.taskiq_scheduler import TaskiqSchedulerService
+    from .templates.content_service import TemplateContentService
+    from .templates.template_service import TemplateService
+    from .update_context import UpdateContext
+    from .user import TrackingIndexService, UserService
+
+_EXPORTS = {
+    "AdminActionLogService": ".admin_action_log_service",
+    "AnalyticsBufferService": ".analytics_buffer_service",
+    "ArchiveBindService": ".chat",
+    "BreakAnalysisService": ".break_analysis_service",
+    "BotMessageService": ".messaging",
+    "UserService": ".user",
+    "TrackingIndexService": ".user",
+    "IAIService": ".chat.summarize",
+    "PunishmentService": ".punishment_service",
+    "BotPermissionService": ".permissions",
+    "ReportScheduleService": ".report_schedule_service",
+    "CategoryService": ".categories.category_service",
+    "TemplateService": ".templates.template_service",
+    "TemplateContentService": ".templates.content_service",
+    "TaskiqSchedulerService": ".scheduler.taskiq_scheduler",
+    "ChatService": ".chat",
+    "UpdateContext": ".update_context",
+}
 
 __all__ = [
     "AdminActionLogService",
@@ -20,6 +53,7 @@ __all__ = [
     "BreakAnalysisService",
     "BotMessageService",
     "UserService",
+    "TrackingIndexService",
     "IAIService",
     "PunishmentService",
     "BotPermissionService",
@@ -29,4 +63,14 @@ __all__ = [
     "TemplateContentService",
     "TaskiqSchedulerService",
     "ChatService",
+    "UpdateContext",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,21 +4,44 @@ from typing import Optional
 from sqlalchemy.exc import SQLAlchemyError
 
 from constants.enums import AdminActionType
-from repositories import AdminActionLogRepository, UserRepository
+from dto.admin_log import AdminLogsPageDTO
+from dto.buffer import BufferedAdminActionLogDTO
+from repositories import AdminActionLogRepository
+from services.analytics_buffer_service import AnalyticsBufferService
+from services.caching import ICache
+from services.time_service import TimeZoneService
+from services.user import UserService
+from utils.keyset_cursor import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_COUNT_TTL_SECONDS = 60
+
 
 class AdminActionLogService:
-    """Сервис для логирования действий администраторов."""
+    """
+    Сервис для логирования действий администраторов.
+
+    Записи складываются в Redis-буфер и вставляются в БД пачками фоновой задачей;
+    при недоступности Redis запись пишется в БД сразу.
+
+    Для просмотра логов отдаёт keyset-страницы по токену курсора и
+    приблизительное общее количество (кешируется на count_ttl_seconds).
+    """
 
     def __init__(
         self,
         log_repository: AdminActionLogRepository,
-        user_repository: UserRepository,
+        user_service: UserService,
+        buffer_service: AnalyticsBufferService,
+        cache: ICache,
+        count_ttl_seconds: int = DEFAULT_COUNT_TTL_SECONDS,
     ) -> None:
         self._log_repository = log_repository
-        self._user_repository = user_repository
+        self._user_service = user_service
+        self._buffer_service = buffer_service
+        self._cache = cache
+        self._count_ttl = count_ttl_seconds
 
     async def log_action(
         self,
@@ -35,8 +58,8 @@ class AdminActionLogService:
             details: Дополнительная информация о действии (пользователь, чат, период и т.д.)
         """
         try:
-            # Получаем пользователя по tg_id
-            user = await self._user_repository.get_user_by_tg_id(tg_id=admin_tg_id)
+            # Получаем пользователя по tg_id (через кеш)
+            user = await self._user_service.get_user(tg_id=admin_tg_id)
             if not user:
                 logger.warning(
                     "Пользователь с tg_id=%s не найден, логирование пропущено",
@@ -44,10 +67,19 @@ class AdminActionLogService:
                 )
                 return
 
-            # Создаем запись в логе
-            await self._log_repository.create_log(
-                admin_id=user.id, action_type=action_type, details=details
+            buffered = await self._buffer_service.add_admin_log(
+                BufferedAdminActionLogDTO(
+                    admin_id=user.id,
+                    action_type=action_type.value,
+                    details=details,
+                    created_at=TimeZoneService.now(),
+                )
             )
+            if not buffered:
+                # Redis недоступен — пишем напрямую, чтобы не потерять запись
+                await self._log_repository.create_log(
+                    admin_id=user.id, action_type=action_type, details=details
+                )
             logger.debug(
                 "Записано действие: admin_tg_id=%s, action_type=%s, details=%s",
                 admin_tg_id,
@@ -57,3 +89,52 @@ class AdminActionLogService:
         except SQLAlchemyError as e:
             # Не прерываем выполнение основного кода при ошибке логирования
             logger.error("Ошибка при логировании действия: %s", e, exc_info=True)
+
+    async def get_logs_page(
+        self,
+        limit: int,
+        admin_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        backward: bool = False,
+    ) -> AdminLogsPageDTO:
+        """
+        Возвращает страницу логов после курсора (или до него при backward=True)
+        вместе с курсорами соседних страниц. Без курсора — первая страница.
+
+        Raises:
+            ValueError: Если токен курсора некорректен
+        """
+        position = decode_cursor(cursor) if cursor else None
+        # Запрашиваем на одну запись больше, чтобы узнать, есть ли страница дальше
+        logs = await self._log_repository.get_logs_page(
+            limit=limit + 1, admin_id=admin_id, cursor=position, backward=backward
+        )
+        has_more = len(logs) > limit
+        if has_more:
+            # При движении назад лишняя запись — самая новая, то есть первая
+            logs = logs[1:] if backward else logs[:-1]
+        if not logs:
+            return AdminLogsPageDTO(logs=[])
+
+        has_next = cursor is not None if backward else has_more
+        has_prev = has_more if backward else cursor is not None
+        return AdminLogsPageDTO(
+            logs=logs,
+            prev_cursor=(
+                encode_cursor(logs[0].created_at, logs[0].id) if has_prev else None
+            ),
+            next_cursor=(
+                encode_cursor(logs[-1].created_at, logs[-1].id) if has_next else None
+            ),
+        )
+
+    async def count_logs(self, admin_id: Optional[int] = None) -> int:
+        """Количество логов для отображения; значение может отставать на TTL кеша."""
+        cache_key = f"admin_logs:count:{admin_id if admin_id is not None else 'all'}"
+        cached = await self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        total = await self._log_repository.count_logs(admin_id=admin_id)
+        await self._cache.set(cache_key, total, ttl=self._count_ttl)
+        return total
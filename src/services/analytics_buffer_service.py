@@ -1,12 +1,24 @@
+import json
 import logging
-from typing import List, Type, TypeVar
+import time
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 from redis.asyncio import Redis as RedisClient
+from redis.asyncio.client import Pipeline
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import TimeoutError as RedisTimeoutError
 
-from dto.buffer import BufferedMessageDTO, BufferedMessageReplyDTO, BufferedReactionDTO
+from dto.buffer import (
+    BufferedAdminActionLogDTO,
+    BufferedMembershipEventDTO,
+    BufferedMessageDTO,
+    BufferedMessageReplyDTO,
+    BufferedReactionDTO,
+)
+from dto.daily_activity import UserDailyActivityDTO
+from services.time_service import TimeZoneService
 
 logger = logging.getLogger(__name__)
 
@@ -19,16 +31,63 @@ _REDIS_ERRORS = (
 )
 
 
+# Живые счётчики дня хранятся, пока день может понадобиться отчёту «за сегодня»
+LIVE_STATS_TTL_SECONDS = 3 * 24 * 3600
+
+
+def _day_key(created_at: datetime) -> str:
+    """Локальный день события (границы дня совпадают с отчётами)."""
+    return TimeZoneService.convert_to_local_time(created_at).strftime("%Y%m%d")
+
+
+def _head_created_at(raw: Optional[bytes]) -> Optional[datetime]:
+    """created_at элемента буфера без полной валидации DTO."""
+    if raw is None:
+        return None
+    try:
+        return TimeZoneService.convert_to_local_time(
+            datetime.fromisoformat(json.loads(raw)["created_at"])
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
 class AnalyticsBufferService:
-    """Сервис для буферизации сообщений и реакций в Redis"""
+    """
+    Сервис для буферизации сообщений, реакций, событий состава и логов в Redis.
+
+    При добавлении сообщения и реакции в том же запросе к Redis обновляются
+    живые счётчики дня по чату: sorted set сообщений по пользователям
+    (лидерборд) и HyperLogLog уникальных активных пользователей. Отчёты
+    «за сегодня» читают их без обращения к Postgres; прошлые дни считаются
+    по БД.
+    """
 
     REDIS_KEY_MESSAGES = "buffer:messages"
     REDIS_KEY_REACTIONS = "buffer:reactions"
     REDIS_KEY_REPLIES = "buffer:replies"
+    REDIS_KEY_MEMBERSHIP_EVENTS = "buffer:membership_events"
+    REDIS_KEY_ADMIN_LOGS = "buffer:admin_logs"
+    # Живые счётчики: {prefix}:{chat_id}:{YYYYMMDD}
+    # Буферы по именам (для метрик глубины и отставания)
+    BUFFER_KEYS = {
+        "messages": REDIS_KEY_MESSAGES,
+        "reactions": REDIS_KEY_REACTIONS,
+        "replies": REDIS_KEY_REPLIES,
+        "membership_events": REDIS_KEY_MEMBERSHIP_EVENTS,
+        "admin_logs": REDIS_KEY_ADMIN_LOGS,
+    }
+
+    REDIS_KEY_LEADERBOARD = "live:leaderboard"
+    REDIS_KEY_USERNAMES = "live:usernames"
+    REDIS_KEY_ACTIVE_USERS = "live:active_users"
+    # Unix-время, с которого ведутся живые счётчики (день до него неполный)
+    REDIS_KEY_LIVE_SINCE = "live:since"
 
     def __init__(self, redis_client: RedisClient) -> None:
         self._redis = redis_client
         self._connected = False
+        self._live_since_marked = False
 
     async def _ensure_connection(self) -> bool:
         """Проверяет доступность Redis."""
@@ -44,16 +103,33 @@ class AnalyticsBufferService:
                 return False
         return True
 
-    async def _add_to_buffer(self, key: str, dto: BaseModel, entity_name: str) -> None:
-        """Общий метод для добавления DTO в буфер Redis"""
+    async def _add_to_buffer(
+        self,
+        key: str,
+        dto: BaseModel,
+        entity_name: str,
+        track: Optional[Callable[[Pipeline], None]] = None,
+    ) -> bool:
+        """
+        Общий метод для добавления DTO в буфер Redis. Возвращает True при успехе.
+
+        track добавляет в тот же pipeline обновление живых счётчиков.
+        """
         if not await self._ensure_connection():
             logger.error("Redis недоступен, %s не добавлено в буфер", entity_name)
-            return
+            return False
 
         try:
             json_data = dto.model_dump_json()
-            await self._redis.rpush(key, json_data.encode("utf-8"))
+            if track is None:
+                await self._redis.rpush(key, json_data.encode("utf-8"))
+            else:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.rpush(key, json_data.encode("utf-8"))
+                    track(pipe)
+                    await pipe.execute()
             logger.debug("%s добавлено в буфер", entity_name.capitalize())
+            return True
         except _REDIS_ERRORS as e:
             logger.error(
                 "Ошибка при добавлении %s в буфер: %s",
@@ -68,6 +144,7 @@ class AnalyticsBufferService:
                 e,
                 exc_info=True,
             )
+        return False
 
     async def _pop_from_buffer(
         self, key: str, dto_class: Type[T], count: int, entity_name: str
@@ -115,18 +192,151 @@ class AnalyticsBufferService:
                 exc_info=True,
             )
 
-    async def add_message(self, dto: BufferedMessageDTO) -> None:
-        """Добавляет сообщение в буфер Redis"""
-        await self._add_to_buffer(self.REDIS_KEY_MESSAGES, dto, "сообщение")
+    def _live_key(self, prefix: str, chat_id: int, day: str) -> str:
+        return f"{prefix}:{chat_id}:{day}"
+
+    def _track_active_user(
+        self, pipe: Pipeline, chat_id: int, user_id: int, day: str
+    ) -> None:
+        key = self._live_key(self.REDIS_KEY_ACTIVE_USERS, chat_id, day)
+        pipe.pfadd(key, user_id)
+        pipe.expire(key, LIVE_STATS_TTL_SECONDS)
+        if not self._live_since_marked:
+            pipe.set(self.REDIS_KEY_LIVE_SINCE, int(time.time()), nx=True)
+            self._live_since_marked = True
+
+    async def add_message(
+        self, dto: BufferedMessageDTO, username: Optional[str] = None
+    ) -> None:
+        """
+        Добавляет сообщение в буфер Redis и учитывает его в живых счётчиках дня.
+
+        username сохраняется для лидерборда, чтобы не читать его из БД.
+        """
+        day = _day_key(dto.created_at)
+
+        def track(pipe: Pipeline) -> None:
+            leaderboard = self._live_key(self.REDIS_KEY_LEADERBOARD, dto.chat_id, day)
+            pipe.zincrby(leaderboard, 1, dto.user_id)
+            pipe.expire(leaderboard, LIVE_STATS_TTL_SECONDS)
+            if username:
+                names = self._live_key(self.REDIS_KEY_USERNAMES, dto.chat_id, day)
+                pipe.hset(names, str(dto.user_id), username)
+                pipe.expire(names, LIVE_STATS_TTL_SECONDS)
+            self._track_active_user(pipe, dto.chat_id, dto.user_id, day)
+
+        await self._add_to_buffer(self.REDIS_KEY_MESSAGES, dto, "сообщение", track)
 
     async def add_reaction(self, dto: BufferedReactionDTO) -> None:
-        """Добавляет реакцию в буфер Redis"""
-        await self._add_to_buffer(self.REDIS_KEY_REACTIONS, dto, "реакция")
+        """Добавляет реакцию в буфер Redis и учитывает автора как активного за день"""
+        day = _day_key(dto.created_at)
+        await self._add_to_buffer(
+            self.REDIS_KEY_REACTIONS,
+            dto,
+            "реакция",
+            lambda pipe: self._track_active_user(pipe, dto.chat_id, dto.user_id, day),
+        )
+
+    async def get_live_day_stats(
+        self, chat_id: int, day: date, limit: int = 10
+    ) -> Optional[tuple[List[UserDailyActivityDTO], int]]:
+        """
+        Лидерборд по сообщениям и число уникальных активных пользователей
+        (сообщения и реакции) за локальный день из живых счётчиков.
+
+        Returns:
+            (топ пользователей, активных пользователей) или None, если счётчики
+            за этот день неполные (ведутся с более позднего момента) или Redis
+            недоступен — тогда статистику нужно считать по БД.
+        """
+        if not await self._ensure_connection():
+            return None
+
+        day_key = day.strftime("%Y%m%d")
+        tz = TimeZoneService.DEFAULT_TIMEZONE
+        day_start = tz.localize(datetime.combine(day, datetime.min.time()))
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.get(self.REDIS_KEY_LIVE_SINCE)
+                pipe.zrevrange(
+                    self._live_key(self.REDIS_KEY_LEADERBOARD, chat_id, day_key),
+                    0,
+                    limit - 1,
+                    withscores=True,
+                )
+                pipe.pfcount(
+                    self._live_key(self.REDIS_KEY_ACTIVE_USERS, chat_id, day_key)
+                )
+                since, ranked, active_users = await pipe.execute()
+            if since is None or int(since) > day_start.timestamp():
+                return None
+
+            user_ids = [int(member) for member, _ in ranked]
+            names = (
+                await self._redis.hmget(
+                    self._live_key(self.REDIS_KEY_USERNAMES, chat_id, day_key),
+                    [str(user_id) for user_id in user_ids],
+                )
+                if user_ids
+                else []
+            )
+        except _REDIS_ERRORS as e:
+            logger.error("Ошибка чтения живых счётчиков chat_id=%s: %s", chat_id, e)
+            return None
+
+        top_users = [
+            UserDailyActivityDTO(
+                user_id=user_id,
+                username=(name.decode() if isinstance(name, bytes) else name)
+                or f"User ID: {user_id}",
+                message_count=int(score),
+                rank=rank,
+            )
+            for rank, (user_id, (_, score), name) in enumerate(
+                zip(user_ids, ranked, names), 1
+            )
+        ]
+        return top_users, int(active_users)
+
+    async def get_buffer_stats(
+        self,
+    ) -> Optional[Dict[str, tuple[int, Optional[datetime]]]]:
+        """
+        Длина каждого буфера и время создания его самого старого элемента
+        (одним pipeline). None — Redis недоступен.
+        """
+        if not await self._ensure_connection():
+            return None
+
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key in self.BUFFER_KEYS.values():
+                    pipe.llen(key)
+                    pipe.lindex(key, 0)
+                results = await pipe.execute()
+        except _REDIS_ERRORS as e:
+            logger.error("Ошибка чтения длины буферов: %s", e)
+            return None
+
+        return {
+            name: (int(length), _head_created_at(head))
+            for name, length, head in zip(self.BUFFER_KEYS, results[::2], results[1::2])
+        }
 
     async def add_reply(self, dto: BufferedMessageReplyDTO) -> None:
         """Добавляет reply сообщение в буфер Redis"""
         await self._add_to_buffer(self.REDIS_KEY_REPLIES, dto, "reply")
 
+    async def add_membership_event(self, dto: BufferedMembershipEventDTO) -> bool:
+        """Добавляет событие состава чата в буфер Redis"""
+        return await self._add_to_buffer(
+            self.REDIS_KEY_MEMBERSHIP_EVENTS, dto, "событие состава"
+        )
+
+    async def add_admin_log(self, dto: BufferedAdminActionLogDTO) -> bool:
+        """Добавляет запись лога действий администратора в буфер Redis"""
+        return await self._add_to_buffer(self.REDIS_KEY_ADMIN_LOGS, dto, "лог действия")
+
     async def re_add_replies(self, dtos: List[BufferedMessageReplyDTO]) -> None:
         """Возвращает reply в буфер для повторной обработки."""
         if not dtos:
@@ -169,6 +379,26 @@ class AnalyticsBufferService:
             self.REDIS_KEY_REPLIES, BufferedMessageReplyDTO, count, "reply"
         )
 
+    async def pop_membership_events(
+        self, count: int = 100
+    ) -> List[BufferedMembershipEventDTO]:
+        """Безопасно читает пачку событий состава чата из Redis без удаления."""
+        return await self._pop_from_buffer(
+            self.REDIS_KEY_MEMBERSHIP_EVENTS,
+            BufferedMembershipEventDTO,
+            count,
+            "событий состава",
+        )
+
+    async def pop_admin_logs(self, count: int = 100) -> List[BufferedAdminActionLogDTO]:
+        """Безопасно читает пачку логов действий администраторов из Redis без удаления."""
+        return await self._pop_from_buffer(
+            self.REDIS_KEY_ADMIN_LOGS,
+            BufferedAdminActionLogDTO,
+            count,
+            "логов действий",
+        )
+
     async def trim_messages(self, count: int) -> None:
         """Удаляет обработанные сообщения из Redis."""
         await self._trim_buffer(self.REDIS_KEY_MESSAGES, count, "сообщений")
@@ -181,6 +411,16 @@ class AnalyticsBufferService:
         """Удаляет обработанные reply сообщения из Redis."""
         await self._trim_buffer(self.REDIS_KEY_REPLIES, count, "reply")
 
+    async def trim_membership_events(self, count: int) -> None:
+        """Удаляет обработанные события состава чата из Redis."""
+        await self._trim_buffer(
+            self.REDIS_KEY_MEMBERSHIP_EVENTS, count, "событий состава"
+        )
+
+    async def trim_admin_logs(self, count: int) -> None:
+        """Удаляет обработанные логи действий администраторов из Redis."""
+        await self._trim_buffer(self.REDIS_KEY_ADMIN_LOGS, count, "логов действий")
+
     async def close(self) -> None:
         """Закрывает соединение с Redis. При использовании shared Redis — no-op."""
         self._connected = False
@@ -1,12 +1,15 @@
+import json
 import logging
-from typing import List, Optional
+import time
+from typing import Any, List, Optional
 
 from pydantic import ValidationError
 from redis.asyncio import Redis as RedisClient
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import TimeoutError as RedisTimeoutError
 
-from dto.automoderation import AutoModerationBufferItemDTO
+from dto.automoderation import AutoModerationBatchJobDTO, AutoModerationBufferItemDTO
+from utils.text_preprocessor import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -16,48 +19,138 @@ _REDIS_ERRORS = (
     OSError,
 )
 
-# RPUSH элемента; при длине списка >= threshold — LRANGE всех, DEL ключа, вернуть элементы; иначе nil.
+# RPUSH элемента и обновление состояния чата (средний интервал между сообщениями,
+# сумма токенов, мета для sweeper). Порог пачки адаптивный: столько сообщений,
+# сколько чат присылает за max_age, в пределах [min_batch, max_batch].
+# Сброс — по размеру, по бюджету токенов или по возрасту самого старого элемента.
 _LUA_PUSH_AND_FLUSH = """
-local key = KEYS[1]
+local list_key = KEYS[1]
+local state_key = KEYS[2]
+local pending_key = KEYS[3]
 local item = ARGV[1]
-local threshold = tonumber(ARGV[2])
-if threshold == nil or threshold < 1 then
-  threshold = 1
+local min_batch = tonumber(ARGV[2])
+if min_batch == nil or min_batch < 1 then
+  min_batch = 1
 end
-redis.call('RPUSH', key, item)
-local len = redis.call('LLEN', key)
-if len >= threshold then
-  local items = redis.call('LRANGE', key, 0, -1)
-  redis.call('DEL', key)
+local max_batch = tonumber(ARGV[3]) or min_batch
+if max_batch < min_batch then
+  max_batch = min_batch
+end
+local max_age = tonumber(ARGV[4])
+local token_budget = tonumber(ARGV[5])
+local item_tokens = tonumber(ARGV[6])
+local now = tonumber(ARGV[7])
+local member = ARGV[8]
+
+redis.call('RPUSH', list_key, item)
+local len = redis.call('LLEN', list_key)
+
+local last = tonumber(redis.call('HGET', state_key, 'last'))
+local gap = tonumber(redis.call('HGET', state_key, 'gap')) or max_age
+if last then
+  local dt = now - last
+  if dt < 0 then dt = 0 end
+  gap = 0.2 * dt + 0.8 * gap
+end
+local tokens = redis.call('HINCRBY', state_key, 'tokens', item_tokens)
+redis.call('HSET', state_key, 'last', ARGV[7], 'gap', tostring(gap), 'meta', ARGV[9])
+redis.call('EXPIRE', state_key, tonumber(ARGV[10]))
+redis.call('ZADD', pending_key, 'NX', now, member)
+local oldest = tonumber(redis.call('ZSCORE', pending_key, member)) or now
+
+local target = max_batch
+if gap > 0 then
+  target = math.floor(max_age / gap)
+end
+if target < min_batch then target = min_batch end
+if target > max_batch then target = max_batch end
+
+if len >= target or tokens >= token_budget or now - oldest >= max_age then
+  local items = redis.call('LRANGE', list_key, 0, -1)
+  redis.call('DEL', list_key)
+  redis.call('HSET', state_key, 'tokens', 0)
+  redis.call('ZREM', pending_key, member)
   return items
 end
 return nil
 """
 
+# Сброс «постаревшего» буфера чата sweeper'ом: только если самый старый элемент
+# всё ещё старше cutoff (пачку могли уже сбросить по размеру).
+_LUA_FLUSH_AGED = """
+local list_key = KEYS[1]
+local state_key = KEYS[2]
+local pending_key = KEYS[3]
+local member = ARGV[1]
+local score = tonumber(redis.call('ZSCORE', pending_key, member))
+if score == nil or score > tonumber(ARGV[2]) then
+  return nil
+end
+redis.call('ZREM', pending_key, member)
+local items = redis.call('LRANGE', list_key, 0, -1)
+redis.call('DEL', list_key)
+redis.call('HSET', state_key, 'tokens', 0)
+if #items == 0 then
+  return nil
+end
+return {redis.call('HGET', state_key, 'meta') or '', items}
+"""
+
+# Границы бакетов гистограмм задержки (секунды)
+_LATENCY_BUCKETS = (5, 15, 60, 300, 900, 3600)
+# Состояние чата живёт сутки без сообщений
+_STATE_TTL_SECONDS = 86400
+
 
 class AutoModerationBufferService:
-    """Сервис списка сообщений на чат с атомарным сбросом при достижении порога."""
+    """
+    Сервис списка сообщений на чат с атомарным сбросом пачки.
 
-    def __init__(self, redis_client: RedisClient) -> None:
+    Пачка сбрасывается по размеру (адаптивному к темпу чата), по бюджету токенов
+    или по возрасту самого старого сообщения; постаревшие буферы тихих чатов
+    забирает sweeper через pop_aged_buffers.
+    """
+
+    PENDING_KEY = "automod:pending"
+    METRICS_KEY_PREFIX = "automod:metrics"
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        max_batch_size: int = 100,
+        max_age_seconds: int = 60,
+        max_batch_tokens: int = 6000,
+    ) -> None:
         self._redis = redis_client
+        self._max_batch_size = max_batch_size
+        self._max_age_seconds = max_age_seconds
+        self._max_batch_tokens = max_batch_tokens
         self._push_flush_script = self._redis.register_script(_LUA_PUSH_AND_FLUSH)
+        self._flush_aged_script = self._redis.register_script(_LUA_FLUSH_AGED)
 
     def _key(self, chat_tgid: str) -> str:
         return f"automod:buffer:{chat_tgid}"
 
+    def _state_key(self, chat_tgid: str) -> str:
+        return f"automod:state:{chat_tgid}"
+
     async def append_text_message(
         self,
         chat_tgid: str,
         item: AutoModerationBufferItemDTO,
         batch_size: int,
+        chat_title: str = "",
+        archive_chat_tgid: str | None = None,
     ) -> Optional[List[AutoModerationBufferItemDTO]]:
         """
         Добавляет текстовое сообщение в буфер чата.
 
-        Если после добавления длина >= batch_size, атомарно возвращает всю пачку и очищает ключ.
+        batch_size — нижняя граница адаптивного порога пачки. Если после добавления
+        сработал порог (размер, токены или возраст), атомарно возвращает всю пачку
+        и очищает ключ. chat_title и archive_chat_tgid нужны sweeper'у.
 
         Returns:
-            Список из batch_size элементов или None, если порог ещё не достигнут.
+            Список элементов пачки или None, если порог ещё не достигнут.
         """
         if batch_size < 1:
             logger.warning(
@@ -67,11 +160,33 @@ class AutoModerationBufferService:
             )
             batch_size = 1
 
-        key = self._key(chat_tgid)
+        now = time.time()
+        if item.enqueued_at is None:
+            item = item.model_copy(update={"enqueued_at": now})
+        meta = json.dumps(
+            {"chat_title": chat_title, "archive_chat_tgid": archive_chat_tgid},
+            ensure_ascii=False,
+        )
+
         try:
             raw = await self._push_flush_script(
-                keys=[key],
-                args=[item.model_dump_json(), str(batch_size)],
+                keys=[
+                    self._key(chat_tgid),
+                    self._state_key(chat_tgid),
+                    self.PENDING_KEY,
+                ],
+                args=[
+                    item.model_dump_json(),
+                    str(batch_size),
+                    str(self._max_batch_size),
+                    str(self._max_age_seconds),
+                    str(self._max_batch_tokens),
+                    str(estimate_tokens(item.message_text)),
+                    f"{now:.3f}",
+                    chat_tgid,
+                    meta,
+                    str(_STATE_TTL_SECONDS),
+                ],
             )
         except _REDIS_ERRORS as e:
             logger.error(
@@ -93,6 +208,119 @@ class AutoModerationBufferService:
         if raw is None:
             return None
 
+        # Ключ уже очищен в Lua — возвращаем список (возможно пустой), не None
+        return self._deserialize_items(chat_tgid, raw)
+
+    async def pop_aged_buffers(
+        self, limit: int = 100
+    ) -> List[AutoModerationBatchJobDTO]:
+        """
+        Забирает буферы, в которых самое старое сообщение ждёт дольше max_age.
+
+        Returns:
+            Пачки для постановки в очередь (с названием чата и архивом из меты).
+        """
+        cutoff = time.time() - self._max_age_seconds
+        try:
+            members = await self._redis.zrangebyscore(
+                self.PENDING_KEY, "-inf", cutoff, start=0, num=limit
+            )
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "automod Redis: ошибка чтения постаревших буферов: %s",
+                e,
+                exc_info=True,
+            )
+            return []
+
+        jobs: List[AutoModerationBatchJobDTO] = []
+        for member in members or []:
+            chat_tgid = member.decode("utf-8") if isinstance(member, bytes) else member
+            try:
+                raw = await self._flush_aged_script(
+                    keys=[
+                        self._key(chat_tgid),
+                        self._state_key(chat_tgid),
+                        self.PENDING_KEY,
+                    ],
+                    args=[chat_tgid, f"{cutoff:.3f}"],
+                )
+            except _REDIS_ERRORS as e:
+                logger.error(
+                    "automod Redis: ошибка сброса буфера chat_tgid=%s: %s",
+                    chat_tgid,
+                    e,
+                    exc_info=True,
+                )
+                continue
+            if not raw:
+                continue
+
+            raw_meta, raw_items = raw
+            meta = self._parse_meta(chat_tgid, raw_meta)
+            batch = self._deserialize_items(chat_tgid, raw_items)
+            if not batch:
+                continue
+            jobs.append(
+                AutoModerationBatchJobDTO(
+                    chat_tgid=chat_tgid,
+                    chat_title=meta.get("chat_title") or "",
+                    archive_chat_tgid=meta.get("archive_chat_tgid"),
+                    batch=batch,
+                )
+            )
+        return jobs
+
+    async def record_latency(self, metric: str, seconds: float) -> None:
+        """
+        Учитывает задержку в кумулятивной гистограмме automod:metrics:{metric}
+        (поля count, sum и le:<граница>).
+        """
+        key = f"{self.METRICS_KEY_PREFIX}:{metric}"
+        seconds = max(seconds, 0.0)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hincrby(key, "count", 1)
+                pipe.hincrbyfloat(key, "sum", seconds)
+                for bound in _LATENCY_BUCKETS:
+                    if seconds <= bound:
+                        pipe.hincrby(key, f"le:{bound}", 1)
+                pipe.hincrby(key, "le:+Inf", 1)
+                await pipe.execute()
+        except _REDIS_ERRORS as e:
+            logger.warning("automod Redis: ошибка записи метрики %s: %s", metric, e)
+
+    async def get_latency_metrics(self, metric: str) -> dict[str, float]:
+        """Текущее состояние гистограммы задержки (пустой dict, если данных нет)."""
+        try:
+            raw = await self._redis.hgetall(f"{self.METRICS_KEY_PREFIX}:{metric}")
+        except _REDIS_ERRORS as e:
+            logger.warning("automod Redis: ошибка чтения метрики %s: %s", metric, e)
+            return {}
+        result: dict[str, float] = {}
+        for field, value in (raw or {}).items():
+            name = field.decode("utf-8") if isinstance(field, bytes) else field
+            result[name] = float(value)
+        return result
+
+    @staticmethod
+    def _parse_meta(chat_tgid: str, raw_meta: Any) -> dict[str, Any]:
+        try:
+            text = raw_meta.decode("utf-8") if isinstance(raw_meta, bytes) else raw_meta
+            meta = json.loads(text) if text else {}
+            return meta if isinstance(meta, dict) else {}
+        except (UnicodeDecodeError, ValueError) as e:
+            logger.error(
+                "automod: не удалось разобрать мету буфера chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+            )
+            return {}
+
+    @staticmethod
+    def _deserialize_items(
+        chat_tgid: str, raw: List[Any]
+    ) -> List[AutoModerationBufferItemDTO]:
         result: List[AutoModerationBufferItemDTO] = []
         for entry in raw:
             try:
@@ -110,5 +338,4 @@ class AutoModerationBufferService:
                 "automod: часть элементов буфера не распарсилась chat_tgid=%s",
                 chat_tgid,
             )
-        # Ключ уже очищен в Lua — возвращаем список (возможно пустой), не None
         return result
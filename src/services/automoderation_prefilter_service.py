@@ -0,0 +1,219 @@
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from redis.asyncio import Redis as RedisClient
+
+from dto.automoderation import AutoModerationBufferItemDTO, SpamDetectionLLMResultDTO
+from services.caching.redis import _REDIS_ERRORS
+
+logger = logging.getLogger(__name__)
+
+# Ссылки, домены, упоминания и приглашения — основной канал спама
+_LINK_RE = re.compile(
+    r"https?://|www\.|t\.me/|tg://|@\w{4,}|[\w-]+\.[^\W\d_]{2,}\b",
+    re.IGNORECASE,
+)
+_INVISIBLE_RE = re.compile(r"[\u200b-\u200f\u2060\ufeff]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Счётчик чистых сообщений автора живёт месяц с последнего обновления
+KNOWN_USER_TTL_SECONDS = 30 * 24 * 3600
+
+
+def normalize_text(text: str) -> str:
+    """Приводит текст к виду, в котором копии спама совпадают."""
+    text = unicodedata.normalize("NFKC", text)
+    text = _INVISIBLE_RE.sub("", text)
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+def text_fingerprint(text: str) -> str:
+    """Хеш нормализованного текста (ключ кеша вердиктов)."""
+    return hashlib.blake2b(normalize_text(text).encode(), digest_size=16).hexdigest()
+
+
+def has_links(text: str) -> bool:
+    return _LINK_RE.search(text) is not None
+
+
+def is_trivially_safe_text(text: str, max_length: int) -> bool:
+    """Короткий текст без ссылок и упоминаний («ок», «спасибо») не проверяется."""
+    if max_length <= 0:
+        return False
+    normalized = normalize_text(text)
+    return len(normalized) <= max_length and not has_links(normalized)
+
+
+@dataclass
+class PrefilterResult:
+    """Итог предфильтра пачки."""
+
+    # Сообщения для LLM: по одному на каждый новый текст
+    candidates: List[AutoModerationBufferItemDTO] = field(default_factory=list)
+    # Срабатывание по кешированному вердикту (LLM не нужна)
+    cached_hit: Optional[SpamDetectionLLMResultDTO] = None
+    # Отпечатки текстов кандидатов (по message_id)
+    fingerprints: Dict[int, str] = field(default_factory=dict)
+    skipped_known: int = 0
+    skipped_cached: int = 0
+    skipped_duplicates: int = 0
+
+
+class AutoModerationPrefilterService:
+    """
+    Дешёвый фильтр пачки автомодерации перед вызовом LLM.
+
+    - Сообщения знакомых авторов без ссылок пропускаются: знакомым автор
+      становится после known_user_messages чистых по вердикту LLM сообщений.
+    - Вердикты LLM кешируются по хешу нормализованного текста: копия спама
+      в другом чате срабатывает без LLM, повторный безобидный текст
+      не отправляется снова.
+    - Одинаковые тексты внутри пачки отправляются в LLM один раз.
+
+    При ошибках Redis фильтр пропускает все сообщения в LLM.
+    """
+
+    VERDICT_KEY_PREFIX = "automod:verdict:"
+    KNOWN_USER_KEY_PREFIX = "automod:known:"
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        verdict_ttl_seconds: int = 86400,
+        known_user_messages: int = 20,
+    ) -> None:
+        self._redis = redis_client
+        self._verdict_ttl = verdict_ttl_seconds
+        self._known_user_messages = known_user_messages
+
+    def _verdict_key(self, fingerprint: str) -> str:
+        return f"{self.VERDICT_KEY_PREFIX}{fingerprint}"
+
+    def _known_key(self, user_tg_id: int) -> str:
+        return f"{self.KNOWN_USER_KEY_PREFIX}{user_tg_id}"
+
+    async def prepare(
+        self, batch: List[AutoModerationBufferItemDTO]
+    ) -> PrefilterResult:
+        """Отбирает сообщения пачки, которые нужно отправить в LLM."""
+        result = PrefilterResult()
+        known = await self._known_users(batch)
+
+        pending: List[AutoModerationBufferItemDTO] = []
+        for item in batch:
+            if item.user_tg_id in known and not has_links(item.message_text):
+                result.skipped_known += 1
+            else:
+                pending.append(item)
+
+        fingerprints = [text_fingerprint(item.message_text) for item in pending]
+        verdicts = await self._cached_verdicts(fingerprints)
+
+        seen: set[str] = set()
+        for item, fingerprint in zip(pending, fingerprints):
+            verdict = verdicts.get(fingerprint)
+            if verdict is not None:
+                result.skipped_cached += 1
+                if verdict.get("spam") and result.cached_hit is None:
+                    result.cached_hit = SpamDetectionLLMResultDTO(
+                        user_tg_id=item.user_tg_id,
+                        message_id=item.message_id,
+                        reason=verdict.get("reason") or "повтор известного спама",
+                        username=item.username,
+                    )
+                continue
+            if fingerprint in seen:
+                result.skipped_duplicates += 1
+                continue
+            seen.add(fingerprint)
+            result.candidates.append(item)
+            result.fingerprints[item.message_id] = fingerprint
+        return result
+
+    async def record(
+        self,
+        prefiltered: PrefilterResult,
+        hit: Optional[SpamDetectionLLMResultDTO],
+    ) -> None:
+        """
+        Сохраняет вердикт LLM по кандидатам.
+
+        Без срабатывания все тексты пачки чистые, а их авторы приближаются
+        к «знакомым». При срабатывании модель называет одного нарушителя,
+        поэтому кешируется только его текст, а счётчик автора сбрасывается.
+        """
+        if not prefiltered.candidates:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                if hit is not None:
+                    fingerprint = prefiltered.fingerprints.get(hit.message_id)
+                    if fingerprint and self._verdict_ttl > 0:
+                        pipe.set(
+                            self._verdict_key(fingerprint),
+                            json.dumps(
+                                {"spam": True, "reason": hit.reason},
+                                ensure_ascii=False,
+                            ),
+                            ex=self._verdict_ttl,
+                        )
+                    pipe.delete(self._known_key(hit.user_tg_id))
+                else:
+                    if self._verdict_ttl > 0:
+                        clean = json.dumps({"spam": False})
+                        for fingerprint in prefiltered.fingerprints.values():
+                            pipe.set(
+                                self._verdict_key(fingerprint),
+                                clean,
+                                ex=self._verdict_ttl,
+                            )
+                    if self._known_user_messages > 0:
+                        counts: Dict[int, int] = {}
+                        for item in prefiltered.candidates:
+                            counts[item.user_tg_id] = counts.get(item.user_tg_id, 0) + 1
+                        for user_tg_id, count in counts.items():
+                            key = self._known_key(user_tg_id)
+                            pipe.incrby(key, count)
+                            pipe.expire(key, KNOWN_USER_TTL_SECONDS)
+                await pipe.execute()
+        except _REDIS_ERRORS as e:
+            logger.warning("automod: не удалось сохранить вердикт в Redis: %s", e)
+
+    async def _known_users(self, batch: List[AutoModerationBufferItemDTO]) -> set[int]:
+        if self._known_user_messages <= 0 or not batch:
+            return set()
+        user_ids = sorted({item.user_tg_id for item in batch})
+        try:
+            counts = await self._redis.mget([self._known_key(u) for u in user_ids])
+        except _REDIS_ERRORS as e:
+            logger.warning("automod: не удалось прочитать знакомых авторов: %s", e)
+            return set()
+        return {
+            user_tg_id
+            for user_tg_id, count in zip(user_ids, counts)
+            if count is not None and int(count) >= self._known_user_messages
+        }
+
+    async def _cached_verdicts(self, fingerprints: List[str]) -> Dict[str, dict]:
+        if self._verdict_ttl <= 0 or not fingerprints:
+            return {}
+        unique = list(dict.fromkeys(fingerprints))
+        try:
+            raw = await self._redis.mget([self._verdict_key(f) for f in unique])
+        except _REDIS_ERRORS as e:
+            logger.warning("automod: не удалось прочитать кеш вердиктов: %s", e)
+            return {}
+        verdicts: Dict[str, dict] = {}
+        for fingerprint, value in zip(unique, raw):
+            if value is None:
+                continue
+            try:
+                verdicts[fingerprint] = json.loads(value)
+            except (TypeError, ValueError):
+                continue
+        return verdicts
@@ -1,9 +1,16 @@
 from .base import ICache
 from .redis import RedisCache
+from .response_cache import CachedResponse, ResponseCache
 from .ttl_cache import TTLEntityCache
+from .update_dedup import UpdateDeduplicator
+from .watermark import DataWatermark
 
 __all__ = [
     "ICache",
     "TTLEntityCache",
     "RedisCache",
+    "CachedResponse",
+    "DataWatermark",
+    "ResponseCache",
+    "UpdateDeduplicator",
 ]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, TypeVar
+from typing import List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -18,6 +18,21 @@ class ICache(ABC):
         """
         pass
 
+    async def get_many(self, keys: List[str]) -> List[Optional[T]]:
+        """
+        Получает значения по нескольким ключам.
+
+        Реализация по умолчанию читает ключи по одному; хранилища с
+        пакетным чтением переопределяют её одним запросом.
+
+        Args:
+            keys: Ключи для поиска в кеше
+
+        Returns:
+            Значения в порядке ключей (None для отсутствующих)
+        """
+        return [await self.get(key) for key in keys]
+
     @abstractmethod
     async def set(self, key: str, value: T, ttl: Optional[int] = None) -> None:
         """
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import pickle
-from typing import Optional, TypeVar
+from typing import List, Optional, TypeVar
 
 from redis.asyncio import Redis as RedisClient
 from redis.exceptions import (
@@ -74,6 +74,33 @@ class RedisCache(ICache):
             logger.error("Redis GET %s deserialize failed: %s", key, e)
             return None
 
+    async def get_many(self, keys: List[str]) -> List[Optional[T]]:
+        """Читает ключи одним MGET; при ошибке Redis — все промахи."""
+        if not keys:
+            return []
+        misses: List[Optional[T]] = [None] * len(keys)
+        try:
+            if not await self._ensure_connection():
+                return misses
+            values = await self.redis.mget(keys)
+        except _REDIS_ERRORS as e:
+            logger.error("Redis MGET (%d keys) failed: %s", len(keys), e)
+            return misses
+
+        result: List[Optional[T]] = []
+        for key, data in zip(keys, values):
+            try:
+                result.append(pickle.loads(data) if data else None)
+            except (pickle.PickleError, TypeError, ValueError) as e:
+                logger.error("Redis MGET %s deserialize failed: %s", key, e)
+                result.append(None)
+        logger.debug(
+            "Redis MGET %d keys: %d HIT",
+            len(keys),
+            sum(value is not None for value in result),
+        )
+        return result
+
     async def set(self, key: str, value: T, ttl: Optional[int] = None) -> None:
         try:
             if not await self._ensure_connection():
@@ -0,0 +1,94 @@
+import asyncio
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from .base import ICache
+from .watermark import DataWatermark
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Готовое тело ответа и его ETag."""
+
+    body: Any
+    etag: str
+
+
+class ResponseCache:
+    """
+    Кеш готовых ответов API.
+
+    Ключ — пространство имён (маршрут) и параметры запроса; свежесть
+    ограничивает TTL. Отчёты по пользователям могут включить в ключ версии
+    данных этих пользователей (DataWatermark, watermark_user_ids): после
+    сброса буферов с их активностью они перестраиваются без явной
+    инвалидации, а активность остальных пользователей их не задевает.
+    Одинаковые запросы, пришедшие одновременно в один процесс, строят
+    ответ один раз.
+    """
+
+    def __init__(
+        self,
+        cache: ICache,
+        watermark: DataWatermark,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._cache = cache
+        self._watermark = watermark
+        self._ttl = ttl_seconds
+        self._inflight: Dict[str, asyncio.Task[CachedResponse]] = {}
+
+    @property
+    def ttl_seconds(self) -> int:
+        return self._ttl
+
+    async def get_or_build(
+        self,
+        namespace: str,
+        params: Sequence[object],
+        build: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[int] = None,
+        watermark_user_ids: Optional[Sequence[int]] = None,
+    ) -> CachedResponse:
+        """
+        Возвращает ответ из кеша или строит его через build.
+        Тело ответа должно сериализоваться в JSON.
+        """
+        key_parts = list(params)
+        if watermark_user_ids:
+            key_parts.append(await self._watermark.current(watermark_user_ids))
+        digest = hashlib.sha1(json.dumps(key_parts, default=str).encode()).hexdigest()
+        key = f"resp:{namespace}:{digest}"
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._load(key, build, ttl_seconds or self._ttl)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: отмена одного запроса не отменяет построение для остальных
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, key: str, build: Callable[[], Awaitable[Any]], ttl: int
+    ) -> CachedResponse:
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        body = await build()
+        payload = json.dumps(body, sort_keys=True, default=str, ensure_ascii=False)
+        response = CachedResponse(
+            body=body, etag=f'"{hashlib.sha1(payload.encode()).hexdigest()}"'
+        )
+        await self._cache.set(key, response, ttl=ttl)
+        logger.debug("Ответ %s построен и закеширован на %d с", key, ttl)
+        return response
@@ -0,0 +1,40 @@
+import logging
+
+from redis.asyncio import Redis as RedisClient
+
+from .redis import _REDIS_ERRORS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_SECONDS = 600
+
+
+class UpdateDeduplicator:
+    """
+    Окно уже принятых update_id в Redis.
+
+    Telegram повторяет доставку вебхука, если не дождался ответа; повтор
+    приходит с тем же update_id и не должен обрабатываться второй раз.
+    При недоступности Redis апдейт считается новым (обработка важнее
+    редкого дубля).
+    """
+
+    KEY_PREFIX = "updates:seen:"
+
+    def __init__(
+        self, redis_client: RedisClient, window_seconds: int = DEFAULT_WINDOW_SECONDS
+    ) -> None:
+        self._redis = redis_client
+        self._window = window_seconds
+
+    async def first_seen(self, update_id: int) -> bool:
+        """Отмечает апдейт как принятый; False, если он уже был в окне."""
+        try:
+            return bool(
+                await self._redis.set(
+                    f"{self.KEY_PREFIX}{update_id}", 1, nx=True, ex=self._window
+                )
+            )
+        except _REDIS_ERRORS as e:
+            logger.error("Не удалось проверить дубликат апдейта %s: %s", update_id, e)
+            return True
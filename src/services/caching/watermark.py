@@ -0,0 +1,56 @@
+import logging
+from typing import Iterable, List
+
+from redis.asyncio import Redis as RedisClient
+
+from .redis import _REDIS_ERRORS
+
+logger = logging.getLogger(__name__)
+
+
+class DataWatermark:
+    """
+    Версии аналитических данных пользователей в Redis.
+
+    Задачи сброса буферов увеличивают версию каждого пользователя, чьи
+    сообщения, реакции или ответы были вставлены. Отчёты по пользователям
+    включают в ключ кеша версии своих пользователей: новые данные дают
+    новый ключ, а сброс буфера с активностью других пользователей кеш
+    отчёта не трогает.
+    """
+
+    KEY_PREFIX = "analytics:watermark:user:"
+
+    def __init__(self, redis_client: RedisClient) -> None:
+        self._redis = redis_client
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+
+    async def current(self, user_ids: Iterable[int]) -> List[int]:
+        """
+        Версии данных пользователей в порядке user_ids (0 — данных ещё не было).
+        Если Redis недоступен — нули.
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return []
+        try:
+            values = await self._redis.mget([self._key(u) for u in user_ids])
+        except _REDIS_ERRORS as e:
+            logger.error("Не удалось прочитать версии данных: %s", e)
+            return [0] * len(user_ids)
+        return [int(value) if value is not None else 0 for value in values]
+
+    async def bump(self, user_ids: Iterable[int]) -> None:
+        """Отмечает появление новых данных пользователей (один запрос на пачку)."""
+        unique_ids = sorted(set(user_ids))
+        if not unique_ids:
+            return
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for user_id in unique_ids:
+                    pipe.incr(self._key(user_id))
+                await pipe.execute()
+        except _REDIS_ERRORS as e:
+            logger.error("Не удалось обновить версии данных: %s", e)
@@ -1,7 +1,8 @@
-from .ai_service_base import IAIService
+from .ai_service_base import AIServiceUnavailableError, IAIService
 from .open_router_service import OpenRouterService
 
 __all__ = [
+    "AIServiceUnavailableError",
     "IAIService",
     "OpenRouterService",
 ]
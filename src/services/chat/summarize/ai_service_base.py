@@ -14,6 +14,10 @@ class SummaryResult:
     summary: str
 
 
+class AIServiceUnavailableError(Exception):
+    """Провайдер модели не ответил (сеть, таймаут, ошибка API)."""
+
+
 class IAIService(ABC):
     """Абстрактный класс для сервисов суммаризации сообщений чата."""
 
@@ -30,11 +34,25 @@ class IAIService(ABC):
     ) -> SummaryResult:
         pass
 
+    @abstractmethod
+    async def summarize_chunk(self, text: str) -> SummaryResult:
+        """Конспект фрагмента лога (map-шаг инкрементальной сводки)."""
+        pass
+
     @abstractmethod
     async def analyze_spam_batch(
         self,
         chat_title: str,
         messages: list[AutoModerationBufferItemDTO],
     ) -> Optional[SpamDetectionLLMResultDTO]:
-        """Анализ пачки сообщений на спамеров/ботов; при отсутствии срабатывания — None."""
+        """
+        Анализ пачки сообщений на спамеров/ботов; при отсутствии срабатывания — None.
+
+        Если модель недоступна, бросает AIServiceUnavailableError, чтобы
+        отсутствие ответа не принималось за чистую пачку.
+        """
         pass
+
+    async def close(self) -> None:
+        """Освобождает сетевые ресурсы сервиса (по умолчанию — нечего закрывать)."""
+        return None
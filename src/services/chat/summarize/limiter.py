@@ -0,0 +1,266 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, Optional
+
+import httpx
+from openrouter.errors import OpenRouterError
+
+from .ai_service_base import AIServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+# Маршруты вызовов модели: у каждого свой лимит конкурентности,
+# чтобы пачки автомодерации не занимали слоты сводок и наоборот
+ROUTE_SUMMARY = "summary"
+ROUTE_AUTOMOD = "automod"
+
+# Сколько последних задержек хранится для p50/p99
+_LATENCY_WINDOW = 512
+
+
+class CircuitOpenError(AIServiceUnavailableError):
+    """Цепь разомкнута: провайдер недавно отказывал, вызов не выполняется."""
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """Отказ провайдера (сеть, таймаут, 429/5xx), а не ошибка запроса."""
+    if isinstance(exc, OpenRouterError):
+        status = getattr(exc, "status_code", None) or 0
+        return status == 429 or status >= 500
+    return isinstance(exc, (httpx.HTTPError, asyncio.TimeoutError, OSError))
+
+
+class CircuitBreaker:
+    """
+    Автомат закрыто → разомкнуто → полуоткрыто.
+
+    После failure_threshold отказов подряд цепь размыкается на
+    reset_timeout_seconds: вызовы сразу получают CircuitOpenError. Затем
+    пропускается один пробный вызов: успех замыкает цепь, отказ снова
+    размыкает её.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout_seconds
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.open_seconds_total = 0.0
+        self.opened_count = 0
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and self._clock() >= self._opened_at + self._reset_timeout
+        ):
+            return self.HALF_OPEN
+        return self._state
+
+    def before_call(self) -> None:
+        """Разрешает вызов или бросает CircuitOpenError."""
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return
+        raise CircuitOpenError("цепь разомкнута после серии отказов провайдера")
+
+    def record_success(self) -> None:
+        if self._state == self.OPEN:
+            self._close()
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        probe, self._probe_in_flight = self._probe_in_flight, False
+        if self._state == self.OPEN:
+            if probe:
+                # Отказ пробного вызова: размыкаем заново
+                now = self._clock()
+                self.open_seconds_total += now - self._opened_at
+                self._opened_at = now
+            return
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+            self.opened_count += 1
+            logger.warning(
+                "OpenRouter: цепь разомкнута на %.0f с после %d отказов подряд",
+                self._reset_timeout,
+                self._failures,
+            )
+
+    def release_probe(self) -> None:
+        """Пробный вызов завершился без вердикта (ошибка запроса, отмена)."""
+        self._probe_in_flight = False
+
+    def open_seconds(self) -> float:
+        """Суммарное время в разомкнутом состоянии, включая текущее."""
+        if self._state == self.OPEN:
+            return self.open_seconds_total + self._clock() - self._opened_at
+        return self.open_seconds_total
+
+    def _close(self) -> None:
+        self.open_seconds_total += self._clock() - self._opened_at
+        self._state = self.CLOSED
+        logger.info("OpenRouter: цепь замкнута, провайдер снова отвечает")
+
+
+class _RouteStats:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.calls = 0
+        self.failures = 0
+        self.rejected = 0
+        self.latencies: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def as_dict(self) -> Dict[str, Any]:
+        ordered = sorted(self.latencies)
+
+        def pct(q: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return round(
+                ordered[min(len(ordered) - 1, int(len(ordered) * q))] * 1000, 1
+            )
+
+        return {
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "latency_p50_ms": pct(0.5),
+            "latency_p99_ms": pct(0.99),
+        }
+
+
+class ProviderLimiter:
+    """
+    Общий на процесс ограничитель вызовов провайдера модели.
+
+    - Семафор на маршрут: не больше max_concurrency вызовов одного маршрута.
+    - Ожидание слота не дольше queue_timeout_seconds, вызов целиком — не
+      дольше call_deadline_seconds; иначе AIServiceUnavailableError.
+    - CircuitBreaker: при серии отказов вызовы сразу получают
+      CircuitOpenError, не занимая слоты и соединения.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        queue_timeout_seconds: float = 30.0,
+        call_deadline_seconds: float = 90.0,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        self._max_concurrency = max_concurrency
+        self._queue_timeout = queue_timeout_seconds
+        self._call_deadline = call_deadline_seconds
+        self.breaker = breaker or CircuitBreaker()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, _RouteStats] = {}
+
+    def _route(self, route: str) -> tuple[asyncio.Semaphore, _RouteStats]:
+        if route not in self._semaphores:
+            self._semaphores[route] = asyncio.Semaphore(self._max_concurrency)
+            self._stats[route] = _RouteStats()
+        return self._semaphores[route], self._stats[route]
+
+    @contextmanager
+    def _deadline(self) -> Iterator[None]:
+        """
+        Отменяет текущую задачу по истечении call_deadline_seconds и
+        превращает эту отмену в asyncio.TimeoutError (asyncio.timeout есть
+        только с Python 3.11).
+        """
+        task = asyncio.current_task()
+        if task is None:
+            raise RuntimeError("дедлайн вызова работает только внутри asyncio-задачи")
+        loop = asyncio.get_running_loop()
+        expired = False
+
+        def expire() -> None:
+            nonlocal expired
+            expired = True
+            task.cancel()
+
+        handle = loop.call_at(loop.time() + self._call_deadline, expire)
+        try:
+            yield
+        except asyncio.CancelledError:
+            if not expired:
+                raise
+            if hasattr(task, "uncancel"):
+                task.uncancel()
+            raise asyncio.TimeoutError(
+                f"вызов не уложился в {self._call_deadline:.0f} с"
+            ) from None
+        finally:
+            handle.cancel()
+
+    @asynccontextmanager
+    async def slot(self, route: str) -> AsyncIterator[None]:
+        """Слот маршрута с дедлайном; исход вызова учитывается в CircuitBreaker."""
+        semaphore, stats = self._route(route)
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError:
+            stats.rejected += 1
+            raise
+
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self._queue_timeout)
+        except BaseException as exc:
+            self.breaker.release_probe()
+            if not isinstance(exc, asyncio.TimeoutError):
+                raise
+            stats.rejected += 1
+            raise AIServiceUnavailableError(
+                f"нет свободного слота {route} за {self._queue_timeout:.0f} с"
+            ) from None
+
+        stats.in_flight += 1
+        stats.calls += 1
+        started = time.perf_counter()
+        try:
+            with self._deadline():
+                yield
+        except BaseException as exc:
+            if is_provider_failure(exc):
+                stats.failures += 1
+                self.breaker.record_failure()
+            else:
+                self.breaker.release_probe()
+            raise
+        else:
+            self.breaker.record_success()
+        finally:
+            stats.latencies.append(time.perf_counter() - started)
+            stats.in_flight -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Метрики: по маршрутам, состояние цепи и время в разомкнутом состоянии."""
+        return {
+            "routes": {route: s.as_dict() for route, s in self._stats.items()},
+            "circuit_state": self.breaker.state,
+            "circuit_opened": self.breaker.opened_count,
+            "circuit_open_seconds": round(self.breaker.open_seconds(), 1),
+        }
@@ -1,6 +1,8 @@
 import asyncio
+import importlib.util
 import logging
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 import httpx
 from openrouter import OpenRouter
@@ -9,22 +11,103 @@ from openrouter.errors import OpenRouterError
 from constants.enums import SummaryType
 from constants.promps import (
     AUTOMOD_SYSTEM,
+    SUMMARY_CHUNK_SYSTEM,
     SYSTEM_CONTENT,
+    USER_CONTENT_CHUNK,
     USER_CONTENT_FULL,
     USER_CONTENT_SHORT,
 )
 from dto.automoderation import AutoModerationBufferItemDTO, SpamDetectionLLMResultDTO
 from utils.automoderation_llm import format_automod_batch, parse_automod_response
 
-from .ai_service_base import IAIService, SummaryResult
+from .ai_service_base import AIServiceUnavailableError, IAIService, SummaryResult
+from .limiter import ROUTE_AUTOMOD, ROUTE_SUMMARY, ProviderLimiter
 
 logger = logging.getLogger(__name__)
 
 
+# HTTP/2 в httpx работает только при установленном пакете h2
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_SUMMARY_ERROR = "❌ Произошла непредвиденная ошибка при генерации сводки."
+_SUMMARY_DEGRADED = (
+    "⏳ Сервис сводок сейчас перегружен или недоступен. Попробуйте позже."
+)
+
+
 class OpenRouterService(IAIService):
-    def __init__(self, api_key: str, model_name: str) -> None:
+    """
+    Клиент OpenRouter с одним долгоживущим HTTP-клиентом на сервис.
+
+    Соединения переиспользуются (keep-alive, HTTP/2 при наличии h2). Вызовы
+    идут через ProviderLimiter: лимит конкурентности отдельно для сводок и
+    автомодерации, дедлайн на ожидание слота и на вызов, CircuitBreaker.
+    При разомкнутой цепи автомодерация получает AIServiceUnavailableError
+    (пачка пропускается), а сводка — ответ «попробуйте позже».
+    Клиент создаётся лениво в том event loop, где выполняется первый запрос,
+    и закрывается через close().
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str,
+        timeout_seconds: float = 60.0,
+        connect_timeout_seconds: float = 10.0,
+        max_connections: int = 10,
+        http2: bool = True,
+        server_url: Optional[str] = None,
+        limiter: Optional[ProviderLimiter] = None,
+    ) -> None:
         super().__init__(model_name)
         self._api_key = api_key
+        self._timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._http2 = http2 and _HTTP2_AVAILABLE
+        self._server_url = server_url
+        self._limiter = limiter or ProviderLimiter()
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[OpenRouter] = None
+
+    def _get_client(self) -> OpenRouter:
+        if self._client is None:
+            self._http_client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=self._limits,
+                timeout=self._timeout,
+                follow_redirects=True,
+            )
+            self._client = OpenRouter(
+                api_key=self._api_key,
+                server_url=self._server_url,
+                async_client=self._http_client,
+            )
+            logger.info(
+                "OpenRouter: создан пул соединений (http2=%s, max_connections=%s)",
+                self._http2,
+                self._limits.max_connections,
+            )
+        return self._client
+
+    @asynccontextmanager
+    async def _acquire(self, route: str = ROUTE_SUMMARY) -> AsyncIterator[OpenRouter]:
+        """Слот маршрута в ProviderLimiter и общий клиент."""
+        async with self._limiter.slot(route):
+            yield self._get_client()
+
+    def stats(self) -> dict:
+        """Метрики вызовов провайдера (в работе, задержки, состояние цепи)."""
+        return self._limiter.stats()
+
+    async def close(self) -> None:
+        """Закрывает пул соединений (вызывается при остановке процесса)."""
+        http_client, self._http_client, self._client = self._http_client, None, None
+        if http_client is not None:
+            await http_client.aclose()
+            logger.info("OpenRouter: пул соединений закрыт")
 
     async def summarize_text(
         self,
@@ -33,72 +116,77 @@ class OpenRouterService(IAIService):
         summary_type: SummaryType,
         tracked_users: list[str],
     ) -> SummaryResult:
-        async with OpenRouter(api_key=self._api_key) as client:
-            try:
-                user_content = (
-                    USER_CONTENT_SHORT
-                    if summary_type == SummaryType.SHORT
-                    else USER_CONTENT_FULL
-                )
-                tracked_users_str = (
-                    ", ".join(tracked_users) if tracked_users else "отсутствуют"
-                )
+        user_content = (
+            USER_CONTENT_SHORT
+            if summary_type == SummaryType.SHORT
+            else USER_CONTENT_FULL
+        )
+        tracked_users_str = ", ".join(tracked_users) if tracked_users else "отсутствуют"
+        return await self._request_summary(
+            [
+                {
+                    "role": "system",
+                    "content": SYSTEM_CONTENT.format(
+                        tracked_users_list=tracked_users_str
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": user_content.format(
+                        text=text,
+                        msg_count=msg_count,
+                        tracked_users_list=tracked_users_str,
+                    ),
+                },
+            ]
+        )
+
+    async def summarize_chunk(self, text: str) -> SummaryResult:
+        return await self._request_summary(
+            [
+                {"role": "system", "content": SUMMARY_CHUNK_SYSTEM},
+                {"role": "user", "content": USER_CONTENT_CHUNK.format(text=text)},
+            ]
+        )
+
+    async def _request_summary(self, messages: list[dict[str, str]]) -> SummaryResult:
+        try:
+            async with self._acquire(ROUTE_SUMMARY) as client:
                 response = await client.chat.send_async(
                     model=self._model_name,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": SYSTEM_CONTENT.format(
-                                tracked_users_list=tracked_users_str
-                            ),
-                        },
-                        {
-                            "role": "user",
-                            "content": user_content.format(
-                                text=text,
-                                msg_count=msg_count,
-                                tracked_users_list=tracked_users_str,
-                            ),
-                        },
-                    ],
+                    messages=messages,
                 )
+        except AIServiceUnavailableError as exc:
+            logger.warning("OpenRouter: сводка в деградированном режиме: %s", exc)
+            return SummaryResult(status_code=503, summary=_SUMMARY_DEGRADED)
+        except OpenRouterError as exc:
+            logger.error(
+                "OpenRouter API error: %s (status=%s)",
+                exc,
+                exc.status_code,
+                exc_info=True,
+            )
+            return SummaryResult(status_code=exc.status_code, summary=_SUMMARY_ERROR)
+        except asyncio.TimeoutError:
+            logger.error("OpenRouter: сводка не уложилась в дедлайн вызова")
+            return SummaryResult(status_code=504, summary=_SUMMARY_DEGRADED)
+        except httpx.HTTPError as exc:
+            logger.error("OpenRouter network error: %s", exc, exc_info=True)
+            return SummaryResult(status_code=503, summary=_SUMMARY_ERROR)
 
-                if not response.choices:
-                    logger.error("OpenRouter response has no choices.")
-                    return SummaryResult(
-                        status_code=502,
-                        summary="❌ Произошла непредвиденная ошибка при генерации сводки.",
-                    )
-
-                first_choice = response.choices[0]
-                message = getattr(first_choice, "message", None)
-                content = getattr(message, "content", None)
-
-                if not content:
-                    logger.error("OpenRouter response has no content.")
-                    return SummaryResult(
-                        status_code=502,
-                        summary="❌ Произошла непредвиденная ошибка при генерации сводки.",
-                    )
-
-                return SummaryResult(status_code=200, summary=content)
-            except OpenRouterError as exc:
-                logger.error(
-                    "OpenRouter API error: %s (status=%s)",
-                    exc,
-                    exc.status_code,
-                    exc_info=True,
-                )
-                return SummaryResult(
-                    status_code=exc.status_code,
-                    summary="❌ Произошла непредвиденная ошибка при генерации сводки.",
-                )
-            except httpx.HTTPError as exc:
-                logger.error("OpenRouter network error: %s", exc, exc_info=True)
-                return SummaryResult(
-                    status_code=503,
-                    summary="❌ Произошла непредвиденная ошибка при генерации сводки.",
-                )
+        if not response.choices:
+            logger.error("OpenRouter response has no choices.")
+            return SummaryResult(status_code=502, summary=_SUMMARY_ERROR)
+
+        first_choice = response.choices[0]
+        message = getattr(first_choice, "message", None)
+        content = getattr(message, "content", None)
+
+        if not content:
+            logger.error("OpenRouter response has no content.")
+            return SummaryResult(status_code=502, summary=_SUMMARY_ERROR)
+
+        return SummaryResult(status_code=200, summary=content)
 
     async def analyze_spam_batch(
         self,
@@ -111,8 +199,8 @@ class OpenRouterService(IAIService):
             f"Название чата: {chat_title}\n\n"
             f"Сообщения ({len(messages)} шт.):\n{format_automod_batch(messages)}"
         )
-        async with OpenRouter(api_key=self._api_key) as client:
-            try:
+        try:
+            async with self._acquire(ROUTE_AUTOMOD) as client:
                 response = await client.chat.send_async(
                     model=self._model_name,
                     messages=[
@@ -120,59 +208,61 @@ class OpenRouterService(IAIService):
                         {"role": "user", "content": user_content},
                     ],
                 )
-                if not response.choices:
-                    logger.error(
-                        "automod OpenRouter: нет choices, chat_title=%s",
-                        chat_title,
-                    )
-                    return None
-                first_choice = response.choices[0]
-                message = getattr(first_choice, "message", None)
-                content = getattr(message, "content", None)
-                if not content or not str(content).strip():
-                    logger.warning(
-                        "automod OpenRouter: пустой content, chat_title=%s",
-                        chat_title,
-                    )
-                    return None
-                parsed = parse_automod_response(str(content), messages)
-                if parsed:
-                    logger.info(
-                        "automod: срабатывание LLM chat_title=%s user_tg_id=%s",
-                        chat_title,
-                        parsed.user_tg_id,
-                    )
-                return parsed
-            except OpenRouterError as exc:
-                logger.error(
-                    "automod OpenRouter API error chat_title=%s: %s (status=%s)",
-                    chat_title,
-                    exc,
-                    getattr(exc, "status_code", None),
-                    exc_info=True,
-                )
-                return None
-            except httpx.HTTPError as exc:
+        except OpenRouterError as exc:
+            logger.error(
+                "automod OpenRouter API error chat_title=%s: %s (status=%s)",
+                chat_title,
+                exc,
+                getattr(exc, "status_code", None),
+                exc_info=True,
+            )
+            raise AIServiceUnavailableError(str(exc)) from exc
+        except httpx.HTTPError as exc:
+            logger.error(
+                "automod OpenRouter HTTP error chat_title=%s: %s",
+                chat_title,
+                exc,
+                exc_info=True,
+            )
+            raise AIServiceUnavailableError(str(exc)) from exc
+        except (asyncio.TimeoutError, OSError) as exc:
+            logger.error(
+                "automod OpenRouter timeout/OS chat_title=%s: %s",
+                chat_title,
+                exc,
+                exc_info=True,
+            )
+            raise AIServiceUnavailableError(str(exc)) from exc
+
+        try:
+            if not response.choices:
                 logger.error(
-                    "automod OpenRouter HTTP error chat_title=%s: %s",
+                    "automod OpenRouter: нет choices, chat_title=%s",
                     chat_title,
-                    exc,
-                    exc_info=True,
                 )
-                return None
-            except (asyncio.TimeoutError, OSError) as exc:
-                logger.error(
-                    "automod OpenRouter timeout/OS chat_title=%s: %s",
+                raise AIServiceUnavailableError("нет choices в ответе")
+            first_choice = response.choices[0]
+            message = getattr(first_choice, "message", None)
+            content = getattr(message, "content", None)
+            if not content or not str(content).strip():
+                logger.warning(
+                    "automod OpenRouter: пустой content, chat_title=%s",
                     chat_title,
-                    exc,
-                    exc_info=True,
                 )
-                return None
-            except (TypeError, ValueError, AttributeError) as exc:
-                logger.error(
-                    "automod OpenRouter внутренняя ошибка chat_title=%s: %s",
+                raise AIServiceUnavailableError("пустой ответ модели")
+            parsed = parse_automod_response(str(content), messages)
+            if parsed:
+                logger.info(
+                    "automod: срабатывание LLM chat_title=%s user_tg_id=%s",
                     chat_title,
-                    exc,
-                    exc_info=True,
+                    parsed.user_tg_id,
                 )
-                return None
+            return parsed
+        except (TypeError, ValueError, AttributeError) as exc:
+            logger.error(
+                "automod OpenRouter внутренняя ошибка chat_title=%s: %s",
+                chat_title,
+                exc,
+                exc_info=True,
+            )
+            return None
@@ -0,0 +1,324 @@
+import logging
+import time
+from typing import List
+
+from pydantic import ValidationError
+from redis.asyncio import Redis as RedisClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from dto.antiraid import RaidJoinItemDTO
+from services.time_service import TimeZoneService
+
+logger = logging.getLogger(__name__)
+
+_REDIS_ERRORS = (
+    RedisConnectionError,
+    RedisTimeoutError,
+    OSError,
+)
+
+# Скользящее окно вступлений (ZSET по времени). При count >= threshold
+# флаг режима рейда продлевается на cooldown; флаг сам истекает, когда поток спадает.
+_LUA_REGISTER_JOIN = """
+local window_key = KEYS[1]
+local mode_key = KEYS[2]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local threshold = tonumber(ARGV[3])
+local cooldown = tonumber(ARGV[4])
+redis.call('ZADD', window_key, now, ARGV[5])
+redis.call('ZREMRANGEBYSCORE', window_key, '-inf', now - window)
+redis.call('EXPIRE', window_key, math.ceil(window))
+local count = redis.call('ZCARD', window_key)
+if count >= threshold then
+  redis.call('SET', mode_key, '1', 'EX', cooldown)
+  return 1
+end
+return redis.call('EXISTS', mode_key)
+"""
+
+# RPUSH в очередь чата; 1 — если сводная обработка ещё не запланирована (её нужно поставить).
+_LUA_ENQUEUE_JOIN = """
+redis.call('RPUSH', KEYS[1], ARGV[1])
+if redis.call('SET', KEYS[2], '1', 'NX', 'EX', tonumber(ARGV[2])) then
+  return 1
+end
+return 0
+"""
+
+# Забирает всю очередь чата и снимает флаг запланированной обработки.
+_LUA_POP_QUEUE = """
+local items = redis.call('LRANGE', KEYS[1], 0, -1)
+redis.call('DEL', KEYS[1])
+redis.call('DEL', KEYS[2])
+return items
+"""
+
+# Убирает участника из очереди и снимает флаг запланированной обработки
+# (задачу сводной обработки поставить не удалось).
+_LUA_WITHDRAW_JOIN = """
+redis.call('LREM', KEYS[1], 1, ARGV[1])
+redis.call('DEL', KEYS[2])
+return 1
+"""
+
+# Во сколько раз флаг запланированной обработки живёт дольше интервала (если задача потерялась)
+_DRAIN_FLAG_TTL_FACTOR = 6
+
+
+class RaidModeService:
+    """
+    Детектор массовых вступлений и очередь сводной обработки на чат.
+
+    При ошибках Redis работает как «рейда нет» — вступления обрабатываются по одному.
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        join_threshold: int,
+        window_seconds: int,
+        cooldown_seconds: int,
+        batch_interval_seconds: int,
+    ) -> None:
+        self._redis = redis_client
+        self._join_threshold = join_threshold
+        self._window_seconds = window_seconds
+        self._cooldown_seconds = cooldown_seconds
+        self._batch_interval_seconds = batch_interval_seconds
+        self._register_join_script = self._redis.register_script(_LUA_REGISTER_JOIN)
+        self._enqueue_script = self._redis.register_script(_LUA_ENQUEUE_JOIN)
+        self._pop_queue_script = self._redis.register_script(_LUA_POP_QUEUE)
+        self._withdraw_script = self._redis.register_script(_LUA_WITHDRAW_JOIN)
+
+    @property
+    def batch_interval_seconds(self) -> int:
+        return self._batch_interval_seconds
+
+    def _window_key(self, chat_tgid: str) -> str:
+        return f"raid:joins:{chat_tgid}"
+
+    def _mode_key(self, chat_tgid: str) -> str:
+        return f"raid:mode:{chat_tgid}"
+
+    def _queue_key(self, chat_tgid: str) -> str:
+        return f"raid:queue:{chat_tgid}"
+
+    def _drain_key(self, chat_tgid: str) -> str:
+        return f"raid:drain:{chat_tgid}"
+
+    def _pending_key(self, chat_tgid: str, message_id: int) -> str:
+        return f"raid:pending:{chat_tgid}:{message_id}"
+
+    async def register_join(self, chat_tgid: str, user_tgid: int) -> bool:
+        """
+        Учитывает вступление в скользящем окне чата.
+
+        Returns:
+            True, если чат находится в режиме рейда.
+        """
+        now = time.time()
+        try:
+            raw = await self._register_join_script(
+                keys=[self._window_key(chat_tgid), self._mode_key(chat_tgid)],
+                args=[
+                    f"{now:.6f}",
+                    str(self._window_seconds),
+                    str(self._join_threshold),
+                    str(self._cooldown_seconds),
+                    f"{now:.6f}:{user_tgid}",
+                ],
+            )
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "raid Redis: ошибка учёта вступления chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+                exc_info=True,
+            )
+            return False
+        return bool(raw)
+
+    async def is_raid_active(self, chat_tgid: str) -> bool:
+        """Проверяет, действует ли режим рейда в чате."""
+        try:
+            return bool(await self._redis.exists(self._mode_key(chat_tgid)))
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "raid Redis: ошибка проверки режима chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+            )
+            return False
+
+    async def enqueue_join(self, chat_tgid: str, item: RaidJoinItemDTO) -> bool | None:
+        """
+        Ставит участника в очередь сводной обработки.
+
+        Returns:
+            True — нужно запланировать обработку очереди, False — она уже запланирована,
+            None — Redis недоступен (участника нужно обработать сразу).
+        """
+        try:
+            raw = await self._enqueue_script(
+                keys=[self._queue_key(chat_tgid), self._drain_key(chat_tgid)],
+                args=[
+                    item.model_dump_json(),
+                    str(self._batch_interval_seconds * _DRAIN_FLAG_TTL_FACTOR),
+                ],
+            )
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "raid Redis: ошибка постановки в очередь chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+                exc_info=True,
+            )
+            return None
+        return bool(raw)
+
+    async def withdraw_join(self, chat_tgid: str, item: RaidJoinItemDTO) -> None:
+        """
+        Отменяет постановку в очередь: участник обрабатывается по одному,
+        а следующее вступление снова запланирует сводную обработку.
+        """
+        try:
+            await self._withdraw_script(
+                keys=[self._queue_key(chat_tgid), self._drain_key(chat_tgid)],
+                args=[item.model_dump_json()],
+            )
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "raid Redis: ошибка отмены постановки в очередь chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+                exc_info=True,
+            )
+
+    async def pop_joins(self, chat_tgid: str) -> List[RaidJoinItemDTO]:
+        """Атомарно забирает всю очередь вступлений чата."""
+        try:
+            raw = await self._pop_queue_script(
+                keys=[self._queue_key(chat_tgid), self._drain_key(chat_tgid)],
+                args=[],
+            )
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "raid Redis: ошибка чтения очереди chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+                exc_info=True,
+            )
+            return []
+
+        result: List[RaidJoinItemDTO] = []
+        for entry in raw or []:
+            try:
+                json_str = entry.decode("utf-8") if isinstance(entry, bytes) else entry
+                result.append(RaidJoinItemDTO.model_validate_json(json_str))
+            except (UnicodeDecodeError, ValidationError, ValueError, TypeError) as e:
+                logger.error(
+                    "raid: не удалось десериализовать элемент очереди chat_tgid=%s: %s",
+                    chat_tgid,
+                    e,
+                )
+        return result
+
+    async def add_pending_verification(
+        self,
+        chat_tgid: str,
+        message_id: int,
+        members: List[RaidJoinItemDTO],
+        ttl: int,
+    ) -> None:
+        """Запоминает участников, которые должны пройти проверку по сводному сообщению."""
+        if not members:
+            return
+        key = self._pending_key(chat_tgid, message_id)
+        mapping = {str(member.user_tgid): member.username or "" for member in members}
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, ttl)
+                await pipe.execute()
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "raid Redis: ошибка записи ожидающих проверки chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+                exc_info=True,
+            )
+
+    async def is_pending_verification(
+        self, chat_tgid: str, message_id: int, user_tgid: int
+    ) -> bool:
+        """Проверяет, что пользователь вступил в составе этого сводного сообщения."""
+        try:
+            return bool(
+                await self._redis.hexists(
+                    self._pending_key(chat_tgid, message_id), str(user_tgid)
+                )
+            )
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "raid Redis: ошибка проверки ожидающего chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+            )
+            return False
+
+    async def mark_verified(
+        self, chat_tgid: str, message_id: int, user_tgid: int
+    ) -> None:
+        """Убирает пользователя из списка ожидающих проверки."""
+        try:
+            await self._redis.hdel(
+                self._pending_key(chat_tgid, message_id), str(user_tgid)
+            )
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "raid Redis: ошибка снятия ожидающего chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+            )
+
+    async def pop_unverified(
+        self, chat_tgid: str, message_id: int
+    ) -> List[RaidJoinItemDTO]:
+        """Атомарно забирает оставшихся непроверенных участников сводного сообщения."""
+        key = self._pending_key(chat_tgid, message_id)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.hgetall(key)
+                pipe.delete(key)
+                members, _ = await pipe.execute()
+        except _REDIS_ERRORS as e:
+            logger.error(
+                "raid Redis: ошибка чтения непроверенных chat_tgid=%s: %s",
+                chat_tgid,
+                e,
+                exc_info=True,
+            )
+            return []
+
+        now = TimeZoneService.now()
+        result: List[RaidJoinItemDTO] = []
+        for raw_id, raw_username in (members or {}).items():
+            try:
+                user_tgid = int(raw_id)
+            except (TypeError, ValueError):
+                continue
+            username = (
+                raw_username.decode("utf-8")
+                if isinstance(raw_username, bytes)
+                else raw_username
+            )
+            result.append(
+                RaidJoinItemDTO(
+                    user_tgid=user_tgid,
+                    username=username or None,
+                    joined_at=now,
+                )
+            )
+        return sorted(result, key=lambda item: item.user_tgid)
@@ -7,6 +7,7 @@ from sqlalchemy.exc import IntegrityError
 from config import settings
 from models import ReportSchedule
 from repositories import ReportScheduleRepository
+from services.scheduler.schedule_notifier import ScheduleChangeNotifier
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +15,13 @@ logger = logging.getLogger(__name__)
 class ReportScheduleService:
     """Сервис для управления расписанием отправки ежедневных отчетов."""
 
-    def __init__(self, schedule_repository: ReportScheduleRepository) -> None:
+    def __init__(
+        self,
+        schedule_repository: ReportScheduleRepository,
+        change_notifier: ScheduleChangeNotifier,
+    ) -> None:
         self._schedule_repository = schedule_repository
+        self._change_notifier = change_notifier
 
     async def get_schedule(self, chat_id: int) -> Optional[ReportSchedule]:
         """
@@ -60,7 +66,7 @@ class ReportScheduleService:
             return schedule
 
         try:
-            return await self._schedule_repository.create_schedule(
+            schedule = await self._schedule_repository.create_schedule(
                 chat_id=chat_id,
                 tz_name=tz_name,
                 sent_time=sent_time,
@@ -78,6 +84,9 @@ class ReportScheduleService:
                     return schedule
             raise
 
+        await self._notify_changed(schedule)
+        return schedule
+
     async def update_sending_time(
         self, chat_id: int, new_time: time
     ) -> Optional[ReportSchedule]:
@@ -100,9 +109,11 @@ class ReportScheduleService:
             )
             return None
 
-        return await self._schedule_repository.update_schedule(
+        updated = await self._schedule_repository.update_schedule(
             schedule_id=schedule.id, sent_time=new_time
         )
+        await self._notify_changed(updated)
+        return updated
 
     async def toggle_schedule(
         self, chat_id: int, enabled: bool
@@ -126,6 +137,17 @@ class ReportScheduleService:
             )
             return None
 
-        return await self._schedule_repository.update_schedule(
+        updated = await self._schedule_repository.update_schedule(
             schedule_id=schedule.id, enabled=enabled
         )
+        await self._notify_changed(updated)
+        return updated
+
+    async def _notify_changed(self, schedule: Optional[ReportSchedule]) -> None:
+        """Сообщает планировщику отчетов новое время запуска расписания."""
+        if schedule is None:
+            return
+        await self._change_notifier.publish(
+            schedule_id=schedule.id,
+            next_run_at=schedule.next_run_at if schedule.enabled else None,
+        )
@@ -1,5 +1,8 @@
+from .schedule_notifier import ScheduleChangeNotifier, ScheduleChangeSubscription
 from .taskiq_scheduler import TaskiqSchedulerService
 
 __all__ = [
+    "ScheduleChangeNotifier",
+    "ScheduleChangeSubscription",
     "TaskiqSchedulerService",
 ]
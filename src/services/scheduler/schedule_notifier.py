@@ -0,0 +1,102 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional
+
+from pydantic import ValidationError
+from redis.asyncio import Redis as RedisClient
+from redis.asyncio.client import PubSub
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from dto.report_schedule import ReportScheduleChangeDTO
+
+logger = logging.getLogger(__name__)
+
+_REDIS_ERRORS = (
+    RedisConnectionError,
+    RedisTimeoutError,
+    OSError,
+)
+
+
+class ScheduleChangeSubscription:
+    """Подписка планировщика на канал изменений расписаний."""
+
+    def __init__(self, pubsub: PubSub) -> None:
+        self._pubsub = pubsub
+
+    async def wait(self, timeout: float) -> Optional[ReportScheduleChangeDTO]:
+        """
+        Ждёт уведомление не дольше timeout секунд.
+
+        Returns:
+            Изменение расписания или None, если за timeout ничего не пришло.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # get_message возвращает None и на служебных сообщениях (subscribe),
+            # поэтому ждём до дедлайна, а не до первого None
+            message = await self._pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=remaining
+            )
+            if not message or message.get("type") != "message":
+                continue
+            change = self._parse(message["data"])
+            if change is not None:
+                return change
+
+    @staticmethod
+    def _parse(data: Any) -> Optional[ReportScheduleChangeDTO]:
+        try:
+            raw = data.decode("utf-8") if isinstance(data, bytes) else data
+            return ReportScheduleChangeDTO.model_validate_json(raw)
+        except (UnicodeDecodeError, ValidationError, ValueError) as e:
+            logger.error("Некорректное уведомление о расписании %r: %s", data, e)
+            return None
+
+
+class ScheduleChangeNotifier:
+    """
+    Уведомления об изменении расписаний отчетов через Redis pub/sub.
+
+    Публикуют сервис расписаний (создание/изменение) и планировщик (после
+    захвата расписаний), слушает планировщик отчетов.
+    """
+
+    CHANNEL = "report_schedules:changed"
+
+    def __init__(self, redis_client: RedisClient) -> None:
+        self._redis = redis_client
+
+    async def publish(self, schedule_id: int, next_run_at: Optional[datetime]) -> None:
+        """Публикует новое время запуска расписания (None — расписание отключено)."""
+        payload = ReportScheduleChangeDTO(
+            schedule_id=schedule_id, next_run_at=next_run_at
+        ).model_dump_json()
+        try:
+            await self._redis.publish(self.CHANNEL, payload)
+        except _REDIS_ERRORS as e:
+            # Планировщик подхватит изменение при периодической пересинхронизации
+            logger.warning(
+                "Не удалось опубликовать изменение расписания id=%s: %s",
+                schedule_id,
+                e,
+            )
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[ScheduleChangeSubscription]:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self.CHANNEL)
+        try:
+            yield ScheduleChangeSubscription(pubsub)
+        finally:
+            try:
+                await pubsub.unsubscribe(self.CHANNEL)
+                await pubsub.aclose()
+            except _REDIS_ERRORS as e:
+                logger.warning("Ошибка при закрытии подписки на расписания: %s", e)
@@ -1,33 +1,143 @@
+import heapq
 import logging
+from datetime import datetime, timezone
+from typing import Optional
 
 from constants.period import TimePeriod
+from dto.report_schedule import ReportScheduleChangeDTO
 from repositories import ReportScheduleRepository
 
+from .schedule_notifier import ScheduleChangeNotifier, ScheduleChangeSubscription
+
 logger = logging.getLogger(__name__)
 
+# Пауза перед повторным захватом, если due-расписание держит другой инстанс
+_CLAIM_RETRY_SECONDS = 1.0
+
 
 class TaskiqSchedulerService:
-    def __init__(self, schedule_repo: ReportScheduleRepository) -> None:
+    """
+    Планировщик ежедневных отчетов.
+
+    Включённые расписания лежат в min-куче по next_run_at; процесс спит до
+    ближайшего запуска или до уведомления об изменении расписания. Захват
+    расписаний остаётся в БД (FOR UPDATE SKIP LOCKED), поэтому несколько
+    инстансов не отправят один отчет дважды.
+    """
+
+    def __init__(
+        self,
+        schedule_repo: ReportScheduleRepository,
+        change_notifier: ScheduleChangeNotifier,
+        batch_size: int = 50,
+    ) -> None:
         self._schedule_repo = schedule_repo
+        self._change_notifier = change_notifier
+        self._batch_size = batch_size
+        # Куча (next_run_at, schedule_id); устаревшие записи отбрасываются лениво
+        self._heap: list[tuple[datetime, int]] = []
+        self._next_run: dict[int, datetime] = {}
+        self._loaded = False
+
+    async def load(self) -> None:
+        """Перечитывает время запуска всех включённых расписаний из БД."""
+        run_times = await self._schedule_repo.get_enabled_run_times()
+        self._next_run = dict(run_times)
+        self._heap = [(run_at, schedule_id) for schedule_id, run_at in run_times]
+        heapq.heapify(self._heap)
+        self._loaded = True
+        logger.debug("Загружено расписаний в очередь: %d", len(self._heap))
+
+    def apply_change(self, change: ReportScheduleChangeDTO) -> None:
+        """Обновляет очередь по уведомлению об изменении расписания."""
+        if change.next_run_at is None:
+            self._next_run.pop(change.schedule_id, None)
+            return
+        self._next_run[change.schedule_id] = change.next_run_at
+        heapq.heappush(self._heap, (change.next_run_at, change.schedule_id))
+
+    def seconds_until_due(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Секунды до ближайшего запуска (0 — уже пора), None — очередь пуста."""
+        while self._heap:
+            run_at, schedule_id = self._heap[0]
+            if self._next_run.get(schedule_id) == run_at:
+                now = now or datetime.now(timezone.utc)
+                return max((run_at - now).total_seconds(), 0.0)
+            heapq.heappop(self._heap)
+        return None
+
+    async def wait_and_dispatch(
+        self, changes: ScheduleChangeSubscription, resync_seconds: float
+    ) -> None:
+        """
+        Одна итерация цикла планировщика: ждёт ближайший запуск, уведомление
+        или пересинхронизацию (не дольше resync_seconds) и обрабатывает событие.
+        """
+        if not self._loaded:
+            await self.load()
+
+        delay = self.seconds_until_due()
+        if delay is None or delay > resync_seconds:
+            change = await changes.wait(resync_seconds)
+            if change is not None:
+                self.apply_change(change)
+            else:
+                # Периодическая сверка с БД на случай потерянного уведомления
+                await self.load()
+            return
 
-    async def tick(self) -> None:
+        change = await changes.wait(delay)
+        if change is not None:
+            self.apply_change(change)
+            return
+
+        claimed = await self.tick()
+        await self.load()
+        if not claimed:
+            # Расписание захватил другой инстанс и ещё не закоммитил новое время
+            change = await changes.wait(_CLAIM_RETRY_SECONDS)
+            if change is not None:
+                self.apply_change(change)
+
+    async def tick(self) -> int:
+        """
+        Захватывает наступившие расписания и ставит отчеты в очередь пакетами
+        (до batch_size чатов на задачу), чтобы воркер считал общие данные
+        пакета один раз.
+
+        Returns:
+            Количество захваченных расписаний.
+        """
         logger.debug("Идем в бд за задачами")
         due_schedules = await self._schedule_repo.get_due_schedules_and_reschedule()
 
         if due_schedules:
             logger.info("Отправляем %s задач в очередь", len(due_schedules))
 
-        from tasks.report_tasks import send_chat_report_task
+        from tasks.report_tasks import send_chat_reports_batch_task
 
-        for schedule in due_schedules:
-            unique_task_id = f"{schedule.id}:{schedule.last_run_at.isoformat()}"
+        due_schedules = sorted(due_schedules, key=lambda schedule: schedule.id)
+        for start in range(0, len(due_schedules), self._batch_size):
+            batch = due_schedules[start : start + self._batch_size]
+            # Расписание попадает ровно в один пакет за запуск, поэтому
+            # первое расписание пакета однозначно определяет задачу
+            first = batch[0]
+            unique_task_id = f"batch:{first.id}:{first.last_run_at.isoformat()}"
 
             await (
-                send_chat_report_task.kicker()
+                send_chat_reports_batch_task.kicker()
                 .with_task_id(unique_task_id)
                 .kiq(
-                    schedule_id=schedule.id,
-                    chat_id=schedule.chat_id,
+                    schedule_ids=[schedule.id for schedule in batch],
+                    chat_ids=[schedule.chat_id for schedule in batch],
                     period=TimePeriod.TODAY.value,
                 )
             )
+
+        # Другие инстансы планировщика узнают новое время без похода в БД
+        for schedule in due_schedules:
+            await self._change_notifier.publish(
+                schedule_id=schedule.id, next_run_at=schedule.next_run_at
+            )
+
+        return len(due_schedules)
@@ -1,7 +1,9 @@
 from .content_service import TemplateContentService
+from .search_index import TemplateSearchIndex
 from .template_service import TemplateService
 
 __all__ = [
     "TemplateService",
     "TemplateContentService",
+    "TemplateSearchIndex",
 ]
@@ -14,6 +14,7 @@ from repositories import (
 from services.admin_action_log_service import AdminActionLogService
 from services.caching import ICache
 from services.templates.cache_helpers import invalidate_category_pages
+from services.templates.search_index import TemplateSearchIndex
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +28,14 @@ class TemplateContentService:
         template_repository: MessageTemplateRepository,
         media_repository: TemplateMediaRepository,
         cache: ICache,
+        search_index: TemplateSearchIndex,
         admin_action_log_service: Optional[AdminActionLogService] = None,
     ) -> None:
         self._user_repository = user_repository
         self._template_repository = template_repository
         self._media_repository = media_repository
         self._cache = cache
+        self._search_index = search_index
         self._admin_action_log_service = admin_action_log_service
 
     def extract_media_content(self, messages: list[Message]) -> Dict[str, Any]:
@@ -92,6 +95,7 @@ class TemplateContentService:
 
             # Сохраняем медиа с привязкой к шаблону
             await self.save_media_files(template_id=new_template.id, content=content)
+            self._search_index.invalidate()
 
             # Логируем действие после успешного создания шаблона
             if self._admin_action_log_service and user.tg_id:
@@ -169,6 +173,7 @@ class TemplateContentService:
             )
 
             if result:
+                self._search_index.invalidate()
                 template = await self._template_repository.get_template_by_id(
                     template_id
                 )
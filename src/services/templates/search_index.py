@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+from dto import TemplateDTO
+from repositories import MessageTemplateRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class TemplateSearchIndex:
+    """
+    In-memory индекс названий шаблонов для inline-поиска.
+
+    Хранит шаблоны с уникальными названиями (как поиск в БД) и отвечает на
+    запросы без обращения к БД теми же совпадениями, что и ILIKE '%q%':
+    - подстроки от 3 символов — пересечением триграммных списков;
+    - более короткие — проходом по названиям (их не больше max_entries).
+
+    Перестраивается лениво: после invalidate() (создание/изменение/удаление
+    шаблона) или по истечении TTL (учёт usage_count). Если шаблонов больше
+    max_entries, индекс не строится и search() возвращает None — поиск идёт
+    через триграммный индекс БД.
+    """
+
+    def __init__(
+        self,
+        template_repository: MessageTemplateRepository,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._template_repository = template_repository
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = asyncio.Lock()
+        self._expires_at = 0.0
+        self._enabled = False
+        self._entries: List[TemplateDTO] = []
+        self._titles: List[str] = []
+        self._trigrams: Dict[str, Set[int]] = {}
+
+    def invalidate(self) -> None:
+        """Помечает индекс устаревшим; следующий поиск перестроит его."""
+        self._expires_at = 0.0
+
+    async def search(self, query: str, limit: int = 50) -> Optional[List[TemplateDTO]]:
+        """
+        Шаблоны, название которых содержит query, в порядке релевантности:
+        точное совпадение, префикс названия, префикс слова, подстрока;
+        внутри группы — по usage_count.
+
+        Returns:
+            Список шаблонов или None, если индекс отключён (слишком много шаблонов)
+        """
+        await self._ensure_fresh()
+        if not self._enabled:
+            return None
+
+        needle = query.strip().lower()
+        if not needle:
+            return []
+
+        ranked = [
+            (rank, idx)
+            for idx in self._candidates(needle)
+            if (rank := self._rank(self._titles[idx], needle)) is not None
+        ]
+        ranked.sort(key=lambda item: (item[0], -self._entries[item[1]].usage_count))
+        return [self._entries[idx] for _, idx in ranked[:limit]]
+
+    def _candidates(self, needle: str) -> Set[int]:
+        if len(needle) < 3:
+            # Триграмм нет: подстрока в любом месте, как ILIKE в БД
+            return {idx for idx, title in enumerate(self._titles) if needle in title}
+
+        postings = [self._trigrams.get(gram, set()) for gram in _trigrams(needle)]
+        return set.intersection(*postings)
+
+    @staticmethod
+    def _rank(title: str, needle: str) -> Optional[int]:
+        if title == needle:
+            return 0
+        if title.startswith(needle):
+            return 1
+        if any(word.startswith(needle) for word in title.split()):
+            return 2
+        if needle in title:
+            return 3
+        return None
+
+    async def _ensure_fresh(self) -> None:
+        if time.monotonic() < self._expires_at:
+            return
+        async with self._lock:
+            if time.monotonic() < self._expires_at:
+                return
+            await self._rebuild()
+
+    async def _rebuild(self) -> None:
+        templates = await self._template_repository.get_templates_for_search_index(
+            limit=self._max_entries + 1
+        )
+        self._expires_at = time.monotonic() + self._ttl
+
+        if len(templates) > self._max_entries:
+            if self._enabled:
+                logger.info(
+                    "Индекс поиска шаблонов отключён: больше %d шаблонов",
+                    self._max_entries,
+                )
+            self._enabled = False
+            self._entries, self._titles, self._trigrams = [], [], {}
+            return
+
+        entries = [TemplateDTO.from_model(template) for template in templates]
+        titles = [entry.title.lower() for entry in entries]
+        trigrams: Dict[str, Set[int]] = defaultdict(set)
+        for idx, title in enumerate(titles):
+            for gram in _trigrams(title):
+                trigrams[gram].add(idx)
+
+        self._entries, self._titles = entries, titles
+        self._trigrams = dict(trigrams)
+        self._enabled = True
+        logger.debug("Индекс поиска шаблонов перестроен: %d названий", len(entries))
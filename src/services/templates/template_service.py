@@ -1,9 +1,14 @@
 from typing import List, Optional
 
+from dto import TemplateDTO
 from models import MessageTemplate
 from repositories import MessageTemplateRepository
 from services.caching import ICache
 from services.templates.cache_helpers import invalidate_category_pages
+from services.templates.search_index import TemplateSearchIndex
+
+# Максимум результатов inline-запроса в Telegram
+INLINE_RESULTS_LIMIT = 50
 
 
 class TemplateService:
@@ -13,9 +18,11 @@ class TemplateService:
         self,
         template_repository: MessageTemplateRepository,
         cache: ICache,
+        search_index: TemplateSearchIndex,
     ) -> None:
         self._template_repository = template_repository
         self._cache = cache
+        self._search_index = search_index
 
     async def get_by_category(
         self,
@@ -101,6 +108,21 @@ class TemplateService:
         """Ищет шаблоны по запросу."""
         return await self._template_repository.get_templates_by_query(query=query)
 
+    async def search_templates(
+        self, query: str, limit: int = INLINE_RESULTS_LIMIT
+    ) -> List[TemplateDTO]:
+        """
+        Ищет шаблоны по подстроке в названии в порядке релевантности.
+        Использует in-memory индекс, а если он отключён — триграммный поиск в БД.
+        """
+        found = await self._search_index.search(query, limit=limit)
+        if found is not None:
+            return found
+        templates = await self._template_repository.get_templates_by_query(
+            query=query, limit=limit
+        )
+        return [TemplateDTO.from_model(template) for template in templates]
+
     async def delete_template(self, template_id: int) -> bool:
         """Удаляет шаблон и инвалидирует кеш."""
         template = await self._template_repository.get_template_by_id(template_id)
@@ -109,6 +131,8 @@ class TemplateService:
 
         category_id = template.category_id
         result = await self._template_repository.delete_template(template_id)
+        if result:
+            self._search_index.invalidate()
         if result and category_id:
             await self.invalidate_category_cache(category_id)
         return result
@@ -119,6 +143,7 @@ class TemplateService:
             template_id, new_title
         )
         if success:
+            self._search_index.invalidate()
             template = await self._template_repository.get_template_by_id(template_id)
             if template and template.category_id:
                 await self.invalidate_category_cache(template.category_id)
@@ -0,0 +1,62 @@
+import logging
+from typing import Optional
+
+from models import ChatSession, User
+from services.chat.chat_service import ChatService
+from services.user.user_service import UserService
+
+logger = logging.getLogger(__name__)
+
+
+class UpdateContext:
+    """
+    Пользователь и чат одного апдейта Telegram.
+
+    Создаётся middleware на каждый апдейт и передаётся через data в фильтры,
+    middleware и use case'ы. Каждая сущность загружается из кеша/БД не более
+    одного раза, последующие обращения возвращают уже загруженный объект.
+    """
+
+    def __init__(
+        self,
+        user_service: UserService,
+        chat_service: ChatService,
+        user_tg_id: str,
+        username: Optional[str] = None,
+        chat_tg_id: Optional[str] = None,
+        chat_title: Optional[str] = None,
+    ) -> None:
+        self._user_service = user_service
+        self._chat_service = chat_service
+        self.user_tg_id = user_tg_id
+        self.username = username
+        self.chat_tg_id = chat_tg_id
+        self.chat_title = chat_title
+        self._user: Optional[User] = None
+        self._chat: Optional[ChatSession] = None
+
+    async def find_user(self) -> Optional[User]:
+        """Пользователь апдейта или None, если его ещё нет в БД."""
+        if self._user is None:
+            self._user = await self._user_service.get_user(
+                tg_id=self.user_tg_id, username=self.username
+            )
+        return self._user
+
+    async def get_user(self) -> User:
+        """Пользователь апдейта; создаётся, если его ещё нет в БД."""
+        if self._user is None:
+            self._user = await self._user_service.get_or_create(
+                tg_id=self.user_tg_id, username=self.username
+            )
+        return self._user
+
+    async def get_chat(self) -> ChatSession:
+        """Чат апдейта (с синхронизацией названия); создаётся, если его нет в БД."""
+        if self._chat is None:
+            if self.chat_tg_id is None:
+                raise ValueError("Апдейт не относится к чату")
+            self._chat = await self._chat_service.get_or_create(
+                chat_tgid=self.chat_tg_id, title=self.chat_title
+            )
+        return self._chat
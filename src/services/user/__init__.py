@@ -1,5 +1,7 @@
+from .tracking_index_service import TrackingIndexService
 from .user_service import UserService
 
 __all__ = [
+    "TrackingIndexService",
     "UserService",
 ]
@@ -0,0 +1,146 @@
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Set
+
+from models import User
+from repositories import ChatTrackingRepository, UserRepository
+from services.caching import ICache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+
+
+class TrackingIndexService:
+    """
+    Кешированный индекс отслеживания для отчетов.
+
+    Хранит в кеше:
+    - админ (tg_id) → отслеживаемые пользователи;
+    - админ (id) → ID отслеживаемых пользователей и ID его чатов
+      (доступы AdminChatAccess — по ним же проверяется доступ в Mini App);
+    - чат (id) → ID админов чата.
+
+    Записи сбрасываются use case'ами изменения отслеживания
+    (invalidate_admin / invalidate_chat), TTL страхует от пропущенной
+    инвалидации (например, смена username отслеживаемого пользователя).
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        chat_tracking_repository: ChatTrackingRepository,
+        cache: ICache,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._user_repository = user_repository
+        self._chat_tracking_repository = chat_tracking_repository
+        self._cache = cache
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def _admin_users_key(admin_tg_id: str) -> str:
+        return f"tracking:admin:{admin_tg_id}:users"
+
+    @staticmethod
+    def _admin_chats_key(admin_id: int) -> str:
+        return f"tracking:admin_id:{admin_id}:chats"
+
+    @staticmethod
+    def _admin_user_ids_key(admin_id: int) -> str:
+        return f"tracking:admin_id:{admin_id}:user_ids"
+
+    @staticmethod
+    def _chat_admins_key(chat_id: int) -> str:
+        return f"tracking:chat:{chat_id}:admins"
+
+    async def get_tracked_users(self, admin_tg_id: str) -> List[User]:
+        """Отслеживаемые пользователи админа (в порядке репозитория)."""
+        key = self._admin_users_key(admin_tg_id)
+        users = await self._cache.get(key)
+        if users is not None:
+            return users
+
+        users = await self._user_repository.get_tracked_users_for_admin(
+            admin_tg_id=admin_tg_id
+        )
+        await self._cache.set(key, users, ttl=self._ttl)
+        return users
+
+    async def get_tracked_user_ids(self, admin_tg_id: str) -> List[int]:
+        """ID отслеживаемых пользователей админа."""
+        return [user.id for user in await self.get_tracked_users(admin_tg_id)]
+
+    async def get_tracked_chat_ids(self, admin_id: int) -> List[int]:
+        """ID чатов, к которым у админа (id в БД) есть доступ."""
+        key = self._admin_chats_key(admin_id)
+        chat_ids = await self._cache.get(key)
+        if chat_ids is not None:
+            return chat_ids
+
+        chats = await self._chat_tracking_repository.get_all_tracked_chats(
+            admin_id=admin_id
+        )
+        chat_ids = [chat.id for chat in chats]
+        await self._cache.set(key, chat_ids, ttl=self._ttl)
+        return chat_ids
+
+    async def get_tracked_user_ids_by_chats(
+        self, chat_ids: Iterable[int]
+    ) -> Dict[int, Set[int]]:
+        """
+        Отслеживаемые пользователи каждого чата — объединение списков
+        отслеживания всех его админов. Промахи кеша догружаются пакетно:
+        один запрос на чаты и один на админов.
+        """
+        chat_ids = list(chat_ids)
+        admins_by_chat = await self._get_cached_sets(
+            chat_ids,
+            key_fn=self._chat_admins_key,
+            fetch=self._user_repository.get_admin_ids_by_chats,
+        )
+        admin_ids = set().union(*admins_by_chat.values())
+        users_by_admin = await self._get_cached_sets(
+            sorted(admin_ids),
+            key_fn=self._admin_user_ids_key,
+            fetch=self._user_repository.get_tracked_user_ids_by_admins,
+        )
+        return {
+            chat_id: set().union(
+                *(users_by_admin[admin_id] for admin_id in admins_by_chat[chat_id])
+            )
+            for chat_id in chat_ids
+        }
+
+    async def _get_cached_sets(
+        self,
+        ids: List[int],
+        key_fn: Callable[[int], str],
+        fetch: Callable[[List[int]], Awaitable[Dict[int, Set[int]]]],
+    ) -> Dict[int, Set[int]]:
+        result: Dict[int, Set[int]] = {}
+        missing: List[int] = []
+        cached_values = await self._cache.get_many([key_fn(i) for i in ids])
+        for item_id, cached in zip(ids, cached_values):
+            if cached is None:
+                missing.append(item_id)
+            else:
+                result[item_id] = set(cached)
+
+        if missing:
+            fetched = await fetch(missing)
+            for item_id in missing:
+                values = fetched.get(item_id, set())
+                result[item_id] = values
+                await self._cache.set(key_fn(item_id), sorted(values), ttl=self._ttl)
+        return result
+
+    async def invalidate_admin(self, admin: User) -> None:
+        """Сбрасывает записи админа после изменения его отслеживания."""
+        await self._cache.delete(self._admin_users_key(admin.tg_id))
+        await self._cache.delete(self._admin_chats_key(admin.id))
+        await self._cache.delete(self._admin_user_ids_key(admin.id))
+        logger.debug("Индекс отслеживания сброшен для админа id=%s", admin.id)
+
+    async def invalidate_chat(self, chat_id: int) -> None:
+        """Сбрасывает список админов чата после изменения доступа к нему."""
+        await self._cache.delete(self._chat_admins_key(chat_id))
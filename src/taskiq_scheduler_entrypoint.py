@@ -1,39 +1,48 @@
 import asyncio
 import logging
 
-from container import ContainerSetup, container
+from config import settings
+from container import ContainerProfile, ContainerSetup, container
 from repositories import UserRepository
 from scheduler import broker
 from services import BotMessageService
-from services.scheduler import TaskiqSchedulerService
+from services.scheduler import ScheduleChangeNotifier, TaskiqSchedulerService
 from utils.exception_handler import notify_devs_about_error
 from utils.logger_config import setup_logger
 
 setup_logger(log_level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Пауза после ошибки в цикле (БД/Redis недоступны), чтобы не крутиться вхолостую
+ERROR_RETRY_SECONDS = 10
+
 
 async def main():
-    ContainerSetup.setup()
+    ContainerSetup.setup(ContainerProfile.SCHEDULER)
     await broker.startup()
     logger.info("TaskIQ scheduler запущен")
 
     taskiq_service: TaskiqSchedulerService = container.resolve(TaskiqSchedulerService)
+    notifier: ScheduleChangeNotifier = container.resolve(ScheduleChangeNotifier)
 
     try:
-        while True:
-            try:
-                await taskiq_service.tick()
-            except Exception as e:
-                logger.error("Ошибка в тике scheduler: %s", e, exc_info=True)
-                await notify_devs_about_error(
-                    bot_message_service=container.resolve(BotMessageService),
-                    user_repository=container.resolve(UserRepository),
-                    exc=e,
-                    context="taskiq_scheduler_entrypoint: tick()",
-                )
-
-            await asyncio.sleep(60)
+        # Подписка открывается до первой загрузки очереди (внутри цикла),
+        # чтобы не пропустить изменения между ними
+        async with notifier.subscribe() as changes:
+            while True:
+                try:
+                    await taskiq_service.wait_and_dispatch(
+                        changes, resync_seconds=settings.REPORT_SCHEDULER_RESYNC_SECONDS
+                    )
+                except Exception as e:
+                    logger.error("Ошибка в цикле scheduler: %s", e, exc_info=True)
+                    await notify_devs_about_error(
+                        bot_message_service=container.resolve(BotMessageService),
+                        user_repository=container.resolve(UserRepository),
+                        exc=e,
+                        context="taskiq_scheduler_entrypoint: wait_and_dispatch()",
+                    )
+                    await asyncio.sleep(ERROR_RETRY_SECONDS)
     except asyncio.CancelledError:
         pass
     finally:
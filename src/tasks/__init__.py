@@ -1,15 +1,51 @@
-from .analytics_tasks import (
-    process_buffered_messages_task,
-    process_buffered_reactions_task,
-    process_buffered_replies_task,
-)
-from .moderation_tasks import delete_message_from_chat
-from .report_tasks import send_chat_report_task
+"""
+Задачи TaskIQ.
+
+Реэкспорт ленивый: воркер, запущенный только с tasks.analytics_tasks, не
+импортирует модули задач модерации и отчетов (и их зависимости).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analytics_tasks import (
+        process_buffered_admin_logs_task,
+        process_buffered_membership_events_task,
+        process_buffered_messages_task,
+        process_buffered_reactions_task,
+        process_buffered_replies_task,
+    )
+    from .moderation_tasks import delete_message_from_chat
+    from .report_tasks import send_chat_report_task, send_chat_reports_batch_task
+
+_EXPORTS = {
+    "send_chat_report_task": ".report_tasks",
+    "send_chat_reports_batch_task": ".report_tasks",
+    "process_buffered_messages_task": ".analytics_tasks",
+    "process_buffered_reactions_task": ".analytics_tasks",
+    "process_buffered_replies_task": ".analytics_tasks",
+    "process_buffered_membership_events_task": ".analytics_tasks",
+    "process_buffered_admin_logs_task": ".analytics_tasks",
+    "delete_message_from_chat": ".moderation_tasks",
+}
 
 __all__ = [
     "send_chat_report_task",
+    "send_chat_reports_batch_task",
     "process_buffered_messages_task",
     "process_buffered_reactions_task",
     "process_buffered_replies_task",
+    "process_buffered_membership_events_task",
+    "process_buffered_admin_logs_task",
     "delete_message_from_chat",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
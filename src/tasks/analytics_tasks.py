@@ -1,15 +1,20 @@
 import logging
 
-from container import ContainerSetup, container
+from container import ContainerProfile, ContainerSetup, container
+from repositories.admin_action_log_repository import AdminActionLogRepository
+from repositories.chat_membership_event_repository import (
+    ChatMembershipEventRepository,
+)
 from repositories.message_reply_repository import MessageReplyRepository
 from repositories.message_repository import MessageRepository
 from repositories.reaction_repository import MessageReactionRepository
 from scheduler import broker
 from services.analytics_buffer_service import AnalyticsBufferService
+from services.caching import DataWatermark
 
 logger = logging.getLogger(__name__)
 
-ContainerSetup.setup()
+ContainerSetup.require(ContainerProfile.ANALYTICS_WORKER)
 
 # Константы для настройки обработки
 BATCH_SIZE = 100
@@ -36,6 +41,8 @@ async def process_buffered_messages_task():
         inserted_count = await message_repository.bulk_create_messages(messages)
         # Удаляем из Redis даже если все были дубликатами
         await buffer_service.trim_messages(len(messages))
+        if inserted_count:
+            await container.resolve(DataWatermark).bump(m.user_id for m in messages)
 
         logger.info(
             "Обработано сообщений: прочитано=%d, вставлено=%d",
@@ -72,6 +79,8 @@ async def process_buffered_reactions_task():
         inserted_count = await reaction_repository.bulk_add_reactions(reactions)
         # Удаляем из Redis даже если все были дубликатами
         await buffer_service.trim_reactions(len(reactions))
+        if inserted_count:
+            await container.resolve(DataWatermark).bump(r.user_id for r in reactions)
 
         logger.info(
             "Обработано реакций: прочитано=%d, вставлено=%d",
@@ -116,6 +125,9 @@ async def process_buffered_replies_task():
             if failed_dtos:
                 await buffer_service.re_add_replies(failed_dtos)
             await buffer_service.trim_replies(len(replies))
+            await container.resolve(DataWatermark).bump(
+                r.reply_user_id for r in replies
+            )
 
         logger.info(
             "Обработано reply сообщений: прочитано=%d, вставлено=%d, возвращено=%d",
@@ -128,3 +140,73 @@ async def process_buffered_replies_task():
             "Ошибка при обработке буферизованных reply сообщений: %s", e, exc_info=True
         )
         raise
+
+
+@broker.task
+async def process_buffered_membership_events_task():
+    """
+    Задача для обработки буферизованных событий состава чатов из Redis.
+    """
+    logger.debug("Начало обработки буферизованных событий состава")
+
+    try:
+        buffer_service: AnalyticsBufferService = container.resolve(
+            AnalyticsBufferService
+        )
+        event_repository: ChatMembershipEventRepository = container.resolve(
+            ChatMembershipEventRepository
+        )
+
+        events = await buffer_service.pop_membership_events(BATCH_SIZE)
+        if not events:
+            logger.debug("Нет событий состава для обработки")
+            return
+
+        inserted_count = await event_repository.bulk_add_events(events)
+        await buffer_service.trim_membership_events(len(events))
+
+        logger.info(
+            "Обработано событий состава: прочитано=%d, вставлено=%d",
+            len(events),
+            inserted_count,
+        )
+    except Exception as e:
+        logger.error(
+            "Ошибка при обработке буферизованных событий состава: %s", e, exc_info=True
+        )
+        raise
+
+
+@broker.task
+async def process_buffered_admin_logs_task():
+    """
+    Задача для обработки буферизованных логов действий администраторов из Redis.
+    """
+    logger.debug("Начало обработки буферизованных логов действий")
+
+    try:
+        buffer_service: AnalyticsBufferService = container.resolve(
+            AnalyticsBufferService
+        )
+        log_repository: AdminActionLogRepository = container.resolve(
+            AdminActionLogRepository
+        )
+
+        logs = await buffer_service.pop_admin_logs(BATCH_SIZE)
+        if not logs:
+            logger.debug("Нет логов действий для обработки")
+            return
+
+        inserted_count = await log_repository.bulk_create_logs(logs)
+        await buffer_service.trim_admin_logs(len(logs))
+
+        logger.info(
+            "Обработано логов действий: прочитано=%d, вставлено=%d",
+            len(logs),
+            inserted_count,
+        )
+    except Exception as e:
+        logger.error(
+            "Ошибка при обработке буферизованных логов действий: %s", e, exc_info=True
+        )
+        raise
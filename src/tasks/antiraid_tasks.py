@@ -0,0 +1,121 @@
+"""Фоновые задачи режима рейда (сводная обработка массовых вступлений)."""
+
+import asyncio
+import logging
+
+from config import settings
+from container import ContainerProfile, ContainerSetup, container
+from dto.antiraid import ArchiveMembersDigestDTO, RaidJoinBatchJobDTO, RaidJoinItemDTO
+from scheduler import broker
+from services.messaging.bot_message_service import BotMessageService
+from services.raid_mode_service import RaidModeService
+from usecases.antiraid import ProcessRaidJoinBatchUseCase
+from usecases.archive import NotifyArchiveChatMembersDigestUseCase
+
+logger = logging.getLogger(__name__)
+
+ContainerSetup.require(ContainerProfile.WORKER)
+
+
+@broker.task
+async def process_raid_join_batch_task(chat_tgid: str, chat_title: str) -> None:
+    """
+    Забирает очередь вступлений чата, накопленную за интервал режима рейда,
+    и обрабатывает её одной пачкой.
+
+    Задержка задаётся при вызове через .kicker().with_labels(delay=N).kiq(...).
+    """
+    try:
+        raid_service: RaidModeService = container.resolve(RaidModeService)
+        items = await raid_service.pop_joins(chat_tgid)
+        if not items:
+            logger.debug("raid: очередь вступлений пуста chat_tgid=%s", chat_tgid)
+            return
+
+        usecase: ProcessRaidJoinBatchUseCase = container.resolve(
+            ProcessRaidJoinBatchUseCase
+        )
+        await usecase.execute(
+            RaidJoinBatchJobDTO(
+                chat_tgid=chat_tgid,
+                chat_title=chat_title,
+                items=items,
+            )
+        )
+    except Exception:
+        logger.exception(
+            "raid task: ошибка обработки пачки вступлений chat_tgid=%s",
+            chat_tgid,
+        )
+
+
+@broker.task
+async def kick_unverified_raid_members_task(
+    chat_id: int,
+    message_id: int,
+    chat_title: str,
+) -> None:
+    """
+    Кикает участников сводного приветствия, не прошедших проверку за отведённое время.
+
+    Сообщение с кнопкой удаляется всегда; кики идут с паузой, в архив — одна сводка.
+
+    Args:
+        chat_id: ID чата
+        message_id: ID сводного приветственного сообщения с кнопкой
+        chat_title: Название чата для сводки в архив
+    """
+    try:
+        bot_message_service: BotMessageService = container.resolve(BotMessageService)
+        raid_service: RaidModeService = container.resolve(RaidModeService)
+
+        await bot_message_service.delete_message_from_chat(
+            chat_id=chat_id,
+            message_id=message_id,
+        )
+
+        unverified = await raid_service.pop_unverified(str(chat_id), message_id)
+        if not unverified:
+            logger.info(
+                "raid: все участники сообщения %s в чате %s прошли проверку",
+                message_id,
+                chat_id,
+            )
+            return
+
+        kicked: list[RaidJoinItemDTO] = []
+        for index, member in enumerate(unverified):
+            if index and settings.RAID_RESTRICT_PACE_SECONDS:
+                await asyncio.sleep(settings.RAID_RESTRICT_PACE_SECONDS)
+            if await bot_message_service.kick_chat_member(
+                chat_tg_id=chat_id,
+                user_tg_id=member.user_tgid,
+            ):
+                kicked.append(member)
+
+        logger.info(
+            "raid: кикнуто %d из %d непроверенных участников в чате %s",
+            len(kicked),
+            len(unverified),
+            chat_id,
+        )
+
+        if kicked:
+            notify_usecase: NotifyArchiveChatMembersDigestUseCase = container.resolve(
+                NotifyArchiveChatMembersDigestUseCase
+            )
+            await notify_usecase.execute(
+                ArchiveMembersDigestDTO(
+                    chat_tgid=str(chat_id),
+                    chat_title=chat_title,
+                    members=kicked,
+                    kicked=True,
+                )
+            )
+    except Exception as e:
+        logger.error(
+            "Ошибка при кике непроверенных участников рейда в чате %s: %s",
+            chat_id,
+            e,
+            exc_info=True,
+        )
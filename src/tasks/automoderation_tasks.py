@@ -5,16 +5,17 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from container import ContainerSetup, container
+from container import ContainerProfile, ContainerSetup, container
 from dto.automoderation import AutoModerationBatchJobDTO, AutoModerationBufferItemDTO
 from scheduler import broker
+from services.automoderation_buffer_service import AutoModerationBufferService
 from usecases.automoderation.process_auto_moderation_batch import (
     ProcessAutoModerationBatchUseCase,
 )
 
 logger = logging.getLogger(__name__)
 
-ContainerSetup.setup()
+ContainerSetup.require(ContainerProfile.AUTOMOD_WORKER)
 
 
 @broker.task
@@ -55,3 +56,38 @@ async def process_auto_moderation_batch_task(
             "automod task: ошибка выполнения use case chat_tgid=%s",
             chat_tgid,
         )
+
+
+@broker.task
+async def sweep_auto_moderation_buffers_task() -> None:
+    """
+    Сбрасывает буферы, где самое старое сообщение ждёт дольше
+    AUTO_MODERATION_MAX_AGE_SECONDS, и ставит их пачки в очередь.
+    """
+    try:
+        buffer_service: AutoModerationBufferService = container.resolve(
+            AutoModerationBufferService
+        )
+        jobs = await buffer_service.pop_aged_buffers()
+    except Exception:
+        logger.exception("automod sweep: ошибка чтения постаревших буферов")
+        return
+
+    for job in jobs:
+        try:
+            await process_auto_moderation_batch_task.kiq(
+                chat_tgid=job.chat_tgid,
+                chat_title=job.chat_title,
+                archive_chat_tgid=job.archive_chat_tgid,
+                batch_items=[m.model_dump(mode="json") for m in job.batch],
+            )
+        except Exception:
+            logger.exception(
+                "automod sweep: не удалось поставить задачу в очередь "
+                "(пачка уже сброшена из Redis) chat_tgid=%s batch_size=%s",
+                job.chat_tgid,
+                len(job.batch),
+            )
+
+    if jobs:
+        logger.info("automod sweep: сброшено постаревших буферов=%d", len(jobs))
@@ -1,6 +1,6 @@
 import logging
 
-from container import ContainerSetup, container
+from container import ContainerProfile, ContainerSetup, container
 from dto import ArchiveMemberNotificationDTO
 from scheduler import broker
 from services.messaging.bot_message_service import BotMessageService
@@ -8,7 +8,7 @@ from usecases.archive import NotifyArchiveChatMemberKickedUseCase
 
 logger = logging.getLogger(__name__)
 
-ContainerSetup.setup()
+ContainerSetup.require(ContainerProfile.WORKER)
 
 
 @broker.task
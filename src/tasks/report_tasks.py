@@ -1,14 +1,14 @@
 import logging
 
 from constants.period import TimePeriod
-from container import ContainerSetup, container
+from container import ContainerProfile, ContainerSetup, container
 from scheduler import broker
 from services.report_schedule_service import ReportScheduleService
 from usecases.report.chat.send_daily_chat_reports import SendDailyChatReportsUseCase
 
 logger = logging.getLogger(__name__)
 
-ContainerSetup.setup()
+ContainerSetup.require(ContainerProfile.WORKER)
 
 
 @broker.task
@@ -78,3 +78,45 @@ async def send_chat_report_task(
             exc_info=True,
         )
         raise
+
+
+@broker.task
+async def send_chat_reports_batch_task(
+    schedule_ids: list[int],
+    chat_ids: list[int],
+    period: str = TimePeriod.TODAY.value,
+):
+    """
+    Задача для пакетной отправки ежедневных отчетов по наступившим расписаниям.
+
+    Расписания уже захвачены планировщиком (только включённые), поэтому
+    повторная проверка каждого расписания не выполняется.
+
+    Args:
+        schedule_ids: ID расписаний (для логирования)
+        chat_ids: ID чатов
+        period: Период для отчетов
+    """
+    logger.info(
+        "Выполнение пакетной задачи отчетов: schedule_ids=%s, period=%s",
+        schedule_ids,
+        period,
+    )
+
+    try:
+        usecase: SendDailyChatReportsUseCase = container.resolve(
+            SendDailyChatReportsUseCase
+        )
+        await usecase.execute_batch(chat_ids=chat_ids, period=period)
+        logger.info(
+            "Пакетная задача отчетов выполнена успешно: %d расписаний",
+            len(schedule_ids),
+        )
+    except Exception as e:
+        logger.error(
+            "Ошибка при выполнении пакетной задачи отчетов schedule_ids=%s: %s",
+            schedule_ids,
+            e,
+            exc_info=True,
+        )
+        raise
@@ -4,15 +4,15 @@ from constants import Dialog
 from dto.admin_log import AdminLogPageResultDTO, GetAdminLogsPageDTO
 from exceptions import AdminLogsError
 from keyboards.inline.admin_logs import format_action_type
-from repositories import AdminActionLogRepository
+from services.admin_action_log_service import AdminActionLogService
 from services.time_service import TimeZoneService
 
 
 class GetAdminLogsPageUseCase:
     """Возвращает страницу логов с готовыми строками для отображения."""
 
-    def __init__(self, log_repository: AdminActionLogRepository) -> None:
-        self._log_repository = log_repository
+    def __init__(self, log_service: AdminActionLogService) -> None:
+        self._log_service = log_service
 
     async def execute(self, dto: GetAdminLogsPageDTO) -> AdminLogPageResultDTO:
         """Загружает страницу логов, форматирует и возвращает DTO."""
@@ -25,30 +25,30 @@ class GetAdminLogsPageUseCase:
 
     async def _execute(self, dto: GetAdminLogsPageDTO) -> AdminLogPageResultDTO:
         """Внутренняя реализация без обработки исключений."""
+        page = await self._log_service.get_logs_page(
+            limit=dto.limit,
+            admin_id=dto.admin_id,
+            cursor=dto.cursor,
+            backward=dto.backward,
+        )
+        logs = page.logs
+        total_count = await self._log_service.count_logs(admin_id=dto.admin_id)
+
         if dto.admin_id is None:
-            logs, total_count = await self._log_repository.get_logs_paginated(
-                page=dto.page, limit=dto.limit
-            )
             header_text = Dialog.AdminLogs.ALL_ADMINS_LOGS
+        elif logs:
+            admin_display = (
+                f"@{logs[0].admin.username}"
+                if logs[0].admin.username
+                else f"ID:{logs[0].admin.tg_id}"
+            )
+            header_text = Dialog.AdminLogs.ADMIN_LOGS_FORMAT.format(
+                user_display=admin_display
+            )
         else:
-            logs, total_count = await self._log_repository.get_logs_by_admin(
-                admin_id=dto.admin_id,
-                page=dto.page,
-                limit=dto.limit,
+            header_text = Dialog.AdminLogs.ADMIN_LOGS_FORMAT.format(
+                user_display="неизвестен"
             )
-            if logs:
-                admin_display = (
-                    f"@{logs[0].admin.username}"
-                    if logs[0].admin.username
-                    else f"ID:{logs[0].admin.tg_id}"
-                )
-                header_text = Dialog.AdminLogs.ADMIN_LOGS_FORMAT.format(
-                    user_display=admin_display
-                )
-            else:
-                header_text = Dialog.AdminLogs.ADMIN_LOGS_FORMAT.format(
-                    user_display="неизвестен"
-                )
 
         entry_lines: list[str] = []
         for log in logs:
@@ -71,4 +71,6 @@ class GetAdminLogsPageUseCase:
             header_text=header_text,
             entry_lines=entry_lines,
             total_count=total_count,
+            prev_cursor=page.prev_cursor,
+            next_cursor=page.next_cursor,
         )
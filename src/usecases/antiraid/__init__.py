@@ -0,0 +1,7 @@
+from .enqueue_raid_join import EnqueueRaidJoinUseCase
+from .process_raid_join_batch import ProcessRaidJoinBatchUseCase
+
+__all__ = [
+    "EnqueueRaidJoinUseCase",
+    "ProcessRaidJoinBatchUseCase",
+]
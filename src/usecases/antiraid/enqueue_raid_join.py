@@ -0,0 +1,54 @@
+import logging
+
+from dto.antiraid import RaidJoinItemDTO
+from services.raid_mode_service import RaidModeService
+
+logger = logging.getLogger(__name__)
+
+
+class EnqueueRaidJoinUseCase:
+    """Учёт темпа вступлений; в режиме рейда — постановка участника в сводную очередь."""
+
+    def __init__(self, raid_mode_service: RaidModeService) -> None:
+        self._raid = raid_mode_service
+
+    async def execute(
+        self,
+        chat_tgid: str,
+        chat_title: str,
+        item: RaidJoinItemDTO,
+    ) -> bool:
+        """
+        Returns:
+            True, если участник поставлен в очередь и обрабатывать его по одному не нужно.
+        """
+        if not await self._raid.register_join(chat_tgid, item.user_tgid):
+            return False
+
+        schedule = await self._raid.enqueue_join(chat_tgid, item)
+        if schedule is None:
+            return False
+        if not schedule:
+            return True
+
+        try:
+            from tasks.antiraid_tasks import process_raid_join_batch_task
+
+            await (
+                process_raid_join_batch_task.kicker()
+                .with_labels(delay=self._raid.batch_interval_seconds)
+                .kiq(chat_tgid=chat_tgid, chat_title=chat_title)
+            )
+            logger.info(
+                "raid: чат %s в режиме рейда, сводная обработка через %s сек",
+                chat_tgid,
+                self._raid.batch_interval_seconds,
+            )
+        except Exception:
+            logger.exception(
+                "raid: не удалось запланировать обработку очереди chat_tgid=%s",
+                chat_tgid,
+            )
+            await self._raid.withdraw_join(chat_tgid, item)
+            return False
+        return True
@@ -0,0 +1,235 @@
+import asyncio
+import html
+import logging
+
+from constants import (
+    KICK_UNVERIFIED_MEMBER_TTL,
+    RAID_GREETING_MAX_MENTIONS,
+    WELCOME_MESSAGE_NOTIFICATION_TTL,
+    Dialog,
+)
+from constants.enums import MembershipEventType
+from dto.antiraid import (
+    ArchiveMembersDigestDTO,
+    RaidJoinBatchJobDTO,
+    RaidJoinItemDTO,
+)
+from dto.buffer import BufferedMembershipEventDTO
+from exceptions import DatabaseException
+from keyboards.inline.antibot import confirm_humanity_raid_ikb
+from models import ChatSession
+from repositories import ChatMembershipEventRepository
+from services import BotMessageService, BotPermissionService, ChatService
+from services.raid_mode_service import RaidModeService
+from usecases.archive import NotifyArchiveChatMembersDigestUseCase
+from utils.antibot_utils import format_welcome_text
+
+logger = logging.getLogger(__name__)
+
+
+def _format_mentions(items: list[RaidJoinItemDTO]) -> str:
+    """Список упоминаний для сводного приветствия (с ограничением длины)."""
+    mentions = [
+        f"@{item.username}" if item.username else html.escape(item.display_name)
+        for item in items[:RAID_GREETING_MAX_MENTIONS]
+    ]
+    text = ", ".join(mentions)
+    hidden = len(items) - RAID_GREETING_MAX_MENTIONS
+    if hidden > 0:
+        text += Dialog.Antibot.RAID_MORE_MEMBERS.format(count=hidden)
+    return text
+
+
+class ProcessRaidJoinBatchUseCase:
+    """
+    Сводная обработка вступлений в режиме рейда: одна вставка событий,
+    ограничения с паузами, одно приветствие и одна сводка в архив на пачку.
+    """
+
+    def __init__(
+        self,
+        chat_service: ChatService,
+        bot_permission_service: BotPermissionService,
+        bot_message_service: BotMessageService,
+        membership_event_repository: ChatMembershipEventRepository,
+        raid_mode_service: RaidModeService,
+        notify_digest_usecase: NotifyArchiveChatMembersDigestUseCase,
+        restrict_pace_seconds: float,
+    ) -> None:
+        self._chat_service = chat_service
+        self._permission_service = bot_permission_service
+        self._bot_message_service = bot_message_service
+        self._membership_event_repository = membership_event_repository
+        self._raid = raid_mode_service
+        self._notify_digest = notify_digest_usecase
+        self._restrict_pace_seconds = restrict_pace_seconds
+
+    async def execute(self, dto: RaidJoinBatchJobDTO) -> None:
+        items = self._unique_items(dto.items)
+        if not items:
+            return
+
+        chat = await self._chat_service.get_chat(chat_tgid=dto.chat_tgid)
+        if chat is None:
+            logger.info(
+                "raid: чат %s не в БД — пачка из %d вступлений пропущена",
+                dto.chat_tgid,
+                len(items),
+            )
+            return
+
+        await self._record_events(chat, items)
+
+        if chat.is_antibot_enabled:
+            await self._restrict_members(dto.chat_tgid, items)
+
+        await self._send_greeting(dto, chat, items)
+
+        try:
+            await self._notify_digest.execute(
+                ArchiveMembersDigestDTO(
+                    chat_tgid=dto.chat_tgid,
+                    chat_title=dto.chat_title,
+                    members=items,
+                )
+            )
+        except Exception:
+            logger.exception(
+                "raid: ошибка отправки сводки в архив chat_tgid=%s",
+                dto.chat_tgid,
+            )
+
+        logger.info(
+            "raid: обработана пачка вступлений chat_tgid=%s размер=%d",
+            dto.chat_tgid,
+            len(items),
+        )
+
+    @staticmethod
+    def _unique_items(items: list[RaidJoinItemDTO]) -> list[RaidJoinItemDTO]:
+        """Один участник может перезайти несколько раз за интервал — берём последний вход."""
+        by_user: dict[int, RaidJoinItemDTO] = {}
+        for item in items:
+            by_user.pop(item.user_tgid, None)
+            by_user[item.user_tgid] = item
+        return list(by_user.values())
+
+    async def _record_events(
+        self, chat: ChatSession, items: list[RaidJoinItemDTO]
+    ) -> None:
+        events = [
+            BufferedMembershipEventDTO(
+                chat_id=chat.id,
+                user_tgid=item.user_tgid,
+                event_type=MembershipEventType.JOIN.value,
+                created_at=item.joined_at,
+            )
+            for item in items
+        ]
+        try:
+            await self._membership_event_repository.bulk_add_events(events)
+        except DatabaseException:
+            logger.exception(
+                "raid: не удалось записать события вступления chat_id=%s",
+                chat.id,
+            )
+
+    async def _restrict_members(
+        self, chat_tgid: str, items: list[RaidJoinItemDTO]
+    ) -> None:
+        """Мьютит участников по очереди с паузой, чтобы не упираться в лимиты Telegram."""
+        if not await self._permission_service.can_moderate(chat_tgid=chat_tgid):
+            logger.warning(
+                "raid: нет прав модератора в чате %s — %d участников не ограничены",
+                chat_tgid,
+                len(items),
+            )
+            return
+
+        failed = 0
+        for index, item in enumerate(items):
+            if index and self._restrict_pace_seconds:
+                await asyncio.sleep(self._restrict_pace_seconds)
+            success = await self._bot_message_service.mute_chat_member(
+                chat_tg_id=chat_tgid,
+                user_tg_id=item.user_tgid,
+                duration_seconds=0,
+            )
+            if not success:
+                failed += 1
+
+        if failed:
+            logger.error(
+                "raid: не удалось ограничить %d из %d участников в чате %s",
+                failed,
+                len(items),
+                chat_tgid,
+            )
+
+    async def _send_greeting(
+        self,
+        dto: RaidJoinBatchJobDTO,
+        chat: ChatSession,
+        items: list[RaidJoinItemDTO],
+    ) -> None:
+        mentions = _format_mentions(items)
+
+        if chat.is_antibot_enabled:
+            greeting_text = ""
+            if chat.show_welcome_text:
+                greeting_text = self._format_greeting(chat.welcome_text, mentions)
+
+            sent_message = await self._bot_message_service.send_chat_message(
+                chat_tgid=dto.chat_tgid,
+                text=greeting_text + Dialog.Antibot.VERIFY_BUTTON_PROMPT,
+                reply_markup=confirm_humanity_raid_ikb(),
+            )
+            if sent_message is None:
+                return
+
+            await self._raid.add_pending_verification(
+                chat_tgid=dto.chat_tgid,
+                message_id=sent_message.message_id,
+                members=items,
+                ttl=KICK_UNVERIFIED_MEMBER_TTL * 2,
+            )
+
+            from tasks.antiraid_tasks import kick_unverified_raid_members_task
+
+            await (
+                kick_unverified_raid_members_task.kicker()
+                .with_labels(delay=KICK_UNVERIFIED_MEMBER_TTL)
+                .kiq(
+                    chat_id=int(dto.chat_tgid),
+                    message_id=sent_message.message_id,
+                    chat_title=dto.chat_title,
+                )
+            )
+            return
+
+        if not chat.show_welcome_text:
+            return
+
+        sent_message = await self._bot_message_service.send_chat_message(
+            chat_tgid=dto.chat_tgid,
+            text=self._format_greeting(chat.welcome_text, mentions),
+        )
+        if sent_message is None or not chat.auto_delete_welcome_text:
+            return
+
+        from tasks.moderation_tasks import delete_message_from_chat
+
+        await (
+            delete_message_from_chat.kicker()
+            .with_labels(delay=WELCOME_MESSAGE_NOTIFICATION_TTL)
+            .kiq(
+                chat_id=int(dto.chat_tgid),
+                message_id=sent_message.message_id,
+            )
+        )
+
+    @staticmethod
+    def _format_greeting(welcome_text: str | None, mentions: str) -> str:
+        if not welcome_text:
+            return Dialog.Antibot.RAID_GREETING.format(usernames=mentions)
+        return format_welcome_text(welcome_text, mentions)
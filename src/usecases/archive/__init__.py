@@ -5,6 +5,7 @@ from .generate_bind_hash import GenerateArchiveBindHashUseCase
 from .get_archive_settings import ArchiveSettingsResult, GetArchiveSettingsUseCase
 from .notify_member_kicked import NotifyArchiveChatMemberKickedUseCase
 from .notify_member_left import NotifyArchiveChatMemberLeftUseCase
+from .notify_members_digest import NotifyArchiveChatMembersDigestUseCase
 from .notify_new_member import NotifyArchiveChatNewMemberUseCase
 from .set_archive_sending_time import (
     SetArchiveSendingTimeResult,
@@ -19,6 +20,7 @@ __all__ = [
     "GetArchiveSettingsUseCase",
     "NotifyArchiveChatMemberKickedUseCase",
     "NotifyArchiveChatMemberLeftUseCase",
+    "NotifyArchiveChatMembersDigestUseCase",
     "NotifyArchiveChatNewMemberUseCase",
     "SetArchiveSendingTimeResult",
     "SetArchiveSendingTimeUseCase",
@@ -0,0 +1,84 @@
+import logging
+
+from constants import RAID_DIGEST_MAX_MEMBERS, Dialog
+from dto.antiraid import ArchiveMembersDigestDTO
+from services import ChatService
+from services.messaging.bot_message_service import BotMessageService
+from services.time_service import TimeZoneService
+
+logger = logging.getLogger(__name__)
+
+
+class NotifyArchiveChatMembersDigestUseCase:
+    """
+    UseCase для сводного уведомления в архивный чат о группе участников
+    (массовое вступление или кик непроверенных в режиме рейда).
+    """
+
+    def __init__(
+        self,
+        chat_service: ChatService,
+        bot_message_service: BotMessageService,
+    ):
+        self.chat_service = chat_service
+        self.bot_message_service = bot_message_service
+
+    async def execute(self, dto: ArchiveMembersDigestDTO) -> None:
+        """
+        Отправляет одно сообщение со списком участников в архивный чат, если он привязан.
+
+        Args:
+            dto: DTO со списком участников и признаком кика
+        """
+        if not dto.members:
+            return
+
+        chat = await self.chat_service.get_chat_with_archive(chat_tgid=dto.chat_tgid)
+
+        if chat is None or not chat.archive_chat_id:
+            logger.info(
+                "Для чата %s нет архива. Сводка по %d участникам пропущена.",
+                dto.chat_tgid,
+                len(dto.members),
+            )
+            return
+
+        lines = [
+            Dialog.ArchiveNotification.DIGEST_MEMBER_LINE.format(
+                username=f"@{member.username}" if member.username else "Отсутствует",
+                tg_id=member.user_tgid,
+            )
+            for member in dto.members[:RAID_DIGEST_MAX_MEMBERS]
+        ]
+        hidden = len(dto.members) - RAID_DIGEST_MAX_MEMBERS
+        if hidden > 0:
+            lines.append(
+                Dialog.ArchiveNotification.DIGEST_MORE_MEMBERS.format(count=hidden)
+            )
+
+        now = TimeZoneService.now()
+        template = (
+            Dialog.ArchiveNotification.MEMBERS_KICKED_DIGEST
+            if dto.kicked
+            else Dialog.ArchiveNotification.NEW_MEMBERS_DIGEST
+        )
+        report_text = template.format(
+            count=len(dto.members),
+            date=now.strftime("%d.%m.%Y"),
+            time=now.strftime("%H:%M"),
+            chat_title=dto.chat_title,
+            members="\n".join(lines),
+        )
+
+        await self.bot_message_service.send_chat_message(
+            chat_tgid=chat.archive_chat_id,
+            text=report_text,
+        )
+
+        logger.info(
+            "Отправлена сводка (kicked=%s) по %d участникам в архивный чат %s для чата %s",
+            dto.kicked,
+            len(dto.members),
+            chat.archive_chat_id,
+            dto.chat_tgid,
+        )
@@ -1,7 +1,11 @@
 import logging
+import time
 
-from dto.automoderation import AutoModerationBatchJobDTO
+from dto.automoderation import AutoModerationBatchJobDTO, SpamDetectionLLMResultDTO
 from services import IAIService
+from services.automoderation_buffer_service import AutoModerationBufferService
+from services.automoderation_prefilter_service import AutoModerationPrefilterService
+from services.chat.summarize import AIServiceUnavailableError
 
 from .notify_auto_moderation_hit import NotifyAutoModerationHitUseCase
 
@@ -9,15 +13,24 @@ logger = logging.getLogger(__name__)
 
 
 class ProcessAutoModerationBatchUseCase:
-    """Вызов модели по готовой пачке и отправка карточки при срабатывании."""
+    """
+    Вызов модели по готовой пачке и отправка карточки при срабатывании.
+
+    Перед LLM пачка проходит предфильтр: знакомые авторы без ссылок,
+    тексты с известным вердиктом и повторы внутри пачки в модель не уходят.
+    """
 
     def __init__(
         self,
         ai_service: IAIService,
         notify_hit_usecase: NotifyAutoModerationHitUseCase,
+        buffer_service: AutoModerationBufferService,
+        prefilter_service: AutoModerationPrefilterService,
     ) -> None:
         self._ai = ai_service
         self._notify = notify_hit_usecase
+        self._buffer = buffer_service
+        self._prefilter = prefilter_service
 
     async def execute(self, dto: AutoModerationBatchJobDTO) -> None:
         if not dto.batch:
@@ -26,14 +39,35 @@ class ProcessAutoModerationBatchUseCase:
                 dto.chat_tgid,
             )
             return
-        hit = None
-        try:
-            hit = await self._ai.analyze_spam_batch(dto.chat_title, dto.batch)
-        except Exception:
-            logger.exception(
-                "automod: непойманное исключение LLM chat_tgid=%s",
-                dto.chat_tgid,
-            )
+        prefiltered = await self._prefilter.prepare(dto.batch)
+        hit = prefiltered.cached_hit
+        logger.debug(
+            "automod: пачка=%d в LLM=%d знакомые=%d кеш=%d повторы=%d chat_tgid=%s",
+            len(dto.batch),
+            len(prefiltered.candidates),
+            prefiltered.skipped_known,
+            prefiltered.skipped_cached,
+            prefiltered.skipped_duplicates,
+            dto.chat_tgid,
+        )
+        if hit is None and prefiltered.candidates:
+            try:
+                hit = await self._ai.analyze_spam_batch(
+                    dto.chat_title, prefiltered.candidates
+                )
+                await self._prefilter.record(prefiltered, hit)
+            except AIServiceUnavailableError as e:
+                logger.warning(
+                    "automod: модель недоступна, пачка пропущена chat_tgid=%s: %s",
+                    dto.chat_tgid,
+                    e,
+                )
+            except Exception:
+                logger.exception(
+                    "automod: непойманное исключение LLM chat_tgid=%s",
+                    dto.chat_tgid,
+                )
+        await self._record_metrics(dto, hit)
         if not hit:
             logger.debug(
                 "automod: нет срабатывания или ошибка модели chat_tgid=%s",
@@ -58,3 +92,28 @@ class ProcessAutoModerationBatchUseCase:
                 "automod: ошибка отправки карточки в архив chat_tgid=%s",
                 dto.chat_tgid,
             )
+
+    async def _record_metrics(
+        self,
+        dto: AutoModerationBatchJobDTO,
+        hit: SpamDetectionLLMResultDTO | None,
+    ) -> None:
+        """Время ожидания пачки до LLM и время до обнаружения (при срабатывании)."""
+        now = time.time()
+        enqueued = [m.enqueued_at for m in dto.batch if m.enqueued_at is not None]
+        if enqueued:
+            await self._buffer.record_latency("batch_wait", now - min(enqueued))
+        if hit is None:
+            return
+        for item in dto.batch:
+            if item.message_id == hit.message_id and item.enqueued_at is not None:
+                time_to_detection = now - item.enqueued_at
+                await self._buffer.record_latency(
+                    "time_to_detection", time_to_detection
+                )
+                logger.info(
+                    "automod: время до обнаружения %.1f с chat_tgid=%s",
+                    time_to_detection,
+                    dto.chat_tgid,
+                )
+                break
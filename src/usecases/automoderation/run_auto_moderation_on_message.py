@@ -2,26 +2,34 @@ import logging
 
 from dto.automoderation import AutoModerationBufferItemDTO, AutoModerationRunDTO
 from services.automoderation_buffer_service import AutoModerationBufferService
+from services.automoderation_prefilter_service import is_trivially_safe_text
 
 logger = logging.getLogger(__name__)
 
 
 class RunAutoModerationOnMessageUseCase:
-    """Буфер Redis; при заполнении пачки — постановка задачи в очередь (LLM в воркере)."""
+    """
+    Буфер Redis; при сбросе пачки — постановка задачи в очередь (LLM в воркере).
+
+    batch_size — нижняя граница адаптивного порога пачки (см. AutoModerationBufferService).
+    safe_text_max_length — короткие тексты без ссылок не попадают в буфер (0 — все).
+    """
 
     def __init__(
         self,
         buffer_service: AutoModerationBufferService,
         batch_size: int,
+        safe_text_max_length: int = 0,
     ) -> None:
         self._buffer = buffer_service
         self._batch_size = batch_size
+        self._safe_text_max_length = safe_text_max_length
 
     async def execute(self, dto: AutoModerationRunDTO) -> None:
         if not dto.is_auto_moderation_enabled:
             return
         text = (dto.message_text or "").strip()
-        if not text:
+        if not text or is_trivially_safe_text(text, self._safe_text_max_length):
             return
         item = AutoModerationBufferItemDTO(
             username=dto.username,
@@ -34,6 +42,8 @@ class RunAutoModerationOnMessageUseCase:
                 dto.chat_tgid,
                 item,
                 self._batch_size,
+                chat_title=dto.chat_title,
+                archive_chat_tgid=dto.archive_chat_tgid,
             )
         except Exception:
             logger.exception(
@@ -10,6 +10,7 @@ from services import (
     AdminActionLogService,
     BotPermissionService,
     ChatService,
+    TrackingIndexService,
     UserService,
 )
 from services.permissions.bot_permission import BotPermissionsCheck
@@ -43,12 +44,14 @@ class RemoveChatFromTrackingUseCase:
         user_service: UserService,
         chat_service: ChatService,
         bot_permission_service: BotPermissionService,
+        tracking_index: TrackingIndexService,
     ):
         self._chat_tracking_repository = chat_tracking_repository
         self._admin_action_log_service = admin_action_log_service
         self._user_service = user_service
         self._chat_service = chat_service
         self._bot_permission_service = bot_permission_service
+        self._tracking_index = tracking_index
 
     async def execute(
         self,
@@ -142,6 +145,8 @@ class RemoveChatFromTrackingUseCase:
                 return result
 
             result.success = True
+            await self._tracking_index.invalidate_admin(admin)
+            await self._tracking_index.invalidate_chat(chat.id)
 
             # 6. Логируем действие администратора
             admin_who = f"@{admin.username}" if admin.username else f"ID:{admin.tg_id}"
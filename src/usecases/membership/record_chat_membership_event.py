@@ -1,22 +1,31 @@
 import logging
 
+from dto.buffer import BufferedMembershipEventDTO
 from dto.membership_event import RecordChatMembershipEventDTO
 from repositories import ChatMembershipEventRepository
-from services import ChatService
+from services import AnalyticsBufferService, ChatService
+from services.time_service import TimeZoneService
 
 logger = logging.getLogger(__name__)
 
 
 class RecordChatMembershipEventUseCase:
-    """Запись события вступления или ухода участника (если чат есть в БД)."""
+    """
+    Запись события вступления или ухода участника (если чат есть в БД).
+
+    Событие уходит в Redis-буфер и вставляется пачкой фоновой задачей;
+    без Redis — пишется в БД сразу.
+    """
 
     def __init__(
         self,
         chat_service: ChatService,
         membership_event_repository: ChatMembershipEventRepository,
+        buffer_service: AnalyticsBufferService,
     ) -> None:
         self._chat_service = chat_service
         self._membership_event_repository = membership_event_repository
+        self._buffer_service = buffer_service
 
     async def execute(self, dto: RecordChatMembershipEventDTO) -> None:
         chat = await self._chat_service.get_chat(chat_tgid=dto.chat_tgid)
@@ -29,6 +38,17 @@ class RecordChatMembershipEventUseCase:
             )
             return
 
+        buffered = await self._buffer_service.add_membership_event(
+            BufferedMembershipEventDTO(
+                chat_id=chat.id,
+                user_tgid=dto.user_tgid,
+                event_type=dto.event_type.value,
+                created_at=TimeZoneService.now(),
+            )
+        )
+        if buffered:
+            return
+
         await self._membership_event_repository.add(
             chat_id=chat.id,
             user_tgid=dto.user_tgid,
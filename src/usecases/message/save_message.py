@@ -1,7 +1,10 @@
+from typing import Optional
+
 from dto.buffer import BufferedMessageDTO
 from dto.message import CreateMessageDTO
 from services.analytics_buffer_service import AnalyticsBufferService
 from services.chat.chat_service import ChatService
+from services.update_context import UpdateContext
 from services.user.user_service import UserService
 
 
@@ -16,21 +19,31 @@ class SaveMessageUseCase:
         self.user_service = user_service
         self.chat_service = chat_service
 
-    async def execute(self, message_dto: CreateMessageDTO) -> None:
+    async def execute(
+        self,
+        message_dto: CreateMessageDTO,
+        update_context: Optional[UpdateContext] = None,
+    ) -> None:
         """
         Сохраняет сообщение в буфер Redis для последующей батч-обработки.
 
         Возвращает "заглушку" ResultMessageDTO, так как сообщение еще не сохранено в БД.
         ID будет присвоен после обработки воркером.
-        """
 
-        user = await self.user_service.get_or_create(
-            tg_id=message_dto.user_tgid,
-            username=message_dto.user_username,
-        )
-        chat = await self.chat_service.get_or_create(
-            chat_tgid=message_dto.chat_tgid,
-        )
+        Если передан update_context, пользователь и чат берутся из него
+        (и остаются загруженными для следующих шагов обработки апдейта).
+        """
+        if update_context is not None:
+            user = await update_context.get_user()
+            chat = await update_context.get_chat()
+        else:
+            user = await self.user_service.get_or_create(
+                tg_id=message_dto.user_tgid,
+                username=message_dto.user_username,
+            )
+            chat = await self.chat_service.get_or_create(
+                chat_tgid=message_dto.chat_tgid,
+            )
 
         # Конвертируем CreateMessageDTO в BufferedMessageDTO
         buffered_dto = BufferedMessageDTO(
@@ -44,4 +57,4 @@ class SaveMessageUseCase:
         )
 
         # Добавляем в буфер Redis
-        await self.buffer_service.add_message(buffered_dto)
+        await self.buffer_service.add_message(buffered_dto, username=user.username)
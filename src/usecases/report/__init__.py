@@ -1,6 +1,8 @@
 from .chat.get_chat_breaks_detail_report import GetChatBreaksDetailReportUseCase
+from .chat.get_chat_day_activity import GetChatDayActivityUseCase
 from .chat.get_chat_report import GetChatReportUseCase
 from .chat.send_daily_chat_reports import SendDailyChatReportsUseCase
+from .export_report import ExportReportUseCase
 from .user.get_all_users_breaks_detail_report import (
     GetAllUsersBreaksDetailReportUseCase,
 )
@@ -15,5 +17,7 @@ __all__ = [
     "GetBreaksDetailReportUseCase",
     "GetAllUsersBreaksDetailReportUseCase",
     "GetChatBreaksDetailReportUseCase",
+    "GetChatDayActivityUseCase",
     "SendDailyChatReportsUseCase",
+    "ExportReportUseCase",
 ]
@@ -3,7 +3,17 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import date, datetime, timedelta
 from statistics import mean, median
-from typing import Any, Awaitable, Callable, List, Optional, Sequence, TypeVar, Union, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from pydantic import BaseModel
 
@@ -20,6 +30,7 @@ from repositories import (
     UserRepository,
 )
 from services.break_analysis_service import BreakAnalysisService
+from services.user import TrackingIndexService
 from services.time_service import TimeZoneService
 from services.work_time_service import WorkTimeService
 from utils.formatter import format_selected_period
@@ -38,6 +49,7 @@ class BaseReportUseCase(ABC):
         user_repository: UserRepository,
         reaction_repository: MessageReactionRepository,
         chat_repository: ChatRepository,
+        tracking_index: TrackingIndexService,
         punishment_repository: PunishmentRepository = None,
     ):
         self._msg_reply_repository = msg_reply_repository
@@ -46,12 +58,19 @@ class BaseReportUseCase(ABC):
         self._reaction_repository = reaction_repository
         self._chat_repository = chat_repository
         self._punishment_repository = punishment_repository
+        self._tracking_index = tracking_index
 
     @abstractmethod
     async def execute(self, dto: BaseModel) -> Any:
         """Абстрактный метод выполнения use case. Принимает DTO из src/dto."""
         ...
 
+    async def _get_tracked_chat_ids(self, admin_tg_id: str) -> List[int]:
+        """ID чатов, к которым у админа есть доступ (пусто, если админа нет)."""
+        admin = await self._user_repository.get_user_by_tg_id(tg_id=admin_tg_id)
+        if admin is None:
+            return []
+        return await self._tracking_index.get_tracked_chat_ids(admin.id)
 
     async def _get_processed_items_by_user(
         self,
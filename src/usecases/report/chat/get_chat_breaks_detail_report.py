@@ -15,7 +15,7 @@ class GetChatBreaksDetailReportUseCase(ChatReportUseCase):
     async def execute(self, dto: ChatReportDTO) -> BreaksDetailReportDTO:
         """Генерирует детализированный отчет по перерывам для чата."""
         # Получаем отслеживаемых пользователей
-        users = await self._user_repository.get_tracked_users_for_admin(
+        users = await self._tracking_index.get_tracked_users(
             admin_tg_id=dto.admin_tg_id,
         )
 
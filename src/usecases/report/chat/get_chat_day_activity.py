@@ -0,0 +1,70 @@
+import logging
+from datetime import date, datetime, time
+
+from dto.daily_activity import ChatDayActivityDTO
+from repositories import MessageRepository, UserRepository
+from services.analytics_buffer_service import AnalyticsBufferService
+from services.time_service import TimeZoneService
+
+logger = logging.getLogger(__name__)
+
+
+class GetChatDayActivityUseCase:
+    """
+    Лидерборд по сообщениям и число активных пользователей чата за день.
+
+    Сегодняшний день читается из живых счётчиков Redis (sorted set и
+    HyperLogLog, которые ведёт AnalyticsBufferService) без запросов к
+    chat_messages. Прошлые дни и неполные счётчики считаются по БД.
+    """
+
+    def __init__(
+        self,
+        buffer_service: AnalyticsBufferService,
+        message_repository: MessageRepository,
+        user_repository: UserRepository,
+    ) -> None:
+        self._buffer = buffer_service
+        self._message_repository = message_repository
+        self._user_repository = user_repository
+
+    async def execute(
+        self, chat_id: int, day: date | None = None, limit: int = 10
+    ) -> ChatDayActivityDTO:
+        today = TimeZoneService.now().date()
+        day = day or today
+
+        if day == today:
+            live = await self._buffer.get_live_day_stats(chat_id, day, limit)
+            if live is not None:
+                top_users, active_users = live
+                return ChatDayActivityDTO(
+                    chat_id=chat_id,
+                    day=day,
+                    top_users=top_users,
+                    active_users_count=active_users,
+                    live=True,
+                )
+            logger.debug("Живые счётчики chat_id=%s неполные, считаем по БД", chat_id)
+
+        tz = TimeZoneService.DEFAULT_TIMEZONE
+        start_date = tz.localize(datetime.combine(day, time.min))
+        end_date = tz.localize(datetime.combine(day, time.max))
+        top_users = await self._message_repository.get_daily_top_users(
+            chat_id=chat_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+        )
+        active_users = await self._user_repository.total_active_users(
+            chat_id=chat_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        return ChatDayActivityDTO(
+            chat_id=chat_id,
+            day=day,
+            top_users=top_users,
+            active_users_count=active_users,
+            live=False,
+        )
@@ -26,7 +26,11 @@ from repositories import (
     PunishmentRepository,
     UserRepository,
 )
-from services import AdminActionLogService, BotPermissionService
+from services import (
+    AdminActionLogService,
+    BotPermissionService,
+    TrackingIndexService,
+)
 from services.break_analysis_service import BreakAnalysisService
 from services.time_service import TimeZoneService
 from services.work_time_service import WorkTimeService
@@ -64,6 +68,7 @@ class GetChatReportUseCase:
         reaction_repository: MessageReactionRepository,
         msg_reply_repository: MessageReplyRepository,
         punishment_repository: PunishmentRepository,
+        tracking_index: TrackingIndexService,
         bot_permission_service: BotPermissionService = None,
         admin_action_log_service: AdminActionLogService = None,
     ) -> None:
@@ -75,6 +80,7 @@ class GetChatReportUseCase:
         self._punishment_repository = punishment_repository
         self._bot_permission_service = bot_permission_service
         self._admin_action_log_service = admin_action_log_service
+        self._tracking_index = tracking_index
 
     async def execute(self, dto: ChatReportDTO) -> ReportResultDTO:
         chat = await self._chat_repository.get_chat_by_id(chat_id=dto.chat_id)
@@ -185,10 +191,7 @@ class GetChatReportUseCase:
         )
 
     async def _get_tracked_users_ids(self, admin_tg_id: str) -> list[int]:
-        tracked_users = await self._user_repository.get_tracked_users_for_admin(
-            admin_tg_id=admin_tg_id
-        )
-        return [user.id for user in tracked_users]
+        return await self._tracking_index.get_tracked_user_ids(admin_tg_id)
 
     async def _get_chat_data(
         self,
@@ -3,7 +3,7 @@ import logging
 from collections import defaultdict
 from datetime import datetime
 from statistics import mean, median
-from typing import Any, Awaitable, Callable, Dict, List, Set, TypeVar
+from typing import Awaitable, Callable, Dict, List, Set, Tuple, TypedDict, TypeVar
 
 from aiogram.exceptions import TelegramAPIError
 
@@ -11,11 +11,10 @@ from constants.dialogs import ReportDialogs
 from constants.period import TimePeriod
 from exceptions import BotBaseException
 from models import ChatMessage, ChatSession, MessageReaction, MessageReply
-from models.user import User
 from repositories import ChatRepository, MessageRepository, UserRepository
 from repositories.message_reply_repository import MessageReplyRepository
 from repositories.reaction_repository import MessageReactionRepository
-from services import BotMessageService
+from services import BotMessageService, TrackingIndexService
 from services.break_analysis_service import BreakAnalysisService
 from services.time_service import TimeZoneService
 from services.work_time_service import WorkTimeService
@@ -26,6 +25,14 @@ T = TypeVar("T", ChatMessage, MessageReply, MessageReaction)
 logger = logging.getLogger(__name__)
 
 
+class _ChatData(TypedDict):
+    """Активность отслеживаемых пользователей чата за период отчета."""
+
+    messages: List[ChatMessage]
+    replies: List[MessageReply]
+    reactions: List[MessageReaction]
+
+
 class SendDailyChatReportsUseCase:
     """UseCase для автоматической отправки ежедневных отчетов по чатам в архивные чаты."""
 
@@ -37,6 +44,8 @@ class SendDailyChatReportsUseCase:
         msg_reply_repository: MessageReplyRepository,
         reaction_repository: MessageReactionRepository,
         bot_message_service: BotMessageService,
+        tracking_index: TrackingIndexService,
+        send_pace_seconds: float = 0.0,
     ):
         self._chat_repository = chat_repository
         self._user_repository = user_repository
@@ -44,6 +53,8 @@ class SendDailyChatReportsUseCase:
         self._msg_reply_repository = msg_reply_repository
         self._reaction_repository = reaction_repository
         self._bot_message_service = bot_message_service
+        self._tracking_index = tracking_index
+        self._send_pace_seconds = send_pace_seconds
 
     async def execute(
         self,
@@ -79,18 +90,15 @@ class SendDailyChatReportsUseCase:
             return
 
         # Сбор всех отслеживаемых пользователей
-        tracked_user_ids = await self._get_all_tracked_user_ids(chat=chat)
+        tracked_by_chat = await self._tracking_index.get_tracked_user_ids_by_chats(
+            [chat.id]
+        )
+        tracked_user_ids = sorted(tracked_by_chat[chat.id])
 
         # Определение временного периода
         start_date, end_date = TimePeriod.to_datetime(period)
 
-        adjusted_start, adjusted_end = WorkTimeService.adjust_dates_to_work_hours(
-            start_date,
-            end_date,
-            work_start=chat.start_time,
-            work_end=chat.end_time,
-            tolerance=chat.tolerance,
-        )
+        adjusted_start, adjusted_end = self._work_period(chat, start_date, end_date)
 
         # Обработка чата
         try:
@@ -115,38 +123,107 @@ class SendDailyChatReportsUseCase:
         )
 
         if report:
-            try:
-                await self._bot_message_service.send_chat_message(
-                    chat_tgid=chat.archive_chat_id,
-                    text=report,
-                )
-            except TelegramAPIError as e:
-                logger.error(
-                    "Ошибка при отправке отчета в архивный чат %s: %s",
-                    chat.title,
-                    e,
-                    exc_info=True,
-                )
-            return
+            await self._send_report(chat=chat, report=report)
 
-    async def _get_all_tracked_user_ids(self, chat: ChatSession) -> List[int]:
-        """Собирает ID всех отслеживаемых пользователей для списка чатов."""
-        admins_set: Set[User] = set()
+    async def execute_batch(self, chat_ids: List[int], period: str) -> None:
+        """
+        Генерирует и отправляет отчеты сразу по нескольким чатам.
 
-        # Получаем админов для чата
-        admins = await self._user_repository.get_admins_for_chat(
-            chat_tg_id=chat.chat_id
+        Отслеживаемые пользователи и активность загружаются для всего пакета
+        несколькими запросами вместо трёх-четырёх на каждый чат, а отправки в
+        архивные чаты идут последовательно с паузой send_pace_seconds, чтобы
+        сгладить пик в популярное время рассылки.
+
+        Args:
+            chat_ids: ID чатов, по которым генерируются отчеты
+            period: Период для отчета
+        """
+        logger.info(
+            "Начало пакетной генерации отчетов: чатов=%d, period=%s",
+            len(chat_ids),
+            period,
         )
-        admins_set.update(admins)
 
-        tracked_users_set: Set[User] = set()
-        for admin in admins_set:
-            users = await self._user_repository.get_tracked_users_for_admin(
-                admin_tg_id=admin.tg_id
+        chats = await self._chat_repository.get_chats_by_ids(chat_ids=chat_ids)
+        ready_chats: List[ChatSession] = []
+        for chat in chats:
+            if not chat.archive_chat_id:
+                logger.warning("Чат не имеет архива: chat_id=%d", chat.id)
+                continue
+            if not self._has_time_settings(chat=chat):
+                await self._notify_admins_missing_settings(chat=chat)
+                continue
+            ready_chats.append(chat)
+
+        if not ready_chats:
+            return
+
+        start_date, end_date = TimePeriod.to_datetime(period)
+        periods = {
+            chat.id: self._work_period(chat, start_date, end_date)
+            for chat in ready_chats
+        }
+        tracked_by_chat = await self._tracking_index.get_tracked_user_ids_by_chats(
+            [chat.id for chat in ready_chats]
+        )
+
+        try:
+            data_by_chat = await self._fetch_batch_data(
+                chats=ready_chats,
+                periods=periods,
+                tracked_by_chat=tracked_by_chat,
             )
-            tracked_users_set.update(users)
+        except BotBaseException as e:
+            logger.error("Ошибка при пакетной загрузке данных: %s", e, exc_info=True)
+            return
+
+        for index, chat in enumerate(ready_chats):
+            if index and self._send_pace_seconds:
+                await asyncio.sleep(self._send_pace_seconds)
+
+            adjusted_start, adjusted_end = periods[chat.id]
+            report = self._generate_chat_report(
+                chat=chat,
+                data=data_by_chat[chat.id],
+                start_date=adjusted_start,
+                end_date=adjusted_end,
+                tracked_user_ids=list(tracked_by_chat.get(chat.id, ())),
+            )
+            if report:
+                await self._send_report(chat=chat, report=report)
+
+    @staticmethod
+    def _work_period(
+        chat: ChatSession, start_date: datetime, end_date: datetime
+    ) -> Tuple[datetime, datetime]:
+        """Период отчета в рабочих часах чата (настройки проверены заранее)."""
+        if chat.start_time is None or chat.end_time is None or chat.tolerance is None:
+            raise ValueError(f"У чата {chat.id} не заданы рабочие часы")
+        return WorkTimeService.adjust_dates_to_work_hours(
+            start_date,
+            end_date,
+            work_start=chat.start_time,
+            work_end=chat.end_time,
+            tolerance=chat.tolerance,
+        )
 
-        return [user.id for user in tracked_users_set]
+    async def _send_report(self, chat: ChatSession, report: str) -> None:
+        archive_chat_id = chat.archive_chat_id
+        if not archive_chat_id:
+            logger.warning("Чат не имеет архива: chat_id=%d", chat.id)
+            return
+        try:
+            await self._bot_message_service.send_chat_message(
+                chat_tgid=archive_chat_id,
+                text=report,
+            )
+        except TelegramAPIError as e:
+            logger.error(
+                "Ошибка при отправке отчета в архивный чат %s: %s",
+                chat.title,
+                e,
+                exc_info=True,
+            )
 
     async def _fetch_chat_data(
         self,
@@ -154,12 +231,11 @@ class SendDailyChatReportsUseCase:
         tracked_user_ids: list[int],
         start_date: datetime,
         end_date: datetime,
-    ) -> Dict[str, List[Any]]:
+    ) -> _ChatData:
         """
         Параллельно загружает сообщения, ответы и реакции для конкретного чата.
         """
-        # Формируем задачи
-        tasks = [
+        messages, replies, reactions = await asyncio.gather(
             self._get_processed_items(
                 self._message_repository.get_messages_by_chat_id_and_period,
                 chat.id,
@@ -181,10 +257,7 @@ class SendDailyChatReportsUseCase:
                 end_date,
                 tracked_user_ids,
             ),
-        ]
-
-        # Запускаем параллельно
-        messages, replies, reactions = await asyncio.gather(*tasks)
+        )
 
         return {
             "messages": messages,
@@ -192,6 +265,70 @@ class SendDailyChatReportsUseCase:
             "reactions": reactions,
         }
 
+    async def _fetch_batch_data(
+        self,
+        chats: List[ChatSession],
+        periods: Dict[int, Tuple[datetime, datetime]],
+        tracked_by_chat: Dict[int, Set[int]],
+    ) -> Dict[int, _ChatData]:
+        """
+        Загружает сообщения, ответы и реакции всех чатов пакета тремя запросами
+        по объединённому периоду и раскладывает их по чатам с учётом рабочего
+        времени и отслеживаемых пользователей каждого чата.
+        """
+        data_by_chat: Dict[int, _ChatData] = {
+            chat.id: {"messages": [], "replies": [], "reactions": []} for chat in chats
+        }
+        all_tracked = set().union(*tracked_by_chat.values())
+        if not all_tracked:
+            return data_by_chat
+
+        chat_ids = list(data_by_chat)
+        tracked_user_ids = sorted(all_tracked)
+        start_date = min(start for start, _ in periods.values())
+        end_date = max(end for _, end in periods.values())
+
+        messages, replies, reactions = await asyncio.gather(
+            self._message_repository.get_messages_by_chat_ids_and_period(
+                chat_ids=chat_ids,
+                start_date=start_date,
+                end_date=end_date,
+                tracked_user_ids=tracked_user_ids,
+            ),
+            self._msg_reply_repository.get_replies_by_chat_ids_and_period(
+                chat_ids=chat_ids,
+                start_date=start_date,
+                end_date=end_date,
+                tracked_user_ids=tracked_user_ids,
+            ),
+            self._reaction_repository.get_reactions_by_chat_ids_and_period(
+                chat_ids=chat_ids,
+                start_date=start_date,
+                end_date=end_date,
+                tracked_user_ids=tracked_user_ids,
+            ),
+        )
+
+        def in_report(
+            item: ChatMessage | MessageReply | MessageReaction, user_id: int
+        ) -> bool:
+            chat_start, chat_end = periods[item.chat_id]
+            return chat_start <= item.created_at <= chat_end and user_id in (
+                tracked_by_chat.get(item.chat_id, ())
+            )
+
+        for message in self._convert_to_local_time(messages):
+            if in_report(message, message.user_id):
+                data_by_chat[message.chat_id]["messages"].append(message)
+        for reply in self._convert_to_local_time(replies):
+            if in_report(reply, reply.reply_user_id):
+                data_by_chat[reply.chat_id]["replies"].append(reply)
+        for reaction in self._convert_to_local_time(reactions):
+            if in_report(reaction, reaction.user_id):
+                data_by_chat[reaction.chat_id]["reactions"].append(reaction)
+
+        return data_by_chat
+
     async def _get_processed_items(
         self,
         repository_method: Callable[..., Awaitable[List[T]]],
@@ -206,7 +343,10 @@ class SendDailyChatReportsUseCase:
             end_date=end_date,
             tracked_user_ids=tracked_user_ids,
         )
-        # Конвертация времени
+        return self._convert_to_local_time(items)
+
+    @staticmethod
+    def _convert_to_local_time(items: List[T]) -> List[T]:
         for item in items:
             item.created_at = TimeZoneService.convert_to_local_time(dt=item.created_at)
         return items
@@ -214,7 +354,7 @@ class SendDailyChatReportsUseCase:
     def _generate_chat_report(
         self,
         chat: ChatSession,
-        data: Dict[str, List[Any]],
+        data: _ChatData,
         start_date: datetime,
         end_date: datetime,
         tracked_user_ids: list[int],
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, time
 
 from constants.enums import AdminActionType
 from dto.daily_activity import ChatDailyStatsDTO
@@ -11,8 +11,11 @@ from repositories import (
 )
 from repositories.reaction_repository import MessageReactionRepository
 from services import AdminActionLogService, BotPermissionService
+from services.time_service import TimeZoneService
 from utils.date_utils import validate_and_normalize_period
 
+from .chat.get_chat_day_activity import GetChatDayActivityUseCase
+
 
 @dataclass
 class UserActivity:
@@ -30,6 +33,7 @@ class GetDailyTopUsersUseCase:
         bot_permission_service: BotPermissionService,
         admin_action_log_service: AdminActionLogService,
         membership_event_repository: ChatMembershipEventRepository,
+        day_activity_usecase: GetChatDayActivityUseCase,
     ):
         self._user_repository = user_repository
         self._message_repository = message_repository
@@ -38,6 +42,7 @@ class GetDailyTopUsersUseCase:
         self._bot_permission_service = bot_permission_service
         self._admin_action_log_service = admin_action_log_service
         self._membership_event_repository = membership_event_repository
+        self._day_activity = day_activity_usecase
 
     async def execute(
         self,
@@ -65,13 +70,23 @@ class GetDailyTopUsersUseCase:
         chat = await self._chat_repository.get_chat_by_id(chat_id)
         chat_title = chat.title if chat else "Неизвестный чат"
 
-        # Получаем топ пользователей
-        top_users = await self._message_repository.get_daily_top_users(
-            chat_id=chat_id,
-            start_date=start_date,
-            end_date=end_date,
-            limit=10,
+        # Топ пользователей и активные: за один день — через живые счётчики
+        # (сегодня) или дневной запрос, иначе — по БД за период
+        day = self._single_day(start_date, end_date)
+        day_activity = (
+            await self._day_activity.execute(chat_id=chat_id, day=day, limit=10)
+            if day is not None
+            else None
         )
+        if day_activity is not None:
+            top_users = day_activity.top_users
+        else:
+            top_users = await self._message_repository.get_daily_top_users(
+                chat_id=chat_id,
+                start_date=start_date,
+                end_date=end_date,
+                limit=10,
+            )
 
         # Получаем топ по реакциям
         top_reactors = await self._reaction_repository.get_daily_top_reactors(
@@ -95,6 +110,7 @@ class GetDailyTopUsersUseCase:
             chat_db_id=chat_id,
             start_date=start_date,
             end_date=end_date,
+            active_users=day_activity.active_users_count if day_activity else None,
         )
 
         joins_count = 0
@@ -141,25 +157,38 @@ class GetDailyTopUsersUseCase:
             removed_count=removed_count,
         )
 
+    @staticmethod
+    def _single_day(start_date: datetime, end_date: datetime) -> date | None:
+        """День периода, если период начинается в полночь и не выходит за сутки."""
+        start = TimeZoneService.convert_to_local_time(start_date)
+        end = TimeZoneService.convert_to_local_time(end_date)
+        if start.time() == time.min and start.date() == end.date():
+            return start.date()
+        return None
+
     async def _get_chat_activity_info(
         self,
         chat_tgid: str,
         chat_db_id: int,
         start_date: datetime,
         end_date: datetime,
+        active_users: int | None = None,
     ) -> UserActivity:
         """
         Получает общее количество активных пользователей
         и количество участников в чате.
+
+        active_users — уже посчитанное число активных (например, из живых счётчиков).
         """
-        activity_users = await self._user_repository.total_active_users(
-            chat_id=chat_db_id,
-            start_date=start_date,
-            end_date=end_date,
-        )
+        if active_users is None:
+            active_users = await self._user_repository.total_active_users(
+                chat_id=chat_db_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
 
         total_users = await self._bot_permission_service.get_total_members(
             chat_tgid=chat_tgid
         )
 
-        return UserActivity(total_users=total_users, active_users=activity_users)
+        return UserActivity(total_users=total_users, active_users=active_users)
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 class GetAllUsersBreaksDetailReportUseCase(BaseReportUseCase):
     async def execute(self, dto: AllUsersReportDTO) -> BreaksDetailReportDTO:
         """Генерирует детализированный отчет по перерывам для всех пользователей."""
-        users = await self._user_repository.get_tracked_users_for_admin(
+        users = await self._tracking_index.get_tracked_users(
             admin_tg_id=dto.user_tg_id,
         )
 
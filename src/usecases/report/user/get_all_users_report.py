@@ -18,7 +18,7 @@ from repositories import (
     PunishmentRepository,
     UserRepository,
 )
-from services import AdminActionLogService
+from services import AdminActionLogService, TrackingIndexService
 from services.work_time_service import WorkTimeService
 from utils.collection_utils import group_by
 
@@ -37,6 +37,7 @@ class GetAllUsersReportUseCase(BaseReportUseCase):
         chat_repository: ChatRepository,
         punishment_repository: PunishmentRepository,
         admin_action_log_service: AdminActionLogService,
+        tracking_index: TrackingIndexService,
     ) -> None:
         super().__init__(
             msg_reply_repository,
@@ -44,6 +45,7 @@ class GetAllUsersReportUseCase(BaseReportUseCase):
             user_repository,
             reaction_repository,
             chat_repository,
+            tracking_index,
             punishment_repository,
         )
         self._admin_action_log_service = admin_action_log_service
@@ -67,7 +69,7 @@ class GetAllUsersReportUseCase(BaseReportUseCase):
             end_date=adjusted_end,
         )
 
-        users = await self._user_repository.get_tracked_users_for_admin(
+        users = await self._tracking_index.get_tracked_users(
             admin_tg_id=dto.user_tg_id,
         )
 
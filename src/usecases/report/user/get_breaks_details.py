@@ -38,14 +38,10 @@ class GetBreaksDetailReportUseCase(BaseReportUseCase):
     async def _get_user_data(self, user: User, dto: SingleUserReportDTO) -> dict:
         """Получает данные пользователя за период."""
         # Проверяем наличие отслеживаемых чатов
-        tracked_chats = await self._chat_repository.get_tracked_chats_for_admin(
-            dto.admin_tg_id
-        )
-        if not tracked_chats:
+        tracked_chat_ids = await self._get_tracked_chat_ids(dto.admin_tg_id)
+        if not tracked_chat_ids:
             return {"no_chats": True}
 
-        tracked_chat_ids = [chat.id for chat in tracked_chats]
-
         messages = await self._get_processed_items_by_user_in_chats(
             repository_method=self._message_repository.get_messages_by_period_date_and_chats,
             user_id=user.id,
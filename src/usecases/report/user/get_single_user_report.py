@@ -18,7 +18,7 @@ from repositories import (
     PunishmentRepository,
     UserRepository,
 )
-from services import AdminActionLogService
+from services import AdminActionLogService, TrackingIndexService
 from services.work_time_service import WorkTimeService
 
 from .base import BaseReportUseCase
@@ -36,6 +36,7 @@ class GetSingleUserReportUseCase(BaseReportUseCase):
         chat_repository: ChatRepository,
         punishment_repository: PunishmentRepository,
         admin_action_log_service: AdminActionLogService,
+        tracking_index: TrackingIndexService,
     ) -> None:
         super().__init__(
             msg_reply_repository,
@@ -43,6 +44,7 @@ class GetSingleUserReportUseCase(BaseReportUseCase):
             user_repository,
             reaction_repository,
             chat_repository,
+            tracking_index,
             punishment_repository,
         )
         self._admin_action_log_service = admin_action_log_service
@@ -174,14 +176,10 @@ class GetSingleUserReportUseCase(BaseReportUseCase):
     ) -> dict:
         """Получает все данные пользователя за период."""
         # Проверяем наличие отслеживаемых чатов
-        tracked_chats = await self._chat_repository.get_tracked_chats_for_admin(
-            dto.admin_tg_id
-        )
-        if not tracked_chats:
+        tracked_chat_ids = await self._get_tracked_chat_ids(dto.admin_tg_id)
+        if not tracked_chat_ids:
             return {"no_chats": True}
 
-        tracked_chat_ids = [chat.id for chat in tracked_chats]
-
         replies = await self._get_processed_items_by_user_in_chats(
             repository_method=self._msg_reply_repository.get_replies_by_period_date_and_chats,
             user_id=user.id,
@@ -1,7 +1,7 @@
 import logging
 
 from repositories import ChatTrackingRepository, UserTrackingRepository
-from services import UserService
+from services import TrackingIndexService, UserService
 
 logger = logging.getLogger(__name__)
 
@@ -14,10 +14,12 @@ class ResetAllTrackingUseCase:
         user_service: UserService,
         user_tracking_repository: UserTrackingRepository,
         chat_tracking_repository: ChatTrackingRepository,
+        tracking_index: TrackingIndexService,
     ):
         self._user_service = user_service
         self._user_tracking_repository = user_tracking_repository
         self._chat_tracking_repository = chat_tracking_repository
+        self._tracking_index = tracking_index
 
     async def execute(self, admin_tgid: str) -> None:
         """
@@ -33,6 +35,11 @@ class ResetAllTrackingUseCase:
                 logger.error(f"Администратор с tg_id={admin_tgid} не найден")
                 return
 
+            # Чаты запоминаем до удаления, чтобы сбросить их записи в индексе
+            tracked_chats = await self._chat_tracking_repository.get_all_tracked_chats(
+                admin_id=admin.id
+            )
+
             # Удаляем всех отслеживаемых пользователей
             deleted_users_count = (
                 await self._user_tracking_repository.delete_all_tracked_users_for_admin(
@@ -47,6 +54,10 @@ class ResetAllTrackingUseCase:
                 )
             )
 
+            await self._tracking_index.invalidate_admin(admin)
+            for chat in tracked_chats:
+                await self._tracking_index.invalidate_chat(chat.id)
+
             logger.info(
                 "Сброшены настройки для администратора %s (id=%s): "
                 "удалено %d пользователей и %d чатов",
@@ -1,18 +1,55 @@
 import logging
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
 from config import settings
 from constants.enums import AdminActionType, SummaryType
+from constants.promps import SUMMARY_PARTIALS_PREAMBLE
 from repositories import ChatRepository, MessageRepository, UserTrackingRepository
 from services import AdminActionLogService
 from services.caching import ICache
 from services.chat.summarize import IAIService
-from utils.text_preprocessor import format_messages_for_llm
+from services.chat.summarize.ai_service_base import SummaryResult
+from services.time_service import TimeZoneService
+from utils.text_preprocessor import (
+    estimate_tokens,
+    format_message_line,
+    split_lines_by_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
+# Сколько раз конспекты сворачиваются повторно, прежде чем их обрезать по бюджету
+_MAX_REDUCE_LEVELS = 3
+
+
+@dataclass
+class _SummaryWindow:
+    """Сообщения одного временного окна: (id, строка лога) в хронологическом порядке."""
+
+    start: datetime
+    lines: list[tuple[int, str]] = field(default_factory=list)
+    # False — часть сообщений окна отрезана началом периода или лимитом выборки
+    complete: bool = True
+
+    @property
+    def max_id(self) -> int:
+        # Порядок по времени не совпадает с порядком id (правки, импорт
+        # истории), поэтому берём максимум, а не id последней строки
+        return max(msg_id for msg_id, _ in self.lines)
+
 
 class GetChatSummaryUseCase:
+    """
+    Сводка чата.
+
+    Небольшой лог уходит в LLM одним запросом. Большой — разбивается на окна
+    (SUMMARY_WINDOW_MINUTES); для каждого окна в кеше хранятся конспекты (map),
+    и повторно конспектируются только сообщения, пришедшие после прошлого запуска.
+    Окно, начало которого отрезано периодом или лимитом, конспектируется без
+    кеша. Финальная сводка строится по конспектам (reduce).
+    """
+
     def __init__(
         self,
         msg_repository: MessageRepository,
@@ -53,19 +90,22 @@ class GetChatSummaryUseCase:
                 return summary
 
         # Если в кеше нет или сообщений много - генерируем заново
-        messages = await self._msg_repo.get_messages_for_summary(
+        rows = await self._msg_repo.get_messages_for_summary_windows(
             chat_id=chat_id,
             limit=msg_limit,
             start_date=start_date,
             end_date=end_date,
         )
 
-        if not messages:
-            return "Нет сообщений для сводки."
-
-        formatted_text, real_count = format_messages_for_llm(messages=messages)
+        windows = self._split_into_windows(rows)
+        self._mark_incomplete_windows(
+            windows,
+            truncated=len(rows) >= msg_limit,
+            period_start=start_date if start_date and end_date else None,
+        )
+        msg_count = sum(len(window.lines) for window in windows)
 
-        if not formatted_text:
+        if not msg_count:
             return "Нет сообщений для сводки."
 
         # Получаем отслеживаемых пользователей
@@ -76,12 +116,23 @@ class GetChatSummaryUseCase:
             f"@{u.username}" if u.username else f"ID:{u.tg_id}" for u in tracked_users
         ]
 
-        summary_result = await self._ai_service.summarize_text(
-            text=formatted_text,
-            msg_count=real_count,
-            summary_type=summary_type,
-            tracked_users=tracked_usernames,
-        )
+        full_text = "\n".join(line for window in windows for _, line in window.lines)
+
+        if estimate_tokens(full_text) <= settings.SUMMARY_CHUNK_MAX_TOKENS:
+            summary_result = await self._ai_service.summarize_text(
+                text=full_text,
+                msg_count=msg_count,
+                summary_type=summary_type,
+                tracked_users=tracked_usernames,
+            )
+        else:
+            summary_result = await self._map_reduce(
+                chat_id=chat_id,
+                windows=windows,
+                msg_count=msg_count,
+                summary_type=summary_type,
+                tracked_users=tracked_usernames,
+            )
 
         summary = summary_result.summary
 
@@ -106,3 +157,149 @@ class GetChatSummaryUseCase:
         )
 
         return summary
+
+    @staticmethod
+    def _split_into_windows(
+        rows: list[tuple[int, datetime, str | None, str | None]],
+    ) -> list[_SummaryWindow]:
+        """Группирует сообщения по окнам фиксированной длины, отбрасывая мусор."""
+        window_seconds = settings.SUMMARY_WINDOW_MINUTES * 60
+        windows: dict[int, _SummaryWindow] = {}
+
+        for msg_id, created_at, text, username in rows:
+            line = format_message_line(text, username)
+            if line is None:
+                continue
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            bucket = int(created_at.timestamp()) // window_seconds * window_seconds
+            window = windows.get(bucket)
+            if window is None:
+                window = _SummaryWindow(
+                    start=datetime.fromtimestamp(bucket, tz=timezone.utc)
+                )
+                windows[bucket] = window
+            window.lines.append((msg_id, line))
+
+        return [windows[bucket] for bucket in sorted(windows)]
+
+    @staticmethod
+    def _mark_incomplete_windows(
+        windows: list[_SummaryWindow],
+        truncated: bool,
+        period_start: datetime | None,
+    ) -> None:
+        """
+        Отмечает окна, в выборку которых попала не вся их часть: конспекты
+        таких окон нельзя кешировать под ключом окна.
+        """
+        if period_start is not None and period_start.tzinfo is None:
+            period_start = period_start.replace(tzinfo=timezone.utc)
+        for index, window in enumerate(windows):
+            if (truncated and index == 0) or (
+                period_start is not None and window.start < period_start
+            ):
+                window.complete = False
+
+    async def _map_reduce(
+        self,
+        chat_id: int,
+        windows: list[_SummaryWindow],
+        msg_count: int,
+        summary_type: SummaryType,
+        tracked_users: list[str],
+    ) -> SummaryResult:
+        budget = settings.SUMMARY_CHUNK_MAX_TOKENS
+        parts: list[str] = []
+
+        for window in windows:
+            partials = await self._get_window_partials(chat_id, window)
+            if isinstance(partials, SummaryResult):
+                return partials
+            label = TimeZoneService.convert_to_local_time(window.start).strftime(
+                "%d.%m %H:%M"
+            )
+            parts.append(f"[{label}]\n" + "\n".join(partials))
+
+        # Если конспектов слишком много для одного запроса — сворачиваем их уровнями
+        for _ in range(_MAX_REDUCE_LEVELS):
+            if estimate_tokens("\n\n".join(parts)) <= budget:
+                break
+            reduced: list[str] = []
+            for group in split_lines_by_tokens(parts, budget):
+                result = await self._ai_service.summarize_chunk(text="\n\n".join(group))
+                if result.status_code != 200:
+                    return result
+                reduced.append(result.summary)
+            parts = reduced
+        else:
+            parts = self._fit_parts_to_budget(parts, budget)
+
+        logger.info(
+            "Сводка чата %s по конспектам: окон=%d, сообщений=%d",
+            chat_id,
+            len(windows),
+            msg_count,
+        )
+        return await self._ai_service.summarize_text(
+            text=SUMMARY_PARTIALS_PREAMBLE + "\n\n".join(parts),
+            msg_count=msg_count,
+            summary_type=summary_type,
+            tracked_users=tracked_users,
+        )
+
+    @staticmethod
+    def _fit_parts_to_budget(parts: list[str], budget: int) -> list[str]:
+        """
+        Последние конспекты, которые укладываются в бюджет; если не влезает
+        даже последний — он обрезается.
+        """
+        kept: list[str] = []
+        used = 0
+        for part in reversed(parts):
+            tokens = estimate_tokens(part) + 2
+            if used + tokens > budget:
+                break
+            kept.append(part)
+            used += tokens
+        if kept:
+            return kept[::-1]
+
+        text = parts[-1]
+        while estimate_tokens(text) > budget:
+            text = text[: len(text) * budget // estimate_tokens(text)]
+        return [text]
+
+    async def _get_window_partials(
+        self, chat_id: int, window: _SummaryWindow
+    ) -> list[str] | SummaryResult:
+        """
+        Конспекты окна из кеша, дополненные конспектами новых сообщений.
+        Неполное окно конспектируется целиком и не кешируется.
+        При ошибке LLM возвращает её результат.
+        """
+        key = f"summary:partial:{chat_id}:{int(window.start.timestamp())}"
+        cached = await self._cache.get(key) if window.complete else None
+        partials, last_id = cached if cached else ([], 0)
+
+        new_lines = [line for msg_id, line in window.lines if msg_id > last_id]
+        if not new_lines:
+            return partials
+
+        partials = list(partials)
+        for chunk in split_lines_by_tokens(
+            new_lines, settings.SUMMARY_CHUNK_MAX_TOKENS
+        ):
+            result = await self._ai_service.summarize_chunk(text="\n".join(chunk))
+            if result.status_code != 200:
+                return result
+            partials.append(result.summary)
+
+        if not window.complete:
+            return partials
+        await self._cache.set(
+            key=key,
+            value=(partials, window.max_id),
+            ttl=settings.SUMMARY_PARTIAL_CACHE_TTL_HOURS * 3600,
+        )
+        return partials
@@ -1,6 +1,6 @@
 import logging
 
-from dto import TemplateDTO, TemplateSearchResultDTO
+from dto import TemplateSearchResultDTO
 from services.templates.template_service import TemplateService
 
 logger = logging.getLogger(__name__)
@@ -21,15 +21,8 @@ class GetTemplatesByQueryUseCase:
             TemplateSearchResultDTO: Результат поиска шаблонов
         """
         try:
-            templates = await self._template_service.get_templates_by_query(query=query)
-
-            # Сортируем по количеству использований от большего к меньшему
-            sorted_templates = sorted(templates, key=lambda x: -x.usage_count)
-
-            # Преобразуем в DTO
-            template_dtos = [
-                TemplateDTO.from_model(template) for template in sorted_templates
-            ]
+            # Уже в порядке релевантности (совпадение названия, затем популярность)
+            template_dtos = await self._template_service.search_templates(query=query)
 
             logger.debug(f"Найдено {len(template_dtos)} шаблонов по запросу '{query}'")
 
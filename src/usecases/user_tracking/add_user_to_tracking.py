@@ -7,7 +7,7 @@ from exceptions import BotBaseException
 from constants.enums import AdminActionType
 from dto import UserTrackingDTO
 from repositories import UserTrackingRepository
-from services import AdminActionLogService, UserService
+from services import AdminActionLogService, TrackingIndexService, UserService
 from services.time_service import TimeZoneService
 
 logger = logging.getLogger(__name__)
@@ -26,10 +26,12 @@ class AddUserToTrackingUseCase:
         user_service: UserService,
         user_tracking_repository: UserTrackingRepository,
         admin_action_log_service: AdminActionLogService,
+        tracking_index: TrackingIndexService,
     ) -> None:
         self._user_tracking_repository = user_tracking_repository
         self._user_service = user_service
         self._admin_action_log_service = admin_action_log_service
+        self._tracking_index = tracking_index
 
     async def execute(self, dto: UserTrackingDTO) -> AddUserToTrackingResult:
         user = await self._user_service.get_user(
@@ -70,6 +72,7 @@ class AddUserToTrackingUseCase:
                 admin_id=admin.id,
                 user_id=user.id,
             )
+            await self._tracking_index.invalidate_admin(admin)
 
             # Логируем действие администратора
             admin_who = f"@{admin.username}" if admin.username else f"ID:{admin.tg_id}"
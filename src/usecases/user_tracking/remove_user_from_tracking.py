@@ -1,7 +1,7 @@
 from constants.enums import AdminActionType
 from dto import RemoveUserTrackingDTO
 from repositories import UserTrackingRepository
-from services import AdminActionLogService, UserService
+from services import AdminActionLogService, TrackingIndexService, UserService
 from services.time_service import TimeZoneService
 
 
@@ -11,10 +11,12 @@ class RemoveUserFromTrackingUseCase:
         user_tracking_repository: UserTrackingRepository,
         user_service: UserService,
         admin_action_log_service: AdminActionLogService,
+        tracking_index: TrackingIndexService,
     ) -> None:
         self.user_tracking_repository = user_tracking_repository
         self.user_service = user_service
         self.admin_action_log_service = admin_action_log_service
+        self.tracking_index = tracking_index
 
     async def execute(self, dto: RemoveUserTrackingDTO) -> bool:
         """Удаляет пользователя из списка отслеживания админа."""
@@ -39,6 +41,7 @@ class RemoveUserFromTrackingUseCase:
             admin_id=admin.id,
             user_id=target_user.id,
         )
+        await self.tracking_index.invalidate_admin(admin)
 
         if target_user:
             # Логируем действие администратора
@@ -22,3 +22,18 @@ def decode_antibot_params(payload: str) -> tuple[str, int] | tuple[None, None]:
         return chat_id, user_id
     except (ValueError, IndexError):
         return None, None
+
+
+def format_welcome_text(welcome_text: str | None, username: str) -> str:
+    """
+    Форматирует текст приветствия; без кастомного текста — стандартное приветствие.
+    """
+    from constants import Dialog
+
+    if not welcome_text:
+        return Dialog.Antibot.GREETING.format(username=username)
+
+    try:
+        return welcome_text.format(username=username)
+    except (KeyError, ValueError, IndexError):
+        return welcome_text
@@ -0,0 +1,31 @@
+"""Курсоры keyset-пагинации по ключу (created_at, id)."""
+
+from datetime import datetime, timedelta, timezone
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Кодирует позицию записи в компактный токен вида "<мкс>.<id>" в hex.
+    Токен помещается в callback_data Telegram (лимит 64 байта).
+    """
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    micros = (created_at - _EPOCH) // _MICROSECOND
+    return f"{micros:x}.{row_id:x}"
+
+
+def decode_cursor(token: str) -> tuple[datetime, int]:
+    """
+    Раскодирует токен курсора в (created_at, id).
+
+    Raises:
+        ValueError: Если токен имеет неверный формат
+    """
+    micros_hex, sep, id_hex = token.partition(".")
+    if not sep or not micros_hex or not id_hex:
+        raise ValueError(f"Некорректный курсор пагинации: {token!r}")
+    created_at = _EPOCH + int(micros_hex, 16) * _MICROSECOND
+    return created_at, int(id_hex, 16)
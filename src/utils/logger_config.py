@@ -1,26 +1,224 @@
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Dict, Optional
 
+from config import settings
 
-def setup_logger(log_level: int = logging.INFO):
+# Слушатель очереди текущей конфигурации (останавливается при повторной настройке)
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Форматирует запись в одну JSON-строку для сборщиков логов."""
+
+    def __init__(self, service_name: str) -> None:
+        super().__init__()
+        self._service_name = service_name
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "service": self._service_name,
+            "logger": record.name,
+            "location": f"{record.module}.{record.funcName}:{record.lineno}",
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = record.stack_info
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Пропускает только часть записей ниже WARNING от «шумных» логгеров.
+
+    rates — доля сохраняемых записей по префиксу имени логгера (0.1 — каждая
+    десятая). Выбирается самый длинный подходящий префикс. Предупреждения и
+    ошибки не сэмплируются.
+    """
+
+    def __init__(self, rates: Dict[str, float]) -> None:
+        super().__init__()
+        self._every = {
+            prefix: max(1, round(1 / rate)) if rate > 0 else 0
+            for prefix, rate in rates.items()
+        }
+        self._prefixes = sorted(self._every, key=len, reverse=True)
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        prefix = next(
+            (
+                p
+                for p in self._prefixes
+                if record.name == p or record.name.startswith(p + ".")
+            ),
+            None,
+        )
+        if prefix is None:
+            return True
+        every = self._every[prefix]
+        if every == 0:
+            return False
+        with self._lock:
+            count = self._counters.get(prefix, 0)
+            self._counters[prefix] = count + 1
+        return count % every == 0
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler с ограниченной очередью и политикой переполнения.
+
+    При заполненной очереди записи ниже WARNING отбрасываются, а
+    предупреждения и ошибки вытесняют самую старую запись. Число потерянных
+    записей сообщается отдельной записью, когда в очереди снова есть место.
+    Запись никогда не блокирует event loop.
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(log_queue)
+        # QueueHandler хранит очередь как _QueueLike, без get_nowait/qsize
+        self._log_queue = log_queue
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Подставляем аргументы и трассировку заранее: форматирование
+        # выполняют обработчики слушателя, а аргументы могут измениться
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self._log_queue.put_nowait(record)
+        except queue.Full:
+            self._on_overflow(record)
+            return
+        self._report_dropped()
+
+    def _on_overflow(self, record: logging.LogRecord) -> None:
+        with self._lock:
+            if record.levelno >= logging.WARNING:
+                try:
+                    self._log_queue.get_nowait()
+                    self._log_queue.put_nowait(record)
+                except (queue.Empty, queue.Full):
+                    pass
+            self.dropped += 1
+
+    def _report_dropped(self) -> None:
+        if not self.dropped or self._log_queue.qsize() * 2 > self._log_queue.maxsize:
+            return
+        with self._lock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            notice = logging.LogRecord(
+                name=__name__,
+                level=logging.WARNING,
+                pathname=__file__,
+                lineno=0,
+                msg="Очередь логов была переполнена, пропущено записей: %d",
+                args=(dropped,),
+                exc_info=None,
+                func="enqueue",
+            )
+            try:
+                self._log_queue.put_nowait(self.prepare(notice))
+            except queue.Full:
+                pass
+
+
+class _BlockingStopListener(QueueListener):
+    """QueueListener, который при остановке ждёт места в заполненной очереди."""
+
+    def __init__(
+        self,
+        log_queue: queue.Queue[logging.LogRecord],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        super().__init__(
+            log_queue, *handlers, respect_handler_level=respect_handler_level
+        )
+        self._log_queue = log_queue
+
+    def enqueue_sentinel(self) -> None:
+        # _sentinel (None) есть у QueueListener, но не описан в стабах
+        self._log_queue.put(getattr(self, "_sentinel"))
+
+
+def _parse_sampling(spec: str) -> Dict[str, float]:
+    """Разбирает строку вида "logger.a=0.1,logger.b=0.5"."""
+    rates: Dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, rate = item.partition("=")
+        try:
+            rates[name.strip()] = min(1.0, max(0.0, float(rate)))
+        except ValueError:
+            continue
+    return rates
+
+
+def setup_logger(
+    log_level: int = logging.INFO,
+    log_format: Optional[str] = None,
+    queue_size: Optional[int] = None,
+    sampling: Optional[Dict[str, float]] = None,
+):
     """
     Настраивает глобальный логгер для всего приложения.
     Поддерживает вывод в консоль и в ротируемые файлы.
 
+    Вызовы логгера только кладут запись в ограниченную очередь; запись в
+    консоль и файлы (включая ротацию) выполняет фоновый поток QueueListener,
+    поэтому диск не блокирует event loop.
+
     :param log_level: Уровень логирования
+    :param log_format: "text" или "json" (по умолчанию settings.LOG_FORMAT)
+    :param queue_size: Размер очереди (по умолчанию settings.LOG_QUEUE_SIZE)
+    :param sampling: Доли записей ниже WARNING по префиксу логгера
+        (по умолчанию settings.LOG_SAMPLING, например "handlers.group.new_message=0.1")
     """
-
-    # Формат сообщения
-    formatter = logging.Formatter(
-        fmt="%(asctime)s [%(levelname)s] %(module)s.%(funcName)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    global _listener
 
     # Определяем имя сервиса для названия лог-файла
     service_name = os.getenv("SERVICE_NAME", "bot")
+    log_format = log_format or settings.LOG_FORMAT
+    queue_size = queue_size or settings.LOG_QUEUE_SIZE
+    if sampling is None:
+        sampling = _parse_sampling(settings.LOG_SAMPLING)
+
+    # Формат сообщения
+    if log_format == "json":
+        formatter: logging.Formatter = JsonFormatter(service_name)
+    else:
+        formatter = logging.Formatter(
+            fmt="%(asctime)s [%(levelname)s] %(module)s.%(funcName)s:%(lineno)d - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
     # Путь к папке с логами
     log_dir = Path("logs")
@@ -53,6 +251,23 @@ def setup_logger(log_level: int = logging.INFO):
     error_handler.setFormatter(formatter)
     error_handler.setLevel(logging.ERROR)
 
+    # Останавливаем слушатель предыдущей настройки (сбрасывает остаток очереди)
+    shutdown_logger()
+
+    # Очередь между event loop и потоком записи
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    queue_handler = BoundedQueueHandler(log_queue)
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+    _listener = _BlockingStopListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
+
     # Настройка корневого логгера
     logger = logging.getLogger()
     logger.setLevel(log_level)
@@ -60,8 +275,17 @@ def setup_logger(log_level: int = logging.INFO):
     # Очищаем старые обработчики, если они были (чтобы избежать дублирования при повторном вызове)
     logger.handlers = []
 
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
+    logger.addHandler(queue_handler)
 
     logging.info(f"Logger configured successfully for service: {service_name}")
+
+
+@atexit.register
+def shutdown_logger() -> None:
+    """Дописывает оставшиеся в очереди записи и останавливает поток записи."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -1,39 +1,55 @@
-def format_messages_for_llm(messages: list, max_chars: int = 100000) -> tuple[str, int]:
+import math
+
+# Грубая оценка токенизации BPE: кириллица дробится мельче латиницы
+_CHARS_PER_TOKEN_ASCII = 4.0
+_CHARS_PER_TOKEN_NON_ASCII = 2.5
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Приблизительно оценивает число токенов в тексте без загрузки токенизатора.
+
+    Оценка завышается для кириллицы, чтобы чанки гарантированно влезали в контекст.
+    """
+    if not text:
+        return 0
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    ascii_count = len(text) - non_ascii
+    return math.ceil(
+        ascii_count / _CHARS_PER_TOKEN_ASCII + non_ascii / _CHARS_PER_TOKEN_NON_ASCII
+    )
+
+
+def format_message_line(text: str | None, user_name: str | None) -> str | None:
+    """
+    Форматирует одно сообщение в строку лога для LLM.
+    Возвращает None для мусора (короткие сообщения и команды).
     """
-    Превращает список объектов сообщений в строку вида:
-    [User1]: Ребят, когда деплой?
-    [Admin]: Завтра в 12:00.
+    if not text or len(text) < 3:
+        return None
+    if text.startswith("/"):  # Игнорируем команды
+        return None
+    return f"[{user_name or 'Unknown'}]: {text[:500]}"
+
+
+def split_lines_by_tokens(lines: list[str], max_tokens: int) -> list[list[str]]:
     """
-    buffer = []
-    current_chars = 0
-    count = 0
-
-    # Сообщения приходят от новых к старым (из репозитория reversed)
-    # Поддерживаются кортежи (text, username) и объекты с .text / .username
-    for msg in messages:
-        if isinstance(msg, tuple) and len(msg) >= 2:
-            text, user_name = msg[0], (msg[1] or "Unknown")
-        else:
-            text = getattr(msg, "text", None)
-            user_name = getattr(msg, "username", None) or "Unknown"
-
-        # Фильтрация мусора
-        if not text or len(text) < 3:
-            continue
-        if text.startswith("/"):  # Игнорируем команды
-            continue
-
-        clean_text = text[:500]
-
-        formatted_line = f"[{user_name}]: {clean_text}"
-        line_len = len(formatted_line) + 1
-
-        if current_chars + line_len > max_chars:
-            break
-
-        buffer.append(formatted_line)
-        current_chars += line_len
-        count += 1
-
-    # Возвращаем в хронологическом порядке (старые в начале)
-    return "\n".join(reversed(buffer)), count
+    Разбивает строки на чанки, каждый из которых укладывается в max_tokens.
+    Строка, которая сама превышает лимит, попадает в отдельный чанк.
+    """
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    current_tokens = 0
+
+    for line in lines:
+        line_tokens = estimate_tokens(line) + 1
+        if current and current_tokens + line_tokens > max_tokens:
+            chunks.append(current)
+            current = []
+            current_tokens = 0
+        current.append(line)
+        current_tokens += line_tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
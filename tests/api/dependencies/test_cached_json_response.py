@@ -0,0 +1,90 @@
+"""Тесты HTTP-обёртки кеша ответов: ETag, Cache-Control и 304."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from punq import Container
+
+from api.dependencies.response_cache import cached_json_response
+from services.caching import DataWatermark, ICache, ResponseCache
+
+
+class _DictCache(ICache):
+    """Кеш в памяти вместо Redis."""
+
+    def __init__(self) -> None:
+        self.data: dict = {}
+
+    async def get(self, key: str):
+        return self.data.get(key)
+
+    async def set(self, key: str, value, ttl=None) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+    async def clear(self) -> None:
+        self.data.clear()
+
+
+@pytest.fixture
+def build() -> AsyncMock:
+    return AsyncMock(return_value={"moderators": [{"tg_id": "1", "total": 3}]})
+
+
+@pytest.fixture
+def client(build: AsyncMock) -> TestClient:
+    container = Container()
+    container.register(
+        ResponseCache,
+        instance=ResponseCache(
+            cache=_DictCache(),
+            watermark=AsyncMock(spec=DataWatermark),
+            ttl_seconds=60,
+        ),
+    )
+    app = FastAPI()
+
+    @app.get("/stats")
+    async def stats(request: Request):
+        return await cached_json_response(
+            request,
+            container,
+            namespace="stats:test",
+            params=[],
+            build=build,
+            ttl_seconds=30,
+        )
+
+    return TestClient(app)
+
+
+def test_response_has_etag_and_private_cache_control(
+    client: TestClient, build: AsyncMock
+) -> None:
+    response = client.get("/stats")
+
+    assert response.status_code == 200
+    assert response.json() == {"moderators": [{"tg_id": "1", "total": 3}]}
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "private, max-age=30"
+
+
+def test_matching_if_none_match_returns_304(
+    client: TestClient, build: AsyncMock
+) -> None:
+    etag = client.get("/stats").headers["etag"]
+
+    not_modified = client.get("/stats", headers={"If-None-Match": etag})
+    weak = client.get("/stats", headers={"If-None-Match": f'"other", W/{etag}'})
+    changed = client.get("/stats", headers={"If-None-Match": '"other"'})
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert weak.status_code == 304
+    assert changed.status_code == 200
+    build.assert_awaited_once()
@@ -0,0 +1,153 @@
+"""Тесты кеша проверки initData в api/dependencies/miniapp.py."""
+
+import hashlib
+import hmac
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import urlencode
+
+import pytest
+from fastapi import HTTPException
+
+from api.dependencies import miniapp
+from config import settings
+from constants.enums import UserRole
+from models import User
+
+
+def _signed_init_data(user_id: int = 42, auth_date: int | None = None) -> str:
+    params = {
+        "auth_date": str(auth_date or int(time.time())),
+        "user": json.dumps({"id": user_id, "username": "admin"}),
+    }
+    data_check_string = "\n".join(f"{k}={v}" for k, v in sorted(params.items()))
+    secret_key = miniapp._compute_secret_key(settings.BOT_TOKEN)
+    params["hash"] = hmac.new(
+        secret_key, data_check_string.encode(), hashlib.sha256
+    ).hexdigest()
+    return urlencode(params)
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> None:
+    miniapp._verified_init_data.clear()
+    miniapp._callers.clear()
+
+
+def test_verified_init_data_is_cached() -> None:
+    """Повторный запрос с теми же initData не проверяет подпись заново."""
+    raw = _signed_init_data()
+
+    with patch.object(
+        miniapp, "_verify_init_data", wraps=miniapp._verify_init_data
+    ) as verify:
+        first = miniapp.verify_telegram_init_data(raw)
+        second = miniapp.verify_telegram_init_data(raw)
+
+    verify.assert_called_once()
+    assert first == second
+    assert miniapp.tg_id_from_init_data(second) == "42"
+
+
+def test_tampered_init_data_rejected_after_cache() -> None:
+    """Изменённые поля дают другую строку и проходят полную проверку."""
+    raw = _signed_init_data()
+    miniapp.verify_telegram_init_data(raw)
+
+    tampered = raw.replace("auth_date=", "auth_date=1")
+    with pytest.raises(HTTPException) as exc_info:
+        miniapp.verify_telegram_init_data(tampered)
+    assert exc_info.value.status_code == 401
+
+
+def test_expired_init_data_not_cached() -> None:
+    """initData с истёкшим сроком в кеш не попадают."""
+    raw = _signed_init_data(auth_date=int(time.time()) - 2 * miniapp.MAX_AGE_SECONDS)
+
+    with patch.object(miniapp.settings, "IS_DEVELOPMENT", True):
+        miniapp.verify_telegram_init_data(raw)
+
+    assert miniapp._verified_init_data.get(raw) is None
+
+
+@pytest.mark.asyncio
+async def test_caller_is_cached_until_expiry() -> None:
+    """Пользователь ищется в БД один раз на время жизни initData."""
+    user = User(id=7, tg_id="42", username="admin", role=UserRole.ADMIN)
+    user.is_active = True
+    user_repo = MagicMock()
+    user_repo.get_user_by_tg_id = AsyncMock(return_value=user)
+    dc = MagicMock()
+    dc.resolve.return_value = user_repo
+    init_data = {"auth_date": str(int(time.time())), "user": '{"id": 42}'}
+
+    first = await miniapp.get_miniapp_caller(init_data, dc)
+    second = await miniapp.get_miniapp_caller(init_data, dc)
+
+    user_repo.get_user_by_tg_id.assert_awaited_once_with(tg_id="42")
+    assert first == second
+    assert first.id == 7 and first.role == UserRole.ADMIN
+
+
+@pytest.mark.asyncio
+async def test_unknown_caller_forbidden() -> None:
+    """Незарегистрированный пользователь получает 403 и не кешируется."""
+    user_repo = MagicMock()
+    user_repo.get_user_by_tg_id = AsyncMock(return_value=None)
+    dc = MagicMock()
+    dc.resolve.return_value = user_repo
+    init_data = {"auth_date": str(int(time.time())), "user": '{"id": 1}'}
+
+    with pytest.raises(HTTPException) as exc_info:
+        await miniapp.get_miniapp_caller(init_data, dc)
+
+    assert exc_info.value.status_code == 403
+    assert miniapp._callers.get("1") is None
+
+
+@pytest.mark.asyncio
+async def test_caller_cache_is_shorter_than_init_data() -> None:
+    """Пользователь кешируется на MINIAPP_CALLER_CACHE_TTL_SECONDS, а не на час."""
+    user = User(id=7, tg_id="42", username="admin", role=UserRole.ADMIN)
+    user.is_active = True
+    user_repo = MagicMock()
+    user_repo.get_user_by_tg_id = AsyncMock(return_value=user)
+    dc = MagicMock()
+    dc.resolve.return_value = user_repo
+    init_data = {"auth_date": str(int(time.time())), "user": '{"id": 42}'}
+
+    before = time.time()
+    await miniapp.get_miniapp_caller(init_data, dc)
+
+    expires_at = miniapp._callers["42"].expires_at
+    ttl = settings.MINIAPP_CALLER_CACHE_TTL_SECONDS
+    assert ttl < miniapp.MAX_AGE_SECONDS
+    assert before + ttl <= expires_at <= time.time() + ttl
+
+
+@pytest.mark.asyncio
+async def test_caller_role_change_seen_after_cache_expiry() -> None:
+    """После истечения кеша понижение роли и удаление видны API (403)."""
+    admin = User(id=7, tg_id="42", username="admin", role=UserRole.ADMIN)
+    demoted = User(id=7, tg_id="42", username="admin", role=UserRole.USER)
+    admin.is_active = demoted.is_active = True
+    user_repo = MagicMock()
+    user_repo.get_user_by_tg_id = AsyncMock(side_effect=[admin, demoted, None])
+    dc = MagicMock()
+    dc.resolve.return_value = user_repo
+    init_data = {"auth_date": str(int(time.time())), "user": '{"id": 42}'}
+
+    # Нулевой срок — запись истекает сразу, как по прошествии TTL
+    with patch.object(miniapp.settings, "MINIAPP_CALLER_CACHE_TTL_SECONDS", 0):
+        caller = await miniapp.get_miniapp_caller(init_data, dc)
+        assert miniapp.get_miniapp_admin(caller).id == 7
+
+        caller = await miniapp.get_miniapp_caller(init_data, dc)
+        with pytest.raises(HTTPException) as exc_info:
+            miniapp.get_miniapp_admin(caller)
+        assert exc_info.value.status_code == 403
+
+        with pytest.raises(HTTPException) as exc_info:
+            await miniapp.get_miniapp_caller(init_data, dc)
+        assert exc_info.value.status_code == 403
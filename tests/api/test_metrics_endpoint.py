@@ -0,0 +1,49 @@
+"""Тесты эндпоинта /metrics FastAPI."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.metrics import router
+from config import settings
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_metrics_exposed_with_token(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "secret")
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer secret"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE bot_handler_duration_seconds histogram" in response.text
+
+
+def test_metrics_closed_without_configured_token(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+
+    assert client.get("/metrics").status_code == 401
+    empty = client.get("/metrics", headers={"Authorization": "Bearer "})
+    assert empty.status_code == 401
+
+
+def test_metrics_require_configured_token(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "secret")
+
+    assert client.get("/metrics").status_code == 401
+    wrong = client.get("/metrics", headers={"Authorization": "Bearer other"})
+    assert wrong.status_code == 401
+    ok = client.get("/metrics", headers={"Authorization": "Bearer secret"})
+    assert ok.status_code == 200
@@ -0,0 +1,75 @@
+"""Тесты доступа к выгрузке отчётов Mini App."""
+
+from typing import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from punq import Container
+
+from api.dependencies.container import get_container
+from api.dependencies.miniapp import get_miniapp_caller
+from api.v1.routers.miniapp.export import router
+from constants.enums import UserRole
+from dto.user import UserDTO
+from services.user import TrackingIndexService
+from usecases.report import ExportReportUseCase
+
+
+async def _rows(_dto) -> AsyncIterator[str]:
+    yield "date,messages\r\n"
+
+
+@pytest.fixture
+def tracking_index() -> AsyncMock:
+    index = AsyncMock(spec=TrackingIndexService)
+    index.get_tracked_chat_ids.return_value = [1]
+    index.get_tracked_user_ids.return_value = [10]
+    return index
+
+
+def _client(tracking_index: AsyncMock, role: UserRole) -> TestClient:
+    container = Container()
+    container.register(TrackingIndexService, instance=tracking_index)
+    container.register(
+        ExportReportUseCase, instance=MagicMock(execute=MagicMock(side_effect=_rows))
+    )
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_container] = lambda: container
+    app.dependency_overrides[get_miniapp_caller] = lambda: UserDTO(
+        id=7, tg_id="42", role=role, is_active=True
+    )
+    return TestClient(app)
+
+
+def test_admin_exports_chat_from_own_access(tracking_index: AsyncMock) -> None:
+    client = _client(tracking_index, UserRole.ADMIN)
+
+    response = client.get("/export", params={"scope": "chat", "target_id": 1})
+
+    assert response.status_code == 200
+    assert response.text == "date,messages\r\n"
+    # Доступ проверяется по id админа в БД (его AdminChatAccess)
+    tracking_index.get_tracked_chat_ids.assert_awaited_once_with(7)
+
+
+def test_chat_without_admin_access_forbidden(tracking_index: AsyncMock) -> None:
+    client = _client(tracking_index, UserRole.ADMIN)
+
+    response = client.get("/export", params={"scope": "chat", "target_id": 2})
+
+    assert response.status_code == 403
+
+
+@pytest.mark.parametrize("role", [UserRole.USER, UserRole.MODERATOR])
+def test_non_admin_forbidden(tracking_index: AsyncMock, role: UserRole) -> None:
+    client = _client(tracking_index, role)
+
+    for scope, target_id in (("chat", 1), ("user", 10)):
+        response = client.get(
+            "/export", params={"scope": scope, "target_id": target_id}
+        )
+        assert response.status_code == 403
+    tracking_index.get_tracked_chat_ids.assert_not_awaited()
@@ -0,0 +1,62 @@
+"""Тесты доступа к живой статистике чата за сегодня в Mini App."""
+
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from punq import Container
+
+from api.dependencies.container import get_container
+from api.dependencies.miniapp import get_miniapp_caller
+from api.v1.routers.miniapp.stats import router
+from constants.enums import UserRole
+from dto.user import UserDTO
+from services.user import TrackingIndexService
+from usecases.report import GetChatDayActivityUseCase
+
+
+@pytest.fixture
+def usecase() -> AsyncMock:
+    usecase = AsyncMock(spec=GetChatDayActivityUseCase)
+    usecase.execute.return_value = AsyncMock(
+        chat_id=1, day=date(2026, 1, 31), top_users=[], active_users_count=0, live=True
+    )
+    return usecase
+
+
+def _client(usecase: AsyncMock, role: UserRole) -> TestClient:
+    tracking_index = AsyncMock(spec=TrackingIndexService)
+    tracking_index.get_tracked_chat_ids.return_value = [1]
+    container = Container()
+    container.register(TrackingIndexService, instance=tracking_index)
+    container.register(GetChatDayActivityUseCase, instance=usecase)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_container] = lambda: container
+    app.dependency_overrides[get_miniapp_caller] = lambda: UserDTO(
+        id=7, tg_id="42", role=role, is_active=True
+    )
+    return TestClient(app)
+
+
+def test_admin_reads_chat_with_access(usecase: AsyncMock) -> None:
+    response = _client(usecase, UserRole.ADMIN).get("/stats/chats/1/today")
+
+    assert response.status_code == 200
+    assert response.json()["chat_id"] == 1
+
+
+def test_chat_without_admin_access_forbidden(usecase: AsyncMock) -> None:
+    response = _client(usecase, UserRole.ADMIN).get("/stats/chats/2/today")
+
+    assert response.status_code == 403
+    usecase.execute.assert_not_awaited()
+
+
+def test_non_admin_forbidden(usecase: AsyncMock) -> None:
+    response = _client(usecase, UserRole.USER).get("/stats/chats/1/today")
+
+    assert response.status_code == 403
+    usecase.execute.assert_not_awaited()
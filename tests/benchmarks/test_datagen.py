@@ -0,0 +1,64 @@
+"""Тесты генератора синтетических данных: детерминизм и ссылочная целостность."""
+
+from dataclasses import replace
+
+from benchmarks.datagen import SCALES, SyntheticDataGenerator
+from constants.work_time import END_TIME
+from models.message import MessageType
+from services.time_service import TimeZoneService
+
+SPEC = replace(SCALES["tiny"], chats=2, users_per_chat=4, days=7)
+
+
+def test_same_seed_gives_identical_rows() -> None:
+    first = SyntheticDataGenerator(SPEC).build()
+    second = SyntheticDataGenerator(SPEC).build()
+
+    assert first.messages == second.messages
+    assert first.replies == second.replies
+    assert first.reactions == second.reactions
+    assert first.templates == second.templates
+    assert (
+        first.messages != SyntheticDataGenerator(replace(SPEC, seed=7)).build().messages
+    )
+
+
+def test_rows_reference_generated_entities() -> None:
+    dataset = SyntheticDataGenerator(SPEC).build()
+    user_ids = {u["id"] for u in dataset.users}
+    chat_ids = {c["id"] for c in dataset.chats}
+    messages = {m["id"]: m for m in dataset.messages}
+
+    assert dataset.messages
+    assert len(messages) == len(dataset.messages)
+    assert all(
+        m["user_id"] in user_ids and m["chat_id"] in chat_ids for m in messages.values()
+    )
+    for reply in dataset.replies:
+        message = messages[reply["reply_message_id"]]
+        assert message["message_type"] == MessageType.REPLY.value
+        assert message["user_id"] == reply["reply_user_id"]
+        assert reply["response_time_seconds"] >= 0
+    for reaction in dataset.reactions:
+        assert reaction["user_id"] in user_ids
+    # Telegram message_id уникален в пределах чата
+    keys = {(m["chat_id"], m["message_id"]) for m in dataset.messages}
+    assert len(keys) == len(dataset.messages)
+
+
+def test_messages_fall_into_local_shift_of_their_day() -> None:
+    generator = SyntheticDataGenerator(SPEC)
+    for batch in generator.iter_days():
+        for message in batch.messages:
+            local = TimeZoneService.convert_to_local_time(message["created_at"])
+            assert local.date() == batch.day
+            assert local.time() < END_TIME
+        times = [m["created_at"] for m in batch.messages]
+        assert times == sorted(times)
+
+
+def test_ids_start_after_offset() -> None:
+    dataset = SyntheticDataGenerator(replace(SPEC, id_offset=5000)).build()
+
+    assert min(u["id"] for u in dataset.users) == 5001
+    assert min(m["id"] for m in dataset.messages) == 5001
@@ -0,0 +1,96 @@
+"""Тесты нагрузочного прогона: сессия без сети, поток апдейтов и replay."""
+
+import asyncio
+from dataclasses import replace
+from typing import Any, Dict
+
+import pytest
+from aiogram import Bot, Dispatcher
+from aiogram.enums import ChatMemberStatus
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import Message, MessageReactionUpdated, Update
+
+from benchmarks.datagen import SCALES, SyntheticDataGenerator
+from benchmarks.load import LoadStats, RecordingSession, replay, synthetic_updates
+
+SPEC = replace(SCALES["tiny"], chats=2, users_per_chat=4, days=2)
+
+
+@pytest.fixture
+def session() -> RecordingSession:
+    return RecordingSession()
+
+
+@pytest.fixture
+def bot(session: RecordingSession) -> Bot:
+    return Bot("123456:TEST", session=session)
+
+
+@pytest.mark.asyncio
+async def test_session_records_calls_and_fakes_results(
+    bot: Bot, session: RecordingSession
+) -> None:
+    sent = await bot.send_message(-100, "привет")
+    deleted = await bot.delete_message(-100, sent.message_id)
+    me = await bot.get_chat_member(-100, bot.id)
+    other = await bot.get_chat_member(-100, 42)
+    admins = await bot.get_chat_administrators(-100)
+
+    assert sent.chat.id == -100 and sent.text == "привет"
+    assert deleted is True
+    assert me.status == ChatMemberStatus.ADMINISTRATOR
+    assert other.status == ChatMemberStatus.MEMBER
+    assert admins == []
+    assert session.calls == {
+        "SendMessage": 1,
+        "DeleteMessage": 1,
+        "GetChatMember": 2,
+        "GetChatAdministrators": 1,
+    }
+
+
+def test_synthetic_updates_are_valid_and_ordered(bot: Bot) -> None:
+    dataset = SyntheticDataGenerator(SPEC).build()
+
+    raw = synthetic_updates(dataset, limit=300)
+    updates = [
+        Update.model_validate({**data, "update_id": i}, context={"bot": bot})
+        for i, data in enumerate(raw)
+    ]
+
+    assert 0 < len(updates) <= 300
+    replies = [u.message for u in updates if u.message and u.message.reply_to_message]
+    reactions = [u.message_reaction for u in updates if u.message_reaction]
+    assert replies and reactions
+    assert all(r.reply_to_message.chat.id == r.chat.id for r in replies)
+    assert all(r.new_reaction[0].emoji for r in reactions)
+
+
+@pytest.mark.asyncio
+async def test_replay_feeds_updates_and_collects_latency(bot: Bot) -> None:
+    dp = Dispatcher(storage=MemoryStorage())
+    handled: Dict[str, int] = {"message": 0, "reaction": 0}
+
+    @dp.message()
+    async def on_message(message: Message) -> None:
+        await asyncio.sleep(0)
+        handled["message"] += 1
+
+    @dp.message_reaction()
+    async def on_reaction(event: MessageReactionUpdated) -> Any:
+        handled["reaction"] += 1
+        raise RuntimeError("сбой обработчика")
+
+    updates = synthetic_updates(SyntheticDataGenerator(SPEC).build(), limit=50)
+    reactions = sum("message_reaction" in u for u in updates)
+    stats = LoadStats()
+
+    await replay(dp, bot, updates, rate=0, stats=stats)
+    summary = stats.summary()
+
+    assert stats.updates == len(updates) == 50
+    assert handled == {"message": 50 - reactions, "reaction": reactions}
+    assert stats.errors == reactions
+    assert len(stats.handler_ms) == len(stats.end_to_end_ms) == 50
+    assert summary["handler_p50_ms"] <= summary["handler_p99_ms"]
+    assert "handler_ms" not in summary
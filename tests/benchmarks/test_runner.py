@@ -0,0 +1,89 @@
+"""Тесты раннера бенчмарков: прогон сценариев, сравнение и сохранение baseline."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.cases import CASES, BenchContext, select_cases
+from benchmarks.datagen import SCALES, SyntheticDataGenerator
+from benchmarks.runner import (
+    CaseResult,
+    compare,
+    load_baseline,
+    main,
+    run_cases,
+    save_baseline,
+)
+
+_FAST = ["--scale", "tiny", "-k", "templates.search", "--rounds", "1"]
+
+
+@pytest.mark.asyncio
+async def test_offline_cases_run_and_backend_cases_are_skipped() -> None:
+    ctx = BenchContext(dataset=SyntheticDataGenerator(SCALES["tiny"]).build())
+
+    results = await run_cases(ctx, select_cases(), rounds=1)
+
+    offline = {case.name for case in CASES if not case.requires}
+    assert set(results) == offline
+    assert "buffer.push_drain" not in results
+    assert all(r.median_ms >= 0 and r.rounds == 1 for r in results.values())
+
+
+def test_select_cases_by_substring() -> None:
+    names = [case.name for case in select_cases("templates")]
+
+    assert names == ["templates.search_index_build", "templates.search"]
+
+
+def test_compare_flags_only_slowdowns_over_threshold() -> None:
+    results = {
+        "fast": CaseResult(median_ms=9.0, min_ms=8.0, rounds=5),
+        "slow": CaseResult(median_ms=14.0, min_ms=13.0, rounds=5),
+        "new": CaseResult(median_ms=1.0, min_ms=1.0, rounds=5),
+    }
+    baseline = {"fast": {"median_ms": 10.0}, "slow": {"median_ms": 10.0}}
+
+    regressions = compare(results, baseline, threshold=0.3)
+
+    assert [r.name for r in regressions] == ["slow"]
+    assert regressions[0].ratio == pytest.approx(1.4)
+
+
+def test_save_baseline_keeps_other_scales(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"medium": {"results": {"x": {"median_ms": 1.0}}}}))
+
+    save_baseline("small", {"y": CaseResult(2.0, 1.5, 5)}, path)
+
+    assert load_baseline("medium", path) == {"x": {"median_ms": 1.0}}
+    assert load_baseline("small", path)["y"]["median_ms"] == 2.0
+    assert load_baseline("large", path) == {}
+
+
+@pytest.mark.asyncio
+async def test_main_compares_only_on_request(tmp_path: Path) -> None:
+    """Без --compare — только замеры; с ним без baseline — код 2."""
+    path = tmp_path / "baseline.json"
+
+    assert await main([*_FAST, "--baseline", str(path)]) == 0
+    assert not path.exists()
+    assert await main([*_FAST, "--baseline", str(path), "--compare"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_main_compares_with_baseline_from_same_environment(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "baseline.json"
+    args = [*_FAST, "--baseline", str(path)]
+
+    assert await main([*args, "--save-baseline"]) == 0
+    # Большой порог: проверяется сам путь сравнения, а не скорость машины
+    assert await main([*args, "--compare", "--threshold", "100"]) == 0
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["tiny"]["environment"]["machine"] = "other"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert await main([*args, "--compare", "--threshold", "100"]) == 2
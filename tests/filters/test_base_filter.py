@@ -46,3 +46,23 @@ async def test_base_user_filter_get_user_returns_none() -> None:
     )
 
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_base_user_filter_get_user_uses_update_context() -> None:
+    """При наличии контекста апдейта пользователь берётся из него."""
+    filter_instance = AdminOnlyFilter()
+    container = MagicMock()
+    user = User(tg_id="123", username="test", role=UserRole.ADMIN)
+    update_context = MagicMock(user_tg_id="123")
+    update_context.find_user = AsyncMock(return_value=user)
+
+    result = await filter_instance.get_user(
+        tg_id="123",
+        current_username="test",
+        container=container,
+        update_context=update_context,
+    )
+
+    assert result == user
+    container.resolve.assert_not_called()
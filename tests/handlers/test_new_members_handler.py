@@ -17,7 +17,10 @@ from dto.moderation import NewMemberRestrictionDTO
 from handlers.group.new_members import (
     process_chat_member_joined,
     process_humanity_verification,
+    process_raid_humanity_verification,
 )
+from services.raid_mode_service import RaidModeService
+from usecases.antiraid import EnqueueRaidJoinUseCase
 from usecases.archive import NotifyArchiveChatNewMemberUseCase
 from usecases.membership import RecordChatMembershipEventUseCase
 from usecases.moderation import RestrictNewMemberUseCase, VerifyMemberUseCase
@@ -39,6 +42,8 @@ async def test_process_chat_member_joined_human_with_antibot(
     restrict_usecase = AsyncMock(spec=RestrictNewMemberUseCase)
     notify_usecase = AsyncMock(spec=NotifyArchiveChatNewMemberUseCase)
     record_membership_uc = AsyncMock(spec=RecordChatMembershipEventUseCase)
+    enqueue_raid_uc = AsyncMock(spec=EnqueueRaidJoinUseCase)
+    enqueue_raid_uc.execute.return_value = False
 
     def resolve_side_effect(cls):
         if cls == RestrictNewMemberUseCase:
@@ -47,6 +52,8 @@ async def test_process_chat_member_joined_human_with_antibot(
             return notify_usecase
         if cls == RecordChatMembershipEventUseCase:
             return record_membership_uc
+        if cls == EnqueueRaidJoinUseCase:
+            return enqueue_raid_uc
         return MagicMock()
 
     mock_container.resolve.side_effect = resolve_side_effect
@@ -124,6 +131,64 @@ async def test_process_chat_member_joined_human_with_antibot(
     assert kwargs["parse_mode"] == "HTML"
 
 
+@pytest.mark.asyncio
+async def test_process_chat_member_joined_raid_mode_queues_member(
+    mock_container: Container,
+) -> None:
+    """
+    В режиме рейда участник ставится в сводную очередь:
+    ни запись события, ни мут, ни приветствие по одному не выполняются.
+    """
+    restrict_usecase = AsyncMock(spec=RestrictNewMemberUseCase)
+    notify_usecase = AsyncMock(spec=NotifyArchiveChatNewMemberUseCase)
+    record_membership_uc = AsyncMock(spec=RecordChatMembershipEventUseCase)
+    enqueue_raid_uc = AsyncMock(spec=EnqueueRaidJoinUseCase)
+    enqueue_raid_uc.execute.return_value = True
+
+    mock_container.resolve.side_effect = lambda cls: {
+        RestrictNewMemberUseCase: restrict_usecase,
+        NotifyArchiveChatNewMemberUseCase: notify_usecase,
+        RecordChatMembershipEventUseCase: record_membership_uc,
+        EnqueueRaidJoinUseCase: enqueue_raid_uc,
+    }.get(cls, MagicMock())
+
+    new_user = MagicMock(spec=User)
+    new_user.id = 321
+    new_user.is_bot = False
+    new_user.username = "raider"
+    new_user.first_name = "Raider"
+
+    new_chat_member = MagicMock(spec=ChatMemberMember)
+    new_chat_member.user = new_user
+
+    chat = MagicMock(spec=Chat)
+    chat.id = -100500
+    chat.title = "Busy Group"
+
+    event = MagicMock(spec=ChatMemberUpdated)
+    event.chat = chat
+    event.new_chat_member = new_chat_member
+
+    bot_mock = AsyncMock()
+
+    await process_chat_member_joined(
+        event=event,
+        container=mock_container,
+        bot=bot_mock,
+    )
+
+    enqueue_raid_uc.execute.assert_awaited_once()
+    kwargs = enqueue_raid_uc.execute.call_args.kwargs
+    assert kwargs["chat_tgid"] == "-100500"
+    assert kwargs["chat_title"] == "Busy Group"
+    assert kwargs["item"].user_tgid == 321
+    assert kwargs["item"].username == "raider"
+    record_membership_uc.execute.assert_not_called()
+    restrict_usecase.execute.assert_not_called()
+    notify_usecase.execute.assert_not_called()
+    bot_mock.send_message.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_process_chat_member_joined_bot_joining(
     mock_container: Container,
@@ -246,3 +311,81 @@ async def test_process_humanity_verification_wrong_user_shows_error(
         Dialog.Antibot.VERIFIED_ERROR_USER,
         show_alert=True,
     )
+
+
+def _raid_callback(user_id: int, chat_id: int = -100777, message_id: int = 55):
+    from constants.callback import CallbackData
+
+    callback = MagicMock(spec=CallbackQuery)
+    callback.from_user = MagicMock(spec=User)
+    callback.from_user.id = user_id
+    callback.data = CallbackData.Antibot.CONFIRM_HUMANITY_RAID
+    callback.message = MagicMock(spec=Message)
+    callback.message.chat = MagicMock()
+    callback.message.chat.id = chat_id
+    callback.message.message_id = message_id
+    callback.message.delete = AsyncMock()
+    callback.answer = AsyncMock()
+    return callback
+
+
+@pytest.mark.asyncio
+async def test_process_raid_humanity_verification_unmutes_pending_member(
+    mock_container: Container,
+) -> None:
+    """Участник из сводного приветствия верифицируется; сообщение остаётся для остальных."""
+    raid_service = AsyncMock(spec=RaidModeService)
+    raid_service.is_pending_verification.return_value = True
+    verify_usecase = AsyncMock(spec=VerifyMemberUseCase)
+    verify_usecase.execute.return_value = ResultVerifyMember(
+        unmuted=True,
+        message=Dialog.Antibot.VERIFIED_SUCCESS,
+    )
+    mock_container.resolve.side_effect = lambda cls: {
+        RaidModeService: raid_service,
+        VerifyMemberUseCase: verify_usecase,
+    }[cls]
+
+    callback = _raid_callback(user_id=42)
+    await process_raid_humanity_verification(
+        callback=callback, container=mock_container
+    )
+
+    verify_usecase.execute.assert_awaited_once_with(
+        user_tgid="42",
+        chat_tgid="-100777",
+    )
+    raid_service.mark_verified.assert_awaited_once_with(
+        chat_tgid="-100777",
+        message_id=55,
+        user_tgid=42,
+    )
+    callback.message.delete.assert_not_called()
+    callback.answer.assert_called_once_with(
+        Dialog.Antibot.VERIFIED_SUCCESS, show_alert=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_raid_humanity_verification_rejects_outsider(
+    mock_container: Container,
+) -> None:
+    """Пользователь не из пачки получает VERIFIED_ERROR_USER, верификация не вызывается."""
+    raid_service = AsyncMock(spec=RaidModeService)
+    raid_service.is_pending_verification.return_value = False
+    verify_usecase = AsyncMock(spec=VerifyMemberUseCase)
+    mock_container.resolve.side_effect = lambda cls: {
+        RaidModeService: raid_service,
+        VerifyMemberUseCase: verify_usecase,
+    }[cls]
+
+    callback = _raid_callback(user_id=7)
+    await process_raid_humanity_verification(
+        callback=callback, container=mock_container
+    )
+
+    verify_usecase.execute.assert_not_called()
+    callback.answer.assert_called_once_with(
+        Dialog.Antibot.VERIFIED_ERROR_USER,
+        show_alert=True,
+    )
@@ -184,3 +184,40 @@ async def test_group_message_handler_ignore_bot(
     # 3. Проверки - ничего не должно быть вызвано
     mock_services["user"].get_or_create.assert_not_called()
     mock_services["save_msg"].execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_group_message_handler_shares_update_context(
+    mock_container: Container, mock_services: dict
+) -> None:
+    """
+    Контекст апдейта передаётся в SaveMessageUseCase и используется
+    автомодерацией вместо повторного запроса чата.
+    """
+    update_context = MagicMock()
+    chat = MagicMock(spec=ChatSession)
+    chat.is_auto_moderation_enabled = False
+    update_context.get_chat = AsyncMock(return_value=chat)
+
+    message = AsyncMock(spec=Message)
+    message.from_user = MagicMock(spec=TGUser)
+    message.from_user.is_bot = False
+    message.from_user.id = 123
+    message.from_user.username = "testuser"
+    message.chat = MagicMock(spec=Chat)
+    message.chat.id = -100123
+    message.chat.title = "Test Group"
+    message.message_id = 556
+    message.text = "Hello"
+    message.content_type = ContentType.TEXT
+    message.date = datetime.now()
+    message.reply_to_message = None
+
+    await group_message_handler(
+        message=message, container=mock_container, update_context=update_context
+    )
+
+    kwargs = mock_services["save_msg"].execute.call_args.kwargs
+    assert kwargs["update_context"] is update_context
+    update_context.get_chat.assert_awaited_once()
+    mock_services["chat"].get_chat.assert_not_called()
@@ -0,0 +1,43 @@
+"""Тесты сборщиков поверх stats() шардов и ограничителя провайдера."""
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from metrics.collectors import AIProviderCollector, ShardingCollector
+from middlewares.sharded_dispatch import ShardedUpdateMiddleware
+from services.chat.summarize.limiter import CircuitBreaker, ProviderLimiter
+
+
+def test_sharding_collector_exports_queue_depths_and_counters() -> None:
+    sharding = ShardedUpdateMiddleware(shards=2, queue_size=10)
+    sharding.processed, sharding.duplicates = 7, 1
+    registry = CollectorRegistry()
+    registry.register(ShardingCollector(sharding.stats))
+
+    assert (
+        registry.get_sample_value("bot_update_shard_queue_depth", {"shard": "1"}) == 0
+    )
+    assert registry.get_sample_value("bot_updates_processed_total") == 7
+    assert registry.get_sample_value("bot_updates_duplicates_total") == 1
+    assert registry.get_sample_value("bot_updates_failed_total") == 0
+
+
+@pytest.mark.asyncio
+async def test_ai_provider_collector_exports_routes_and_circuit_state() -> None:
+    limiter = ProviderLimiter(breaker=CircuitBreaker(failure_threshold=1))
+    async with limiter.slot("summary"):
+        pass
+    with pytest.raises(OSError):
+        async with limiter.slot("spam"):
+            raise OSError("сеть")
+    registry = CollectorRegistry()
+    registry.register(AIProviderCollector(limiter.stats))
+
+    route = {"route": "summary"}
+    assert registry.get_sample_value("ai_provider_calls_total", route) == 1
+    assert registry.get_sample_value("ai_provider_in_flight", route) == 0
+    assert (
+        registry.get_sample_value("ai_provider_failures_total", {"route": "spam"}) == 1
+    )
+    assert registry.get_sample_value("ai_provider_circuit_open") == 1
+    assert registry.get_sample_value("ai_provider_circuit_opened_total") == 1
@@ -0,0 +1,79 @@
+"""Тесты переноса живых значений процесса воркера в общие метрики."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from metrics.live import (
+    _gauge,
+    export_collectors,
+    start_live_export,
+    stop_live_export,
+)
+
+
+class _StubCollector(Collector):
+    def __init__(self) -> None:
+        self.in_flight = 2
+
+    def collect(self):
+        gauge = GaugeMetricFamily(
+            "live_test_in_flight", "Вызовов в работе", labels=["route"]
+        )
+        gauge.add_metric(["summary"], self.in_flight)
+        yield gauge
+        yield CounterMetricFamily("live_test_calls", "Вызовов", value=7)
+
+
+def _value(name: str, labelnames: tuple = (), **labels: str) -> float:
+    gauge = _gauge(name, "", labelnames)
+    samples = [s for metric in gauge.collect() for s in metric.samples]
+    return next(s.value for s in samples if s.labels == labels)
+
+
+def test_export_collectors_copies_samples_into_gauges() -> None:
+    collector = _StubCollector()
+
+    export_collectors([collector])
+    collector.in_flight = 0
+    export_collectors([collector])
+
+    assert _value("live_test_in_flight", ("route",), route="summary") == 0
+    assert _value("live_test_calls_total") == 7
+
+
+@pytest.mark.asyncio
+async def test_single_process_registers_collectors_directly(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    collector = _StubCollector()
+
+    try:
+        assert start_live_export([collector]) is None
+        assert REGISTRY.get_sample_value("live_test_calls_total") == 7
+    finally:
+        REGISTRY.unregister(collector)
+
+
+@pytest.mark.asyncio
+async def test_multiprocess_exports_until_stopped_and_marks_process_dead(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    collector = _StubCollector()
+    collector.in_flight = 5
+
+    task = start_live_export([collector], interval=0.01)
+    assert task is not None
+    await asyncio.sleep(0.02)
+    with patch("metrics.live.mark_process_dead") as mark_dead:
+        await stop_live_export(task)
+
+    assert task.cancelled()
+    mark_dead.assert_called_once()
+    assert _value("live_test_in_flight", ("route",), route="summary") == 5
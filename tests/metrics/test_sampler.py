@@ -0,0 +1,74 @@
+"""Тесты замеров буферов аналитики и очередей TaskIQ."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aio_pika.exceptions import AMQPError
+from prometheus_client import REGISTRY
+
+from metrics.sampler import sample_buffers, sample_task_queues
+from services.time_service import TimeZoneService
+
+
+@pytest.mark.asyncio
+async def test_sample_buffers_sets_length_and_lag() -> None:
+    buffer_service = MagicMock()
+    buffer_service.get_buffer_stats = AsyncMock(
+        return_value={
+            "messages": (12, TimeZoneService.now() - timedelta(seconds=30)),
+            "reactions": (0, None),
+        }
+    )
+
+    await sample_buffers(buffer_service)
+
+    messages = {"buffer": "messages"}
+    assert REGISTRY.get_sample_value("analytics_buffer_length", messages) == 12
+    assert REGISTRY.get_sample_value("analytics_buffer_lag_seconds", messages) >= 30
+    assert (
+        REGISTRY.get_sample_value(
+            "analytics_buffer_lag_seconds", {"buffer": "reactions"}
+        )
+        == 0
+    )
+
+
+@pytest.mark.asyncio
+async def test_sample_buffers_keeps_values_when_redis_unavailable() -> None:
+    buffer_service = MagicMock()
+    buffer_service.get_buffer_stats = AsyncMock(return_value=None)
+
+    await sample_buffers(buffer_service)
+
+
+def _broker(channel: MagicMock) -> MagicMock:
+    broker = MagicMock()
+    broker.write_conn.channel = MagicMock(return_value=channel)
+    channel.__aenter__ = AsyncMock(return_value=channel)
+    channel.__aexit__ = AsyncMock(return_value=False)
+    return broker
+
+
+@pytest.mark.asyncio
+async def test_sample_task_queues_uses_passive_declare() -> None:
+    channel = MagicMock()
+    queue = MagicMock()
+    queue.declaration_result.message_count = 5
+    channel.declare_queue = AsyncMock(return_value=queue)
+
+    await sample_task_queues(_broker(channel), ["taskiq"])
+
+    channel.declare_queue.assert_awaited_once_with("taskiq", passive=True)
+    assert REGISTRY.get_sample_value("taskiq_queue_messages", {"queue": "taskiq"}) == 5
+
+
+@pytest.mark.asyncio
+async def test_sample_task_queues_swallows_broker_errors() -> None:
+    channel = MagicMock()
+    channel.declare_queue = AsyncMock(side_effect=AMQPError("нет очереди"))
+
+    await sample_task_queues(_broker(channel), ["missing"])
+
+    broker = MagicMock(write_conn=None)
+    await sample_task_queues(broker, ["taskiq"])
@@ -0,0 +1,43 @@
+"""Тесты сервера метрик процессов без FastAPI."""
+
+import socket
+
+import aiohttp
+import pytest
+
+from metrics.server import metrics_registry, start_metrics_server
+from prometheus_client import REGISTRY
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_server_exposes_metrics_and_yields_busy_port() -> None:
+    port = _free_port()
+    runner = await start_metrics_server(port, host="127.0.0.1")
+    assert runner is not None
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://127.0.0.1:{port}/metrics") as response:
+                body = await response.text()
+        assert response.status == 200
+        assert "taskiq_task_duration_seconds" in body
+
+        # Второй процесс воркера не мешает первому
+        assert await start_metrics_server(port, host="127.0.0.1") is None
+    finally:
+        await runner.cleanup()
+
+
+def test_registry_aggregates_processes_with_multiproc_dir(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert metrics_registry() is REGISTRY
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    assert metrics_registry() is not REGISTRY
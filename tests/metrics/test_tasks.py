@@ -0,0 +1,37 @@
+"""Тесты middleware метрик задач TaskIQ."""
+
+from prometheus_client import REGISTRY
+from taskiq import TaskiqMessage, TaskiqResult
+
+from metrics.tasks import TaskMetricsMiddleware
+
+
+def _message(task_id: str) -> TaskiqMessage:
+    return TaskiqMessage(
+        task_id=task_id, task_name="tests:job", labels={}, args=[], kwargs={}
+    )
+
+
+def _result(is_err: bool) -> TaskiqResult[None]:
+    return TaskiqResult(is_err=is_err, return_value=None, execution_time=0.0)
+
+
+def test_duration_and_errors_are_recorded_per_task() -> None:
+    middleware = TaskMetricsMiddleware()
+    labels = {"task": "tests:job"}
+    count_before = (
+        REGISTRY.get_sample_value("taskiq_task_duration_seconds_count", labels) or 0
+    )
+    errors_before = REGISTRY.get_sample_value("taskiq_task_errors_total", labels) or 0
+
+    for task_id, is_err in (("1", False), ("2", True)):
+        message = middleware.pre_execute(_message(task_id))
+        middleware.post_execute(message, _result(is_err))
+
+    assert REGISTRY.get_sample_value("taskiq_task_duration_seconds_count", labels) == (
+        count_before + 2
+    )
+    assert REGISTRY.get_sample_value("taskiq_task_errors_total", labels) == (
+        errors_before + 1
+    )
+    assert middleware._started == {}
@@ -3,7 +3,7 @@
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from aiogram.types import Message, User
+from aiogram.types import Chat, Message, User
 
 from middlewares.language_middleware import LanguageMiddleware
 
@@ -66,3 +66,62 @@ async def test_language_middleware_calls_handler_and_sets_user_language(
     assert "user_language" in data
     assert data["user_language"] in ("ru", "en")
     assert result == "ok"
+
+
+def _group_message(text: str) -> Message:
+    return Message.model_construct(
+        message_id=2,
+        date=MagicMock(),
+        chat=Chat.model_construct(id=-100, type="supergroup", title="Group"),
+        from_user=User.model_construct(
+            id=999,
+            is_bot=False,
+            first_name="Test",
+            username="user",
+            language_code="ru",
+        ),
+        text=text,
+    )
+
+
+@pytest.mark.asyncio
+async def test_language_middleware_skips_group_chatter(
+    mock_user_service: MagicMock,
+    mock_container: MagicMock,
+    mock_handler: AsyncMock,
+) -> None:
+    """Обычное сообщение группы не требует определения языка."""
+    middleware = LanguageMiddleware(
+        user_service=mock_user_service,
+        container=mock_container,
+    )
+    data = {}
+
+    await middleware(mock_handler, _group_message("привет"), data)
+
+    mock_user_service.get_user.assert_not_called()
+    assert "user_language" not in data
+    mock_handler.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_language_middleware_uses_update_context_for_group_command(
+    mock_user_service: MagicMock,
+    mock_container: MagicMock,
+    mock_handler: AsyncMock,
+) -> None:
+    """Для команд в группе пользователь берётся из контекста апдейта."""
+    db_user = MagicMock(language="en")
+    update_context = MagicMock(user_tg_id="999")
+    update_context.find_user = AsyncMock(return_value=db_user)
+    middleware = LanguageMiddleware(
+        user_service=mock_user_service,
+        container=mock_container,
+    )
+    data = {"update_context": update_context}
+
+    await middleware(mock_handler, _group_message("/warn"), data)
+
+    update_context.find_user.assert_awaited_once()
+    mock_user_service.get_user.assert_not_called()
+    assert data["user_language"] == "en"
@@ -0,0 +1,96 @@
+"""Тесты middleware метрик: обработчики aiogram и запросы к Bot API."""
+
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram import Dispatcher, Router
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.methods import DeleteMessage, SendMessage
+from aiogram.types import Message, Update
+from prometheus_client import REGISTRY
+
+from middlewares.metrics import HandlerMetricsMiddleware, TelegramApiMetricsMiddleware
+
+
+def _sample(name: str, **labels: str) -> float:
+    value: Optional[float] = REGISTRY.get_sample_value(name, labels)
+    return value or 0.0
+
+
+def _message_update(update_id: int, text: str) -> Update:
+    return Update.model_validate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": -1, "type": "supergroup"},
+                "from": {"id": 1, "is_bot": False, "first_name": "U"},
+                "text": text,
+            },
+        }
+    )
+
+
+async def ok_handler(message: Message) -> None:
+    return None
+
+
+async def failing_handler(message: Message) -> None:
+    raise RuntimeError("сбой")
+
+
+@pytest.mark.asyncio
+async def test_handler_metrics_cover_nested_routers_and_errors() -> None:
+    """Middleware диспетчера замеряет обработчики вложенных роутеров."""
+    dp = Dispatcher(storage=MemoryStorage())
+    dp.message.middleware(HandlerMetricsMiddleware())
+    router = Router()
+    router.message.register(ok_handler, lambda m: m.text == "ok")
+    router.message.register(failing_handler)
+    dp.include_router(router)
+    ok = {"event_type": "Message", "handler": f"{__name__}.ok_handler"}
+    failing = {"event_type": "Message", "handler": f"{__name__}.failing_handler"}
+    ok_before = _sample("bot_handler_duration_seconds_count", **ok)
+    failing_before = _sample("bot_handler_duration_seconds_count", **failing)
+    errors_before = _sample("bot_handler_errors_total", **failing)
+    bot = MagicMock()
+
+    await dp.feed_update(bot, _message_update(1, "ok"))
+    with pytest.raises(RuntimeError):
+        await dp.feed_update(bot, _message_update(2, "fail"))
+
+    assert _sample("bot_handler_duration_seconds_count", **ok) == ok_before + 1
+    assert (
+        _sample("bot_handler_duration_seconds_count", **failing) == failing_before + 1
+    )
+    assert _sample("bot_handler_errors_total", **failing) == errors_before + 1
+    assert _sample("bot_handler_errors_total", **ok) == 0
+
+
+@pytest.mark.asyncio
+async def test_api_metrics_time_requests_and_count_errors_by_type() -> None:
+    middleware = TelegramApiMetricsMiddleware()
+    send = SendMessage(chat_id=-1, text="x")
+    delete = DeleteMessage(chat_id=-1, message_id=1)
+    error = {"method": "DeleteMessage", "error": "TelegramBadRequest"}
+    sent_before = _sample(
+        "telegram_api_request_duration_seconds_count", method="SendMessage"
+    )
+    errors_before = _sample("telegram_api_errors_total", **error)
+
+    response = MagicMock()
+    assert await middleware(AsyncMock(return_value=response), MagicMock(), send) is (
+        response
+    )
+    failing = AsyncMock(side_effect=TelegramBadRequest(method=delete, message="x"))
+    with pytest.raises(TelegramBadRequest):
+        await middleware(failing, MagicMock(), delete)
+
+    assert (
+        _sample("telegram_api_request_duration_seconds_count", method="SendMessage")
+        == sent_before + 1
+    )
+    assert _sample("telegram_api_errors_total", **error) == errors_before + 1
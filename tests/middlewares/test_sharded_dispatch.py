@@ -0,0 +1,149 @@
+"""Тесты ShardedUpdateMiddleware: порядок внутри чата, параллельность, дубли."""
+
+import asyncio
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.types import CallbackQuery, Chat, InlineQuery, Message, Update, User
+
+from middlewares.sharded_dispatch import ShardedUpdateMiddleware, shard_key
+
+
+def _message_update(update_id: int, chat_id: int) -> Update:
+    return Update.model_construct(
+        update_id=update_id,
+        message=Message.model_construct(
+            message_id=update_id,
+            date=MagicMock(),
+            chat=Chat.model_construct(id=chat_id, type="supergroup"),
+        ),
+    )
+
+
+def test_shard_key_uses_chat_then_user_then_update_id() -> None:
+    """Ключ — чат сообщения/колбэка, иначе пользователь, иначе update_id."""
+    user = User.model_construct(id=42, is_bot=False, first_name="U")
+    callback = Update.model_construct(
+        update_id=2,
+        callback_query=CallbackQuery.model_construct(
+            id="1",
+            from_user=user,
+            chat_instance="x",
+            message=Message.model_construct(
+                message_id=1,
+                date=MagicMock(),
+                chat=Chat.model_construct(id=-7, type="supergroup"),
+            ),
+        ),
+    )
+    inline = Update.model_construct(
+        update_id=3,
+        inline_query=InlineQuery.model_construct(
+            id="1", from_user=user, query="", offset=""
+        ),
+    )
+
+    assert shard_key(_message_update(1, -5)) == -5
+    assert shard_key(callback) == -7
+    assert shard_key(inline) == 42
+
+
+@pytest.mark.asyncio
+async def test_passes_through_when_not_started() -> None:
+    """Без запущенных воркеров апдейт обрабатывается напрямую."""
+    middleware = ShardedUpdateMiddleware(shards=2, queue_size=10)
+    handler = AsyncMock(return_value="ok")
+
+    result = await middleware(handler, _message_update(1, -1), {})
+
+    assert result == "ok"
+    handler.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_same_chat_processed_in_order_other_chats_in_parallel() -> None:
+    """Апдейты одного чата идут по порядку; медленный чат не держит другой."""
+    middleware = ShardedUpdateMiddleware(shards=2, queue_size=10)
+    processed: List[int] = []
+    slow_release = asyncio.Event()
+
+    async def handler(update: Update, data: dict) -> None:
+        if update.update_id == 1:
+            await slow_release.wait()
+        processed.append(update.update_id)
+
+    await middleware.start()
+    # Чат -2 → шард 0, чат -1 → шард 1
+    await middleware(handler, _message_update(1, -2), {})
+    await middleware(handler, _message_update(2, -2), {})
+    await middleware(handler, _message_update(3, -1), {})
+    await asyncio.sleep(0.01)
+
+    assert processed == [3]
+
+    slow_release.set()
+    await middleware.stop()
+
+    assert processed == [3, 1, 2]
+    assert middleware.stats()["processed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_dropped() -> None:
+    """Повтор update_id отбрасывается дедупликатором."""
+    deduplicator = MagicMock()
+    deduplicator.first_seen = AsyncMock(side_effect=[True, False])
+    middleware = ShardedUpdateMiddleware(
+        shards=1, queue_size=10, deduplicator=deduplicator
+    )
+    handler = AsyncMock()
+
+    await middleware.start()
+    await middleware(handler, _message_update(1, -1), {})
+    await middleware(handler, _message_update(1, -1), {})
+    await middleware.stop()
+
+    handler.assert_awaited_once()
+    assert middleware.stats()["duplicates"] == 1
+
+
+@pytest.mark.asyncio
+async def test_handler_error_is_counted_and_worker_survives() -> None:
+    """Ошибка обработчика не останавливает шард."""
+    middleware = ShardedUpdateMiddleware(shards=1, queue_size=10)
+    handler = AsyncMock(side_effect=[RuntimeError("boom"), None])
+
+    await middleware.start()
+    await middleware(handler, _message_update(1, -1), {})
+    await middleware(handler, _message_update(2, -1), {})
+    await middleware.stop()
+
+    stats = middleware.stats()
+    assert stats["failed"] == 1
+    assert stats["processed"] == 1
+    assert stats["queue_depths"] == [0]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_applies_backpressure() -> None:
+    """Заполненный шард заставляет приём апдейтов ждать."""
+    middleware = ShardedUpdateMiddleware(shards=1, queue_size=1)
+    release = asyncio.Event()
+
+    async def handler(update: Update, data: dict) -> None:
+        await release.wait()
+
+    await middleware.start()
+    await middleware(handler, _message_update(1, -1), {})
+    await asyncio.sleep(0)
+    await middleware(handler, _message_update(2, -1), {})
+    blocked = asyncio.create_task(middleware(handler, _message_update(3, -1), {}))
+    await asyncio.sleep(0.01)
+
+    assert not blocked.done()
+    assert middleware.queue_depths() == [1]
+
+    release.set()
+    await blocked
+    await middleware.stop()
@@ -0,0 +1,53 @@
+"""Тесты UpdateContextMiddleware: создание контекста апдейта в data."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.types import Chat, Message, User
+
+from middlewares.update_context_middleware import UpdateContextMiddleware
+from services.update_context import UpdateContext
+
+
+def _message() -> Message:
+    return Message.model_construct(
+        message_id=1,
+        date=MagicMock(),
+        chat=Chat.model_construct(id=-100, type="supergroup", title="Group"),
+        from_user=User.model_construct(
+            id=999, is_bot=False, first_name="Test", username="user"
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_puts_lazy_context_into_data() -> None:
+    """В data появляется контекст с id пользователя и чата, без загрузки."""
+    user_service = AsyncMock()
+    chat_service = AsyncMock()
+    middleware = UpdateContextMiddleware(user_service, chat_service)
+    handler = AsyncMock(return_value="ok")
+    data: dict = {}
+
+    result = await middleware(handler, _message(), data)
+
+    assert result == "ok"
+    context = data["update_context"]
+    assert isinstance(context, UpdateContext)
+    assert context.user_tg_id == "999"
+    assert context.chat_tg_id == "-100"
+    assert context.chat_title == "Group"
+    user_service.get_user.assert_not_called()
+    chat_service.get_or_create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_middleware_keeps_existing_context() -> None:
+    """Контекст, созданный раньше в цепочке, не пересоздаётся."""
+    middleware = UpdateContextMiddleware(AsyncMock(), AsyncMock())
+    existing = MagicMock()
+    data = {"update_context": existing}
+
+    await middleware(AsyncMock(), _message(), data)
+
+    assert data["update_context"] is existing
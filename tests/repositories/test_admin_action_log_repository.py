@@ -33,8 +33,8 @@ async def test_create_log(db_manager: Any) -> None:
 
 
 @pytest.mark.asyncio
-async def test_get_logs_paginated(db_manager: Any) -> None:
-    """Тестирует получение всех логов с пагинацией."""
+async def test_get_logs_page(db_manager: Any) -> None:
+    """Тестирует keyset-пагинацию всех логов вперёд и назад."""
     # Arrange
     repo = AdminActionLogRepository(db_manager)
     async with db_manager.session() as session:
@@ -54,16 +54,25 @@ async def test_get_logs_paginated(db_manager: Any) -> None:
         await session.commit()
 
     # Act & Assert
-    # Page 1
-    logs_p1, total = await repo.get_logs_paginated(page=1, limit=10)
+    assert await repo.count_logs() >= 15
 
-    assert total >= 15
+    # Page 1
+    logs_p1 = await repo.get_logs_page(limit=10)
     assert len(logs_p1) == 10
 
-    # Page 2
-    logs_p2, total = await repo.get_logs_paginated(page=2, limit=10)
-    assert total >= 15
+    # Page 2 — после последней записи первой страницы
+    last = logs_p1[-1]
+    logs_p2 = await repo.get_logs_page(limit=10, cursor=(last.created_at, last.id))
     assert len(logs_p2) >= 5
+    assert not {log.id for log in logs_p1} & {log.id for log in logs_p2}
+    assert (logs_p2[0].created_at, logs_p2[0].id) < (last.created_at, last.id)
+
+    # Назад от первой записи второй страницы — снова первая страница
+    first = logs_p2[0]
+    logs_back = await repo.get_logs_page(
+        limit=10, cursor=(first.created_at, first.id), backward=True
+    )
+    assert [log.id for log in logs_back] == [log.id for log in logs_p1]
 
 
 @pytest.mark.asyncio
@@ -95,7 +104,8 @@ async def test_get_logs_by_admin(db_manager: Any) -> None:
         admin_id_a = admin_a.id
 
     # Act
-    logs_a, total_a = await repo.get_logs_by_admin(admin_id=admin_id_a)
+    logs_a = await repo.get_logs_page(admin_id=admin_id_a)
+    total_a = await repo.count_logs(admin_id=admin_id_a)
 
     # Assert
     assert total_a == 5
@@ -11,7 +11,7 @@ from repositories.message_repository import MessageRepository
 
 
 @pytest.mark.asyncio
-async def test_get_messages_for_summary_empty(db_manager: Any) -> None:
+async def test_get_messages_for_summary_windows_empty(db_manager: Any) -> None:
     """Пустой список сообщений для саммари при отсутствии данных."""
     async with db_manager.session() as session:
         chat = ChatSession(chat_id="-100_msg_sum", title="Msg Sum")
@@ -20,12 +20,12 @@ async def test_get_messages_for_summary_empty(db_manager: Any) -> None:
         chat_id = chat.id
 
     repo = MessageRepository(db_manager)
-    result = await repo.get_messages_for_summary(chat_id=chat_id, limit=10)
+    result = await repo.get_messages_for_summary_windows(chat_id=chat_id, limit=10)
     assert result == []
 
 
 @pytest.mark.asyncio
-async def test_get_messages_for_summary_with_messages(db_manager: Any) -> None:
+async def test_get_messages_for_summary_windows_with_messages(db_manager: Any) -> None:
     """Получение текстовых сообщений для саммари."""
     now = datetime.now(timezone.utc)
     async with db_manager.session() as session:
@@ -47,14 +47,14 @@ async def test_get_messages_for_summary_with_messages(db_manager: Any) -> None:
         chat_id = chat.id
 
     repo = MessageRepository(db_manager)
-    result = await repo.get_messages_for_summary(chat_id=chat_id, limit=10)
+    result = await repo.get_messages_for_summary_windows(chat_id=chat_id, limit=10)
     assert len(result) == 1
-    assert result[0] == ("Hello", "msg_user")
+    assert result[0][2:] == ("Hello", "msg_user")
 
 
 @pytest.mark.asyncio
-async def test_get_messages_for_summary_with_dates(db_manager: Any) -> None:
-    """get_messages_for_summary с start_date и end_date фильтрует по периоду."""
+async def test_get_messages_for_summary_windows_with_dates(db_manager: Any) -> None:
+    """get_messages_for_summary_windows с start_date и end_date фильтрует по периоду."""
     now = datetime.now(timezone.utc)
     start = now - timedelta(hours=2)
     end = now - timedelta(hours=1)
@@ -77,11 +77,11 @@ async def test_get_messages_for_summary_with_dates(db_manager: Any) -> None:
         chat_id = chat.id
 
     repo = MessageRepository(db_manager)
-    result = await repo.get_messages_for_summary(
+    result = await repo.get_messages_for_summary_windows(
         chat_id=chat_id, limit=10, start_date=start, end_date=end
     )
     assert len(result) >= 1
-    assert result[0][0] == "In range"
+    assert result[0][2] == "In range"
 
 
 @pytest.mark.asyncio
@@ -134,6 +134,44 @@ async def test_get_messages_by_chat_id_and_period(db_manager: Any) -> None:
     assert len(result_tracked) >= 1
 
 
+@pytest.mark.asyncio
+async def test_get_messages_by_chat_ids_and_period(db_manager: Any) -> None:
+    """Сообщения нескольких чатов за период одним запросом."""
+    now = datetime.now(timezone.utc)
+    async with db_manager.session() as session:
+        chat1 = ChatSession(chat_id="-100_msg_batch_1", title="Msg Batch 1")
+        chat2 = ChatSession(chat_id="-100_msg_batch_2", title="Msg Batch 2")
+        user = User(tg_id="msg_batch", username="msg_batch")
+        session.add_all([chat1, chat2, user])
+        await session.flush()
+        session.add_all(
+            [
+                ChatMessage(
+                    chat_id=chat.id,
+                    user_id=user.id,
+                    message_id=f"mb{chat.id}",
+                    message_type="text",
+                    content_type="text",
+                    text="Hi",
+                    created_at=now,
+                )
+                for chat in (chat1, chat2)
+            ]
+        )
+        await session.commit()
+        chat_ids = [chat1.id, chat2.id]
+        user_id = user.id
+
+    repo = MessageRepository(db_manager)
+    result = await repo.get_messages_by_chat_ids_and_period(
+        chat_ids=chat_ids,
+        start_date=now - timedelta(hours=1),
+        end_date=now + timedelta(hours=1),
+        tracked_user_ids=[user_id],
+    )
+    assert {m.chat_id for m in result} == set(chat_ids)
+
+
 @pytest.mark.asyncio
 async def test_get_max_message_id(db_manager: Any) -> None:
     """Максимальный id сообщения в чате."""
@@ -201,6 +239,37 @@ async def test_count_messages_since(db_manager: Any) -> None:
     assert count >= 1
 
 
+@pytest.mark.asyncio
+async def test_count_messages_by_day(db_manager: Any) -> None:
+    """Подсчёт текстовых сообщений по дням одним запросом."""
+    now = datetime.now(timezone.utc).replace(hour=12, minute=0)
+    async with db_manager.session() as session:
+        chat = ChatSession(chat_id="-100_msg_day", title="Msg Day")
+        user = User(tg_id="msg_d", username="msg_d")
+        session.add_all([chat, user])
+        await session.flush()
+        for i, created_at in enumerate([now, now, now - timedelta(days=1)]):
+            session.add(
+                ChatMessage(
+                    chat_id=chat.id,
+                    user_id=user.id,
+                    message_id=f"md{i}",
+                    message_type="text",
+                    content_type="text",
+                    text="x",
+                    created_at=created_at,
+                )
+            )
+        await session.commit()
+
+    repo = MessageRepository(db_manager)
+    counts = await repo.count_messages_by_day(
+        start=now - timedelta(days=2), end=now + timedelta(hours=1), tz_name="UTC"
+    )
+    assert counts[now.strftime("%Y-%m-%d")] >= 2
+    assert counts[(now - timedelta(days=1)).strftime("%Y-%m-%d")] >= 1
+
+
 @pytest.mark.asyncio
 async def test_bulk_create_messages_empty(db_manager: Any) -> None:
     """bulk_create_messages с пустым списком возвращает 0."""
@@ -310,3 +379,85 @@ async def test_get_messages_by_period_date_and_chats(db_manager: Any) -> None:
     )
     assert len(result) == 2
     assert {m.chat_id for m in result} == {chat1.id, chat2.id}
+
+
+@pytest.mark.asyncio
+async def test_iter_messages_for_export(db_manager: Any) -> None:
+    """Потоковая выгрузка сообщений чата пачками в порядке времени."""
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    async with db_manager.session() as session:
+        chat = ChatSession(chat_id="-100_msg_exp", title="Msg Export")
+        user = User(tg_id="msg_exp", username="msg_exp")
+        session.add_all([chat, user])
+        await session.flush()
+        for i in range(5):
+            session.add(
+                ChatMessage(
+                    chat_id=chat.id,
+                    user_id=user.id,
+                    message_id=f"exp{i}",
+                    message_type="text",
+                    content_type="text",
+                    text=f"t{i}",
+                    created_at=now - timedelta(minutes=5 - i),
+                )
+            )
+        await session.commit()
+        chat_id = chat.id
+
+    repo = MessageRepository(db_manager)
+    batches = [
+        batch
+        async for batch in repo.iter_messages_for_export(
+            start=now - timedelta(hours=1),
+            end=now + timedelta(hours=1),
+            chat_id=chat_id,
+            batch_size=2,
+        )
+    ]
+    rows = [row for batch in batches for row in batch]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [row[5] for row in rows] == [f"exp{i}" for i in range(5)]
+    assert tuple(rows[0][1:5]) == ("-100_msg_exp", "Msg Export", "msg_exp", "msg_exp")
+
+
+@pytest.mark.asyncio
+async def test_iter_daily_counts_for_export(db_manager: Any) -> None:
+    """Потоковая выгрузка дневных счётчиков пользователя."""
+    now = datetime.now(timezone.utc).replace(hour=12, minute=0)
+    async with db_manager.session() as session:
+        chat = ChatSession(chat_id="-100_msg_exp_d", title="Msg Export Daily")
+        user = User(tg_id="msg_exp_d", username="msg_exp_d")
+        session.add_all([chat, user])
+        await session.flush()
+        for i, created_at in enumerate([now, now, now - timedelta(days=1)]):
+            session.add(
+                ChatMessage(
+                    chat_id=chat.id,
+                    user_id=user.id,
+                    message_id=f"expd{i}",
+                    message_type="text",
+                    content_type="text",
+                    text="x",
+                    created_at=created_at,
+                )
+            )
+        await session.commit()
+        user_id = user.id
+
+    repo = MessageRepository(db_manager)
+    rows = [
+        row
+        async for batch in repo.iter_daily_counts_for_export(
+            start=now - timedelta(days=2),
+            end=now + timedelta(hours=1),
+            tz_name="UTC",
+            user_id=user_id,
+        )
+        for row in batch
+    ]
+    counts = {row[0].strftime("%Y-%m-%d"): row[5] for row in rows}
+    assert counts == {
+        (now - timedelta(days=1)).strftime("%Y-%m-%d"): 1,
+        now.strftime("%Y-%m-%d"): 2,
+    }
@@ -348,3 +348,46 @@ async def test_get_punishment_counts_by_moderators(db_manager: Any) -> None:
         assert stats[mod2.id]["bans"] == 1
         assert stats[999]["warns"] == 0
         assert stats[999]["bans"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_action_counts_by_moderators(db_manager: Any) -> None:
+    """Сводная статистика модераторов за сегодня и за всё время одним запросом."""
+    async with db_manager.session() as session:
+        mod1 = await create_test_user(session, "1", "mod1")
+        mod2 = await create_test_user(session, "2", "mod2")
+        user = await create_test_user(session, "3", "user")
+        chat = await create_test_chat(session, "-1", "chat")
+
+        repo = PunishmentRepository(db_manager)
+
+        now = datetime.now()
+        await repo.create_punishment(
+            Punishment(
+                user_id=user.id,
+                chat_id=chat.id,
+                step=1,
+                punishment_type=PunishmentType.WARNING,
+                punished_by_id=mod1.id,
+                created_at=now - timedelta(days=3),
+            )
+        )
+        await repo.create_punishment(
+            Punishment(
+                user_id=user.id,
+                chat_id=chat.id,
+                step=2,
+                punishment_type=PunishmentType.BAN,
+                punished_by_id=mod1.id,
+            )
+        )
+
+        stats = await repo.get_action_counts_by_moderators(
+            moderator_ids=[mod1.id, mod2.id],
+            today_start=now - timedelta(hours=1),
+            end_date=now + timedelta(days=1),
+        )
+
+        assert stats[mod1.id] == {"today": 1, "total": 2}
+        assert stats[mod2.id] == {"today": 0, "total": 0}
+        assert await repo.get_action_counts_by_moderators([], now, now) == {}
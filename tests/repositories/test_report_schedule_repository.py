@@ -128,6 +128,40 @@ async def test_update_schedule_not_found(db_manager: Any) -> None:
     assert await repo.update_schedule(99999, enabled=False) is None
 
 
+@pytest.mark.asyncio
+async def test_get_enabled_run_times(db_manager: Any) -> None:
+    """get_enabled_run_times возвращает только включённые расписания со временем запуска."""
+    run_at = datetime(2030, 1, 1, 9, 0, tzinfo=timezone.utc)
+    async with db_manager.session() as session:
+        enabled_chat = ChatSession(chat_id="-100_rs_rt_on", title="RS On")
+        disabled_chat = ChatSession(chat_id="-100_rs_rt_off", title="RS Off")
+        session.add_all([enabled_chat, disabled_chat])
+        await session.flush()
+        enabled = ReportSchedule(
+            chat_id=enabled_chat.id,
+            timezone="Europe/Moscow",
+            sent_time=time(12, 0),
+            enabled=True,
+            next_run_at=run_at,
+        )
+        disabled = ReportSchedule(
+            chat_id=disabled_chat.id,
+            timezone="Europe/Moscow",
+            sent_time=time(12, 0),
+            enabled=False,
+            next_run_at=None,
+        )
+        session.add_all([enabled, disabled])
+        await session.commit()
+        enabled_id, disabled_id = enabled.id, disabled.id
+
+    repo = ReportScheduleRepository(db_manager)
+    run_times = dict(await repo.get_enabled_run_times())
+
+    assert run_times[enabled_id] == run_at
+    assert disabled_id not in run_times
+
+
 def test_calculate_next_run_today_future(db_manager: Any) -> None:
     """_calculate_next_run: если время отправки ещё не прошло сегодня — следующее сегодня."""
     from types import SimpleNamespace
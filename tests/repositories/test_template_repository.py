@@ -6,6 +6,7 @@ import pytest
 
 from models import ChatSession, MessageTemplate, TemplateCategory, User
 from repositories.template_repository import MessageTemplateRepository
+from services.templates.search_index import TemplateSearchIndex
 
 
 @pytest.mark.asyncio
@@ -313,3 +314,92 @@ async def test_update_template_content_not_found(db_manager: Any) -> None:
     """update_template_content для несуществующего id возвращает False."""
     repo = MessageTemplateRepository(db_manager)
     assert await repo.update_template_content(99999, {"text": "x"}) is False
+
+
+@pytest.mark.asyncio
+async def test_get_templates_by_query_ranks_prefix_first(db_manager: Any) -> None:
+    """Названия, начинающиеся с запроса, идут раньше прочих совпадений."""
+    async with db_manager.session() as session:
+        user = User(tg_id="tpl_rank", username="tpl_rank")
+        cat = TemplateCategory(name="CatRank", sort_order=0)
+        session.add_all([user, cat])
+        await session.flush()
+        for title, usage in (("Про RankQuery", 100), ("RankQuery основной", 1)):
+            session.add(
+                MessageTemplate(
+                    title=title,
+                    content="x",
+                    category_id=cat.id,
+                    author_id=user.id,
+                    usage_count=usage,
+                )
+            )
+        await session.commit()
+
+    repo = MessageTemplateRepository(db_manager)
+    result = await repo.get_templates_by_query("rankquery", limit=10)
+    assert [t.title for t in result] == ["RankQuery основной", "Про RankQuery"]
+
+
+@pytest.mark.asyncio
+async def test_get_templates_for_search_index_unique_titles(db_manager: Any) -> None:
+    """Для индекса поиска берётся по одному шаблону на название."""
+    async with db_manager.session() as session:
+        user = User(tg_id="tpl_idx", username="tpl_idx")
+        cat = TemplateCategory(name="CatIdx", sort_order=0)
+        session.add_all([user, cat])
+        await session.flush()
+        for _ in range(2):
+            session.add(
+                MessageTemplate(
+                    title="IndexDuplicateTitle",
+                    content="x",
+                    category_id=cat.id,
+                    author_id=user.id,
+                )
+            )
+        await session.commit()
+
+    repo = MessageTemplateRepository(db_manager)
+    result = await repo.get_templates_for_search_index(limit=1000)
+    assert [t.title for t in result].count("IndexDuplicateTitle") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        # Короче триграммы: подстрока в любом месте, в т.ч. в середине слова
+        ("zq", {"Zq rules", "Pay Zq order", "aZqa"}),
+        ("Q", {"Zq rules", "Pay Zq order", "aZqa"}),
+        ("zq r", {"Zq rules"}),
+        ("pay zq", {"Pay Zq order"}),
+    ],
+)
+async def test_search_index_matches_database_search(
+    db_manager: Any, query: str, expected: set
+) -> None:
+    """In-memory индекс находит те же названия, что и ILIKE в БД."""
+    async with db_manager.session() as session:
+        user = User(tg_id=f"tpl_parity_{query}", username=f"tpl_parity_{query}")
+        cat = TemplateCategory(name=f"CatParity {query}", sort_order=0)
+        session.add_all([user, cat])
+        await session.flush()
+        for title in ("Zq rules", "Pay Zq order", "aZqa", "Other"):
+            session.add(
+                MessageTemplate(
+                    title=title,
+                    content="x",
+                    category_id=cat.id,
+                    author_id=user.id,
+                )
+            )
+        await session.commit()
+
+    repo = MessageTemplateRepository(db_manager)
+    from_db = {t.title for t in await repo.get_templates_by_query(query, limit=1000)}
+    from_index = await TemplateSearchIndex(repo).search(query, limit=1000)
+
+    assert from_index is not None
+    assert {t.title for t in from_index} == from_db
+    assert expected <= from_db
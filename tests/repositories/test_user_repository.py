@@ -529,6 +529,49 @@ async def test_get_user_by_username_case_insensitive(db_manager: Any) -> None:
     assert found.username == "CaseUser"
 
 
+@pytest.mark.asyncio
+async def test_get_admin_and_tracked_user_ids_in_batch(db_manager: Any) -> None:
+    """Пакетные варианты: админы по чатам и отслеживаемые по админам."""
+    from models import AdminChatAccess, ChatSession, admin_user_tracking
+
+    repo = UserRepository(db_manager)
+    async with db_manager.session() as session:
+        chat1 = ChatSession(chat_id="chat_tr_batch_1", title="Batch 1")
+        chat2 = ChatSession(chat_id="chat_tr_batch_2", title="Batch 2")
+        a1 = User(tg_id="a1_tr_batch", username="a1_tr_batch", role=UserRole.ADMIN)
+        a2 = User(tg_id="a2_tr_batch", username="a2_tr_batch", role=UserRole.ADMIN)
+        u1 = User(tg_id="u1_tr_batch", username="u1_tr_batch")
+        u2 = User(tg_id="u2_tr_batch", username="u2_tr_batch")
+        session.add_all([chat1, chat2, a1, a2, u1, u2])
+        await session.flush()
+
+        # a1 — админ обоих чатов, a2 — только второго
+        session.add_all(
+            [
+                AdminChatAccess(admin_id=a1.id, chat_id=chat1.id),
+                AdminChatAccess(admin_id=a1.id, chat_id=chat2.id),
+                AdminChatAccess(admin_id=a2.id, chat_id=chat2.id),
+            ]
+        )
+        await session.execute(
+            admin_user_tracking.insert().values(
+                [
+                    {"admin_id": a1.id, "tracked_user_id": u1.id},
+                    {"admin_id": a2.id, "tracked_user_id": u2.id},
+                ]
+            )
+        )
+        await session.commit()
+        chat1_id, chat2_id = chat1.id, chat2.id
+        a1_id, a2_id, u1_id, u2_id = a1.id, a2.id, u1.id, u2.id
+
+    admins = await repo.get_admin_ids_by_chats([chat1_id, chat2_id])
+    tracked = await repo.get_tracked_user_ids_by_admins([a1_id, a2_id])
+
+    assert admins == {chat1_id: {a1_id}, chat2_id: {a1_id, a2_id}}
+    assert tracked == {a1_id: {u1_id}, a2_id: {u2_id}}
+
+
 @pytest.mark.asyncio
 async def test_get_tracked_users_for_admin_admin_not_found(db_manager: Any) -> None:
     """get_tracked_users_for_admin для несуществующего админа возвращает []."""
@@ -1,5 +1,6 @@
 """Тесты для AdminActionLogService."""
 
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
@@ -7,8 +8,13 @@ import pytest
 from sqlalchemy.exc import SQLAlchemyError
 
 from constants.enums import AdminActionType
-from repositories import AdminActionLogRepository, UserRepository
+from dto.buffer import BufferedAdminActionLogDTO
+from models import AdminActionLog
+from repositories import AdminActionLogRepository
+from services import AnalyticsBufferService, UserService
 from services.admin_action_log_service import AdminActionLogService
+from services.caching import ICache
+from utils.keyset_cursor import decode_cursor, encode_cursor
 
 
 @pytest.fixture
@@ -17,31 +23,64 @@ def mock_log_repo() -> AsyncMock:
 
 
 @pytest.fixture
-def mock_user_repo() -> AsyncMock:
-    return AsyncMock(spec=UserRepository)
+def mock_user_service() -> AsyncMock:
+    return AsyncMock(spec=UserService)
+
+
+@pytest.fixture
+def mock_buffer_service() -> AsyncMock:
+    buffer_service = AsyncMock(spec=AnalyticsBufferService)
+    buffer_service.add_admin_log = AsyncMock(return_value=True)
+    return buffer_service
+
+
+@pytest.fixture
+def mock_cache() -> AsyncMock:
+    cache = AsyncMock(spec=ICache)
+    cache.get = AsyncMock(return_value=None)
+    return cache
 
 
 @pytest.fixture
 def service(
     mock_log_repo: AsyncMock,
-    mock_user_repo: AsyncMock,
+    mock_user_service: AsyncMock,
+    mock_buffer_service: AsyncMock,
+    mock_cache: AsyncMock,
 ) -> AdminActionLogService:
     return AdminActionLogService(
         log_repository=mock_log_repo,
-        user_repository=mock_user_repo,
+        user_service=mock_user_service,
+        buffer_service=mock_buffer_service,
+        cache=mock_cache,
+        count_ttl_seconds=60,
     )
 
 
+def _make_logs(count: int) -> list[AdminActionLog]:
+    """Логи от новых к старым, как их отдаёт репозиторий."""
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        AdminActionLog(
+            id=100 - i,
+            admin_id=1,
+            action_type="report_user",
+            created_at=base - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
 @pytest.mark.asyncio
-async def test_log_action_user_found(
+async def test_log_action_user_found_buffered(
     service: AdminActionLogService,
-    mock_user_repo: AsyncMock,
+    mock_user_service: AsyncMock,
     mock_log_repo: AsyncMock,
+    mock_buffer_service: AsyncMock,
 ) -> None:
-    """При найденном пользователе создаётся запись в логе."""
+    """При найденном пользователе запись уходит в буфер, в БД напрямую не пишется."""
     admin = SimpleNamespace(id=1, tg_id="123", username="admin")
-    mock_user_repo.get_user_by_tg_id = AsyncMock(return_value=admin)
-    mock_log_repo.create_log = AsyncMock()
+    mock_user_service.get_user = AsyncMock(return_value=admin)
 
     await service.log_action(
         admin_tg_id="123",
@@ -49,41 +88,47 @@ async def test_log_action_user_found(
         details="Отчёт за период",
     )
 
-    mock_user_repo.get_user_by_tg_id.assert_called_once_with(tg_id="123")
-    mock_log_repo.create_log.assert_called_once_with(
-        admin_id=admin.id,
-        action_type=AdminActionType.REPORT_USER,
-        details="Отчёт за период",
-    )
+    mock_user_service.get_user.assert_called_once_with(tg_id="123")
+    mock_buffer_service.add_admin_log.assert_called_once()
+    buffered = mock_buffer_service.add_admin_log.call_args.args[0]
+    assert isinstance(buffered, BufferedAdminActionLogDTO)
+    assert buffered.admin_id == admin.id
+    assert buffered.action_type == AdminActionType.REPORT_USER.value
+    assert buffered.details == "Отчёт за период"
+    mock_log_repo.create_log.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_log_action_user_not_found(
     service: AdminActionLogService,
-    mock_user_repo: AsyncMock,
+    mock_user_service: AsyncMock,
     mock_log_repo: AsyncMock,
+    mock_buffer_service: AsyncMock,
 ) -> None:
     """При ненайденном пользователе логирование не выполняется."""
-    mock_user_repo.get_user_by_tg_id = AsyncMock(return_value=None)
+    mock_user_service.get_user = AsyncMock(return_value=None)
 
     await service.log_action(
         admin_tg_id="unknown",
         action_type=AdminActionType.REPORT_USER,
     )
 
-    mock_user_repo.get_user_by_tg_id.assert_called_once_with(tg_id="unknown")
+    mock_user_service.get_user.assert_called_once_with(tg_id="unknown")
+    mock_buffer_service.add_admin_log.assert_not_called()
     mock_log_repo.create_log.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_log_action_details_none(
+async def test_log_action_buffer_unavailable_writes_directly(
     service: AdminActionLogService,
-    mock_user_repo: AsyncMock,
+    mock_user_service: AsyncMock,
     mock_log_repo: AsyncMock,
+    mock_buffer_service: AsyncMock,
 ) -> None:
-    """create_log вызывается с details=None если не переданы."""
+    """Без Redis create_log вызывается напрямую (details=None если не переданы)."""
     admin = SimpleNamespace(id=10, tg_id="1", username="a")
-    mock_user_repo.get_user_by_tg_id = AsyncMock(return_value=admin)
+    mock_user_service.get_user = AsyncMock(return_value=admin)
+    mock_buffer_service.add_admin_log = AsyncMock(return_value=False)
     mock_log_repo.create_log = AsyncMock()
 
     await service.log_action(admin_tg_id="1", action_type=AdminActionType.REPORT_USER)
@@ -98,13 +143,80 @@ async def test_log_action_details_none(
 @pytest.mark.asyncio
 async def test_log_action_db_error_swallowed(
     service: AdminActionLogService,
-    mock_user_repo: AsyncMock,
+    mock_user_service: AsyncMock,
     mock_log_repo: AsyncMock,
+    mock_buffer_service: AsyncMock,
 ) -> None:
     """При SQLAlchemyError логирование не пробрасывает исключение."""
     admin = SimpleNamespace(id=10, tg_id="1", username="a")
-    mock_user_repo.get_user_by_tg_id = AsyncMock(return_value=admin)
+    mock_user_service.get_user = AsyncMock(return_value=admin)
+    mock_buffer_service.add_admin_log = AsyncMock(return_value=False)
     mock_log_repo.create_log = AsyncMock(side_effect=SQLAlchemyError("db error"))
 
     await service.log_action(admin_tg_id="1", action_type=AdminActionType.REPORT_USER)
     mock_log_repo.create_log.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_logs_page_first_page_has_next_cursor(
+    service: AdminActionLogService,
+    mock_log_repo: AsyncMock,
+) -> None:
+    """Первая страница: лишняя запись отбрасывается и даёт next_cursor."""
+    logs = _make_logs(4)
+    mock_log_repo.get_logs_page = AsyncMock(return_value=logs)
+
+    page = await service.get_logs_page(limit=3)
+
+    mock_log_repo.get_logs_page.assert_called_once_with(
+        limit=4, admin_id=None, cursor=None, backward=False
+    )
+    assert page.logs == logs[:3]
+    assert page.prev_cursor is None
+    assert page.next_cursor == encode_cursor(logs[2].created_at, logs[2].id)
+
+
+@pytest.mark.asyncio
+async def test_get_logs_page_backward_to_first_page(
+    service: AdminActionLogService,
+    mock_log_repo: AsyncMock,
+) -> None:
+    """Назад без лишней записи — это первая страница: prev_cursor нет."""
+    logs = _make_logs(2)
+    mock_log_repo.get_logs_page = AsyncMock(return_value=logs)
+    cursor = encode_cursor(datetime(2025, 1, 1, tzinfo=timezone.utc), 5)
+
+    page = await service.get_logs_page(
+        limit=3, admin_id=7, cursor=cursor, backward=True
+    )
+
+    mock_log_repo.get_logs_page.assert_called_once_with(
+        limit=4, admin_id=7, cursor=decode_cursor(cursor), backward=True
+    )
+    assert page.logs == logs
+    assert page.prev_cursor is None
+    assert page.next_cursor == encode_cursor(logs[-1].created_at, logs[-1].id)
+
+
+@pytest.mark.asyncio
+async def test_get_logs_page_invalid_cursor(service: AdminActionLogService) -> None:
+    """Некорректный токен курсора — ValueError."""
+    with pytest.raises(ValueError):
+        await service.get_logs_page(limit=3, cursor="garbage")
+
+
+@pytest.mark.asyncio
+async def test_count_logs_cached(
+    service: AdminActionLogService,
+    mock_log_repo: AsyncMock,
+    mock_cache: AsyncMock,
+) -> None:
+    """Количество берётся из кеша, а при промахе считается и кешируется."""
+    mock_log_repo.count_logs = AsyncMock(return_value=42)
+
+    assert await service.count_logs(admin_id=3) == 42
+    mock_cache.set.assert_called_once_with("admin_logs:count:3", 42, ttl=60)
+
+    mock_cache.get = AsyncMock(return_value=41)
+    assert await service.count_logs(admin_id=3) == 41
+    mock_log_repo.count_logs.assert_called_once_with(admin_id=3)
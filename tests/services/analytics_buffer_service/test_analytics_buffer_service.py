@@ -1,23 +1,36 @@
 """Тесты для AnalyticsBufferService: add_message, pop_messages, trim_messages с моком Redis."""
 
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from dto.buffer import BufferedMessageDTO
+from dto.buffer import (
+    BufferedAdminActionLogDTO,
+    BufferedMembershipEventDTO,
+    BufferedMessageDTO,
+)
 from services.analytics_buffer_service import AnalyticsBufferService
+from services.time_service import TimeZoneService
 
 
 @pytest.fixture
 def buffer_service() -> AnalyticsBufferService:
     """Сервис с подменённым подключением к Redis."""
     mock_redis = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    mock_redis.pipeline = MagicMock()
+    mock_redis.pipeline.return_value.__aenter__.return_value = pipe
     svc = AnalyticsBufferService(redis_client=mock_redis)
     svc._connected = True
     return svc
 
 
+def _pipe(svc: AnalyticsBufferService) -> MagicMock:
+    return svc._redis.pipeline.return_value.__aenter__.return_value
+
+
 @pytest.fixture
 def sample_message_dto() -> BufferedMessageDTO:
     return BufferedMessageDTO(
@@ -38,10 +51,76 @@ async def test_add_message_calls_rpush(
 ) -> None:
     """add_message добавляет сериализованное сообщение в буфер через rpush."""
     await buffer_service.add_message(sample_message_dto)
-    buffer_service._redis.rpush.assert_called_once()
-    call_args = buffer_service._redis.rpush.call_args[0]
+    pipe = _pipe(buffer_service)
+    pipe.rpush.assert_called_once()
+    call_args = pipe.rpush.call_args[0]
     assert call_args[0] == AnalyticsBufferService.REDIS_KEY_MESSAGES
     assert b"chat_id" in call_args[1] or b"message_id" in call_args[1]
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_add_message_updates_live_counters(
+    buffer_service: AnalyticsBufferService,
+    sample_message_dto: BufferedMessageDTO,
+) -> None:
+    """В том же pipeline растут лидерборд дня, имена и HyperLogLog активных."""
+    await buffer_service.add_message(sample_message_dto, username="alice")
+    pipe = _pipe(buffer_service)
+    day = TimeZoneService.convert_to_local_time(sample_message_dto.created_at)
+    suffix = f"1:{day.strftime('%Y%m%d')}"
+
+    pipe.zincrby.assert_called_once_with(f"live:leaderboard:{suffix}", 1, 2)
+    pipe.hset.assert_called_once_with(f"live:usernames:{suffix}", "2", "alice")
+    pipe.pfadd.assert_called_once_with(f"live:active_users:{suffix}", 2)
+    pipe.set.assert_called_once()
+    assert pipe.set.call_args.args[0] == AnalyticsBufferService.REDIS_KEY_LIVE_SINCE
+
+    # Отметка начала счётчиков ставится один раз на процесс
+    await buffer_service.add_message(sample_message_dto)
+    pipe.set.assert_called_once()
+
+
+def _live_service(since, ranked, active_users, names) -> AnalyticsBufferService:
+    redis = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[since, ranked, active_users])
+    redis.pipeline = MagicMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    redis.hmget = AsyncMock(return_value=names)
+    svc = AnalyticsBufferService(redis_client=redis)
+    svc._connected = True
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_get_live_day_stats_builds_leaderboard() -> None:
+    """Лидерборд и число активных читаются из живых счётчиков."""
+    today = TimeZoneService.now()
+    since = int((today - timedelta(days=2)).timestamp())
+    svc = _live_service(
+        since=str(since).encode(),
+        ranked=[(b"7", 5.0), (b"9", 3.0)],
+        active_users=4,
+        names=[b"bob", None],
+    )
+
+    top_users, active_users = await svc.get_live_day_stats(1, today.date())
+
+    assert active_users == 4
+    assert [(u.user_id, u.username, u.message_count, u.rank) for u in top_users] == [
+        (7, "bob", 5, 1),
+        (9, "User ID: 9", 3, 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_live_day_stats_returns_none_when_counters_incomplete() -> None:
+    """Счётчики начаты после начала дня (деплой, очистка Redis) — нужна БД."""
+    today = TimeZoneService.now()
+    for since in (None, str(int(today.timestamp()) + 1).encode()):
+        svc = _live_service(since=since, ranked=[], active_users=0, names=[])
+        assert await svc.get_live_day_stats(1, today.date()) is None
 
 
 @pytest.mark.asyncio
@@ -122,11 +201,11 @@ async def test_add_reaction_calls_rpush(
         created_at=datetime.now(timezone.utc),
     )
     await buffer_service.add_reaction(dto)
-    buffer_service._redis.rpush.assert_called_once()
-    assert (
-        buffer_service._redis.rpush.call_args[0][0]
-        == AnalyticsBufferService.REDIS_KEY_REACTIONS
-    )
+    pipe = _pipe(buffer_service)
+    pipe.rpush.assert_called_once()
+    assert pipe.rpush.call_args[0][0] == AnalyticsBufferService.REDIS_KEY_REACTIONS
+    pipe.pfadd.assert_called_once()
+    pipe.zincrby.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -172,3 +251,74 @@ async def test_re_add_replies_empty_does_nothing(
     """re_add_replies с пустым списком не вызывает Redis."""
     await buffer_service.re_add_replies([])
     buffer_service._redis.rpush.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_membership_event_calls_rpush_and_returns_true(
+    buffer_service: AnalyticsBufferService,
+) -> None:
+    """add_membership_event кладёт событие в свой ключ и сообщает об успехе."""
+    dto = BufferedMembershipEventDTO(
+        chat_id=1,
+        user_tgid=2,
+        event_type="join",
+        created_at=datetime.now(timezone.utc),
+    )
+    assert await buffer_service.add_membership_event(dto) is True
+    call_args = buffer_service._redis.rpush.call_args[0]
+    assert call_args[0] == AnalyticsBufferService.REDIS_KEY_MEMBERSHIP_EVENTS
+
+
+@pytest.mark.asyncio
+async def test_add_admin_log_when_connection_fails_returns_false() -> None:
+    """При недоступности Redis add_admin_log возвращает False (нужна прямая запись)."""
+    svc = AnalyticsBufferService(redis_client=AsyncMock())
+    svc._ensure_connection = AsyncMock(return_value=False)
+    dto = BufferedAdminActionLogDTO(
+        admin_id=1,
+        action_type="report_user",
+        created_at=datetime.now(timezone.utc),
+    )
+    assert await svc.add_admin_log(dto) is False
+    svc._redis.rpush.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_pop_admin_logs_returns_deserialized_list(
+    buffer_service: AnalyticsBufferService,
+) -> None:
+    """pop_admin_logs читает и десериализует логи из своего ключа."""
+    dto = BufferedAdminActionLogDTO(
+        admin_id=5,
+        action_type="report_user",
+        details="d",
+        created_at=datetime.now(timezone.utc),
+    )
+    buffer_service._redis.lrange = AsyncMock(
+        return_value=[dto.model_dump_json().encode("utf-8")]
+    )
+    result = await buffer_service.pop_admin_logs(count=10)
+    buffer_service._redis.lrange.assert_called_once_with(
+        AnalyticsBufferService.REDIS_KEY_ADMIN_LOGS, 0, 9
+    )
+    assert result == [dto]
+
+
+@pytest.mark.asyncio
+async def test_get_buffer_stats_reads_length_and_oldest_item(
+    buffer_service: AnalyticsBufferService,
+    sample_message_dto: BufferedMessageDTO,
+) -> None:
+    """Длина и created_at головы каждого буфера — одним pipeline."""
+    head = sample_message_dto.model_dump_json().encode()
+    pipe = _pipe(buffer_service)
+    pipe.execute.return_value = [3, head, 0, None, 1, b"broken", 0, None, 0, None]
+
+    stats = await buffer_service.get_buffer_stats()
+
+    assert list(stats) == list(AnalyticsBufferService.BUFFER_KEYS)
+    length, oldest = stats["messages"]
+    assert length == 3 and oldest == sample_message_dto.created_at
+    assert stats["reactions"] == (0, None)
+    assert stats["replies"] == (1, None)
+    assert pipe.llen.call_count == len(AnalyticsBufferService.BUFFER_KEYS)
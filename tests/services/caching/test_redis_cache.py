@@ -0,0 +1,39 @@
+import pickle
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from services.caching.redis import RedisCache
+
+
+@pytest.fixture
+def client() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.mark.asyncio
+async def test_get_many_reads_keys_with_one_mget(client: AsyncMock) -> None:
+    client.mget.return_value = [pickle.dumps([1, 2]), None, b"not a pickle"]
+    cache = RedisCache(client)
+
+    result = await cache.get_many(["a", "b", "c"])
+
+    # Битое значение считается промахом, остальные ключи не теряются
+    assert result == [[1, 2], None, None]
+    client.mget.assert_awaited_once_with(["a", "b", "c"])
+    client.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_many_returns_misses_on_redis_error(client: AsyncMock) -> None:
+    client.mget.side_effect = RedisConnectionError("down")
+    cache = RedisCache(client)
+
+    assert await cache.get_many(["a", "b"]) == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_get_many_empty_keys_skips_redis(client: AsyncMock) -> None:
+    assert await RedisCache(client).get_many([]) == []
+    client.mget.assert_not_awaited()
@@ -0,0 +1,187 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.caching.base import ICache
+from services.caching.response_cache import ResponseCache
+from services.caching.watermark import DataWatermark
+
+
+class _DictCache(ICache):
+    """Кеш в памяти вместо Redis."""
+
+    def __init__(self) -> None:
+        self.data: dict = {}
+
+    async def get(self, key: str):
+        return self.data.get(key)
+
+    async def set(self, key: str, value, ttl=None) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+    async def clear(self) -> None:
+        self.data.clear()
+
+
+class _FakeRedis:
+    """Счётчики в памяти: MGET и INCR через pipeline, как у redis.asyncio."""
+
+    def __init__(self) -> None:
+        self.data: dict = {}
+
+    async def mget(self, keys: list) -> list:
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> "_FakePipeline":
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._keys: list = []
+
+    async def __aenter__(self) -> "_FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def incr(self, key: str) -> None:
+        self._keys.append(key)
+
+    async def execute(self) -> list:
+        for key in self._keys:
+            self._redis.data[key] = str(int(self._redis.data.get(key, 0)) + 1)
+        return []
+
+
+@pytest.fixture
+def watermark() -> DataWatermark:
+    return DataWatermark(_FakeRedis())  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def mock_watermark() -> AsyncMock:
+    watermark = AsyncMock(spec=DataWatermark)
+    watermark.current = AsyncMock(return_value=[1])
+    return watermark
+
+
+@pytest.fixture
+def response_cache(mock_watermark: AsyncMock) -> ResponseCache:
+    return ResponseCache(cache=_DictCache(), watermark=mock_watermark, ttl_seconds=60)
+
+
+@pytest.mark.asyncio
+async def test_get_or_build_caches_response(response_cache: ResponseCache) -> None:
+    """Повторный запрос с теми же параметрами не пересобирает ответ."""
+    build = AsyncMock(return_value={"users": [1, 2]})
+
+    first = await response_cache.get_or_build("analytics:users", ["1", "day"], build)
+    second = await response_cache.get_or_build("analytics:users", ["1", "day"], build)
+
+    build.assert_awaited_once()
+    assert first == second
+    assert first.body == {"users": [1, 2]}
+    assert first.etag.startswith('"') and first.etag.endswith('"')
+
+
+@pytest.mark.asyncio
+async def test_get_or_build_coalesces_concurrent_requests(
+    response_cache: ResponseCache,
+) -> None:
+    """Одновременные одинаковые запросы строят ответ один раз."""
+    calls = 0
+
+    async def build() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    results = await asyncio.gather(
+        *(response_cache.get_or_build("stats", [7], build) for _ in range(5))
+    )
+
+    assert calls == 1
+    assert len({r.etag for r in results}) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_build_rebuilds_only_after_own_users_flush(
+    watermark: DataWatermark,
+) -> None:
+    """
+    Сброс буфера с активностью других пользователей не сбрасывает кеш
+    отчёта; новые данные его пользователей дают новый ключ (тот же ETag,
+    если тело не изменилось).
+    """
+    response_cache = ResponseCache(cache=_DictCache(), watermark=watermark)
+    build = AsyncMock(return_value={"messages": 3})
+
+    async def report():
+        return await response_cache.get_or_build(
+            "analytics", [], build, watermark_user_ids=[1, 2]
+        )
+
+    first = await report()
+    await watermark.bump([3, 4])
+    await report()
+    assert build.await_count == 1
+
+    await watermark.bump([2, 3])
+    second = await report()
+    assert build.await_count == 2
+    assert first.etag == second.etag
+
+
+@pytest.mark.asyncio
+async def test_watermark_versions_per_user(watermark: DataWatermark) -> None:
+    await watermark.bump([5, 5, 6])
+    await watermark.bump([6])
+
+    assert await watermark.current([5, 6, 7]) == [1, 2, 0]
+    assert await watermark.current([]) == []
+
+
+@pytest.mark.asyncio
+async def test_watermark_redis_error_reads_zeros() -> None:
+    from redis.exceptions import ConnectionError as RedisConnectionError
+
+    redis = AsyncMock()
+    redis.mget.side_effect = RedisConnectionError("down")
+
+    assert await DataWatermark(redis).current([1, 2]) == [0, 0]
+
+
+@pytest.mark.asyncio
+async def test_get_or_build_without_watermark_ignores_new_data(
+    response_cache: ResponseCache,
+    mock_watermark: AsyncMock,
+) -> None:
+    """Без watermark_user_ids ключ — только параметры: ответ живёт до TTL."""
+    build = AsyncMock(return_value={"moderators": []})
+
+    await response_cache.get_or_build("stats", ["За сегодня"], build)
+    mock_watermark.current = AsyncMock(return_value=[2])
+    await response_cache.get_or_build("stats", ["За сегодня"], build)
+
+    build.assert_awaited_once()
+    mock_watermark.current.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_or_build_error_not_cached(response_cache: ResponseCache) -> None:
+    """Ошибка построения пробрасывается и не кешируется."""
+    build = AsyncMock(side_effect=[RuntimeError("boom"), {"ok": True}])
+
+    with pytest.raises(RuntimeError):
+        await response_cache.get_or_build("stats", [], build)
+    result = await response_cache.get_or_build("stats", [], build)
+
+    assert result.body == {"ok": True}
@@ -0,0 +1,26 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from services.caching.update_dedup import UpdateDeduplicator
+
+
+@pytest.mark.asyncio
+async def test_first_seen_sets_key_with_nx_and_window() -> None:
+    redis = AsyncMock()
+    redis.set = AsyncMock(side_effect=[True, None])
+    deduplicator = UpdateDeduplicator(redis, window_seconds=60)
+
+    assert await deduplicator.first_seen(5) is True
+    assert await deduplicator.first_seen(5) is False
+    redis.set.assert_awaited_with("updates:seen:5", 1, nx=True, ex=60)
+
+
+@pytest.mark.asyncio
+async def test_first_seen_fails_open_on_redis_error() -> None:
+    redis = AsyncMock()
+    redis.set = AsyncMock(side_effect=RedisConnectionError("down"))
+    deduplicator = UpdateDeduplicator(redis)
+
+    assert await deduplicator.first_seen(5) is True
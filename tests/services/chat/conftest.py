@@ -0,0 +1,103 @@
+"""Локальный stub-сервер OpenRouter для тестов пула соединений и ограничителя."""
+
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable
+
+import pytest
+
+_COMPLETION = json.dumps(
+    {
+        "id": "gen-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "stub",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "конспект"},
+            }
+        ],
+    }
+).encode()
+
+_OVERLOADED = json.dumps({"error": {"message": "overloaded", "code": 503}}).encode()
+
+_REASONS = {200: b"OK", 503: b"Service Unavailable"}
+
+
+class StubOpenRouterServer:
+    """
+    Минимальный HTTP/1.1 сервер с keep-alive: на каждый запрос отвечает
+    status (200 — ответ модели «конспект», 503 — ошибка перегрузки) через
+    delay секунд, считает соединения и запросы.
+    """
+
+    def __init__(self, status: int = 200, delay: float = 0.0) -> None:
+        self.connections = 0
+        self.requests = 0
+        self._status = status
+        self._body = _COMPLETION if status == 200 else _OVERLOADED
+        self._delay = delay
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def close(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/api/v1"
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value.strip())
+                if length:
+                    await reader.readexactly(length)
+                self.requests += 1
+                await asyncio.sleep(self._delay)
+                writer.write(
+                    b"HTTP/1.1 %d %s\r\n"
+                    % (self._status, _REASONS[self._status])
+                    + b"Content-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(self._body)).encode() + b"\r\n"
+                    b"Connection: keep-alive\r\n\r\n" + self._body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+StartStubServer = Callable[..., Awaitable[StubOpenRouterServer]]
+
+
+@pytest.fixture
+async def open_router_stub() -> AsyncIterator[StartStubServer]:
+    """Фабрика stub-серверов: await open_router_stub(status=503, delay=0.3)."""
+    servers: list[StubOpenRouterServer] = []
+
+    async def start(**kwargs) -> StubOpenRouterServer:
+        server = StubOpenRouterServer(**kwargs)
+        await server.start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        await server.close()
@@ -0,0 +1,212 @@
+"""
+ProviderLimiter и CircuitBreaker OpenRouterService: лимиты по маршрутам,
+дедлайны и деградированный режим против локального stub-сервера (conftest).
+"""
+
+import asyncio
+from typing import Awaitable, Callable
+
+import pytest
+
+from dto.automoderation import AutoModerationBufferItemDTO
+from services.chat.summarize import AIServiceUnavailableError
+from services.chat.summarize.limiter import (
+    ROUTE_AUTOMOD,
+    ROUTE_SUMMARY,
+    CircuitBreaker,
+    CircuitOpenError,
+    ProviderLimiter,
+)
+from services.chat.summarize.open_router_service import OpenRouterService
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _batch() -> list[AutoModerationBufferItemDTO]:
+    return [
+        AutoModerationBufferItemDTO(
+            username="u", user_tg_id=1, message_id=1, message_text="hello"
+        )
+    ]
+
+
+def test_breaker_opens_after_failures_and_probes_after_reset() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=10, clock=clock)
+
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+    # Пока идёт пробный вызов, остальные отклоняются
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_failure()
+    clock.now = 15
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.open_seconds() == 15
+
+    clock.now = 25
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.open_seconds() == 25
+    assert breaker.opened_count == 1
+
+
+@pytest.mark.asyncio
+async def test_routes_have_separate_slots() -> None:
+    """Занятые слоты автомодерации не блокируют сводки."""
+    limiter = ProviderLimiter(max_concurrency=1, queue_timeout_seconds=0.05)
+    release = asyncio.Event()
+
+    async def hold_automod() -> None:
+        async with limiter.slot(ROUTE_AUTOMOD):
+            await release.wait()
+
+    holder = asyncio.create_task(hold_automod())
+    await asyncio.sleep(0)
+
+    async with limiter.slot(ROUTE_SUMMARY):
+        pass
+    with pytest.raises(AIServiceUnavailableError):
+        async with limiter.slot(ROUTE_AUTOMOD):
+            pass
+
+    release.set()
+    await holder
+    stats = limiter.stats()["routes"]
+    assert stats[ROUTE_AUTOMOD]["rejected"] == 1
+    assert stats[ROUTE_AUTOMOD]["in_flight"] == 0
+    assert stats[ROUTE_SUMMARY]["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_call_deadline_counts_as_failure() -> None:
+    limiter = ProviderLimiter(
+        call_deadline_seconds=0.01,
+        breaker=CircuitBreaker(failure_threshold=1),
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with limiter.slot(ROUTE_SUMMARY):
+            await asyncio.sleep(1)
+
+    assert limiter.stats()["circuit_state"] == CircuitBreaker.OPEN
+    assert limiter.stats()["routes"][ROUTE_SUMMARY]["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_external_cancel_is_not_turned_into_timeout() -> None:
+    limiter = ProviderLimiter(
+        call_deadline_seconds=5,
+        breaker=CircuitBreaker(failure_threshold=1),
+    )
+
+    async def call() -> None:
+        async with limiter.slot(ROUTE_SUMMARY):
+            await asyncio.sleep(1)
+
+    task = asyncio.create_task(call())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.stats()["circuit_state"] == CircuitBreaker.CLOSED
+    assert limiter.stats()["routes"][ROUTE_SUMMARY]["in_flight"] == 0
+
+
+def test_deadline_outside_task_is_rejected() -> None:
+    """Без текущей задачи дедлайну нечего отменять — сразу RuntimeError."""
+    limiter = ProviderLimiter(call_deadline_seconds=1)
+    loop = asyncio.new_event_loop()
+    errors: list[BaseException] = []
+
+    def enter_deadline() -> None:
+        try:
+            with limiter._deadline():
+                pass
+        except RuntimeError as e:
+            errors.append(e)
+        finally:
+            loop.stop()
+
+    try:
+        loop.call_soon(enter_deadline)
+        loop.run_forever()
+    finally:
+        loop.close()
+
+    assert len(errors) == 1
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_without_requests(
+    open_router_stub: Callable[..., Awaitable],
+) -> None:
+    """После серии 5xx сводка и автомодерация не обращаются к провайдеру."""
+    server = await open_router_stub(status=503)
+    service = OpenRouterService(
+        api_key="test",
+        model_name="stub",
+        http2=False,
+        server_url=server.url,
+        limiter=ProviderLimiter(breaker=CircuitBreaker(failure_threshold=2)),
+    )
+    try:
+        for _ in range(2):
+            result = await service.summarize_chunk(text="x")
+            assert result.status_code == 503
+        requests_before_open = server.requests
+
+        degraded = await service.summarize_chunk(text="x")
+        with pytest.raises(CircuitOpenError):
+            await service.analyze_spam_batch("G", _batch())
+    finally:
+        await service.close()
+
+    assert requests_before_open >= 2
+    assert server.requests == requests_before_open
+    assert degraded.status_code == 503
+    assert "попробуйте позже" in degraded.summary.lower()
+    stats = service.stats()
+    assert stats["circuit_state"] == CircuitBreaker.OPEN
+    assert stats["routes"][ROUTE_AUTOMOD]["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_provider_hits_call_deadline(
+    open_router_stub: Callable[..., Awaitable],
+) -> None:
+    server = await open_router_stub(status=503, delay=0.3)
+    service = OpenRouterService(
+        api_key="test",
+        model_name="stub",
+        http2=False,
+        server_url=server.url,
+        limiter=ProviderLimiter(call_deadline_seconds=0.05),
+    )
+    try:
+        result = await service.summarize_chunk(text="x")
+        with pytest.raises(AIServiceUnavailableError):
+            await service.analyze_spam_batch("G", _batch())
+    finally:
+        await service.close()
+
+    assert result.status_code == 504
+    assert service.stats()["routes"][ROUTE_SUMMARY]["failures"] == 1
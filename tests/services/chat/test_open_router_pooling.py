@@ -0,0 +1,89 @@
+"""
+Пул соединений OpenRouterService против локального stub-сервера.
+
+Сравнивает число установленных соединений (TCP/TLS-рукопожатий): клиент на
+каждый вызов (как было) против общего клиента сервиса.
+"""
+
+import asyncio
+from typing import Awaitable, Callable
+
+import pytest
+from openrouter import OpenRouter
+
+from services.chat.summarize.limiter import ProviderLimiter
+from services.chat.summarize.open_router_service import OpenRouterService
+
+_CALLS = 20
+
+
+async def _send_per_call_client(url: str) -> None:
+    async with OpenRouter(api_key="test", server_url=url) as client:
+        await client.chat.send_async(
+            model="stub", messages=[{"role": "user", "content": "x"}]
+        )
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_reuses_connection(
+    open_router_stub: Callable[..., Awaitable],
+) -> None:
+    """Общий клиент сервиса держит одно соединение вместо нового на каждый вызов."""
+    server = await open_router_stub()
+    for _ in range(_CALLS):
+        await _send_per_call_client(server.url)
+    per_call_connections = server.connections
+
+    server.connections = 0
+    service = OpenRouterService(
+        api_key="test", model_name="stub", http2=False, server_url=server.url
+    )
+    try:
+        for _ in range(_CALLS):
+            result = await service.summarize_chunk(text="x")
+            assert result.status_code == 200
+            assert result.summary == "конспект"
+    finally:
+        await service.close()
+    pooled_connections = server.connections
+
+    assert per_call_connections == _CALLS
+    assert pooled_connections == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped_by_semaphore() -> None:
+    """Одновременно выполняется не больше max_concurrency запросов."""
+    service = OpenRouterService(
+        api_key="test",
+        model_name="stub",
+        limiter=ProviderLimiter(max_concurrency=2),
+    )
+    in_flight = 0
+    peak = 0
+
+    async def hold_slot() -> None:
+        nonlocal in_flight, peak
+        async with service._acquire():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    try:
+        await asyncio.gather(*(hold_slot() for _ in range(6)))
+    finally:
+        await service.close()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_close_is_idempotent_and_recreates_client() -> None:
+    """После close() следующий вызов создаёт новый пул, повторный close безопасен."""
+    service = OpenRouterService(api_key="test", model_name="stub")
+    first = service._get_client()
+    await service.close()
+    await service.close()
+    assert service._get_client() is not first
+    await service.close()
@@ -0,0 +1,115 @@
+"""Тесты TemplateSearchIndex: ранжирование, перестроение и отключение индекса."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from models import MessageTemplate
+from services.templates.search_index import TemplateSearchIndex
+from services.templates.template_service import TemplateService
+
+
+def _template(template_id: int, title: str, usage_count: int = 0) -> MessageTemplate:
+    return MessageTemplate(
+        id=template_id,
+        title=title,
+        content=f"content {template_id}",
+        usage_count=usage_count,
+        media_items=[],
+    )
+
+
+@pytest.fixture
+def repository() -> MagicMock:
+    repo = MagicMock()
+    repo.get_templates_for_search_index = AsyncMock(
+        return_value=[
+            _template(1, "Правила чата", usage_count=5),
+            _template(2, "Приветствие новичков", usage_count=50),
+            _template(3, "Правила", usage_count=1),
+            _template(4, "Ссылка на правила", usage_count=100),
+            _template(5, "Оплата заказа", usage_count=10),
+        ]
+    )
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_exact_prefix_word_then_substring(
+    repository: MagicMock,
+) -> None:
+    """Точное совпадение, префикс названия, префикс слова, затем подстрока."""
+    index = TemplateSearchIndex(repository)
+
+    exact = await index.search("правила")
+    assert [t.id for t in exact] == [3, 1, 4]
+
+    substring = await index.search("ила")
+    assert {t.id for t in substring} == {1, 3, 4}
+    # Внутри одной группы — по популярности
+    assert [t.id for t in substring] == [4, 1, 3]
+
+
+@pytest.mark.asyncio
+async def test_short_query_matches_substrings(repository: MagicMock) -> None:
+    """Запрос короче триграммы совпадает в любом месте названия, как ILIKE."""
+    index = TemplateSearchIndex(repository)
+
+    assert [t.id for t in await index.search("пр")] == [2, 1, 3, 4]
+    # Середина слова: «правила», «оплата» — по популярности
+    assert [t.id for t in await index.search("ла")] == [4, 5, 1, 3]
+    assert [t.id for t in await index.search("з")] == [5]
+    assert await index.search("  ") == []
+
+
+@pytest.mark.asyncio
+async def test_index_is_built_once_until_invalidated(repository: MagicMock) -> None:
+    """Повторные запросы не ходят в БД; invalidate() перестраивает индекс."""
+    index = TemplateSearchIndex(repository, ttl_seconds=3600)
+
+    await index.search("правила")
+    await index.search("оплата")
+    assert repository.get_templates_for_search_index.await_count == 1
+
+    repository.get_templates_for_search_index.return_value = [
+        _template(6, "Правила доставки")
+    ]
+    index.invalidate()
+    result = await index.search("правила")
+
+    assert [t.id for t in result] == [6]
+    assert repository.get_templates_for_search_index.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_index_disabled_for_large_library(repository: MagicMock) -> None:
+    """Слишком много шаблонов: индекс отключён, сервис ищет в БД."""
+    index = TemplateSearchIndex(repository, max_entries=2)
+    assert await index.search("правила") is None
+
+    repository.get_templates_by_query = AsyncMock(
+        return_value=[_template(3, "Правила")]
+    )
+    service = TemplateService(
+        template_repository=repository, cache=AsyncMock(), search_index=index
+    )
+    result = await service.search_templates("правила")
+
+    assert [t.id for t in result] == [3]
+    repository.get_templates_by_query.assert_awaited_once_with(
+        query="правила", limit=50
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_template_invalidates_index(repository: MagicMock) -> None:
+    """Удаление шаблона сбрасывает индекс поиска."""
+    index = MagicMock(spec=TemplateSearchIndex)
+    repository.get_template_by_id = AsyncMock(return_value=_template(3, "Правила"))
+    repository.delete_template = AsyncMock(return_value=True)
+    service = TemplateService(
+        template_repository=repository, cache=AsyncMock(), search_index=index
+    )
+
+    assert await service.delete_template(3) is True
+    index.invalidate.assert_called_once()
@@ -1,6 +1,7 @@
 """Тесты буфера автомодерации (Redis Lua) с моком клиента."""
 
-from unittest.mock import MagicMock
+import json
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -38,8 +39,15 @@ async def test_append_returns_none_until_flush() -> None:
     assert r1 is None
     script_fn.assert_called_once()
     call = script_fn.call_args
-    assert call.kwargs["keys"] == ["automod:buffer:-100"]
+    assert call.kwargs["keys"] == [
+        "automod:buffer:-100",
+        "automod:state:-100",
+        AutoModerationBufferService.PENDING_KEY,
+    ]
     assert call.kwargs["args"][1] == "5"
+    # Время попадания в буфер проставляется сервисом
+    pushed = AutoModerationBufferItemDTO.model_validate_json(call.kwargs["args"][0])
+    assert pushed.enqueued_at is not None
 
 
 @pytest.mark.asyncio
@@ -77,3 +85,51 @@ async def test_append_on_redis_error_returns_none() -> None:
     svc = AutoModerationBufferService(redis)
     r = await svc.append_text_message("-100", _item(), batch_size=3)
     assert r is None
+
+
+@pytest.mark.asyncio
+async def test_pop_aged_buffers_builds_jobs_from_meta() -> None:
+    """Sweeper забирает постаревшие буферы и восстанавливает чат/архив из меты."""
+    raw_item = _item(user_tg_id=7, message_id=70, text="spam").model_dump_json()
+    meta = json.dumps({"chat_title": "Чат", "archive_chat_tgid": "-200"})
+
+    async def flush_aged(keys: list[str], args: list[str]):
+        if args[0] == "-100":
+            return [meta.encode("utf-8"), [raw_item.encode("utf-8")]]
+        return None  # пачку уже сбросили по размеру
+
+    redis = MagicMock()
+    flush_script = MagicMock(side_effect=flush_aged)
+    redis.register_script.side_effect = [MagicMock(), flush_script]
+    redis.zrangebyscore = AsyncMock(return_value=[b"-100", b"-300"])
+
+    svc = AutoModerationBufferService(redis, max_age_seconds=60)
+    jobs = await svc.pop_aged_buffers()
+
+    assert len(jobs) == 1
+    assert jobs[0].chat_tgid == "-100"
+    assert jobs[0].chat_title == "Чат"
+    assert jobs[0].archive_chat_tgid == "-200"
+    assert jobs[0].batch[0].message_id == 70
+    assert flush_script.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_record_latency_fills_cumulative_buckets() -> None:
+    """Задержка попадает во все бакеты не меньше неё, плюс count и sum."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe_cm = MagicMock()
+    pipe_cm.__aenter__ = AsyncMock(return_value=pipe)
+    pipe_cm.__aexit__ = AsyncMock(return_value=False)
+    redis = MagicMock()
+    redis.pipeline.return_value = pipe_cm
+
+    svc = AutoModerationBufferService(redis)
+    await svc.record_latency("time_to_detection", 42.0)
+
+    fields = [call.args[1] for call in pipe.hincrby.call_args_list]
+    assert fields == ["count", "le:60", "le:300", "le:900", "le:3600", "le:+Inf"]
+    pipe.hincrbyfloat.assert_called_once_with(
+        "automod:metrics:time_to_detection", "sum", 42.0
+    )
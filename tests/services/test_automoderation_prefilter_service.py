@@ -0,0 +1,174 @@
+"""Тесты предфильтра автомодерации (кеш вердиктов, знакомые авторы) с моком Redis."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+
+from dto.automoderation import AutoModerationBufferItemDTO, SpamDetectionLLMResultDTO
+from services.automoderation_prefilter_service import (
+    AutoModerationPrefilterService,
+    has_links,
+    is_trivially_safe_text,
+    text_fingerprint,
+)
+
+
+def _item(
+    *, user_tg_id: int = 1, message_id: int = 10, text: str = "hello"
+) -> AutoModerationBufferItemDTO:
+    return AutoModerationBufferItemDTO(
+        username="u",
+        user_tg_id=user_tg_id,
+        message_id=message_id,
+        message_text=text,
+    )
+
+
+def _redis(known: dict | None = None, verdicts: dict | None = None) -> MagicMock:
+    """Redis-мок: mget отдаёт счётчики знакомых авторов и вердикты по ключам."""
+    values = {
+        **{
+            f"{AutoModerationPrefilterService.KNOWN_USER_KEY_PREFIX}{k}": str(v)
+            for k, v in (known or {}).items()
+        },
+        **{
+            f"{AutoModerationPrefilterService.VERDICT_KEY_PREFIX}{k}": json.dumps(v)
+            for k, v in (verdicts or {}).items()
+        },
+    }
+    redis = MagicMock()
+    redis.mget = AsyncMock(side_effect=lambda keys: [values.get(k) for k in keys])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis.pipeline.return_value.__aenter__.return_value = pipe
+    return redis
+
+
+def test_fingerprint_ignores_case_spacing_and_invisible_chars() -> None:
+    assert text_fingerprint("Купи  КРИПТУ\u200b сейчас") == text_fingerprint(
+        " купи крипту\nсейчас "
+    )
+    assert text_fingerprint("купи крипту") != text_fingerprint("купи монеты")
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("ок", False),
+        ("т.е. завтра в 10.30", False),
+        ("https://x.io", True),
+        ("заходи t.me/promo", True),
+        ("пиши @promo_bot", True),
+        ("casino.xyz бонус", True),
+    ],
+)
+def test_has_links(text: str, expected: bool) -> None:
+    assert has_links(text) is expected
+
+
+def test_trivially_safe_text() -> None:
+    assert is_trivially_safe_text("Ок!", 12)
+    assert not is_trivially_safe_text("Ок!", 0)
+    assert not is_trivially_safe_text("это уже длинное сообщение", 12)
+    assert not is_trivially_safe_text("bit.ly/x", 12)
+
+
+@pytest.mark.asyncio
+async def test_prepare_skips_known_users_without_links() -> None:
+    redis = _redis(known={1: 25})
+    svc = AutoModerationPrefilterService(redis, known_user_messages=20)
+    batch = [
+        _item(user_tg_id=1, message_id=1, text="обычный разговор"),
+        _item(user_tg_id=1, message_id=2, text="смотри https://spam.example"),
+        _item(user_tg_id=2, message_id=3, text="привет всем"),
+    ]
+
+    result = await svc.prepare(batch)
+
+    assert [m.message_id for m in result.candidates] == [2, 3]
+    assert result.skipped_known == 1
+
+
+@pytest.mark.asyncio
+async def test_prepare_uses_cached_verdicts_and_dedups_batch() -> None:
+    spam = "Заработок от 1000$ в день"
+    redis = _redis(
+        verdicts={
+            text_fingerprint(spam): {"spam": True, "reason": "реклама"},
+            text_fingerprint("доброе утро"): {"spam": False},
+        }
+    )
+    svc = AutoModerationPrefilterService(redis)
+    batch = [
+        _item(user_tg_id=5, message_id=1, text="доброе утро"),
+        _item(user_tg_id=6, message_id=2, text="новый текст"),
+        _item(user_tg_id=7, message_id=3, text="НОВЫЙ   текст"),
+        _item(user_tg_id=8, message_id=4, text=spam.upper()),
+    ]
+
+    result = await svc.prepare(batch)
+
+    assert [m.message_id for m in result.candidates] == [2]
+    assert result.skipped_cached == 2
+    assert result.skipped_duplicates == 1
+    assert result.cached_hit == SpamDetectionLLMResultDTO(
+        user_tg_id=8, message_id=4, reason="реклама", username="u"
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [RedisConnectionError("down"), ResponseError("OOM command not allowed")],
+)
+async def test_prepare_fails_open_on_redis_error(error: Exception) -> None:
+    redis = _redis()
+    redis.mget = AsyncMock(side_effect=error)
+    svc = AutoModerationPrefilterService(redis)
+    batch = [_item(message_id=1), _item(message_id=2, text="другое")]
+
+    result = await svc.prepare(batch)
+
+    assert result.candidates == batch
+
+
+@pytest.mark.asyncio
+async def test_record_clean_batch_caches_verdicts_and_counts_users() -> None:
+    redis = _redis()
+    pipe = redis.pipeline.return_value.__aenter__.return_value
+    svc = AutoModerationPrefilterService(
+        redis, verdict_ttl_seconds=60, known_user_messages=20
+    )
+    prefiltered = await svc.prepare(
+        [_item(user_tg_id=1, message_id=1), _item(user_tg_id=1, message_id=2, text="a")]
+    )
+
+    await svc.record(prefiltered, None)
+
+    assert pipe.set.call_count == 2
+    assert all(c.kwargs["ex"] == 60 for c in pipe.set.call_args_list)
+    pipe.incrby.assert_called_once_with("automod:known:1", 2)
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_record_hit_caches_only_spam_text_and_resets_author() -> None:
+    redis = _redis()
+    pipe = redis.pipeline.return_value.__aenter__.return_value
+    svc = AutoModerationPrefilterService(redis, verdict_ttl_seconds=60)
+    prefiltered = await svc.prepare(
+        [_item(user_tg_id=1, message_id=1), _item(user_tg_id=2, message_id=2, text="x")]
+    )
+    hit = SpamDetectionLLMResultDTO(user_tg_id=2, message_id=2, reason="спам")
+
+    await svc.record(prefiltered, hit)
+
+    pipe.set.assert_called_once()
+    key, value = pipe.set.call_args.args
+    assert key == f"automod:verdict:{text_fingerprint('x')}"
+    assert json.loads(value) == {"spam": True, "reason": "спам"}
+    pipe.delete.assert_called_once_with("automod:known:2")
+    pipe.incrby.assert_not_called()
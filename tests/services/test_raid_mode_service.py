@@ -0,0 +1,114 @@
+"""Тесты детектора режима рейда (Redis Lua) с моком клиента."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from dto.antiraid import RaidJoinItemDTO
+from services.raid_mode_service import RaidModeService
+
+
+def _item(user_tgid: int = 1, username: str | None = "u") -> RaidJoinItemDTO:
+    return RaidJoinItemDTO(
+        user_tgid=user_tgid,
+        username=username,
+        joined_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def _service(*script_results) -> tuple[RaidModeService, list[MagicMock]]:
+    """Сервис с Lua-скриптами (register, enqueue, pop, withdraw) в порядке регистрации."""
+    scripts = []
+    for result in script_results:
+
+        async def run(keys: list[str], args: list[str], _result=result):
+            if isinstance(_result, Exception):
+                raise _result
+            return _result
+
+        scripts.append(MagicMock(side_effect=run))
+
+    redis = MagicMock()
+    redis.register_script.side_effect = scripts
+    svc = RaidModeService(
+        redis,
+        join_threshold=20,
+        window_seconds=60,
+        cooldown_seconds=300,
+        batch_interval_seconds=10,
+    )
+    return svc, scripts
+
+
+@pytest.mark.asyncio
+async def test_register_join_passes_window_settings() -> None:
+    svc, (register, _, _, _) = _service(0, None, None, None)
+
+    assert await svc.register_join("-100", 42) is False
+
+    call = register.call_args
+    assert call.kwargs["keys"] == ["raid:joins:-100", "raid:mode:-100"]
+    args = call.kwargs["args"]
+    assert args[1:4] == ["60", "20", "300"]
+    assert args[4].endswith(":42")
+
+
+@pytest.mark.asyncio
+async def test_register_join_reports_raid_mode() -> None:
+    svc, _ = _service(1, None, None, None)
+    assert await svc.register_join("-100", 42) is True
+
+
+@pytest.mark.asyncio
+async def test_register_join_on_redis_error_falls_back_to_no_raid() -> None:
+    from redis.exceptions import ConnectionError as RedisConnectionError
+
+    svc, _ = _service(RedisConnectionError("down"), None, None, None)
+    assert await svc.register_join("-100", 42) is False
+
+
+@pytest.mark.asyncio
+async def test_enqueue_join_returns_schedule_flag() -> None:
+    svc, (_, enqueue, _, _) = _service(None, 1, None, None)
+
+    assert await svc.enqueue_join("-100", _item()) is True
+
+    call = enqueue.call_args
+    assert call.kwargs["keys"] == ["raid:queue:-100", "raid:drain:-100"]
+    assert call.kwargs["args"][1] == "60"
+
+
+@pytest.mark.asyncio
+async def test_enqueue_join_on_redis_error_returns_none() -> None:
+    from redis.exceptions import ConnectionError as RedisConnectionError
+
+    svc, _ = _service(None, RedisConnectionError("down"), None, None)
+    assert await svc.enqueue_join("-100", _item()) is None
+
+
+@pytest.mark.asyncio
+async def test_pop_joins_skips_broken_entries() -> None:
+    payload = [
+        _item(1, "a").model_dump_json().encode("utf-8"),
+        b"not-json",
+        _item(2, None).model_dump_json(),
+    ]
+    svc, _ = _service(None, None, payload, None)
+
+    items = await svc.pop_joins("-100")
+
+    assert [i.user_tgid for i in items] == [1, 2]
+    assert items[1].username is None
+
+
+@pytest.mark.asyncio
+async def test_withdraw_join_removes_item_and_drain_flag() -> None:
+    svc, (_, _, _, withdraw) = _service(None, None, None, 1)
+    item = _item()
+
+    await svc.withdraw_join("-100", item)
+
+    call = withdraw.call_args
+    assert call.kwargs["keys"] == ["raid:queue:-100", "raid:drain:-100"]
+    assert call.kwargs["args"] == [item.model_dump_json()]
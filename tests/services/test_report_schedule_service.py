@@ -1,6 +1,6 @@
 """Тесты ReportScheduleService."""
 
-from datetime import time
+from datetime import datetime, time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -9,6 +9,7 @@ from sqlalchemy.exc import IntegrityError
 from models import ReportSchedule
 from repositories.report_schedule_repository import ReportScheduleRepository
 from services.report_schedule_service import ReportScheduleService
+from services.scheduler.schedule_notifier import ScheduleChangeNotifier
 
 
 @pytest.fixture
@@ -17,8 +18,15 @@ def mock_repo() -> AsyncMock:
 
 
 @pytest.fixture
-def service(mock_repo: AsyncMock) -> ReportScheduleService:
-    return ReportScheduleService(schedule_repository=mock_repo)
+def mock_notifier() -> AsyncMock:
+    return AsyncMock(spec=ScheduleChangeNotifier)
+
+
+@pytest.fixture
+def service(mock_repo: AsyncMock, mock_notifier: AsyncMock) -> ReportScheduleService:
+    return ReportScheduleService(
+        schedule_repository=mock_repo, change_notifier=mock_notifier
+    )
 
 
 @pytest.fixture
@@ -68,9 +76,7 @@ async def test_get_or_create_schedule_returns_existing(
     """get_or_create_schedule возвращает существующее расписание."""
     mock_repo.get_schedule = AsyncMock(return_value=sample_schedule)
 
-    result = await service.get_or_create_schedule(
-        chat_id=1, sent_time=time(10, 0)
-    )
+    result = await service.get_or_create_schedule(chat_id=1, sent_time=time(10, 0))
 
     assert result is sample_schedule
     mock_repo.create_schedule.assert_not_called()
@@ -114,9 +120,7 @@ async def test_get_or_create_schedule_race_condition_returns_existing(
         side_effect=IntegrityError("", "", "unique constraint chat_id")
     )
 
-    result = await service.get_or_create_schedule(
-        chat_id=1, sent_time=time(9, 0)
-    )
+    result = await service.get_or_create_schedule(chat_id=1, sent_time=time(9, 0))
 
     assert result is sample_schedule
     assert mock_repo.get_schedule.call_count == 2
@@ -133,9 +137,7 @@ async def test_update_sending_time_success(
     mock_repo.get_schedule = AsyncMock(return_value=sample_schedule)
     mock_repo.update_schedule = AsyncMock(return_value=updated)
 
-    result = await service.update_sending_time(
-        chat_id=1, new_time=time(12, 0)
-    )
+    result = await service.update_sending_time(chat_id=1, new_time=time(12, 0))
 
     assert result is updated
     mock_repo.update_schedule.assert_called_once_with(
@@ -151,9 +153,7 @@ async def test_update_sending_time_returns_none_when_not_found(
     """update_sending_time возвращает None когда расписание не найдено."""
     mock_repo.get_schedule = AsyncMock(return_value=None)
 
-    result = await service.update_sending_time(
-        chat_id=999, new_time=time(12, 0)
-    )
+    result = await service.update_sending_time(chat_id=999, new_time=time(12, 0))
 
     assert result is None
     mock_repo.update_schedule.assert_not_called()
@@ -190,3 +190,54 @@ async def test_toggle_schedule_returns_none_when_not_found(
 
     assert result is None
     mock_repo.update_schedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_sending_time_publishes_change(
+    service: ReportScheduleService,
+    mock_repo: AsyncMock,
+    mock_notifier: AsyncMock,
+    sample_schedule: MagicMock,
+) -> None:
+    """После изменения времени планировщик получает новое next_run_at."""
+    updated = MagicMock(id=1, enabled=True, next_run_at=datetime(2030, 1, 1, 9, 0))
+    mock_repo.get_schedule = AsyncMock(return_value=sample_schedule)
+    mock_repo.update_schedule = AsyncMock(return_value=updated)
+
+    await service.update_sending_time(chat_id=1, new_time=time(12, 0))
+
+    mock_notifier.publish.assert_awaited_once_with(
+        schedule_id=1, next_run_at=updated.next_run_at
+    )
+
+
+@pytest.mark.asyncio
+async def test_toggle_schedule_off_publishes_removal(
+    service: ReportScheduleService,
+    mock_repo: AsyncMock,
+    mock_notifier: AsyncMock,
+    sample_schedule: MagicMock,
+) -> None:
+    """Отключённое расписание уходит из очереди планировщика (next_run_at=None)."""
+    updated = MagicMock(id=1, enabled=False, next_run_at=None)
+    mock_repo.get_schedule = AsyncMock(return_value=sample_schedule)
+    mock_repo.update_schedule = AsyncMock(return_value=updated)
+
+    await service.toggle_schedule(chat_id=1, enabled=False)
+
+    mock_notifier.publish.assert_awaited_once_with(schedule_id=1, next_run_at=None)
+
+
+@pytest.mark.asyncio
+async def test_existing_schedule_is_not_published(
+    service: ReportScheduleService,
+    mock_repo: AsyncMock,
+    mock_notifier: AsyncMock,
+    sample_schedule: MagicMock,
+) -> None:
+    """get_or_create_schedule не публикует изменения для существующего расписания."""
+    mock_repo.get_schedule = AsyncMock(return_value=sample_schedule)
+
+    await service.get_or_create_schedule(chat_id=1, sent_time=time(9, 0))
+
+    mock_notifier.publish.assert_not_called()
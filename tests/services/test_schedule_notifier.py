@@ -0,0 +1,61 @@
+"""Тесты ScheduleChangeNotifier / ScheduleChangeSubscription."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from dto.report_schedule import ReportScheduleChangeDTO
+from services.scheduler import ScheduleChangeNotifier, ScheduleChangeSubscription
+
+
+@pytest.mark.asyncio
+async def test_publish_sends_change_to_channel() -> None:
+    redis = MagicMock()
+    redis.publish = AsyncMock()
+    run_at = datetime(2030, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+    await ScheduleChangeNotifier(redis).publish(schedule_id=3, next_run_at=run_at)
+
+    channel, payload = redis.publish.await_args.args
+    assert channel == ScheduleChangeNotifier.CHANNEL
+    assert ReportScheduleChangeDTO.model_validate_json(payload) == (
+        ReportScheduleChangeDTO(schedule_id=3, next_run_at=run_at)
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_swallows_redis_errors() -> None:
+    """Ошибка Redis не ломает сохранение расписания — поможет пересинхронизация."""
+    redis = MagicMock()
+    redis.publish = AsyncMock(side_effect=RedisConnectionError("down"))
+
+    await ScheduleChangeNotifier(redis).publish(schedule_id=3, next_run_at=None)
+
+
+@pytest.mark.asyncio
+async def test_subscription_skips_service_and_invalid_messages() -> None:
+    """None от подтверждения подписки и битый payload не прерывают ожидание."""
+    payload = ReportScheduleChangeDTO(schedule_id=5).model_dump_json().encode()
+    pubsub = MagicMock()
+    pubsub.get_message = AsyncMock(
+        side_effect=[
+            None,
+            {"type": "message", "data": b"{"},
+            {"type": "message", "data": payload},
+        ]
+    )
+
+    change = await ScheduleChangeSubscription(pubsub).wait(1.0)
+
+    assert change == ReportScheduleChangeDTO(schedule_id=5)
+    assert pubsub.get_message.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_subscription_returns_none_after_timeout() -> None:
+    pubsub = MagicMock()
+    pubsub.get_message = AsyncMock(return_value=None)
+
+    assert await ScheduleChangeSubscription(pubsub).wait(0.01) is None
@@ -0,0 +1,182 @@
+"""Тесты TaskiqSchedulerService (очередь расписаний на куче)."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from dto.report_schedule import ReportScheduleChangeDTO
+from repositories.report_schedule_repository import ReportScheduleRepository
+from services.scheduler import ScheduleChangeNotifier, TaskiqSchedulerService
+
+NOW = datetime(2030, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mock_repo() -> AsyncMock:
+    repo = AsyncMock(spec=ReportScheduleRepository)
+    repo.get_enabled_run_times = AsyncMock(return_value=[])
+    repo.get_due_schedules_and_reschedule = AsyncMock(return_value=[])
+    return repo
+
+
+@pytest.fixture
+def mock_notifier() -> AsyncMock:
+    return AsyncMock(spec=ScheduleChangeNotifier)
+
+
+@pytest.fixture
+def service(mock_repo: AsyncMock, mock_notifier: AsyncMock) -> TaskiqSchedulerService:
+    return TaskiqSchedulerService(
+        schedule_repo=mock_repo, change_notifier=mock_notifier
+    )
+
+
+def _changes(*results: ReportScheduleChangeDTO | None) -> MagicMock:
+    subscription = MagicMock()
+    subscription.wait = AsyncMock(side_effect=list(results))
+    return subscription
+
+
+@pytest.mark.asyncio
+async def test_seconds_until_due_uses_earliest_schedule(
+    service: TaskiqSchedulerService, mock_repo: AsyncMock
+) -> None:
+    """Сон до ближайшего next_run_at из кучи."""
+    mock_repo.get_enabled_run_times.return_value = [
+        (1, NOW + timedelta(hours=2)),
+        (2, NOW + timedelta(minutes=5)),
+    ]
+    await service.load()
+
+    assert service.seconds_until_due(now=NOW) == 300
+
+
+@pytest.mark.asyncio
+async def test_apply_change_replaces_and_removes_entries(
+    service: TaskiqSchedulerService, mock_repo: AsyncMock
+) -> None:
+    """Изменение времени вытесняет старую запись, отключение убирает расписание."""
+    mock_repo.get_enabled_run_times.return_value = [(1, NOW + timedelta(minutes=1))]
+    await service.load()
+
+    service.apply_change(
+        ReportScheduleChangeDTO(schedule_id=1, next_run_at=NOW + timedelta(hours=1))
+    )
+    assert service.seconds_until_due(now=NOW) == 3600
+
+    service.apply_change(ReportScheduleChangeDTO(schedule_id=1, next_run_at=None))
+    assert service.seconds_until_due(now=NOW) is None
+
+
+@pytest.mark.asyncio
+async def test_wait_and_dispatch_sleeps_until_next_run(
+    service: TaskiqSchedulerService, mock_repo: AsyncMock
+) -> None:
+    """Таймаут ожидания — время до ближайшего запуска, а не фиксированный тик."""
+    run_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    mock_repo.get_enabled_run_times.return_value = [(1, run_at)]
+    changes = _changes(ReportScheduleChangeDTO(schedule_id=1, next_run_at=run_at))
+
+    await service.wait_and_dispatch(changes, resync_seconds=300)
+
+    timeout = changes.wait.await_args.args[0]
+    assert 0 < timeout <= 30
+    mock_repo.get_due_schedules_and_reschedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_wait_and_dispatch_resyncs_when_queue_is_empty(
+    service: TaskiqSchedulerService, mock_repo: AsyncMock
+) -> None:
+    """Без расписаний планировщик спит resync_seconds и сверяется с БД."""
+    changes = _changes(None)
+
+    await service.wait_and_dispatch(changes, resync_seconds=300)
+
+    changes.wait.assert_awaited_once_with(300)
+    assert mock_repo.get_enabled_run_times.await_count == 2
+    mock_repo.get_due_schedules_and_reschedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_wait_and_dispatch_applies_notification(
+    service: TaskiqSchedulerService, mock_repo: AsyncMock
+) -> None:
+    """Уведомление обновляет очередь без обращения к БД."""
+    run_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    changes = _changes(ReportScheduleChangeDTO(schedule_id=7, next_run_at=run_at))
+
+    await service.wait_and_dispatch(changes, resync_seconds=300)
+
+    assert mock_repo.get_enabled_run_times.await_count == 1
+    assert service.seconds_until_due() > 3500
+
+
+@pytest.mark.asyncio
+async def test_wait_and_dispatch_claims_due_schedules(
+    service: TaskiqSchedulerService,
+    mock_repo: AsyncMock,
+    mock_notifier: AsyncMock,
+) -> None:
+    """Наступившее расписание захватывается, отчет ставится в очередь, время публикуется."""
+    now = datetime.now(timezone.utc)
+    mock_repo.get_enabled_run_times.return_value = [(1, now - timedelta(seconds=1))]
+    next_run = now + timedelta(days=1)
+    mock_repo.get_due_schedules_and_reschedule.return_value = [
+        MagicMock(id=1, chat_id=10, last_run_at=now, next_run_at=next_run)
+    ]
+    changes = _changes(None)
+
+    with patch("tasks.report_tasks.send_chat_reports_batch_task") as task:
+        task.kicker.return_value.with_task_id.return_value.kiq = AsyncMock()
+        await service.wait_and_dispatch(changes, resync_seconds=300)
+
+    task.kicker.return_value.with_task_id.assert_called_once_with(
+        f"batch:1:{now.isoformat()}"
+    )
+    mock_notifier.publish.assert_awaited_once_with(schedule_id=1, next_run_at=next_run)
+    assert changes.wait.await_args.args[0] == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_and_dispatch_backs_off_when_claimed_elsewhere(
+    service: TaskiqSchedulerService, mock_repo: AsyncMock
+) -> None:
+    """Если расписание забрал другой инстанс, повторная попытка — после паузы."""
+    past = datetime.now(timezone.utc) - timedelta(seconds=1)
+    mock_repo.get_enabled_run_times.return_value = [(1, past)]
+    changes = _changes(None, None)
+
+    with patch("tasks.report_tasks.send_chat_reports_batch_task"):
+        await service.wait_and_dispatch(changes, resync_seconds=300)
+
+    assert changes.wait.await_count == 2
+    assert changes.wait.await_args_list[1].args[0] > 0
+
+
+@pytest.mark.asyncio
+async def test_tick_splits_due_schedules_into_batches(
+    mock_repo: AsyncMock, mock_notifier: AsyncMock
+) -> None:
+    """Наступившие расписания уходят пакетами по batch_size чатов."""
+    now = datetime.now(timezone.utc)
+    mock_repo.get_due_schedules_and_reschedule.return_value = [
+        MagicMock(id=i, chat_id=100 + i, last_run_at=now, next_run_at=now)
+        for i in (3, 1, 2)
+    ]
+    service = TaskiqSchedulerService(
+        schedule_repo=mock_repo, change_notifier=mock_notifier, batch_size=2
+    )
+
+    with patch("tasks.report_tasks.send_chat_reports_batch_task") as task:
+        kiq = AsyncMock()
+        task.kicker.return_value.with_task_id.return_value.kiq = kiq
+        claimed = await service.tick()
+
+    assert claimed == 3
+    assert [call.kwargs["chat_ids"] for call in kiq.await_args_list] == [
+        [101, 102],
+        [103],
+    ]
+    assert mock_notifier.publish.await_count == 3
@@ -0,0 +1,80 @@
+"""Тесты UpdateContext: пользователь и чат загружаются один раз на апдейт."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.update_context import UpdateContext
+
+
+@pytest.fixture
+def user_service() -> AsyncMock:
+    svc = AsyncMock()
+    svc.get_user.return_value = MagicMock(id=1)
+    svc.get_or_create.return_value = MagicMock(id=1)
+    return svc
+
+
+@pytest.fixture
+def chat_service() -> AsyncMock:
+    svc = AsyncMock()
+    svc.get_or_create.return_value = MagicMock(id=10)
+    return svc
+
+
+@pytest.fixture
+def context(user_service: AsyncMock, chat_service: AsyncMock) -> UpdateContext:
+    return UpdateContext(
+        user_service=user_service,
+        chat_service=chat_service,
+        user_tg_id="123",
+        username="user",
+        chat_tg_id="-100",
+        chat_title="Group",
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_user_loads_once(
+    context: UpdateContext, user_service: AsyncMock
+) -> None:
+    """Повторные get_user/find_user не обращаются к сервису."""
+    first = await context.get_user()
+    assert await context.get_user() is first
+    assert await context.find_user() is first
+    user_service.get_or_create.assert_awaited_once_with(tg_id="123", username="user")
+    user_service.get_user.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_find_user_does_not_memoize_missing_user(
+    context: UpdateContext, user_service: AsyncMock
+) -> None:
+    """Отсутствующий пользователь не кешируется: get_user затем создаёт его."""
+    user_service.get_user.return_value = None
+
+    assert await context.find_user() is None
+    created = await context.get_user()
+
+    assert created is user_service.get_or_create.return_value
+    user_service.get_or_create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_chat_loads_once_with_title(
+    context: UpdateContext, chat_service: AsyncMock
+) -> None:
+    """Чат загружается один раз с актуальным названием."""
+    first = await context.get_chat()
+    assert await context.get_chat() is first
+    chat_service.get_or_create.assert_awaited_once_with(chat_tgid="-100", title="Group")
+
+
+@pytest.mark.asyncio
+async def test_get_chat_without_chat_raises(
+    user_service: AsyncMock, chat_service: AsyncMock
+) -> None:
+    """Апдейт без чата: get_chat сообщает об ошибке."""
+    context = UpdateContext(user_service, chat_service, user_tg_id="123")
+    with pytest.raises(ValueError):
+        await context.get_chat()
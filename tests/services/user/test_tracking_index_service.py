@@ -0,0 +1,164 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from constants.enums import UserRole
+from models import User
+from repositories import ChatTrackingRepository
+from repositories.user_repository import UserRepository
+from services.caching.base import ICache
+from services.user.tracking_index_service import TrackingIndexService
+
+
+class _DictCache(ICache):
+    """Кеш в памяти вместо Redis."""
+
+    def __init__(self) -> None:
+        self.data: dict = {}
+        self.reads: list = []
+
+    async def get(self, key: str):
+        self.reads.append(key)
+        return self.data.get(key)
+
+    async def get_many(self, keys: list) -> list:
+        self.reads.append(tuple(keys))
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key: str, value, ttl=None) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> bool:
+        return self.data.pop(key, None) is not None
+
+    async def clear(self) -> None:
+        self.data.clear()
+
+
+@pytest.fixture
+def mock_user_repo() -> AsyncMock:
+    return AsyncMock(spec=UserRepository)
+
+
+@pytest.fixture
+def mock_chat_repo() -> AsyncMock:
+    return AsyncMock(spec=ChatTrackingRepository)
+
+
+@pytest.fixture
+def cache() -> _DictCache:
+    return _DictCache()
+
+
+@pytest.fixture
+def index(
+    mock_user_repo: AsyncMock, mock_chat_repo: AsyncMock, cache: _DictCache
+) -> TrackingIndexService:
+    return TrackingIndexService(
+        user_repository=mock_user_repo,
+        chat_tracking_repository=mock_chat_repo,
+        cache=cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_tracked_users_caches_repository_result(
+    index: TrackingIndexService, mock_user_repo: AsyncMock
+) -> None:
+    user = User(id=5, tg_id="u5", username="user5", role=UserRole.USER)
+    mock_user_repo.get_tracked_users_for_admin.return_value = [user]
+
+    assert await index.get_tracked_user_ids("adm") == [5]
+    assert await index.get_tracked_users("adm") == [user]
+
+    mock_user_repo.get_tracked_users_for_admin.assert_awaited_once_with(
+        admin_tg_id="adm"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_tracked_chat_ids_caches_empty_result(
+    index: TrackingIndexService, mock_chat_repo: AsyncMock
+) -> None:
+    """Пустой список тоже кешируется — повторный клик не идёт в БД."""
+    mock_chat_repo.get_all_tracked_chats.return_value = []
+
+    assert await index.get_tracked_chat_ids(100) == []
+    assert await index.get_tracked_chat_ids(100) == []
+
+    mock_chat_repo.get_all_tracked_chats.assert_awaited_once_with(admin_id=100)
+
+
+@pytest.mark.asyncio
+async def test_get_tracked_chat_ids_reads_admin_access_per_admin(
+    index: TrackingIndexService, mock_chat_repo: AsyncMock
+) -> None:
+    """Чаты админа — его доступы AdminChatAccess, у каждого админа свои."""
+    chats_by_admin = {100: [MagicMock(id=1), MagicMock(id=2)], 200: []}
+    mock_chat_repo.get_all_tracked_chats.side_effect = lambda admin_id: chats_by_admin[
+        admin_id
+    ]
+
+    assert await index.get_tracked_chat_ids(100) == [1, 2]
+    assert await index.get_tracked_chat_ids(200) == []
+
+    await index.invalidate_admin(MagicMock(id=100, tg_id="adm"))
+    chats_by_admin[100] = [MagicMock(id=1)]
+    assert await index.get_tracked_chat_ids(100) == [1]
+
+
+@pytest.mark.asyncio
+async def test_get_tracked_user_ids_by_chats_loads_misses_in_batch(
+    index: TrackingIndexService, mock_user_repo: AsyncMock
+) -> None:
+    """Промахи догружаются одним запросом на чаты и одним на админов."""
+    mock_user_repo.get_admin_ids_by_chats.return_value = {1: {100}, 2: {100, 200}}
+    mock_user_repo.get_tracked_user_ids_by_admins.return_value = {
+        100: {10},
+        200: {20},
+    }
+
+    result = await index.get_tracked_user_ids_by_chats([1, 2, 3])
+    again = await index.get_tracked_user_ids_by_chats([1, 2, 3])
+
+    assert result == again == {1: {10}, 2: {10, 20}, 3: set()}
+    mock_user_repo.get_admin_ids_by_chats.assert_awaited_once_with([1, 2, 3])
+    mock_user_repo.get_tracked_user_ids_by_admins.assert_awaited_once_with([100, 200])
+
+
+@pytest.mark.asyncio
+async def test_get_tracked_user_ids_by_chats_reads_cache_in_batch(
+    index: TrackingIndexService, mock_user_repo: AsyncMock, cache: _DictCache
+) -> None:
+    """Кеш читается одним пакетом на чаты и одним на админов, а не по ключу."""
+    mock_user_repo.get_admin_ids_by_chats.return_value = {1: {100}, 2: {200}}
+    mock_user_repo.get_tracked_user_ids_by_admins.return_value = {100: {10}}
+    await index.get_tracked_user_ids_by_chats([1, 2])
+    cache.reads.clear()
+
+    assert await index.get_tracked_user_ids_by_chats([1, 2]) == {1: {10}, 2: set()}
+
+    assert cache.reads == [
+        ("tracking:chat:1:admins", "tracking:chat:2:admins"),
+        ("tracking:admin_id:100:user_ids", "tracking:admin_id:200:user_ids"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_admin_and_chat_drop_entries(
+    index: TrackingIndexService, mock_user_repo: AsyncMock
+) -> None:
+    mock_user_repo.get_tracked_users_for_admin.return_value = []
+    mock_user_repo.get_admin_ids_by_chats.return_value = {1: {100}}
+    mock_user_repo.get_tracked_user_ids_by_admins.return_value = {100: {10}}
+    await index.get_tracked_users("adm")
+    await index.get_tracked_user_ids_by_chats([1])
+
+    await index.invalidate_admin(MagicMock(id=100, tg_id="adm"))
+    await index.invalidate_chat(1)
+    await index.get_tracked_users("adm")
+    await index.get_tracked_user_ids_by_chats([1])
+
+    assert mock_user_repo.get_tracked_users_for_admin.await_count == 2
+    assert mock_user_repo.get_admin_ids_by_chats.await_count == 2
+    assert mock_user_repo.get_tracked_user_ids_by_admins.await_count == 2
@@ -1,14 +1,27 @@
-"""Тесты для process_buffered_replies_task."""
+"""Тесты для задач обработки буферов аналитики."""
 
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from dto.buffer import BufferedMessageReplyDTO
+from dto.buffer import (
+    BufferedAdminActionLogDTO,
+    BufferedMembershipEventDTO,
+    BufferedMessageReplyDTO,
+)
+from repositories.admin_action_log_repository import AdminActionLogRepository
+from repositories.chat_membership_event_repository import (
+    ChatMembershipEventRepository,
+)
 from repositories.message_reply_repository import MessageReplyRepository
 from services.analytics_buffer_service import AnalyticsBufferService
-from tasks.analytics_tasks import process_buffered_replies_task
+from services.caching import DataWatermark
+from tasks.analytics_tasks import (
+    process_buffered_admin_logs_task,
+    process_buffered_membership_events_task,
+    process_buffered_replies_task,
+)
 
 
 def _make_reply_dto(
@@ -33,6 +46,13 @@ def mock_buffer_service() -> MagicMock:
     return svc
 
 
+@pytest.fixture
+def mock_watermark() -> MagicMock:
+    watermark = MagicMock()
+    watermark.bump = AsyncMock()
+    return watermark
+
+
 @pytest.fixture
 def mock_reply_repository() -> MagicMock:
     repo = MagicMock()
@@ -69,6 +89,7 @@ async def test_process_buffered_replies_empty_buffer(
 async def test_process_buffered_replies_all_inserted(
     mock_buffer_service: MagicMock,
     mock_reply_repository: MagicMock,
+    mock_watermark: MagicMock,
 ) -> None:
     """Когда все reply вставлены, trim вызывается, re_add — нет."""
     replies = [_make_reply_dto(), _make_reply_dto(reply_msg_id="101")]
@@ -80,6 +101,8 @@ async def test_process_buffered_replies_all_inserted(
             return mock_buffer_service
         if cls is MessageReplyRepository:
             return mock_reply_repository
+        if cls is DataWatermark:
+            return mock_watermark
         raise ValueError(f"Unexpected: {cls}")
 
     with patch("tasks.analytics_tasks.container") as mock_container:
@@ -90,12 +113,16 @@ async def test_process_buffered_replies_all_inserted(
     mock_reply_repository.bulk_create_replies.assert_called_once_with(replies)
     mock_buffer_service.re_add_replies.assert_not_called()
     mock_buffer_service.trim_replies.assert_called_once_with(2)
+    mock_watermark.bump.assert_called_once()
+    # Версия данных растёт только у авторов вставленных ответов
+    assert set(mock_watermark.bump.call_args.args[0]) == {2}
 
 
 @pytest.mark.asyncio
 async def test_process_buffered_replies_none_inserted(
     mock_buffer_service: MagicMock,
     mock_reply_repository: MagicMock,
+    mock_watermark: MagicMock,
 ) -> None:
     """Когда ничего не вставлено, trim и re_add не вызываются."""
     replies = [_make_reply_dto()]
@@ -107,6 +134,8 @@ async def test_process_buffered_replies_none_inserted(
             return mock_buffer_service
         if cls is MessageReplyRepository:
             return mock_reply_repository
+        if cls is DataWatermark:
+            return mock_watermark
         raise ValueError(f"Unexpected: {cls}")
 
     with patch("tasks.analytics_tasks.container") as mock_container:
@@ -116,12 +145,14 @@ async def test_process_buffered_replies_none_inserted(
 
     mock_buffer_service.re_add_replies.assert_not_called()
     mock_buffer_service.trim_replies.assert_not_called()
+    mock_watermark.bump.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_process_buffered_replies_partial_insert(
     mock_buffer_service: MagicMock,
     mock_reply_repository: MagicMock,
+    mock_watermark: MagicMock,
 ) -> None:
     """При частичном успехе failed возвращаются в буфер, затем trim."""
     replies = [
@@ -138,6 +169,8 @@ async def test_process_buffered_replies_partial_insert(
             return mock_buffer_service
         if cls is MessageReplyRepository:
             return mock_reply_repository
+        if cls is DataWatermark:
+            return mock_watermark
         raise ValueError(f"Unexpected: {cls}")
 
     with patch("tasks.analytics_tasks.container") as mock_container:
@@ -147,3 +180,98 @@ async def test_process_buffered_replies_partial_insert(
 
     mock_buffer_service.re_add_replies.assert_called_once_with(failed)
     mock_buffer_service.trim_replies.assert_called_once_with(3)
+    mock_watermark.bump.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_process_buffered_membership_events_bulk_insert_and_trim(
+    mock_buffer_service: MagicMock,
+) -> None:
+    """События состава вставляются одной пачкой и удаляются из буфера."""
+    events = [
+        BufferedMembershipEventDTO(
+            chat_id=1,
+            user_tgid=user_tgid,
+            event_type="join",
+            created_at=datetime.now(timezone.utc),
+        )
+        for user_tgid in (10, 11)
+    ]
+    mock_buffer_service.pop_membership_events = AsyncMock(return_value=events)
+    mock_buffer_service.trim_membership_events = AsyncMock()
+    event_repository = MagicMock()
+    event_repository.bulk_add_events = AsyncMock(return_value=2)
+
+    def resolve_fn(cls):
+        if cls is AnalyticsBufferService:
+            return mock_buffer_service
+        if cls is ChatMembershipEventRepository:
+            return event_repository
+        raise ValueError(f"Unexpected: {cls}")
+
+    with patch("tasks.analytics_tasks.container") as mock_container:
+        mock_container.resolve.side_effect = resolve_fn
+
+        await process_buffered_membership_events_task()
+
+    event_repository.bulk_add_events.assert_awaited_once_with(events)
+    mock_buffer_service.trim_membership_events.assert_awaited_once_with(2)
+
+
+@pytest.mark.asyncio
+async def test_process_buffered_admin_logs_empty_buffer(
+    mock_buffer_service: MagicMock,
+) -> None:
+    """При пустом буфере логов репозиторий и trim не вызываются."""
+    mock_buffer_service.pop_admin_logs = AsyncMock(return_value=[])
+    mock_buffer_service.trim_admin_logs = AsyncMock()
+    log_repository = MagicMock()
+    log_repository.bulk_create_logs = AsyncMock()
+
+    def resolve_fn(cls):
+        if cls is AnalyticsBufferService:
+            return mock_buffer_service
+        if cls is AdminActionLogRepository:
+            return log_repository
+        raise ValueError(f"Unexpected: {cls}")
+
+    with patch("tasks.analytics_tasks.container") as mock_container:
+        mock_container.resolve.side_effect = resolve_fn
+
+        await process_buffered_admin_logs_task()
+
+    log_repository.bulk_create_logs.assert_not_called()
+    mock_buffer_service.trim_admin_logs.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_process_buffered_admin_logs_bulk_insert_and_trim(
+    mock_buffer_service: MagicMock,
+) -> None:
+    """Логи действий вставляются одной пачкой и удаляются из буфера."""
+    logs = [
+        BufferedAdminActionLogDTO(
+            admin_id=1,
+            action_type="report_user",
+            created_at=datetime.now(timezone.utc),
+        )
+    ]
+    mock_buffer_service.pop_admin_logs = AsyncMock(return_value=logs)
+    mock_buffer_service.trim_admin_logs = AsyncMock()
+    log_repository = MagicMock()
+    log_repository.bulk_create_logs = AsyncMock(return_value=1)
+
+    def resolve_fn(cls):
+        if cls is AnalyticsBufferService:
+            return mock_buffer_service
+        if cls is AdminActionLogRepository:
+            return log_repository
+        raise ValueError(f"Unexpected: {cls}")
+
+    with patch("tasks.analytics_tasks.container") as mock_container:
+        mock_container.resolve.side_effect = resolve_fn
+
+        await process_buffered_admin_logs_task()
+
+    log_repository.bulk_create_logs.assert_awaited_once_with(logs)
+    mock_buffer_service.trim_admin_logs.assert_awaited_once_with(1)
@@ -1,11 +1,11 @@
-"""Тесты report_tasks: send_chat_report_task."""
+"""Тесты report_tasks: send_chat_report_task и send_chat_reports_batch_task."""
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from constants.period import TimePeriod
-from tasks.report_tasks import send_chat_report_task
+from tasks.report_tasks import send_chat_report_task, send_chat_reports_batch_task
 
 
 @pytest.fixture
@@ -123,9 +123,7 @@ async def test_send_chat_report_task_get_schedule_exception_raises(
     mock_schedule_service: MagicMock,
 ) -> None:
     """send_chat_report_task пробрасывает исключение при ошибке get_schedule."""
-    mock_schedule_service.get_schedule = AsyncMock(
-        side_effect=RuntimeError("DB error")
-    )
+    mock_schedule_service.get_schedule = AsyncMock(side_effect=RuntimeError("DB error"))
 
     def resolve_fn(cls):
         from services.report_schedule_service import ReportScheduleService
@@ -142,3 +140,24 @@ async def test_send_chat_report_task_get_schedule_exception_raises(
                 schedule_id=1,
                 chat_id=1,
             )
+
+
+@pytest.mark.asyncio
+async def test_send_chat_reports_batch_task_calls_batch_usecase(
+    mock_send_reports_usecase: MagicMock,
+) -> None:
+    """send_chat_reports_batch_task передаёт весь пакет чатов в usecase."""
+    mock_send_reports_usecase.execute_batch = AsyncMock()
+
+    with patch("tasks.report_tasks.container") as mock_container:
+        mock_container.resolve.return_value = mock_send_reports_usecase
+
+        await send_chat_reports_batch_task(
+            schedule_ids=[1, 2],
+            chat_ids=[41, 42],
+            period=TimePeriod.TODAY.value,
+        )
+
+    mock_send_reports_usecase.execute_batch.assert_awaited_once_with(
+        chat_ids=[41, 42], period=TimePeriod.TODAY.value
+    )
@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock, patch
+
+import container as container_module
+from container import ContainerProfile, ContainerSetup
+from script.bench_bootstrap import measure
+
+# Модули, которые не должен загружать воркер аналитики
+_HEAVY_MODULES = ("aiogram", "openrouter", "keyboards", "presenters", "handlers")
+
+
+def test_analytics_worker_profile_excludes_bot_steps() -> None:
+    steps = ContainerSetup.steps(ContainerProfile.ANALYTICS_WORKER)
+
+    assert "_register_repositories" in steps
+    assert "_register_buffers" in steps
+    assert "_register_bot_components" not in steps
+    assert "_register_services" not in steps
+    assert "_register_usecases" not in steps
+
+
+def test_default_profile_is_bot_with_all_steps() -> None:
+    assert ContainerSetup.steps() == ContainerSetup.steps(ContainerProfile.BOT)
+    assert "_register_dispatcher" in ContainerSetup.steps()
+    assert "_register_dispatcher" not in ContainerSetup.steps(ContainerProfile.API)
+
+
+def test_steps_union_keeps_registration_order() -> None:
+    steps = ContainerSetup.steps(
+        ContainerProfile.AUTOMOD_WORKER, ContainerProfile.ANALYTICS_WORKER
+    )
+
+    assert steps.index("_register_redis") < steps.index("_register_services")
+    assert steps.index("_register_services") < steps.index(
+        "_register_automoderation_usecases"
+    )
+    assert len(steps) == len(set(steps))
+
+
+def test_setup_registers_each_step_once() -> None:
+    fake_container = MagicMock()
+    step_mocks = {step: MagicMock() for step in ContainerSetup.steps()}
+
+    with (
+        patch.object(container_module, "container", fake_container),
+        patch.object(ContainerSetup, "_registered_steps", set()),
+        patch.multiple(ContainerSetup, **step_mocks),
+    ):
+        ContainerSetup.setup(ContainerProfile.ANALYTICS_WORKER)
+        ContainerSetup.setup(ContainerProfile.ANALYTICS_WORKER)
+        ContainerSetup.setup(ContainerProfile.SCHEDULER)
+
+    for step, mock in step_mocks.items():
+        expected = 1 if step in ContainerSetup.steps(ContainerProfile.SCHEDULER) else 0
+        assert mock.call_count == expected, step
+    assert fake_container.compile.call_count == 2
+
+
+def test_setup_required_uses_declared_profiles() -> None:
+    with (
+        patch.object(ContainerSetup, "_required_profiles", set()),
+        patch.object(ContainerSetup, "setup") as setup,
+    ):
+        ContainerSetup.require(ContainerProfile.ANALYTICS_WORKER)
+        ContainerSetup.require(ContainerProfile.ANALYTICS_WORKER)
+        ContainerSetup.setup_required()
+
+    setup.assert_called_once_with(ContainerProfile.ANALYTICS_WORKER)
+
+
+def test_analytics_worker_bootstrap_is_lighter_than_bot() -> None:
+    """Регрессия времени импорта и RSS: воркер аналитики не тянет aiogram и хендлеры."""
+    worker = measure("analytics_worker")
+    bot = measure("bot")
+
+    loaded = set(worker["modules"])
+    for name in _HEAVY_MODULES:
+        assert name not in loaded, name
+    assert "aiogram" in bot["modules"]
+    assert worker["seconds"] < bot["seconds"]
+    assert worker["rss_mb"] < bot["rss_mb"]
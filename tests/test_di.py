@@ -0,0 +1,73 @@
+from punq import Scope
+
+from di import CompiledContainer
+
+
+class Repo:
+    pass
+
+
+class UseCase:
+    def __init__(self, repo: Repo) -> None:
+        self.repo = repo
+
+
+class Configured:
+    def __init__(self, repo: Repo, limit: int) -> None:
+        self.repo = repo
+        self.limit = limit
+
+
+def _container() -> CompiledContainer:
+    container = CompiledContainer()
+    container.register(Repo)
+    container.register(UseCase)
+    return container
+
+
+def test_compiled_factory_builds_transient() -> None:
+    container = _container()
+    container.compile()
+
+    assert UseCase in container._compiled
+    first = container.resolve(UseCase)
+    second = container.resolve(UseCase)
+    assert isinstance(first.repo, Repo)
+    assert first is not second
+
+
+def test_promoted_registration_is_warmed_singleton() -> None:
+    container = _container()
+    container.compile(promote_to_singleton=lambda key: key is UseCase)
+
+    assert container.registrations[UseCase][-1].scope == Scope.singleton
+    assert UseCase in container._singletons
+    assert container.resolve(UseCase) is container.resolve(UseCase)
+    # Непереведённая зависимость остаётся transient
+    assert container.resolve(Repo) is not container.resolve(Repo)
+
+
+def test_static_kwargs_are_passed_to_compiled_factory() -> None:
+    container = _container()
+    container.register(Configured, factory=Configured, limit=5)
+    container.compile()
+
+    assert container.resolve(Configured).limit == 5
+
+
+def test_register_invalidates_compiled_factory() -> None:
+    container = _container()
+    container.compile()
+    repo = Repo()
+    container.register(Repo, instance=repo)
+
+    assert Repo not in container._compiled
+    assert container.resolve(UseCase).repo is repo
+
+
+def test_resolve_kwargs_fall_back_to_punq() -> None:
+    container = _container()
+    container.compile()
+    repo = Repo()
+
+    assert container.resolve(UseCase, repo=repo).repo is repo
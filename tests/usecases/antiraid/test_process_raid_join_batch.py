@@ -0,0 +1,208 @@
+"""Тесты ProcessRaidJoinBatchUseCase и EnqueueRaidJoinUseCase."""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from punq import Container
+
+from config import settings
+from constants import Dialog
+from container import ContainerSetup
+from dto.antiraid import RaidJoinBatchJobDTO, RaidJoinItemDTO
+from services import BotMessageService, BotPermissionService, ChatService
+from services.raid_mode_service import RaidModeService
+from repositories import ChatMembershipEventRepository
+from usecases.antiraid import EnqueueRaidJoinUseCase, ProcessRaidJoinBatchUseCase
+from usecases.archive import NotifyArchiveChatMembersDigestUseCase
+
+
+def _item(user_tgid: int, username: str | None = None) -> RaidJoinItemDTO:
+    return RaidJoinItemDTO(
+        user_tgid=user_tgid,
+        username=username,
+        first_name=f"name{user_tgid}",
+        joined_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def _chat(*, antibot: bool, show_welcome: bool = True) -> MagicMock:
+    chat = MagicMock()
+    chat.id = 7
+    chat.is_antibot_enabled = antibot
+    chat.show_welcome_text = show_welcome
+    chat.welcome_text = None
+    chat.auto_delete_welcome_text = False
+    return chat
+
+
+@pytest.fixture
+def deps() -> dict:
+    sent = MagicMock()
+    sent.message_id = 900
+    bot_message_service = MagicMock()
+    bot_message_service.mute_chat_member = AsyncMock(return_value=True)
+    bot_message_service.send_chat_message = AsyncMock(return_value=sent)
+    permission_service = MagicMock()
+    permission_service.can_moderate = AsyncMock(return_value=True)
+    repo = MagicMock()
+    repo.bulk_add_events = AsyncMock(return_value=3)
+    raid = MagicMock()
+    raid.add_pending_verification = AsyncMock()
+    return {
+        "chat_service": MagicMock(),
+        "bot_permission_service": permission_service,
+        "bot_message_service": bot_message_service,
+        "membership_event_repository": repo,
+        "raid_mode_service": raid,
+        "notify_digest_usecase": AsyncMock(),
+        "restrict_pace_seconds": 0,
+    }
+
+
+def _kick_task_mock() -> MagicMock:
+    task = MagicMock()
+    chain = MagicMock()
+    chain.kiq = AsyncMock()
+    chain.with_labels.return_value = chain
+    task.kicker.return_value = chain
+    return task
+
+
+@pytest.mark.asyncio
+async def test_batch_with_antibot_sends_one_greeting_and_one_insert(deps) -> None:
+    deps["chat_service"].get_chat = AsyncMock(return_value=_chat(antibot=True))
+    uc = ProcessRaidJoinBatchUseCase(**deps)
+    items = [_item(1, "a"), _item(2, "b"), _item(1, "a"), _item(3)]
+
+    kick_task = _kick_task_mock()
+    with patch("tasks.antiraid_tasks.kick_unverified_raid_members_task", kick_task):
+        await uc.execute(
+            RaidJoinBatchJobDTO(chat_tgid="-100", chat_title="T", items=items)
+        )
+
+    # Повторный вход одного и того же участника схлопывается
+    events = deps["membership_event_repository"].bulk_add_events.call_args.args[0]
+    assert sorted(e.user_tgid for e in events) == [1, 2, 3]
+    assert deps["bot_message_service"].mute_chat_member.await_count == 3
+
+    deps["bot_message_service"].send_chat_message.assert_awaited_once()
+    text = deps["bot_message_service"].send_chat_message.call_args.kwargs["text"]
+    assert "@b" in text and "@a" in text and "name3" in text
+    assert text.endswith(Dialog.Antibot.VERIFY_BUTTON_PROMPT)
+
+    pending = deps["raid_mode_service"].add_pending_verification.call_args.kwargs
+    assert pending["message_id"] == 900
+    assert len(pending["members"]) == 3
+    kick_task.kicker.return_value.kiq.assert_awaited_once()
+
+    digest = deps["notify_digest_usecase"].execute.call_args.args[0]
+    assert len(digest.members) == 3
+    assert digest.kicked is False
+
+
+@pytest.mark.asyncio
+async def test_batch_without_antibot_does_not_restrict(deps) -> None:
+    deps["chat_service"].get_chat = AsyncMock(
+        return_value=_chat(antibot=False, show_welcome=True)
+    )
+    uc = ProcessRaidJoinBatchUseCase(**deps)
+
+    await uc.execute(
+        RaidJoinBatchJobDTO(chat_tgid="-100", chat_title="T", items=[_item(1, "a")])
+    )
+
+    deps["bot_message_service"].mute_chat_member.assert_not_called()
+    deps["raid_mode_service"].add_pending_verification.assert_not_called()
+    text = deps["bot_message_service"].send_chat_message.call_args.kwargs["text"]
+    assert text == Dialog.Antibot.RAID_GREETING.format(usernames="@a")
+
+
+@pytest.mark.asyncio
+async def test_batch_for_unknown_chat_is_skipped(deps) -> None:
+    deps["chat_service"].get_chat = AsyncMock(return_value=None)
+    uc = ProcessRaidJoinBatchUseCase(**deps)
+
+    await uc.execute(
+        RaidJoinBatchJobDTO(chat_tgid="-100", chat_title="T", items=[_item(1)])
+    )
+
+    deps["membership_event_repository"].bulk_add_events.assert_not_called()
+    deps["bot_message_service"].send_chat_message.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_outside_raid_mode_returns_false() -> None:
+    raid = MagicMock()
+    raid.register_join = AsyncMock(return_value=False)
+    raid.enqueue_join = AsyncMock()
+
+    result = await EnqueueRaidJoinUseCase(raid).execute("-100", "T", _item(1))
+
+    assert result is False
+    raid.enqueue_join.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_in_raid_mode_schedules_drain_once() -> None:
+    raid = MagicMock()
+    raid.batch_interval_seconds = 10
+    raid.register_join = AsyncMock(return_value=True)
+    raid.enqueue_join = AsyncMock(side_effect=[True, False])
+
+    drain_task = _kick_task_mock()
+    with patch("tasks.antiraid_tasks.process_raid_join_batch_task", drain_task):
+        uc = EnqueueRaidJoinUseCase(raid)
+        assert await uc.execute("-100", "T", _item(1)) is True
+        assert await uc.execute("-100", "T", _item(2)) is True
+
+    drain_task.kicker.return_value.with_labels.assert_called_once_with(delay=10)
+    drain_task.kicker.return_value.kiq.assert_awaited_once_with(
+        chat_tgid="-100", chat_title="T"
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_falls_back_when_queue_unavailable() -> None:
+    raid = MagicMock()
+    raid.register_join = AsyncMock(return_value=True)
+    raid.enqueue_join = AsyncMock(return_value=None)
+
+    assert await EnqueueRaidJoinUseCase(raid).execute("-100", "T", _item(1)) is False
+
+
+@pytest.mark.asyncio
+async def test_enqueue_withdraws_join_when_drain_cannot_be_scheduled() -> None:
+    raid = MagicMock()
+    raid.batch_interval_seconds = 10
+    raid.register_join = AsyncMock(return_value=True)
+    raid.enqueue_join = AsyncMock(return_value=True)
+    raid.withdraw_join = AsyncMock()
+    item = _item(1)
+
+    drain_task = _kick_task_mock()
+    drain_task.kicker.return_value.kiq.side_effect = RuntimeError("broker down")
+    with patch("tasks.antiraid_tasks.process_raid_join_batch_task", drain_task):
+        result = await EnqueueRaidJoinUseCase(raid).execute("-100", "T", item)
+
+    assert result is False
+    raid.withdraw_join.assert_awaited_once_with("-100", item)
+
+
+def test_process_batch_usecase_resolves_from_container(deps) -> None:
+    container = Container()
+    for service, instance in (
+        (ChatService, deps["chat_service"]),
+        (BotPermissionService, deps["bot_permission_service"]),
+        (BotMessageService, deps["bot_message_service"]),
+        (ChatMembershipEventRepository, deps["membership_event_repository"]),
+        (RaidModeService, deps["raid_mode_service"]),
+        (NotifyArchiveChatMembersDigestUseCase, deps["notify_digest_usecase"]),
+    ):
+        container.register(service, instance=instance)
+
+    ContainerSetup._register_antiraid_usecases(container)
+    usecase = container.resolve(ProcessRaidJoinBatchUseCase)
+
+    assert isinstance(usecase, ProcessRaidJoinBatchUseCase)
+    assert usecase._restrict_pace_seconds == settings.RAID_RESTRICT_PACE_SECONDS
@@ -1,5 +1,6 @@
 """Тесты ProcessAutoModerationBatchUseCase."""
 
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -9,6 +10,8 @@ from dto.automoderation import (
     AutoModerationBufferItemDTO,
     SpamDetectionLLMResultDTO,
 )
+from services.automoderation_prefilter_service import PrefilterResult
+from services.chat.summarize import AIServiceUnavailableError
 from usecases.automoderation.process_auto_moderation_batch import (
     ProcessAutoModerationBatchUseCase,
 )
@@ -25,12 +28,30 @@ def _batch() -> list[AutoModerationBufferItemDTO]:
     ]
 
 
+def _prefilter(**result: object) -> MagicMock:
+    """Предфильтр, отдающий заданный результат (по умолчанию — всю пачку в LLM)."""
+    prefilter = MagicMock()
+
+    async def prepare(batch):
+        return PrefilterResult(
+            **{
+                "candidates": list(batch),
+                "fingerprints": {m.message_id: str(m.message_id) for m in batch},
+                **result,
+            }
+        )
+
+    prefilter.prepare = AsyncMock(side_effect=prepare)
+    prefilter.record = AsyncMock()
+    return prefilter
+
+
 @pytest.mark.asyncio
 async def test_execute_no_hit_skips_notify() -> None:
     ai = MagicMock()
     ai.analyze_spam_batch = AsyncMock(return_value=None)
     notify = AsyncMock()
-    uc = ProcessAutoModerationBatchUseCase(ai, notify)
+    uc = ProcessAutoModerationBatchUseCase(ai, notify, AsyncMock(), _prefilter())
     dto = AutoModerationBatchJobDTO(
         chat_tgid="-1001",
         chat_title="G",
@@ -53,7 +74,7 @@ async def test_execute_hit_calls_notify() -> None:
     ai = MagicMock()
     ai.analyze_spam_batch = AsyncMock(return_value=hit)
     notify = AsyncMock()
-    uc = ProcessAutoModerationBatchUseCase(ai, notify)
+    uc = ProcessAutoModerationBatchUseCase(ai, notify, AsyncMock(), _prefilter())
     dto = AutoModerationBatchJobDTO(
         chat_tgid="-1001",
         chat_title="G",
@@ -80,7 +101,7 @@ async def test_execute_hit_without_archive_skips_notify() -> None:
     ai = MagicMock()
     ai.analyze_spam_batch = AsyncMock(return_value=hit)
     notify = AsyncMock()
-    uc = ProcessAutoModerationBatchUseCase(ai, notify)
+    uc = ProcessAutoModerationBatchUseCase(ai, notify, AsyncMock(), _prefilter())
     dto = AutoModerationBatchJobDTO(
         chat_tgid="-1001",
         chat_title="G",
@@ -89,3 +110,102 @@ async def test_execute_hit_without_archive_skips_notify() -> None:
     )
     await uc.execute(dto)
     notify.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_hit_records_time_to_detection() -> None:
+    """При срабатывании учитываются ожидание пачки и время до обнаружения."""
+    hit = SpamDetectionLLMResultDTO(
+        user_tg_id=1,
+        message_id=10,
+        reason="spam",
+        username="u",
+    )
+    ai = MagicMock()
+    ai.analyze_spam_batch = AsyncMock(return_value=hit)
+    buffer = AsyncMock()
+    uc = ProcessAutoModerationBatchUseCase(ai, AsyncMock(), buffer, _prefilter())
+    item = _batch()[0].model_copy(update={"enqueued_at": time.time() - 30})
+    dto = AutoModerationBatchJobDTO(
+        chat_tgid="-1001",
+        chat_title="G",
+        archive_chat_tgid="-1002",
+        batch=[item],
+    )
+    await uc.execute(dto)
+
+    metrics = {
+        call.args[0]: call.args[1] for call in buffer.record_latency.call_args_list
+    }
+    assert set(metrics) == {"batch_wait", "time_to_detection"}
+    assert 29 <= metrics["time_to_detection"] < 60
+
+
+@pytest.mark.asyncio
+async def test_execute_cached_hit_skips_llm() -> None:
+    """Известный спам срабатывает по кешу вердиктов без вызова LLM."""
+    hit = SpamDetectionLLMResultDTO(
+        user_tg_id=1, message_id=10, reason="spam", username="u"
+    )
+    ai = MagicMock()
+    ai.analyze_spam_batch = AsyncMock()
+    notify = AsyncMock()
+    prefilter = _prefilter(candidates=[], cached_hit=hit)
+    uc = ProcessAutoModerationBatchUseCase(ai, notify, AsyncMock(), prefilter)
+    dto = AutoModerationBatchJobDTO(
+        chat_tgid="-1001",
+        chat_title="G",
+        archive_chat_tgid="-1002",
+        batch=_batch(),
+    )
+    await uc.execute(dto)
+
+    ai.analyze_spam_batch.assert_not_called()
+    prefilter.record.assert_not_called()
+    notify.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_sends_only_candidates_and_records_verdict() -> None:
+    """В LLM уходят только отобранные предфильтром сообщения."""
+    batch = _batch() + [
+        AutoModerationBufferItemDTO(
+            username="u", user_tg_id=1, message_id=11, message_text="hello"
+        )
+    ]
+    ai = MagicMock()
+    ai.analyze_spam_batch = AsyncMock(return_value=None)
+    prefilter = _prefilter(candidates=batch[:1], skipped_duplicates=1)
+    uc = ProcessAutoModerationBatchUseCase(ai, AsyncMock(), AsyncMock(), prefilter)
+    dto = AutoModerationBatchJobDTO(
+        chat_tgid="-1001",
+        chat_title="G",
+        archive_chat_tgid="-1002",
+        batch=batch,
+    )
+    await uc.execute(dto)
+
+    ai.analyze_spam_batch.assert_awaited_once_with("G", batch[:1])
+    prefiltered, hit = prefilter.record.await_args.args
+    assert prefiltered.candidates == batch[:1]
+    assert hit is None
+
+
+@pytest.mark.asyncio
+async def test_execute_unavailable_model_does_not_record_verdict() -> None:
+    """Недоступная модель не считается чистым вердиктом."""
+    ai = MagicMock()
+    ai.analyze_spam_batch = AsyncMock(side_effect=AIServiceUnavailableError("down"))
+    notify = AsyncMock()
+    prefilter = _prefilter()
+    uc = ProcessAutoModerationBatchUseCase(ai, notify, AsyncMock(), prefilter)
+    dto = AutoModerationBatchJobDTO(
+        chat_tgid="-1001",
+        chat_title="G",
+        archive_chat_tgid="-1002",
+        batch=_batch(),
+    )
+    await uc.execute(dto)
+
+    prefilter.record.assert_not_called()
+    notify.execute.assert_not_called()
@@ -82,3 +82,31 @@ async def test_partial_batch_no_enqueue() -> None:
         await uc.execute(dto)
 
     mock_task.kiq.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_trivially_safe_text_is_not_buffered() -> None:
+    """Короткий текст без ссылок не попадает в буфер; со ссылкой — попадает."""
+    buffer = MagicMock(spec=AutoModerationBufferService)
+    buffer.append_text_message = AsyncMock(return_value=None)
+    uc = RunAutoModerationOnMessageUseCase(
+        buffer, batch_size=30, safe_text_max_length=12
+    )
+
+    def dto(text: str) -> AutoModerationRunDTO:
+        return AutoModerationRunDTO(
+            chat_tgid="-100",
+            chat_title="Chat",
+            is_auto_moderation_enabled=True,
+            archive_chat_tgid=None,
+            username="u",
+            user_tg_id=99,
+            message_id=5,
+            message_text=text,
+        )
+
+    await uc.execute(dto("  Ок, спасибо "))
+    buffer.append_text_message.assert_not_called()
+
+    await uc.execute(dto("t.me/promo"))
+    buffer.append_text_message.assert_awaited_once()
@@ -19,6 +19,7 @@ def usecase() -> AddChatToTrackUseCase:
         user_service=AsyncMock(),
         chat_service=AsyncMock(),
         bot_permission_service=AsyncMock(),
+        tracking_index=AsyncMock(),
     )
 
 
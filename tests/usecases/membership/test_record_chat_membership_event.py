@@ -16,9 +16,12 @@ def usecase() -> RecordChatMembershipEventUseCase:
     chat_service = MagicMock()
     membership_repository = MagicMock()
     membership_repository.add = AsyncMock()
+    buffer_service = MagicMock()
+    buffer_service.add_membership_event = AsyncMock(return_value=True)
     return RecordChatMembershipEventUseCase(
         chat_service=chat_service,
         membership_event_repository=membership_repository,
+        buffer_service=buffer_service,
     )
 
 
@@ -34,14 +37,37 @@ async def test_execute_chat_not_found_skips_add(
         event_type=MembershipEventType.JOIN,
     )
     await usecase.execute(dto)
+    usecase._buffer_service.add_membership_event.assert_not_called()
     usecase._membership_event_repository.add.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_execute_chat_found_calls_add(
+async def test_execute_chat_found_buffers_event(
     usecase: RecordChatMembershipEventUseCase,
 ) -> None:
-    """При наличии чата вызывается add с внутренним id сессии."""
+    """При наличии чата событие уходит в буфер, а не в БД напрямую."""
+    chat = MagicMock()
+    chat.id = 7
+    usecase._chat_service.get_chat = AsyncMock(return_value=chat)
+    dto = RecordChatMembershipEventDTO(
+        chat_tgid="-100",
+        user_tgid=99,
+        event_type=MembershipEventType.JOIN,
+    )
+    await usecase.execute(dto)
+    buffered = usecase._buffer_service.add_membership_event.call_args.args[0]
+    assert buffered.chat_id == 7
+    assert buffered.user_tgid == 99
+    assert buffered.event_type == MembershipEventType.JOIN.value
+    usecase._membership_event_repository.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_buffer_unavailable_calls_add(
+    usecase: RecordChatMembershipEventUseCase,
+) -> None:
+    """Без Redis вызывается add с внутренним id сессии."""
+    usecase._buffer_service.add_membership_event = AsyncMock(return_value=False)
     chat = MagicMock()
     chat.id = 7
     usecase._chat_service.get_chat = AsyncMock(return_value=chat)
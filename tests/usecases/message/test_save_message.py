@@ -60,3 +60,38 @@ async def test_save_message_success() -> None:
     assert called_dto.content_type == message_dto.content_type
     assert called_dto.text == message_dto.text
     assert called_dto.created_at == message_dto.created_at
+
+
+@pytest.mark.asyncio
+async def test_save_message_uses_update_context() -> None:
+    """С контекстом апдейта пользователь и чат берутся из него, а не из сервисов."""
+    mock_buffer_service = AsyncMock(spec=AnalyticsBufferService)
+    mock_user_service = AsyncMock(spec=UserService)
+    mock_chat_service = AsyncMock(spec=ChatService)
+    use_case = SaveMessageUseCase(
+        buffer_service=mock_buffer_service,
+        user_service=mock_user_service,
+        chat_service=mock_chat_service,
+    )
+    update_context = MagicMock()
+    update_context.get_user = AsyncMock(return_value=MagicMock(id=7))
+    update_context.get_chat = AsyncMock(return_value=MagicMock(id=70))
+
+    await use_case.execute(
+        CreateMessageDTO(
+            chat_tgid="70",
+            user_tgid="7",
+            message_id="msg_2",
+            message_type="message",
+            content_type="text",
+            text="Hi",
+            created_at=datetime.now(),
+        ),
+        update_context=update_context,
+    )
+
+    mock_user_service.get_or_create.assert_not_called()
+    mock_chat_service.get_or_create.assert_not_called()
+    called_dto: BufferedMessageDTO = mock_buffer_service.add_message.call_args[0][0]
+    assert called_dto.user_id == 7
+    assert called_dto.chat_id == 70
@@ -20,6 +20,7 @@ def usecase() -> GetSingleUserReportUseCase:
         chat_repository=AsyncMock(),
         punishment_repository=AsyncMock(),
         admin_action_log_service=AsyncMock(),
+        tracking_index=AsyncMock(),
     )
 
 
@@ -0,0 +1,67 @@
+"""Тесты GetChatDayActivityUseCase: живые счётчики за сегодня и запасной путь через БД."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dto.daily_activity import UserDailyActivityDTO
+from services.time_service import TimeZoneService
+from usecases.report.chat.get_chat_day_activity import GetChatDayActivityUseCase
+
+_TOP = [UserDailyActivityDTO(user_id=7, username="bob", message_count=5, rank=1)]
+
+
+def _usecase(live) -> GetChatDayActivityUseCase:
+    buffer_service = AsyncMock()
+    buffer_service.get_live_day_stats = AsyncMock(return_value=live)
+    message_repository = AsyncMock()
+    message_repository.get_daily_top_users = AsyncMock(return_value=_TOP)
+    user_repository = AsyncMock()
+    user_repository.total_active_users = AsyncMock(return_value=12)
+    return GetChatDayActivityUseCase(
+        buffer_service=buffer_service,
+        message_repository=message_repository,
+        user_repository=user_repository,
+    )
+
+
+@pytest.mark.asyncio
+async def test_today_uses_live_counters_without_db() -> None:
+    """За сегодня при полных счётчиках запросов к БД нет."""
+    usecase = _usecase(live=(_TOP, 4))
+
+    result = await usecase.execute(chat_id=1)
+
+    assert result.live is True
+    assert result.top_users == _TOP
+    assert result.active_users_count == 4
+    usecase._message_repository.get_daily_top_users.assert_not_called()
+    usecase._user_repository.total_active_users.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_today_falls_back_to_db_when_counters_incomplete() -> None:
+    usecase = _usecase(live=None)
+
+    result = await usecase.execute(chat_id=1)
+
+    assert result.live is False
+    assert result.active_users_count == 12
+    usecase._message_repository.get_daily_top_users.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_past_day_reads_db_for_whole_local_day() -> None:
+    usecase = _usecase(live=(_TOP, 4))
+    yesterday = TimeZoneService.now().date() - timedelta(days=1)
+
+    result = await usecase.execute(chat_id=1, day=yesterday, limit=5)
+
+    assert result.live is False
+    usecase._buffer.get_live_day_stats.assert_not_called()
+    kwargs = usecase._message_repository.get_daily_top_users.call_args.kwargs
+    assert kwargs["limit"] == 5
+    assert kwargs["start_date"].date() == yesterday
+    assert kwargs["end_date"].date() == yesterday
+    assert kwargs["end_date"] - kwargs["start_date"] > timedelta(hours=23)
@@ -55,6 +55,7 @@ def usecase() -> GetChatReportUseCase:
         punishment_repository=AsyncMock(),
         bot_permission_service=None,
         admin_action_log_service=AsyncMock(),
+        tracking_index=AsyncMock(),
     )
 
 
@@ -118,7 +119,7 @@ async def test_execute_no_tracked_users_returns_error_dto(
     chat.tolerance = 30
     chat.breaks_time = 15
     usecase._chat_repository.get_chat_by_id = AsyncMock(return_value=chat)
-    usecase._user_repository.get_tracked_users_for_admin = AsyncMock(return_value=[])
+    usecase._tracking_index.get_tracked_user_ids = AsyncMock(return_value=[])
 
     result = await usecase.execute(chat_report_dto)
 
@@ -152,8 +153,8 @@ async def test_execute_success_returns_report_result(
     msg.user = MagicMock(username="tracked_user")
 
     usecase._chat_repository.get_chat_by_id = AsyncMock(return_value=chat)
-    usecase._user_repository.get_tracked_users_for_admin = AsyncMock(
-        return_value=[tracked_user]
+    usecase._tracking_index.get_tracked_user_ids = AsyncMock(
+        return_value=[tracked_user.id]
     )
     usecase._message_repository.get_messages_by_chat_id_and_period = AsyncMock(
         return_value=[msg]
@@ -225,8 +226,8 @@ async def test_execute_calculate_users_stats_with_multiple_users_and_reactions(
     react.user = u2
 
     usecase._chat_repository.get_chat_by_id = AsyncMock(return_value=chat)
-    usecase._user_repository.get_tracked_users_for_admin = AsyncMock(
-        return_value=[u1, u2]
+    usecase._tracking_index.get_tracked_user_ids = AsyncMock(
+        return_value=[u1.id, u2.id]
     )
     usecase._message_repository.get_messages_by_chat_id_and_period = AsyncMock(
         return_value=[msg1, msg2]
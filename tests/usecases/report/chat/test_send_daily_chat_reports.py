@@ -19,6 +19,7 @@ def usecase() -> SendDailyChatReportsUseCase:
         msg_reply_repository=AsyncMock(),
         reaction_repository=AsyncMock(),
         bot_message_service=AsyncMock(),
+        tracking_index=AsyncMock(),
     )
 
 
@@ -83,8 +84,6 @@ async def test_execute_success_sends_report_to_archive(
     chat.tolerance = 30
     chat.breaks_time = 15
 
-    admin = MagicMock()
-    admin.tg_id = "adm_1"
     tracked_user = MagicMock()
     tracked_user.id = 1
     tracked_user.username = "tracked_user"
@@ -95,9 +94,8 @@ async def test_execute_success_sends_report_to_archive(
     msg.user = MagicMock(username="tracked_user")
 
     usecase._chat_repository.get_chat_by_id = AsyncMock(return_value=chat)
-    usecase._user_repository.get_admins_for_chat = AsyncMock(return_value=[admin])
-    usecase._user_repository.get_tracked_users_for_admin = AsyncMock(
-        return_value=[tracked_user]
+    usecase._tracking_index.get_tracked_user_ids_by_chats = AsyncMock(
+        return_value={1: {tracked_user.id}}
     )
     usecase._message_repository.get_messages_by_chat_id_and_period = AsyncMock(
         return_value=[msg]
@@ -127,3 +125,93 @@ async def test_execute_success_sends_report_to_archive(
     assert call_kw["chat_tgid"] == "-200"
     assert "Отчёт" in call_kw["text"] or "отчёт" in call_kw["text"]
     assert "Work Chat" in call_kw["text"]
+
+
+def _work_chat(chat_id: int, archive_chat_id: str | None) -> MagicMock:
+    chat = MagicMock()
+    chat.id = chat_id
+    chat.chat_id = f"-10{chat_id}"
+    chat.title = f"Chat {chat_id}"
+    chat.archive_chat_id = archive_chat_id
+    chat.start_time = time(9, 0)
+    chat.end_time = time(18, 0)
+    chat.tolerance = 30
+    chat.breaks_time = 15
+    return chat
+
+
+def _message(chat_id: int, user_id: int, username: str) -> MagicMock:
+    msg = MagicMock()
+    msg.chat_id = chat_id
+    msg.user_id = user_id
+    msg.created_at = datetime(2025, 2, 22, 12, 0, tzinfo=timezone.utc)
+    msg.user = MagicMock(username=username)
+    return msg
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_shares_queries_and_paces_sends() -> None:
+    """Пакет: один запрос на вид активности для всех чатов, данные разложены
+    по чатам с учётом отслеживаемых пользователей, отправки идут с паузой."""
+    usecase = SendDailyChatReportsUseCase(
+        chat_repository=AsyncMock(),
+        user_repository=AsyncMock(),
+        message_repository=AsyncMock(),
+        msg_reply_repository=AsyncMock(),
+        reaction_repository=AsyncMock(),
+        bot_message_service=AsyncMock(),
+        tracking_index=AsyncMock(),
+        send_pace_seconds=0.5,
+    )
+    usecase._chat_repository.get_chats_by_ids = AsyncMock(
+        return_value=[
+            _work_chat(1, "-201"),
+            _work_chat(2, "-202"),
+            _work_chat(3, None),
+        ]
+    )
+    usecase._tracking_index.get_tracked_user_ids_by_chats = AsyncMock(
+        return_value={1: {10}, 2: {20}}
+    )
+    usecase._message_repository.get_messages_by_chat_ids_and_period = AsyncMock(
+        return_value=[
+            _message(1, 10, "alice"),
+            # Пользователь 20 отслеживается только во втором чате
+            _message(1, 20, "bob"),
+            _message(2, 20, "bob"),
+        ]
+    )
+    usecase._msg_reply_repository.get_replies_by_chat_ids_and_period = AsyncMock(
+        return_value=[]
+    )
+    usecase._reaction_repository.get_reactions_by_chat_ids_and_period = AsyncMock(
+        return_value=[]
+    )
+
+    start_dt = datetime(2025, 2, 22, 0, 0, 0, tzinfo=timezone.utc)
+    end_dt = datetime(2025, 2, 22, 18, 0, 0, tzinfo=timezone.utc)
+    module = "usecases.report.chat.send_daily_chat_reports"
+    with (
+        patch(f"{module}.TimePeriod.to_datetime", return_value=(start_dt, end_dt)),
+        patch(
+            f"{module}.WorkTimeService.adjust_dates_to_work_hours",
+            return_value=(start_dt, end_dt),
+        ),
+        patch(f"{module}.asyncio.sleep", new=AsyncMock()) as sleep,
+    ):
+        await usecase.execute_batch(chat_ids=[1, 2, 3], period="За сегодня")
+
+    usecase._tracking_index.get_tracked_user_ids_by_chats.assert_awaited_once_with(
+        [1, 2]
+    )
+    fetch = usecase._message_repository.get_messages_by_chat_ids_and_period
+    fetch.assert_awaited_once()
+    assert fetch.await_args.kwargs["chat_ids"] == [1, 2]
+    assert fetch.await_args.kwargs["tracked_user_ids"] == [10, 20]
+
+    sends = usecase._bot_message_service.send_chat_message.await_args_list
+    assert [call.kwargs["chat_tgid"] for call in sends] == ["-201", "-202"]
+    assert "@alice" in sends[0].kwargs["text"]
+    assert "@bob" not in sends[0].kwargs["text"]
+    assert "@bob" in sends[1].kwargs["text"]
+    sleep.assert_awaited_once_with(0.5)
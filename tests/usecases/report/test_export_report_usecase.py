@@ -0,0 +1,118 @@
+"""Тесты ExportReportUseCase: заголовок, форматирование строк, потоковая память."""
+
+import csv
+import io
+import tracemalloc
+from datetime import date, datetime, timezone
+from typing import Any, AsyncIterator, List, Sequence
+from unittest.mock import MagicMock
+
+import pytest
+
+from constants.enums import ExportGranularity, ExportScope
+from dto.report import ReportExportDTO
+from usecases.report.export_report import (
+    DAILY_COLUMNS,
+    MESSAGES_COLUMNS,
+    ExportReportUseCase,
+)
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+END = datetime(2025, 1, 31, tzinfo=timezone.utc)
+
+
+def _dto(
+    scope: ExportScope = ExportScope.CHAT,
+    granularity: ExportGranularity = ExportGranularity.MESSAGES,
+) -> ReportExportDTO:
+    return ReportExportDTO(
+        scope=scope,
+        target_id=7,
+        start_date=START,
+        end_date=END,
+        granularity=granularity,
+    )
+
+
+def _batches(rows: List[Sequence[Any]], size: int) -> AsyncIterator[Sequence[Any]]:
+    async def gen() -> AsyncIterator[Sequence[Any]]:
+        for i in range(0, len(rows), size):
+            yield rows[i : i + size]
+
+    return gen()
+
+
+async def _collect(usecase: ExportReportUseCase, dto: ReportExportDTO) -> str:
+    return "".join([chunk async for chunk in usecase.execute(dto)])
+
+
+@pytest.mark.asyncio
+async def test_messages_export_writes_header_and_rows() -> None:
+    """Выгрузка сообщений: заголовок и строки с локальным временем."""
+    rows = [(START, "-100", "Chat", "42", "user", "m1", "text", 'a, "b"')]
+    repo = MagicMock()
+    repo.iter_messages_for_export.return_value = _batches(rows, 10)
+    usecase = ExportReportUseCase(message_repository=repo, batch_size=10)
+
+    parsed = list(csv.reader(io.StringIO(await _collect(usecase, _dto()))))
+
+    assert tuple(parsed[0]) == MESSAGES_COLUMNS
+    assert parsed[1][1:] == ["-100", "Chat", "42", "user", "m1", "text", 'a, "b"']
+    assert datetime.fromisoformat(parsed[1][0]) == START
+    kwargs = repo.iter_messages_for_export.call_args.kwargs
+    assert kwargs["chat_id"] == 7
+    assert kwargs["user_id"] is None
+    assert kwargs["batch_size"] == 10
+
+
+@pytest.mark.asyncio
+async def test_daily_export_filters_by_user() -> None:
+    """Дневная выгрузка по пользователю: даты в формате YYYY-MM-DD."""
+    rows = [(date(2025, 1, 2), "-100", "Chat", "42", "user", 3)]
+    repo = MagicMock()
+    repo.iter_daily_counts_for_export.return_value = _batches(rows, 10)
+    usecase = ExportReportUseCase(message_repository=repo)
+
+    dto = _dto(scope=ExportScope.USER, granularity=ExportGranularity.DAILY)
+    parsed = list(csv.reader(io.StringIO(await _collect(usecase, dto))))
+
+    assert tuple(parsed[0]) == DAILY_COLUMNS
+    assert parsed[1] == ["2025-01-02", "-100", "Chat", "42", "user", "3"]
+    kwargs = repo.iter_daily_counts_for_export.call_args.kwargs
+    assert kwargs["user_id"] == 7
+    assert kwargs["chat_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_large_export_is_streamed_in_bounded_memory() -> None:
+    """100k строк отдаются по куску на пачку, не накапливаясь в памяти."""
+    total, batch_size = 100_000, 1000
+
+    async def gen() -> AsyncIterator[Sequence[Any]]:
+        for b in range(total // batch_size):
+            yield [
+                (START, "-100", "Chat", "42", "user", f"m{b}_{i}", "text", "x" * 50)
+                for i in range(batch_size)
+            ]
+
+    repo = MagicMock()
+    repo.iter_messages_for_export.return_value = gen()
+    usecase = ExportReportUseCase(message_repository=repo, batch_size=batch_size)
+
+    chunks = 0
+    lines = 0
+    size = 0
+    tracemalloc.start()
+    try:
+        async for chunk in usecase.execute(_dto()):
+            chunks += 1
+            lines += chunk.count("\n")
+            size += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert chunks == total // batch_size + 1
+    assert lines == total + 1
+    # Пик памяти — порядка одной пачки, а не всей выгрузки
+    assert peak < size / 4
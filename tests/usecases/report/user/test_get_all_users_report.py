@@ -35,6 +35,7 @@ def usecase() -> GetAllUsersReportUseCase:
         chat_repository=AsyncMock(),
         punishment_repository=AsyncMock(),
         admin_action_log_service=AsyncMock(),
+        tracking_index=AsyncMock(),
     )
 
 
@@ -44,7 +45,7 @@ async def test_execute_empty_tracked_users_returns_error_dto(
     all_users_dto: AllUsersReportDTO,
 ) -> None:
     """Пустой список отслеживаемых пользователей — error_message в DTO."""
-    usecase._user_repository.get_tracked_users_for_admin = AsyncMock(return_value=[])
+    usecase._tracking_index.get_tracked_users = AsyncMock(return_value=[])
 
     result = await usecase.execute(all_users_dto)
 
@@ -66,9 +67,7 @@ async def test_execute_with_users_no_activity_returns_empty_stats(
 ) -> None:
     """Пользователи есть, но нет сообщений/реакций/наказаний — в отчёт не попадают."""
     user = User(id=1, tg_id="u1", username="user1", role=UserRole.USER)
-    usecase._user_repository.get_tracked_users_for_admin = AsyncMock(
-        return_value=[user]
-    )
+    usecase._tracking_index.get_tracked_users = AsyncMock(return_value=[user])
     usecase._msg_reply_repository.get_replies_by_period_date_for_users = AsyncMock(
         return_value=[]
     )
@@ -40,6 +40,7 @@ def usecase() -> GetSingleUserReportUseCase:
         chat_repository=AsyncMock(),
         punishment_repository=AsyncMock(),
         admin_action_log_service=AsyncMock(),
+        tracking_index=AsyncMock(),
     )
 
 
@@ -51,7 +52,7 @@ async def test_execute_no_tracked_chats_returns_error_message(
 ) -> None:
     """Если у админа нет отслеживаемых чатов — возвращается error_message и no_chats."""
     usecase._user_repository.get_user_by_id = AsyncMock(return_value=sample_user)
-    usecase._chat_repository.get_tracked_chats_for_admin = AsyncMock(return_value=[])
+    usecase._tracking_index.get_tracked_chat_ids = AsyncMock(return_value=[])
 
     result = await usecase.execute(report_dto=report_dto)
 
@@ -63,6 +64,31 @@ async def test_execute_no_tracked_chats_returns_error_message(
     assert result.replies_stats.total_count == 0
 
 
+@pytest.mark.asyncio
+async def test_tracked_chats_are_read_by_admin_db_id(
+    usecase: GetSingleUserReportUseCase,
+    report_dto: SingleUserReportDTO,
+    sample_user: User,
+) -> None:
+    """Чаты админа ищутся по его id в БД; неизвестный админ — без чатов."""
+    admin = User(id=20, tg_id="20", username="admin", role=UserRole.ADMIN)
+    usecase._user_repository.get_user_by_id = AsyncMock(return_value=sample_user)
+    usecase._user_repository.get_user_by_tg_id = AsyncMock(return_value=admin)
+    usecase._tracking_index.get_tracked_chat_ids = AsyncMock(return_value=[])
+
+    await usecase.execute(report_dto=report_dto)
+
+    usecase._user_repository.get_user_by_tg_id.assert_awaited_once_with(tg_id="20")
+    usecase._tracking_index.get_tracked_chat_ids.assert_awaited_once_with(20)
+
+    usecase._user_repository.get_user_by_tg_id = AsyncMock(return_value=None)
+    usecase._tracking_index.get_tracked_chat_ids.reset_mock()
+    result = await usecase.execute(report_dto=report_dto)
+
+    assert result.error_message == "⚠️ Необходимо добавить чат в отслеживание."
+    usecase._tracking_index.get_tracked_chat_ids.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_execute_user_not_found_raises(
     usecase: GetSingleUserReportUseCase,
@@ -1,18 +1,25 @@
 """Tests for summary caching behavior."""
 
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from config import settings
 from constants.enums import SummaryType
+from constants.promps import SUMMARY_PARTIALS_PREAMBLE
 from repositories import ChatRepository, MessageRepository, UserTrackingRepository
 from services import AdminActionLogService
 from services.caching import ICache
 from services.chat.summarize import IAIService
 from services.chat.summarize.ai_service_base import SummaryResult
-from usecases.summarize.summarize_chat_messages import GetChatSummaryUseCase
+from usecases.summarize.summarize_chat_messages import (
+    GetChatSummaryUseCase,
+    _SummaryWindow,
+)
+
+_NOW = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
 
 
 def _build_usecase():
@@ -41,8 +48,8 @@ async def test_cache_saved_on_success() -> None:
         _build_usecase()
     )
 
-    msg_repo.get_messages_for_summary.return_value = [
-        SimpleNamespace(text="Hello world", username="user")
+    msg_repo.get_messages_for_summary_windows.return_value = [
+        (1, _NOW, "Hello world", "user")
     ]
     msg_repo.get_max_message_id.return_value = 10
     user_tracking_repo.get_tracked_users_by_admin.return_value = []
@@ -72,8 +79,8 @@ async def test_cache_skipped_on_error() -> None:
         _build_usecase()
     )
 
-    msg_repo.get_messages_for_summary.return_value = [
-        SimpleNamespace(text="Hello world", username="user")
+    msg_repo.get_messages_for_summary_windows.return_value = [
+        (1, _NOW, "Hello world", "user")
     ]
     user_tracking_repo.get_tracked_users_by_admin.return_value = []
     chat_repo.get_chat_by_id.return_value = SimpleNamespace(title="Chat")
@@ -90,3 +97,205 @@ async def test_cache_skipped_on_error() -> None:
 
     assert result == "error"
     cache.set.assert_not_called()
+
+
+def _busy_chat_rows() -> list[tuple]:
+    """Два часовых окна по 3 сообщения."""
+    rows = []
+    for msg_id in range(1, 7):
+        created_at = _NOW - timedelta(hours=1) if msg_id <= 3 else _NOW
+        rows.append((msg_id, created_at, f"message number {msg_id}", "user"))
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_large_log_uses_map_reduce_with_partial_cache() -> None:
+    """Лог сверх бюджета токенов конспектируется по окнам, конспекты кешируются."""
+    usecase, msg_repo, chat_repo, user_tracking_repo, ai_service, cache = (
+        _build_usecase()
+    )
+    msg_repo.get_messages_for_summary_windows.return_value = _busy_chat_rows()
+    msg_repo.get_max_message_id.return_value = 6
+    user_tracking_repo.get_tracked_users_by_admin.return_value = []
+    chat_repo.get_chat_by_id.return_value = SimpleNamespace(title="Chat")
+    cache.get.return_value = None
+    ai_service.summarize_chunk.return_value = SummaryResult(
+        status_code=200, summary="partial"
+    )
+    ai_service.summarize_text.return_value = SummaryResult(
+        status_code=200, summary="final"
+    )
+
+    with patch.object(settings, "SUMMARY_CHUNK_MAX_TOKENS", 10):
+        result = await usecase.execute(
+            chat_id=1,
+            summary_type=SummaryType.FULL,
+            admin_tg_id="42",
+        )
+
+    assert result == "final"
+    assert ai_service.summarize_chunk.await_count >= 2
+    partial_keys = [
+        call.kwargs["key"]
+        for call in cache.set.call_args_list
+        if call.kwargs["key"].startswith("summary:partial:1:")
+    ]
+    assert len(partial_keys) == 2
+    final_text = ai_service.summarize_text.call_args.kwargs["text"]
+    assert "partial" in final_text
+    assert ai_service.summarize_text.call_args.kwargs["msg_count"] == 6
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_summarizes_only_new_messages_of_window() -> None:
+    """Закешированное окно не конспектируется заново, новое — только по свежим сообщениям."""
+    usecase, msg_repo, chat_repo, user_tracking_repo, ai_service, cache = (
+        _build_usecase()
+    )
+    msg_repo.get_messages_for_summary_windows.return_value = _busy_chat_rows()
+    msg_repo.get_max_message_id.return_value = 6
+    user_tracking_repo.get_tracked_users_by_admin.return_value = []
+    chat_repo.get_chat_by_id.return_value = SimpleNamespace(title="Chat")
+
+    async def cache_get(key: str):
+        if key.startswith("summary:partial:"):
+            # Оба окна уже конспектированы до сообщения 5 включительно
+            return (["old partial"], 5)
+        return None
+
+    cache.get.side_effect = cache_get
+    ai_service.summarize_chunk.return_value = SummaryResult(
+        status_code=200, summary="new partial"
+    )
+    ai_service.summarize_text.return_value = SummaryResult(
+        status_code=200, summary="final"
+    )
+
+    with patch.object(settings, "SUMMARY_CHUNK_MAX_TOKENS", 20):
+        await usecase.execute(
+            chat_id=1,
+            summary_type=SummaryType.SHORT,
+            admin_tg_id="42",
+        )
+
+    ai_service.summarize_chunk.assert_awaited_once_with(text="[user]: message number 6")
+
+
+def _partial_cache_calls(cache) -> tuple[list[str], list[str]]:
+    read = [
+        call.args[0]
+        for call in cache.get.call_args_list
+        if call.args[0].startswith("summary:partial:")
+    ]
+    written = [
+        call.kwargs["key"]
+        for call in cache.set.call_args_list
+        if call.kwargs["key"].startswith("summary:partial:")
+    ]
+    return read, written
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "period",
+    [
+        # Начало периода отрезает первое окно
+        {"start_date": _NOW - timedelta(minutes=45), "end_date": _NOW},
+        # Лимит выборки отрезает старые сообщения первого окна
+        {"msg_limit": 6},
+    ],
+)
+async def test_cut_window_is_not_cached(period: dict) -> None:
+    """Окно, попавшее в выборку частично, конспектируется без кеша."""
+    usecase, msg_repo, chat_repo, user_tracking_repo, ai_service, cache = (
+        _build_usecase()
+    )
+    msg_repo.get_messages_for_summary_windows.return_value = _busy_chat_rows()
+    msg_repo.get_max_message_id.return_value = 6
+    user_tracking_repo.get_tracked_users_by_admin.return_value = []
+    chat_repo.get_chat_by_id.return_value = SimpleNamespace(title="Chat")
+    cache.get.return_value = None
+    ai_service.summarize_chunk.return_value = SummaryResult(
+        status_code=200, summary="partial"
+    )
+    ai_service.summarize_text.return_value = SummaryResult(
+        status_code=200, summary="final"
+    )
+
+    with patch.object(settings, "SUMMARY_CHUNK_MAX_TOKENS", 10):
+        await usecase.execute(
+            chat_id=1, summary_type=SummaryType.SHORT, admin_tg_id="42", **period
+        )
+
+    read, written = _partial_cache_calls(cache)
+    window_seconds = settings.SUMMARY_WINDOW_MINUTES * 60
+    last_window = int(_NOW.timestamp()) // window_seconds * window_seconds
+    assert read == written == [f"summary:partial:1:{last_window}"]
+
+
+@pytest.mark.asyncio
+async def test_reduce_shrinks_partials_that_cannot_be_grouped() -> None:
+    """Конспекты, каждый из которых сам не влезает в бюджет, всё равно сворачиваются."""
+    usecase, msg_repo, chat_repo, user_tracking_repo, ai_service, cache = (
+        _build_usecase()
+    )
+    msg_repo.get_messages_for_summary_windows.return_value = _busy_chat_rows()
+    msg_repo.get_max_message_id.return_value = 6
+    user_tracking_repo.get_tracked_users_by_admin.return_value = []
+    chat_repo.get_chat_by_id.return_value = SimpleNamespace(title="Chat")
+    cache.get.return_value = None
+
+    async def summarize_chunk(text: str) -> SummaryResult:
+        summary = "p" * 60 if "message number" in text else "short"
+        return SummaryResult(status_code=200, summary=summary)
+
+    ai_service.summarize_chunk.side_effect = summarize_chunk
+    ai_service.summarize_text.return_value = SummaryResult(
+        status_code=200, summary="final"
+    )
+
+    with patch.object(settings, "SUMMARY_CHUNK_MAX_TOKENS", 10):
+        await usecase.execute(
+            chat_id=1, summary_type=SummaryType.SHORT, admin_tg_id="42"
+        )
+
+    final_text = ai_service.summarize_text.call_args.kwargs["text"]
+    assert "p" * 60 not in final_text
+    assert final_text.endswith("short\n\nshort")
+
+
+@pytest.mark.asyncio
+async def test_reduce_truncates_when_partials_do_not_shrink() -> None:
+    """Если свёртка не укладывается в бюджет, в финальный запрос идёт обрезанный конспект."""
+    usecase, msg_repo, chat_repo, user_tracking_repo, ai_service, cache = (
+        _build_usecase()
+    )
+    msg_repo.get_messages_for_summary_windows.return_value = _busy_chat_rows()
+    msg_repo.get_max_message_id.return_value = 6
+    user_tracking_repo.get_tracked_users_by_admin.return_value = []
+    chat_repo.get_chat_by_id.return_value = SimpleNamespace(title="Chat")
+    cache.get.return_value = None
+    ai_service.summarize_chunk.return_value = SummaryResult(
+        status_code=200, summary="x" * 100
+    )
+    ai_service.summarize_text.return_value = SummaryResult(
+        status_code=200, summary="final"
+    )
+
+    with patch.object(settings, "SUMMARY_CHUNK_MAX_TOKENS", 10):
+        await usecase.execute(
+            chat_id=1, summary_type=SummaryType.SHORT, admin_tg_id="42"
+        )
+
+    final_text = ai_service.summarize_text.call_args.kwargs["text"]
+    assert final_text == SUMMARY_PARTIALS_PREAMBLE + "x" * 40
+
+
+def test_window_max_id_ignores_line_order() -> None:
+    """max_id окна — наибольший id, даже если он не у последней строки."""
+    window = _SummaryWindow(
+        start=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        lines=[(10, "a"), (30, "b"), (20, "c")],
+    )
+
+    assert window.max_id == 30
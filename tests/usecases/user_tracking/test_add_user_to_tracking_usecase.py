@@ -39,6 +39,7 @@ def use_case(
         user_service=mock_user_service,
         user_tracking_repository=mock_repo,
         admin_action_log_service=mock_admin_log,
+        tracking_index=AsyncMock(),
     )
 
 
@@ -60,6 +61,7 @@ async def test_add_user_to_tracking_success(
     assert result.success is True
     assert result.user_id == 1
     mock_repo.add_user_to_tracking.assert_called_once_with(admin_id=2, user_id=1)
+    use_case._tracking_index.invalidate_admin.assert_awaited_once_with(admin)
     mock_admin_log.log_action.assert_called_once()
 
 
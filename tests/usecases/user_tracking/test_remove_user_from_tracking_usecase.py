@@ -39,6 +39,7 @@ def use_case(
         user_tracking_repository=mock_repo,
         user_service=mock_user_service,
         admin_action_log_service=mock_admin_log,
+        tracking_index=AsyncMock(),
     )
 
 
@@ -58,6 +59,7 @@ async def test_remove_user_from_tracking_success(
 
     assert result is True
     mock_repo.remove_user_from_tracking.assert_called_once_with(admin_id=2, user_id=1)
+    use_case.tracking_index.invalidate_admin.assert_awaited_once_with(admin)
     mock_admin_log.log_action.assert_called_once()
 
 
@@ -0,0 +1,35 @@
+"""Тесты для utils/keyset_cursor.py."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from utils.keyset_cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_roundtrip() -> None:
+    """Токен раскодируется в исходные created_at и id с точностью до микросекунды."""
+    created_at = datetime(2026, 3, 14, 15, 9, 26, 535897, tzinfo=timezone.utc)
+    token = encode_cursor(created_at, 123456)
+
+    assert decode_cursor(token) == (created_at, 123456)
+
+
+def test_cursor_fits_callback_data() -> None:
+    """Токен достаточно короткий для callback_data Telegram."""
+    token = encode_cursor(datetime(2100, 1, 1, tzinfo=timezone.utc), 10**9)
+    assert len(token) <= 24
+
+
+def test_cursor_naive_datetime_treated_as_utc() -> None:
+    """Naive datetime считается UTC."""
+    naive = datetime(2026, 1, 1, 12, 0)
+    created_at, _ = decode_cursor(encode_cursor(naive, 1))
+    assert created_at == naive.replace(tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("token", ["", "abc", ".1", "1.", "zz.1"])
+def test_decode_cursor_invalid(token: str) -> None:
+    """Некорректные токены дают ValueError."""
+    with pytest.raises(ValueError):
+        decode_cursor(token)
@@ -0,0 +1,129 @@
+"""Тесты конвейера логирования: очередь с переполнением, сэмплирование, JSON."""
+
+import json
+import logging
+import queue
+import sys
+
+import pytest
+
+from utils import logger_config
+from utils.logger_config import (
+    BoundedQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    _parse_sampling,
+    setup_logger,
+)
+
+
+def _record(level: int = logging.INFO, name: str = "app", msg: str = "m %s"):
+    return logging.LogRecord(name, level, __file__, 1, msg, ("x",), None)
+
+
+def test_queue_handler_drops_low_level_records_when_full() -> None:
+    """Переполнение: INFO отбрасывается, очередь не блокирует вызов."""
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2))
+    for _ in range(3):
+        handler.emit(_record())
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 1
+
+
+def test_queue_handler_errors_evict_oldest_record() -> None:
+    """Ошибка при полной очереди вытесняет самую старую запись."""
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2))
+    handler.emit(_record(msg="first %s"))
+    handler.emit(_record(msg="second %s"))
+    handler.emit(_record(logging.ERROR, msg="boom %s"))
+
+    messages = [handler.queue.get_nowait().msg for _ in range(2)]
+    assert messages == ["second x", "boom x"]
+    assert handler.dropped == 1
+
+
+def test_queue_handler_reports_dropped_records() -> None:
+    """Когда место освободилось, в очередь попадает запись о потерях."""
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2))
+    for _ in range(3):
+        handler.emit(_record())
+    handler.queue.get_nowait()
+    handler.queue.get_nowait()
+
+    handler.emit(_record(msg="after %s"))
+
+    records = [handler.queue.get_nowait() for _ in range(2)]
+    assert records[0].msg == "after x"
+    assert records[1].levelno == logging.WARNING
+    assert "1" in records[1].getMessage()
+    assert handler.dropped == 0
+
+
+def test_queue_handler_prepares_exception_text() -> None:
+    """Трассировка форматируется до постановки в очередь."""
+    handler = BoundedQueueHandler(queue.Queue(maxsize=2))
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        record = _record(logging.ERROR)
+        record.exc_info = sys.exc_info()
+    handler.emit(record)
+
+    queued = handler.queue.get_nowait()
+    assert queued.exc_info is None
+    assert "ValueError: bad" in queued.exc_text
+
+
+def test_sampling_filter_keeps_fraction_of_noisy_logger() -> None:
+    """Шумный логгер сэмплируется, предупреждения и прочие логгеры — нет."""
+    sampling = SamplingFilter({"handlers.group": 0.25, "handlers.group.silent": 0})
+
+    kept = sum(
+        sampling.filter(_record(name="handlers.group.new_message")) for _ in range(8)
+    )
+    assert kept == 2
+    assert not sampling.filter(_record(name="handlers.group.silent"))
+    assert sampling.filter(_record(logging.WARNING, name="handlers.group.silent"))
+    assert sampling.filter(_record(name="handlers.groupies"))
+
+
+def test_parse_sampling_ignores_invalid_items() -> None:
+    assert _parse_sampling("a.b=0.1, c=2,bad=x,,") == {"a.b": 0.1, "c": 1.0}
+
+
+def test_json_formatter_outputs_structured_record() -> None:
+    """JSON-формат содержит уровень, логгер, сообщение и трассировку."""
+    record = _record(logging.ERROR, name="svc.module")
+    record.exc_text = "Traceback: boom"
+
+    payload = json.loads(JsonFormatter("bot").format(record))
+
+    assert payload["level"] == "ERROR"
+    assert payload["service"] == "bot"
+    assert payload["logger"] == "svc.module"
+    assert payload["message"] == "m x"
+    assert payload["exc"] == "Traceback: boom"
+
+
+def test_setup_logger_routes_root_through_queue(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Корневой логгер пишет только в очередь; файл дописывается слушателем."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SERVICE_NAME", "test")
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    try:
+        setup_logger(log_format="json", queue_size=100, sampling={})
+        assert [type(h) for h in root.handlers] == [BoundedQueueHandler]
+
+        logging.getLogger("app").info("hello %s", "world")
+        logger_config.shutdown_logger()
+
+        lines = (tmp_path / "logs" / "test.log").read_text().splitlines()
+        assert json.loads(lines[-1])["message"] == "hello world"
+    finally:
+        logger_config.shutdown_logger()
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)